@@ -79,6 +79,7 @@ class MCPServerConfig:
     timeout: int = 120
     retry_attempts: int = 3
     health_check_interval: int = 300
+    max_connections: int = 5
 
 
 @dataclass
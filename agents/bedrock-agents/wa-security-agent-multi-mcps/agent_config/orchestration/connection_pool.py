@@ -17,14 +17,16 @@
 
 """
 Connection Pool Manager for MCP Servers
-Manages connection pooling, load balancing, and connection health monitoring
+Lends connections to one caller at a time, with per-server limits, idle expiry,
+liveness probing before reuse and first-come, first-served waiting when a pool is full
 """
 
 import asyncio
-import time
+import itertools
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
 
 from agent_config.utils.logging_utils import get_logger
 
@@ -43,6 +45,7 @@ class ConnectionInfo:
     use_count: int = 0
     error_count: int = 0
     connection_object: Any = None
+    in_use: bool = False
 
 
 @dataclass
@@ -57,17 +60,35 @@ class PoolStats:
     failed_requests: int = 0
     average_response_time: float = 0.0
     pool_utilization: float = 0.0
+    waited_requests: int = 0
+    failed_probes: int = 0
 
 
 class ConnectionPoolManager:
     """
-    Manages connection pools for multiple MCP servers with load balancing
+    Manages connection pools for multiple MCP servers
+
+    A connection is borrowed with get_connection() and given back with
+    return_connection(); while borrowed, no other caller gets it. Connection objects
+    are created by the connect callable of the borrower and closed with their close()
+    coroutine. When a pool is at its limit, borrowers wait in arrival order and each
+    returned connection is handed to the longest waiting one.
     """
 
-    def __init__(self, max_connections_per_server: int = 5, max_idle_time: int = 300):
+    def __init__(
+        self,
+        max_connections_per_server: int = 5,
+        max_idle_time: int = 300,
+        liveness_probe_interval: int = 30,
+        server_limits: Optional[Dict[str, int]] = None,
+    ):
         """Initialize the connection pool manager"""
         self.max_connections_per_server = max_connections_per_server
         self.max_idle_time = max_idle_time  # seconds
+        self.liveness_probe_interval = liveness_probe_interval  # seconds
+
+        # Maximum connections of servers that don't use the default
+        self.server_limits: Dict[str, int] = dict(server_limits or {})
 
         # Connection pools by server name
         self.pools: Dict[str, List[ConnectionInfo]] = {}
@@ -75,8 +96,8 @@ class ConnectionPoolManager:
         # Pool statistics
         self.stats: Dict[str, PoolStats] = {}
 
-        # Load balancing - round robin counters
-        self.round_robin_counters: Dict[str, int] = {}
+        # Borrowers waiting for a connection, in arrival order
+        self.waiters: Dict[str, Deque[asyncio.Future]] = {}
 
         # Cleanup task
         self._cleanup_task: Optional[asyncio.Task] = None
@@ -85,77 +106,225 @@ class ConnectionPoolManager:
         # Locks for thread safety
         self._pool_locks: Dict[str, asyncio.Lock] = {}
 
+        self._connection_ids = itertools.count()
+
         logger.info(
             f"Connection pool manager initialized - Max connections per server: {max_connections_per_server}"
         )
 
-    async def get_connection(self, server_name: str) -> Optional[ConnectionInfo]:
-        """Get an available connection from the pool using load balancing"""
+    def set_server_limit(self, server_name: str, max_connections: int) -> None:
+        """Set the maximum number of connections to one server"""
+        self.server_limits[server_name] = max_connections
+
+    def get_max_connections(self, server_name: str) -> int:
+        """Get the maximum number of connections to a server"""
+        return self.server_limits.get(server_name, self.max_connections_per_server)
+
+    def _ensure_pool(self, server_name: str) -> None:
+        """Create the pool, statistics, waiter queue and lock of a server if needed"""
         if server_name not in self._pool_locks:
             self._pool_locks[server_name] = asyncio.Lock()
+        if server_name not in self.pools:
+            self.pools[server_name] = []
+            self.stats[server_name] = PoolStats()
+            self.waiters[server_name] = deque()
+
+    def _reserve(self, server_name: str) -> ConnectionInfo:
+        """Add a borrowed connection without a connection object to a pool"""
+        now = datetime.now()
+        connection = ConnectionInfo(
+            connection_id=f"{server_name}_{next(self._connection_ids)}",
+            server_name=server_name,
+            created_at=now,
+            last_used=now,
+            in_use=True,
+        )
+        self.pools[server_name].append(connection)
+        self.stats[server_name].total_connections += 1
+        logger.info(
+            f"Created new connection {connection.connection_id} for {server_name}"
+        )
+        return connection
+
+    def _hand_off(self, server_name: str, connection: ConnectionInfo) -> bool:
+        """Give a borrowed connection to the longest waiting borrower, if any"""
+        waiters = self.waiters.get(server_name)
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(connection)
+                return True
+        return False
+
+    def _release(self, connection: ConnectionInfo) -> None:
+        """Hand a borrowed connection to a waiter, or put it back as idle"""
+        connection.last_used = datetime.now()
+        if not self._hand_off(connection.server_name, connection):
+            connection.in_use = False
+
+    def _remove(self, connection: ConnectionInfo) -> bool:
+        """Remove a connection from its pool, giving its slot to a waiter"""
+        server_name = connection.server_name
+        pool = self.pools.get(server_name)
+        if pool is None or connection not in pool:
+            return False
+
+        pool.remove(connection)
+        connection.in_use = False
+        self.stats[server_name].total_connections -= 1
+
+        # The freed slot goes to the longest waiting borrower, which opens a new connection
+        if any(not waiter.done() for waiter in self.waiters.get(server_name, ())):
+            self._hand_off(server_name, self._reserve(server_name))
+        return True
+
+    def _remove_waiter(self, server_name: str, waiter: asyncio.Future) -> None:
+        """Remove a borrower that stopped waiting from the waiter queue"""
+        waiters = self.waiters.get(server_name)
+        if waiters and waiter in waiters:
+            waiters.remove(waiter)
+
+    async def _close_object(self, connection: ConnectionInfo) -> None:
+        """Close the connection object of a connection that left its pool"""
+        if connection.connection_object and hasattr(
+            connection.connection_object, "close"
+        ):
+            try:
+                await connection.connection_object.close()
+            except Exception as e:
+                logger.error(
+                    f"Error closing connection {connection.connection_id}: {e}"
+                )
 
-        async with self._pool_locks[server_name]:
-            # Initialize pool if it doesn't exist
-            if server_name not in self.pools:
-                self.pools[server_name] = []
-                self.stats[server_name] = PoolStats()
-                self.round_robin_counters[server_name] = 0
+    async def _is_reusable(self, connection: ConnectionInfo) -> bool:
+        """Check an idle connection before reuse: not expired, and alive if idle for a while"""
+        if connection.connection_object is None:
+            return True
 
-            pool = self.pools[server_name]
-            stats = self.stats[server_name]
-
-            # Find an available connection using round-robin load balancing
-            available_connections = [
-                conn for conn in pool if conn.is_active and conn.connection_object
-            ]
-
-            if available_connections:
-                # Use round-robin to select connection
-                counter = self.round_robin_counters[server_name]
-                selected_connection = available_connections[
-                    counter % len(available_connections)
-                ]
-                self.round_robin_counters[server_name] = (counter + 1) % len(
-                    available_connections
-                )
+        idle_time = (datetime.now() - connection.last_used).total_seconds()
+        if idle_time > self.max_idle_time:
+            logger.debug(
+                f"Connection {connection.connection_id} expired after {idle_time:.0f}s idle"
+            )
+            return False
+        if idle_time < self.liveness_probe_interval or not hasattr(
+            connection.connection_object, "ping"
+        ):
+            return True
+
+        try:
+            await connection.connection_object.ping()
+            return True
+        except Exception as e:
+            self.stats[connection.server_name].failed_probes += 1
+            logger.info(
+                f"Connection {connection.connection_id} failed its liveness probe: {e}"
+            )
+            return False
 
-                # Update connection usage
-                selected_connection.last_used = datetime.now()
-                selected_connection.use_count += 1
+    async def _checkout(
+        self, server_name: str, timeout: Optional[float]
+    ) -> Optional[ConnectionInfo]:
+        """Take an idle connection or a free slot, or wait in line for one"""
+        self._ensure_pool(server_name)
+        loop = asyncio.get_running_loop()
 
-                logger.debug(
-                    f"Reusing connection {selected_connection.connection_id} for {server_name}"
-                )
-                return selected_connection
-
-            # No available connections, check if we can create a new one
-            if len(pool) < self.max_connections_per_server:
-                connection_id = f"{server_name}_{len(pool)}_{int(time.time())}"
-                new_connection = ConnectionInfo(
-                    connection_id=connection_id,
-                    server_name=server_name,
-                    created_at=datetime.now(),
-                    last_used=datetime.now(),
-                    is_active=True,
-                    use_count=1,
-                )
+        async with self._pool_locks[server_name]:
+            pool = self.pools[server_name]
+            waiters = self.waiters[server_name]
 
-                pool.append(new_connection)
-                stats.total_connections += 1
+            # Borrowers that arrive while others wait queue up behind them
+            if not waiters:
+                idle_connections = [
+                    conn for conn in pool if not conn.in_use and conn.is_active
+                ]
+                if idle_connections:
+                    # The most recently used connection is the most likely to be warm
+                    connection = max(idle_connections, key=lambda conn: conn.last_used)
+                    connection.in_use = True
+                    logger.debug(
+                        f"Reusing connection {connection.connection_id} for {server_name}"
+                    )
+                    return connection
+
+                if len(pool) < self.get_max_connections(server_name):
+                    return self._reserve(server_name)
 
-                logger.info(f"Created new connection {connection_id} for {server_name}")
-                return new_connection
+            waiter = loop.create_future()
+            waiters.append(waiter)
+            self.stats[server_name].waited_requests += 1
+            logger.debug(
+                f"Connection pool for {server_name} is full, {len(waiters)} waiting"
+            )
 
-            # Pool is full, wait for an available connection or return None
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # A connection was handed over just as the wait timed out
+                return waiter.result()
+            self._remove_waiter(server_name, waiter)
             logger.warning(
-                f"Connection pool for {server_name} is full ({self.max_connections_per_server} connections)"
+                f"Timed out after {timeout}s waiting for a connection to {server_name}"
             )
             return None
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Pass on a connection handed over just as the borrower was cancelled
+                self._release(waiter.result())
+            else:
+                self._remove_waiter(server_name, waiter)
+            raise
+
+    async def get_connection(
+        self,
+        server_name: str,
+        connect: Optional[Callable[[], Awaitable[Any]]] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[ConnectionInfo]:
+        """Borrow a connection to a server, waiting if its pool is full
+
+        Args:
+            server_name: Name of the MCP server
+            connect: Coroutine function opening a new connection object, called when
+                the pool has no idle connection
+            timeout: Seconds to wait for a connection when the pool is full, or None
+                to wait as long as it takes
+
+        Returns:
+            The borrowed connection, to give back with return_connection(), or None if
+            the timeout elapsed
+        """
+        while True:
+            connection = await self._checkout(server_name, timeout)
+            if connection is None:
+                return None
+
+            if connection.connection_object is None and connect is not None:
+                try:
+                    self.set_connection_object(connection, await connect())
+                except BaseException:
+                    await self.close_connection(connection)
+                    raise
+            elif not await self._is_reusable(connection):
+                await self.close_connection(connection)
+                continue
+
+            connection.last_used = datetime.now()
+            connection.use_count += 1
+            return connection
 
     async def return_connection(
-        self, connection: ConnectionInfo, success: bool = True
+        self, connection: ConnectionInfo, success: bool = True, discard: bool = False
     ) -> None:
-        """Return a connection to the pool and update statistics"""
+        """Give a borrowed connection back to the pool and update statistics
+
+        Args:
+            connection: Connection returned by get_connection()
+            success: Whether the request made with the connection succeeded
+            discard: Close the connection instead of reusing it, e.g. after a
+                transport error
+        """
         server_name = connection.server_name
 
         if server_name not in self._pool_locks:
@@ -180,12 +349,16 @@ class ConnectionPoolManager:
                             f"Connection {connection.connection_id} marked as inactive due to errors"
                         )
 
-                # Update success rate
-                if stats.total_requests > 0:
-                    success_rate = stats.successful_requests / stats.total_requests
-                    logger.debug(
-                        f"Connection pool success rate for {server_name}: {success_rate:.2%}"
-                    )
+            if not connection.in_use:
+                return
+            if discard or not connection.is_active:
+                removed = self._remove(connection)
+            else:
+                self._release(connection)
+                return
+
+        if removed:
+            await self._close_object(connection)
 
     async def close_connection(self, connection: ConnectionInfo) -> None:
         """Close and remove a connection from the pool"""
@@ -195,28 +368,11 @@ class ConnectionPoolManager:
             return
 
         async with self._pool_locks[server_name]:
-            if server_name in self.pools:
-                pool = self.pools[server_name]
-                if connection in pool:
-                    pool.remove(connection)
-
-                    # Close the actual connection object if it exists
-                    if connection.connection_object and hasattr(
-                        connection.connection_object, "close"
-                    ):
-                        try:
-                            await connection.connection_object.close()
-                        except Exception as e:
-                            logger.error(
-                                f"Error closing connection {connection.connection_id}: {e}"
-                            )
-
-                    if server_name in self.stats:
-                        self.stats[server_name].total_connections -= 1
-
-                    logger.info(
-                        f"Closed and removed connection {connection.connection_id}"
-                    )
+            removed = self._remove(connection)
+
+        if removed:
+            await self._close_object(connection)
+            logger.info(f"Closed and removed connection {connection.connection_id}")
 
     async def health_check_pool(self, server_name: str) -> Dict[str, Any]:
         """Perform health check on all connections in a pool"""
@@ -234,41 +390,42 @@ class ConnectionPoolManager:
                 else:
                     unhealthy_count += 1
 
+            max_connections = self.get_max_connections(server_name)
             return {
                 "healthy": healthy_count,
                 "unhealthy": unhealthy_count,
                 "total": len(pool),
-                "utilization": len(pool) / self.max_connections_per_server
-                if self.max_connections_per_server > 0
-                else 0,
+                "in_use": len([conn for conn in pool if conn.in_use]),
+                "utilization": (
+                    len(pool) / max_connections if max_connections > 0 else 0
+                ),
             }
 
     async def cleanup_idle_connections(self) -> None:
         """Clean up idle connections that haven't been used recently"""
         current_time = datetime.now()
-        cleanup_count = 0
+        removed_connections = []
 
         for server_name in list(self.pools.keys()):
             if server_name not in self._pool_locks:
                 continue
 
             async with self._pool_locks[server_name]:
-                pool = self.pools[server_name]
-                connections_to_remove = []
+                for connection in self.pools[server_name][:]:
+                    if connection.in_use:
+                        continue
 
-                for connection in pool:
                     idle_time = (current_time - connection.last_used).total_seconds()
-
                     if idle_time > self.max_idle_time or not connection.is_active:
-                        connections_to_remove.append(connection)
+                        self._remove(connection)
+                        removed_connections.append(connection)
 
-                # Remove idle connections
-                for connection in connections_to_remove:
-                    await self.close_connection(connection)
-                    cleanup_count += 1
+        # Close connections outside the locks, so borrowers aren't held up
+        for connection in removed_connections:
+            await self._close_object(connection)
 
-        if cleanup_count > 0:
-            logger.info(f"Cleaned up {cleanup_count} idle connections")
+        if removed_connections:
+            logger.info(f"Cleaned up {len(removed_connections)} idle connections")
 
     async def start_cleanup_task(self) -> None:
         """Start the background cleanup task"""
@@ -312,15 +469,21 @@ class ConnectionPoolManager:
 
             pool_stats = {
                 "connections": len(pool),
-                "max_connections": self.max_connections_per_server,
+                "max_connections": self.get_max_connections(server_name),
                 "active_connections": health_info["healthy"],
-                "idle_connections": health_info["total"] - health_info["healthy"],
+                "idle_connections": health_info["total"] - health_info["in_use"],
+                "in_use_connections": health_info["in_use"],
+                "waiting_requests": len(self.waiters.get(server_name, ())),
+                "waited_requests": stats.waited_requests,
+                "failed_probes": stats.failed_probes,
                 "total_requests": stats.total_requests,
                 "successful_requests": stats.successful_requests,
                 "failed_requests": stats.failed_requests,
-                "success_rate": stats.successful_requests / stats.total_requests
-                if stats.total_requests > 0
-                else 0.0,
+                "success_rate": (
+                    stats.successful_requests / stats.total_requests
+                    if stats.total_requests > 0
+                    else 0.0
+                ),
                 "utilization": health_info["utilization"],
             }
 
@@ -338,6 +501,27 @@ class ConnectionPoolManager:
 
         return total_stats
 
+    async def close_pool(self, server_name: str) -> None:
+        """Close every connection to a server; waiting borrowers get None"""
+        if server_name not in self._pool_locks:
+            return
+
+        async with self._pool_locks[server_name]:
+            # Release the waiters first, so removing the connections doesn't reserve new
+            # slots for them in a pool that is being closed
+            waiters = self.waiters.get(server_name, deque())
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+
+            connections = self.pools.get(server_name, [])[:]
+            for connection in connections:
+                self._remove(connection)
+
+        for connection in connections:
+            await self._close_object(connection)
+
     async def close_all(self) -> None:
         """Close all connections and clean up resources"""
         logger.info("Closing all connection pools...")
@@ -351,17 +535,13 @@ class ConnectionPoolManager:
                 pass
 
         # Close all connections
-        for server_name, pool in self.pools.items():
-            async with self._pool_locks.get(server_name, asyncio.Lock()):
-                for connection in pool[
-                    :
-                ]:  # Create a copy to avoid modification during iteration
-                    await self.close_connection(connection)
+        for server_name in list(self.pools.keys()):
+            await self.close_pool(server_name)
 
         # Clear all data structures
         self.pools.clear()
         self.stats.clear()
-        self.round_robin_counters.clear()
+        self.waiters.clear()
         self._pool_locks.clear()
 
         logger.info("All connection pools closed")
@@ -389,12 +569,15 @@ class ConnectionPoolManager:
                 "total_requests": stats.total_requests,
                 "successful_requests": stats.successful_requests,
                 "failed_requests": stats.failed_requests,
-                "success_rate": stats.successful_requests / stats.total_requests
-                if stats.total_requests > 0
-                else 0.0,
+                "success_rate": (
+                    stats.successful_requests / stats.total_requests
+                    if stats.total_requests > 0
+                    else 0.0
+                ),
             },
             "configuration": {
-                "max_connections": self.max_connections_per_server,
+                "max_connections": self.get_max_connections(server_name),
                 "max_idle_time": self.max_idle_time,
+                "liveness_probe_interval": self.liveness_probe_interval,
             },
         }
@@ -23,12 +23,17 @@ Individual connector classes for different types of MCP servers
 import asyncio
 import json
 import time
+from contextlib import asynccontextmanager
 from datetime import timedelta
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional
 
+import anyio
 import boto3
+import httpx
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
 
 from agent_config.interfaces import MCPConnector, MCPServerConfig, ToolResult
 from agent_config.orchestration.connection_pool import ConnectionPoolManager
@@ -37,6 +42,94 @@ from agent_config.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Errors raised when the transport of a pooled session was dropped or timed out
+TRANSPORT_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError,
+    httpx.TransportError,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+)
+
+# Error the streamable HTTP client returns when the server no longer knows the session
+SESSION_TERMINATED_MESSAGE = "Session terminated"
+
+
+def is_transport_error(error: BaseException) -> bool:
+    """Whether an error means a pooled MCP session can't be reused"""
+    if isinstance(error, McpError):
+        return (
+            error.error.code in (CONNECTION_CLOSED, httpx.codes.REQUEST_TIMEOUT)
+            or error.error.message == SESSION_TERMINATED_MESSAGE
+        )
+    return isinstance(error, TRANSPORT_ERRORS)
+
+
+class PooledMCPSession:
+    """
+    MCP client session that stays open between tool calls, for the connection pool
+
+    The streamable HTTP transport and the ClientSession are entered and exited by one
+    background task, since their contexts can't be left from another task.
+    """
+
+    def __init__(self, url: str, headers: Dict[str, str], timeout: timedelta):
+        self.url = url
+        self.headers = headers
+        self.timeout = timeout
+        self.session: Optional[ClientSession] = None
+        self._closing = asyncio.Event()
+        self._owner_task: Optional[asyncio.Task] = None
+
+    async def open(self) -> "PooledMCPSession":
+        """Open the transport and run the MCP initialize handshake"""
+        ready = asyncio.get_running_loop().create_future()
+        self._owner_task = asyncio.create_task(self._hold_session(ready))
+        self.session = await ready
+        return self
+
+    async def _hold_session(self, ready: asyncio.Future) -> None:
+        """Keep the transport and session open until close() is called"""
+        try:
+            async with streamablehttp_client(
+                self.url, self.headers, timeout=self.timeout
+            ) as (read_stream, write_stream, _):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    if not ready.done():
+                        ready.set_result(session)
+                    await self._closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"MCP session to {self.url} closed: {e}")
+        finally:
+            if not ready.done():
+                ready.set_exception(
+                    ConnectionError("MCP session closed before it was initialized")
+                )
+
+    async def ping(self) -> None:
+        """Check that the session is still open and the server answers"""
+        if self._owner_task is None or self._owner_task.done():
+            raise ConnectionError("MCP session transport is closed")
+        await self.session.send_ping()
+
+    async def close(self) -> None:
+        """Close the session and its transport"""
+        if self._owner_task is None:
+            return
+        self._closing.set()
+        try:
+            await asyncio.wait_for(self._owner_task, timeout=5)
+        except asyncio.TimeoutError:
+            self._owner_task.cancel()
+        except Exception as e:
+            logger.debug(f"Error closing MCP session to {self.url}: {e}")
+
 
 class BaseMCPConnector(MCPConnector):
     """Base class for MCP server connectors with common functionality"""
@@ -55,6 +148,10 @@ class BaseMCPConnector(MCPConnector):
         self.is_initialized = False
         self.last_health_check = 0
         self.health_check_cache_duration = 30  # seconds
+        self.mcp_url = None
+        self.mcp_headers = None
+
+        connection_pool.set_server_limit(config.name, config.max_connections)
 
         logger.info(f"Initialized {config.name} MCP connector for region {region}")
 
@@ -80,6 +177,43 @@ class BaseMCPConnector(MCPConnector):
         """Override in subclasses to implement specific health check logic"""
         return self.is_initialized
 
+    async def _open_session(self) -> PooledMCPSession:
+        """Open a new MCP session to the server for the connection pool"""
+        return await PooledMCPSession(
+            self.mcp_url, self.mcp_headers, timedelta(seconds=self.config.timeout)
+        ).open()
+
+    @asynccontextmanager
+    async def _borrow_session(self) -> AsyncIterator[ClientSession]:
+        """Borrow a pooled MCP session, giving it back when the block exits
+
+        A session whose transport failed or timed out is closed rather than reused.
+        JSON-RPC errors returned by the server and errors raised by the caller's own
+        code leave the session healthy, so it goes back to the pool.
+        """
+        if not self.mcp_url or not self.mcp_headers:
+            raise ValueError("MCP connection not configured")
+
+        connection = await self.connection_pool.get_connection(
+            self.config.name, connect=self._open_session, timeout=self.config.timeout
+        )
+        if connection is None:
+            raise TimeoutError(
+                f"No {self.config.name} MCP session became available within {self.config.timeout}s"
+            )
+
+        try:
+            yield connection.connection_object.session
+        except BaseException as e:
+            if is_transport_error(e):
+                await self.connection_pool.return_connection(
+                    connection, success=False, discard=True
+                )
+            else:
+                await self.connection_pool.return_connection(connection, success=True)
+            raise
+        await self.connection_pool.return_connection(connection, success=True)
+
     async def _execute_with_retry(self, operation, *args, **kwargs):
         """Execute an operation with retry logic"""
         last_exception = None
@@ -113,8 +247,6 @@ class SecurityMCPConnector(BaseMCPConnector):
         connection_pool: ConnectionPoolManager,
     ):
         super().__init__(config, region, connection_pool)
-        self.mcp_url = None
-        self.mcp_headers = None
         self.connection_info = None
 
     async def initialize(self) -> bool:
@@ -167,16 +299,9 @@ class SecurityMCPConnector(BaseMCPConnector):
 
     async def _test_connection(self) -> None:
         """Test the connection to Security MCP Server"""
-        if not self.mcp_url or not self.mcp_headers:
-            raise ValueError("MCP connection not configured")
-
-        async with streamablehttp_client(
-            self.mcp_url, self.mcp_headers, timeout=timedelta(seconds=30)
-        ) as (read_stream, write_stream, _):
-            async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
-                # Test with a simple tool list call
-                await session.list_tools()
+        async with self._borrow_session() as session:
+            # Test with a simple tool list call, leaving a warm session in the pool
+            await session.list_tools()
 
     async def discover_tools(self) -> List[Dict[str, Any]]:
         """Discover available tools on Security MCP Server"""
@@ -191,29 +316,23 @@ class SecurityMCPConnector(BaseMCPConnector):
 
     async def _discover_tools_internal(self) -> List[Dict[str, Any]]:
         """Internal method to discover tools"""
-        async with streamablehttp_client(
-            self.mcp_url,
-            self.mcp_headers,
-            timeout=timedelta(seconds=self.config.timeout),
-        ) as (read_stream, write_stream, _):
-            async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
-                tool_result = await session.list_tools()
-
-                tools = [
-                    {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "parameters": tool.inputSchema.get("properties", {})
-                        if hasattr(tool, "inputSchema") and tool.inputSchema
-                        else {},
-                        "mcp_server": self.config.name,
-                    }
-                    for tool in tool_result.tools
-                ]
-
-                logger.info(f"Discovered {len(tools)} tools from Security MCP Server")
-                return tools
+        async with self._borrow_session() as session:
+            tool_result = await session.list_tools()
+
+        tools = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": tool.inputSchema.get("properties", {})
+                if hasattr(tool, "inputSchema") and tool.inputSchema
+                else {},
+                "mcp_server": self.config.name,
+            }
+            for tool in tool_result.tools
+        ]
+
+        logger.info(f"Discovered {len(tools)} tools from Security MCP Server")
+        return tools
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> ToolResult:
         """Call a tool on Security MCP Server"""
@@ -260,15 +379,9 @@ class SecurityMCPConnector(BaseMCPConnector):
         self, tool_name: str, arguments: Dict[str, Any]
     ) -> str:
         """Internal method to call tool"""
-        async with streamablehttp_client(
-            self.mcp_url,
-            self.mcp_headers,
-            timeout=timedelta(seconds=self.config.timeout),
-        ) as (read_stream, write_stream, _):
-            async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
-                result = await session.call_tool(name=tool_name, arguments=arguments)
-                return result.content[0].text
+        async with self._borrow_session() as session:
+            result = await session.call_tool(name=tool_name, arguments=arguments)
+        return result.content[0].text
 
     async def _perform_health_check(self) -> bool:
         """Perform health check for Security MCP Server"""
@@ -276,7 +389,8 @@ class SecurityMCPConnector(BaseMCPConnector):
             return False
 
         try:
-            await self._test_connection()
+            async with self._borrow_session() as session:
+                await asyncio.wait_for(session.send_ping(), timeout=10)
             return True
         except Exception as e:
             logger.warning(f"Security MCP Server health check failed: {e}")
@@ -284,6 +398,7 @@ class SecurityMCPConnector(BaseMCPConnector):
 
     async def close(self) -> None:
         """Close Security MCP Server connection"""
+        await self.connection_pool.close_pool(self.config.name)
         self.is_initialized = False
         self.mcp_url = None
         self.mcp_headers = None
@@ -302,6 +417,8 @@ class KnowledgeMCPConnector(BaseMCPConnector):
         super().__init__(config, region, connection_pool)
         self.available_tools = []
         self.public_endpoint = "https://knowledge-mcp.global.api.aws"
+        self.mcp_url = f"{self.public_endpoint}/mcp"
+        self.mcp_headers = {"User-Agent": "AWS-Enhanced-Security-Agent/1.0"}
 
     async def initialize(self) -> bool:
         """Initialize connection to AWS Knowledge MCP Server"""
@@ -415,54 +532,26 @@ class KnowledgeMCPConnector(BaseMCPConnector):
             f"Calling AWS Knowledge tool: {tool_name} via {self.public_endpoint}"
         )
 
-        # Make HTTP request to the public AWS Knowledge MCP endpoint
-        import httpx
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Prepare MCP request payload
-            mcp_request = {
-                "jsonrpc": "2.0",
-                "id": f"{tool_name}_{int(time.time())}",
-                "method": "tools/call",
-                "params": {"name": tool_name, "arguments": arguments},
-            }
-
-            # Make request to public endpoint
-            response = await client.post(
-                f"{self.public_endpoint}/mcp",
-                json=mcp_request,
-                headers={
-                    "Content-Type": "application/json",
-                    "User-Agent": "AWS-Enhanced-Security-Agent/1.0",
-                },
-            )
-
-            if response.status_code == 200:
-                result_data = response.json()
-
-                # Extract results from MCP response
-                if "result" in result_data and "content" in result_data["result"]:
-                    content = result_data["result"]["content"]
-                    if isinstance(content, list) and len(content) > 0:
-                        # Parse the text content which should contain JSON results
-                        text_content = content[0].get("text", "")
-                        if text_content:
-                            try:
-                                # Try to parse as JSON
-                                parsed_results = json.loads(text_content)
-                                return parsed_results
-                            except json.JSONDecodeError:
-                                # If not JSON, return as text
-                                return text_content
-
-                logger.warning(
-                    f"No results from AWS Knowledge MCP server for tool: {tool_name}"
-                )
-                return {}
-            else:
-                raise Exception(
-                    f"HTTP error from AWS Knowledge MCP server: {response.status_code}"
-                )
+        async with self._borrow_session() as session:
+            result = await session.call_tool(name=tool_name, arguments=arguments)
+
+        # Extract results from MCP response
+        if result.content and len(result.content) > 0:
+            # Parse the text content which should contain JSON results
+            text_content = getattr(result.content[0], "text", "")
+            if text_content:
+                try:
+                    # Try to parse as JSON
+                    parsed_results = json.loads(text_content)
+                    return parsed_results
+                except json.JSONDecodeError:
+                    # If not JSON, return as text
+                    return text_content
+
+        logger.warning(
+            f"No results from AWS Knowledge MCP server for tool: {tool_name}"
+        )
+        return {}
 
     def _format_search_result(self, search_phrase: str) -> str:
         """Format search results for AWS documentation"""
@@ -524,6 +613,7 @@ Based on your current context, here are recommended resources:
 
     async def close(self) -> None:
         """Close AWS Knowledge MCP Server connection"""
+        await self.connection_pool.close_pool(self.config.name)
         self.is_initialized = False
         self.available_tools.clear()
         logger.info("AWS Knowledge MCP Server connection closed")
@@ -539,8 +629,6 @@ class APIMCPConnector(BaseMCPConnector):
         connection_pool: ConnectionPoolManager,
     ):
         super().__init__(config, region, connection_pool)
-        self.mcp_url = None
-        self.mcp_headers = None
         self.connection_info = None
 
     async def initialize(self) -> bool:
@@ -586,16 +674,9 @@ class APIMCPConnector(BaseMCPConnector):
 
     async def _test_connection(self) -> None:
         """Test the connection to AWS API MCP Server"""
-        if not self.mcp_url or not self.mcp_headers:
-            raise ValueError("MCP connection not configured")
-
-        async with streamablehttp_client(
-            self.mcp_url, self.mcp_headers, timeout=timedelta(seconds=30)
-        ) as (read_stream, write_stream, _):
-            async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
-                # Test with a simple tool list call
-                await session.list_tools()
+        async with self._borrow_session() as session:
+            # Test with a simple tool list call, leaving a warm session in the pool
+            await session.list_tools()
 
     async def discover_tools(self) -> List[Dict[str, Any]]:
         """Discover available tools on AWS API MCP Server"""
@@ -610,29 +691,23 @@ class APIMCPConnector(BaseMCPConnector):
 
     async def _discover_tools_internal(self) -> List[Dict[str, Any]]:
         """Internal method to discover tools"""
-        async with streamablehttp_client(
-            self.mcp_url,
-            self.mcp_headers,
-            timeout=timedelta(seconds=self.config.timeout),
-        ) as (read_stream, write_stream, _):
-            async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
-                tool_result = await session.list_tools()
-
-                tools = [
-                    {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "parameters": tool.inputSchema.get("properties", {})
-                        if hasattr(tool, "inputSchema") and tool.inputSchema
-                        else {},
-                        "mcp_server": self.config.name,
-                    }
-                    for tool in tool_result.tools
-                ]
-
-                logger.info(f"Discovered {len(tools)} tools from AWS API MCP Server")
-                return tools
+        async with self._borrow_session() as session:
+            tool_result = await session.list_tools()
+
+        tools = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": tool.inputSchema.get("properties", {})
+                if hasattr(tool, "inputSchema") and tool.inputSchema
+                else {},
+                "mcp_server": self.config.name,
+            }
+            for tool in tool_result.tools
+        ]
+
+        logger.info(f"Discovered {len(tools)} tools from AWS API MCP Server")
+        return tools
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> ToolResult:
         """Call a tool on AWS API MCP Server"""
@@ -681,19 +756,13 @@ class APIMCPConnector(BaseMCPConnector):
         """Internal method to call AWS API MCP tools via Bedrock Core Runtime"""
         logger.info(f"Calling AWS API tool via Bedrock Core Runtime: {tool_name}")
 
-        async with streamablehttp_client(
-            self.mcp_url,
-            self.mcp_headers,
-            timeout=timedelta(seconds=self.config.timeout),
-        ) as (read_stream, write_stream, _):
-            async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
-                result = await session.call_tool(tool_name, arguments)
-
-                if result.content and len(result.content) > 0:
-                    return result.content[0].text
-                else:
-                    return f"Tool {tool_name} executed successfully but returned no content"
+        async with self._borrow_session() as session:
+            result = await session.call_tool(tool_name, arguments)
+
+        if result.content and len(result.content) > 0:
+            return result.content[0].text
+        else:
+            return f"Tool {tool_name} executed successfully but returned no content"
 
     def _format_instance_description(self, arguments: Dict[str, Any]) -> str:
         """Format EC2 instance description results"""
@@ -794,20 +863,16 @@ class APIMCPConnector(BaseMCPConnector):
             return False
 
         try:
-            async with streamablehttp_client(
-                self.mcp_url, self.mcp_headers, timeout=timedelta(seconds=10)
-            ) as (read_stream, write_stream, _):
-                async with ClientSession(read_stream, write_stream) as session:
-                    await session.initialize()
-                    # Simple health check by listing tools
-                    await session.list_tools()
-                    return True
+            async with self._borrow_session() as session:
+                await asyncio.wait_for(session.send_ping(), timeout=10)
+            return True
         except Exception as e:
             logger.warning(f"AWS API MCP Server health check failed: {e}")
             return False
 
     async def close(self) -> None:
         """Close AWS API MCP Server connection"""
+        await self.connection_pool.close_pool(self.config.name)
         self.is_initialized = False
         self.mcp_url = None
         self.mcp_headers = None
@@ -0,0 +1,211 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Dependency-Aware Tool Call Planning
+Plans tool calls as a directed acyclic graph and runs each call through the parallel
+execution engine as soon as the calls it depends on have completed, so independent
+calls run concurrently and end-to-end latency approaches the plan's critical path
+"""
+
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from agent_config.interfaces import ToolCall, ToolResult
+from agent_config.orchestration.parallel_executor import ParallelExecutionEngine
+from agent_config.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PlannedToolCall:
+    """A tool call in a plan and the IDs of the calls it waits for"""
+
+    call_id: str
+    tool_call: ToolCall
+    depends_on: List[str] = field(default_factory=list)
+    # Builds the call to execute from the results of its dependencies
+    prepare: Optional[Callable[[ToolCall, Dict[str, ToolResult]], ToolCall]] = None
+    # Calls that must finish first, whether or not they succeed
+    after: List[str] = field(default_factory=list)
+
+    @property
+    def waits_for(self) -> List[str]:
+        """Get the IDs of the dependencies and of the calls ordered before this one"""
+        return self.depends_on + [
+            call_id for call_id in self.after if call_id not in self.depends_on
+        ]
+
+
+class ToolCallPlan:
+    """
+    Directed acyclic graph of tool calls
+    A call can only depend on calls added before it, so every plan is acyclic and the
+    insertion order is a valid sequential order
+    """
+
+    def __init__(self):
+        self.calls: Dict[str, PlannedToolCall] = {}
+
+    def add(
+        self,
+        call_id: str,
+        tool_call: ToolCall,
+        depends_on: Optional[List[str]] = None,
+        prepare: Optional[Callable[[ToolCall, Dict[str, ToolResult]], ToolCall]] = None,
+        after: Optional[List[str]] = None,
+    ) -> PlannedToolCall:
+        """
+        Add a tool call that starts once all calls in depends_on and after have completed
+        The call is skipped when one of depends_on fails, but not when one of after fails
+        """
+        if call_id in self.calls:
+            raise ValueError(f"Duplicate tool call ID: {call_id}")
+
+        depends_on = list(dict.fromkeys(depends_on or []))
+        after = list(dict.fromkeys(after or []))
+        unknown = [
+            dependency
+            for dependency in depends_on + after
+            if dependency not in self.calls
+        ]
+        if unknown:
+            raise ValueError(
+                f"Tool call {call_id} depends on calls not in the plan: {', '.join(unknown)}"
+            )
+
+        planned = PlannedToolCall(call_id, tool_call, depends_on, prepare, after)
+        self.calls[call_id] = planned
+        return planned
+
+    def dependents(self) -> Dict[str, List[str]]:
+        """Get the IDs of the calls that wait for each call"""
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        for planned in self.calls.values():
+            for dependency in planned.waits_for:
+                dependents[dependency].append(planned.call_id)
+        return dependents
+
+    def critical_path(self, durations: Dict[str, float]) -> float:
+        """Get the duration of the longest dependency chain, given each call's duration"""
+        finish_times: Dict[str, float] = {}
+        for call_id, planned in self.calls.items():
+            start = max(
+                (finish_times[dependency] for dependency in planned.waits_for),
+                default=0.0,
+            )
+            finish_times[call_id] = start + durations.get(call_id, 0.0)
+        return max(finish_times.values(), default=0.0)
+
+
+class DAGExecutor:
+    """Executes tool call plans through the parallel execution engine"""
+
+    def __init__(self, engine: ParallelExecutionEngine):
+        self.engine = engine
+
+    async def iter_results(
+        self, plan: ToolCallPlan
+    ) -> AsyncIterator[Tuple[str, ToolResult]]:
+        """
+        Execute a plan and yield (call ID, result) as each call completes
+
+        A call is submitted to the engine as soon as all of its dependencies have
+        succeeded and the calls it is ordered after have finished. When a dependency
+        fails, the call is not executed and yields a failed result instead. Calls still
+        running are cancelled when the iterator is closed early, so callers that may
+        stop before the end should aclose() it.
+        """
+        results: Dict[str, ToolResult] = {}
+        pending = {
+            call_id: set(planned.waits_for) for call_id, planned in plan.calls.items()
+        }
+        dependents = plan.dependents()
+        running: Dict[asyncio.Task, str] = {}
+
+        def launch(call_id: str) -> None:
+            planned = plan.calls[call_id]
+            tool_call = planned.tool_call
+            if planned.prepare:
+                tool_call = planned.prepare(
+                    tool_call,
+                    {
+                        dependency: results[dependency]
+                        for dependency in planned.depends_on
+                    },
+                )
+            task = asyncio.create_task(self.engine.execute_parallel_calls([tool_call]))
+            running[task] = call_id
+
+        for call_id in [call_id for call_id, deps in pending.items() if not deps]:
+            del pending[call_id]
+            launch(call_id)
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                completed = [(running.pop(task), task.result()[0]) for task in done]
+
+                while completed:
+                    call_id, result = completed.pop(0)
+                    results[call_id] = result
+                    yield call_id, result
+
+                    for dependent in dependents.get(call_id, []):
+                        if dependent not in pending:
+                            continue
+                        if (
+                            not result.success
+                            and call_id in plan.calls[dependent].depends_on
+                        ):
+                            # Settle the dependent now, and its own dependents in turn
+                            del pending[dependent]
+                            skipped = plan.calls[dependent].tool_call
+                            completed.append(
+                                (
+                                    dependent,
+                                    ToolResult(
+                                        tool_name=skipped.tool_name,
+                                        mcp_server=skipped.mcp_server,
+                                        success=False,
+                                        data=None,
+                                        error_message=f"Skipped: dependency {call_id} failed",
+                                    ),
+                                )
+                            )
+                            continue
+
+                        pending[dependent].discard(call_id)
+                        if not pending[dependent]:
+                            del pending[dependent]
+                            launch(dependent)
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def execute(self, plan: ToolCallPlan) -> Dict[str, ToolResult]:
+        """Execute a plan and return the result of every call, keyed by call ID"""
+        results = {}
+        async for call_id, result in self.iter_results(plan):
+            results[call_id] = result
+        logger.info(f"Executed tool call plan with {len(results)} calls")
+        return results
@@ -111,6 +111,9 @@ class MCPOrchestratorImpl(MCPOrchestrator):
                 # Start health monitoring
                 asyncio.create_task(self._start_health_monitoring())
 
+                # Close pooled MCP sessions that stay idle
+                await self.connection_pool.start_cleanup_task()
+
                 # Start parallel execution engine
                 await self.parallel_executor.start()
 
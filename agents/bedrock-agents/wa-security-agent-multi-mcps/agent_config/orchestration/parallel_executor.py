@@ -22,13 +22,14 @@ request queuing, load balancing, timeout handling, and circuit breaker patterns
 """
 
 import asyncio
+import math
 import random
 import time
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from agent_config.interfaces import ToolCall, ToolPriority, ToolResult
 from agent_config.utils.logging_utils import get_logger
@@ -36,6 +37,15 @@ from agent_config.utils.logging_utils import get_logger
 logger = get_logger(__name__)
 
 
+def _percentile(values: Iterable[float], fraction: float) -> Optional[float]:
+    """Get the nearest-rank percentile of values, or None if there are none"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
 class CircuitBreakerState(Enum):
     """Circuit breaker states"""
 
@@ -72,7 +82,12 @@ class QueuedRequest:
     tool_call: ToolCall
     future: asyncio.Future
     queued_at: datetime = field(default_factory=datetime.now)
-    priority: ToolPriority = ToolPriority.NORMAL
+    priority: Optional[ToolPriority] = None
+
+    def __post_init__(self):
+        # Queue at the priority of the tool call unless one is given explicitly
+        if self.priority is None:
+            self.priority = self.tool_call.priority
 
 
 class CircuitBreaker:
@@ -155,7 +170,12 @@ class CircuitBreaker:
 
 
 class RequestQueue:
-    """Priority-based request queue with load balancing"""
+    """Priority-based request queue with load balancing
+
+    Requests are kept in one FIFO deque per priority and always dequeued from the
+    highest non-empty priority. A condition variable wakes waiting consumers as soon as
+    a request is enqueued, so consumers never poll an empty queue.
+    """
 
     def __init__(self, max_size: int = 1000):
         self.max_size = max_size
@@ -163,11 +183,11 @@ class RequestQueue:
             priority: deque() for priority in ToolPriority
         }
         self.total_size = 0
-        self._lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition()
 
     async def enqueue(self, request: QueuedRequest) -> bool:
         """Add request to appropriate priority queue"""
-        async with self._lock:
+        async with self._not_empty:
             if self.total_size >= self.max_size:
                 logger.warning(
                     f"Request queue full ({self.max_size}), rejecting request"
@@ -176,14 +196,22 @@ class RequestQueue:
 
             self.queues[request.priority].append(request)
             self.total_size += 1
+            self._not_empty.notify()
             logger.debug(
                 f"Enqueued request with priority {request.priority.name}, queue size: {self.total_size}"
             )
             return True
 
-    async def dequeue(self) -> Optional[QueuedRequest]:
-        """Dequeue highest priority request"""
-        async with self._lock:
+    async def dequeue(self, wait: bool = False) -> Optional[QueuedRequest]:
+        """Dequeue highest priority request
+
+        Args:
+            wait: Wait until a request is enqueued instead of returning None when empty
+        """
+        async with self._not_empty:
+            if wait:
+                await self._not_empty.wait_for(lambda: self.total_size > 0)
+
             # Check queues in priority order (highest first)
             for priority in reversed(list(ToolPriority)):
                 if self.queues[priority]:
@@ -194,7 +222,7 @@ class RequestQueue:
 
     async def get_queue_stats(self) -> Dict[str, Any]:
         """Get queue statistics"""
-        async with self._lock:
+        async with self._not_empty:
             stats = {
                 "total_size": self.total_size,
                 "max_size": self.max_size,
@@ -341,6 +369,9 @@ class ParallelExecutionEngine:
         self.failed_requests = 0
         self.start_time = datetime.now()
 
+        # Seconds the most recent requests spent in the queue before being dispatched
+        self.queue_wait_times: deque = deque(maxlen=1000)
+
         # Background task for processing queue
         self._queue_processor_task: Optional[asyncio.Task] = None
         self._shutdown_event = asyncio.Event()
@@ -359,6 +390,7 @@ class ParallelExecutionEngine:
     async def start(self) -> None:
         """Start the parallel execution engine"""
         if self._queue_processor_task is None:
+            self._shutdown_event.clear()
             self._queue_processor_task = asyncio.create_task(self._process_queue())
             logger.info("Parallel execution engine started")
 
@@ -367,11 +399,12 @@ class ParallelExecutionEngine:
         self._shutdown_event.set()
 
         if self._queue_processor_task:
+            # The processor sleeps until a request is enqueued, so wake it by cancelling
+            self._queue_processor_task.cancel()
             try:
-                await asyncio.wait_for(self._queue_processor_task, timeout=5.0)
-            except asyncio.TimeoutError:
-                self._queue_processor_task.cancel()
-                logger.warning("Queue processor task cancelled due to timeout")
+                await self._queue_processor_task
+            except asyncio.CancelledError:
+                pass
 
             self._queue_processor_task = None
 
@@ -417,9 +450,7 @@ class ParallelExecutionEngine:
 
         for tool_call in tool_calls:
             future = asyncio.Future()
-            request = QueuedRequest(
-                tool_call=tool_call, future=future, priority=tool_call.priority
-            )
+            request = QueuedRequest(tool_call=tool_call, future=future)
 
             # Try to enqueue request
             if await self.request_queue.enqueue(request):
@@ -479,21 +510,30 @@ class ParallelExecutionEngine:
             return error_results
 
     async def _process_queue(self) -> None:
-        """Background task to process the request queue"""
+        """Background task to process the request queue
+
+        A concurrency slot is taken before each dequeue, so requests wait in the priority
+        queue rather than on the semaphore and the next free slot always goes to the
+        highest priority request. Dequeuing blocks until a request is enqueued.
+        """
         logger.info("Queue processor started")
 
         while not self._shutdown_event.is_set():
+            slot_acquired = False
             try:
-                # Get next request from queue
-                request = await self.request_queue.dequeue()
+                await self.request_semaphore.acquire()
+                slot_acquired = True
+
+                # Wait for the next request from queue
+                request = await self.request_queue.dequeue(wait=True)
 
-                if request is None:
-                    # No requests, wait a bit
-                    await asyncio.sleep(0.1)
+                # Skip requests whose caller stopped waiting while they were queued
+                if request.future.done():
                     continue
 
                 # Check if request has timed out while in queue
                 queue_time = (datetime.now() - request.queued_at).total_seconds()
+                self.queue_wait_times.append(queue_time)
                 if queue_time > request.tool_call.timeout:
                     logger.warning(
                         f"Request {request.tool_call.tool_name} timed out in queue after {queue_time}s"
@@ -528,18 +568,34 @@ class ParallelExecutionEngine:
                     request.future.set_result(circuit_breaker_result)
                     continue
 
-                # Execute request with concurrency control
-                asyncio.create_task(self._execute_request(request))
+                # Execute request; the task releases the concurrency slot when done.
+                # Cancelling the request's future cancels the running call.
+                task = asyncio.create_task(self._execute_request(request))
+
+                def cancel_call(future: asyncio.Future, task=task) -> None:
+                    if future.cancelled():
+                        task.cancel()
 
+                request.future.add_done_callback(cancel_call)
+                slot_acquired = False
+
+            except asyncio.CancelledError:
+                break
             except Exception as e:
                 logger.error(f"Error in queue processor: {e}")
                 await asyncio.sleep(1.0)  # Back off on error
+            finally:
+                if slot_acquired:
+                    self.request_semaphore.release()
 
         logger.info("Queue processor stopped")
 
     async def _execute_request(self, request: QueuedRequest) -> None:
-        """Execute a single request with all safety mechanisms"""
-        async with self.request_semaphore:
+        """Execute a single request with all safety mechanisms
+
+        Runs in the concurrency slot taken by the queue processor and releases it.
+        """
+        try:
             start_time = time.time()
             circuit_breaker = self._get_circuit_breaker(request.tool_call.mcp_server)
 
@@ -581,7 +637,8 @@ class ParallelExecutionEngine:
                 async with self._execution_lock:
                     self.successful_requests += 1
 
-                request.future.set_result(result)
+                if not request.future.done():
+                    request.future.set_result(result)
 
             except asyncio.TimeoutError:
                 execution_time = time.time() - start_time
@@ -606,7 +663,8 @@ class ParallelExecutionEngine:
                 async with self._execution_lock:
                     self.failed_requests += 1
 
-                request.future.set_result(timeout_result)
+                if not request.future.done():
+                    request.future.set_result(timeout_result)
 
             except Exception as e:
                 execution_time = time.time() - start_time
@@ -631,11 +689,14 @@ class ParallelExecutionEngine:
                 async with self._execution_lock:
                     self.failed_requests += 1
 
-                request.future.set_result(error_result)
+                if not request.future.done():
+                    request.future.set_result(error_result)
 
             finally:
                 async with self._execution_lock:
                     self.active_requests -= 1
+        finally:
+            self.request_semaphore.release()
 
     async def _simulate_tool_execution(
         self, tool_call: ToolCall, timeout: float
@@ -684,6 +745,11 @@ class ParallelExecutionEngine:
             "active_requests": self.active_requests,
             "max_concurrent_requests": self.max_concurrent_requests,
             "queue_stats": queue_stats,
+            "queue_wait_seconds": {
+                "samples": len(self.queue_wait_times),
+                "p50": _percentile(self.queue_wait_times, 0.50),
+                "p99": _percentile(self.queue_wait_times, 0.99),
+            },
             "load_balancer_stats": load_balancer_stats,
             "circuit_breaker_stats": circuit_breaker_stats,
         }
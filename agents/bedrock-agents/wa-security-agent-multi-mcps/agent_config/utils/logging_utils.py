@@ -25,7 +25,7 @@ import logging
 import time
 from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 
 @dataclass
@@ -212,9 +212,11 @@ structured_logger = StructuredLogger()
 performance_tracker = PerformanceTracker()
 
 
-def get_logger() -> StructuredLogger:
-    """Get the global structured logger instance"""
-    return structured_logger
+def get_logger(name: Optional[str] = None) -> Union[StructuredLogger, logging.Logger]:
+    """Get the logger of a module by name, or the global structured logger instance"""
+    if name is None:
+        return structured_logger
+    return logging.getLogger(name)
 
 
 def get_performance_tracker() -> PerformanceTracker:
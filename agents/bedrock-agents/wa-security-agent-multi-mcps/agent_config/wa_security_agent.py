@@ -34,6 +34,9 @@ from bedrock_agentcore.memory import MemoryHook
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 
+from .interfaces import ToolCall, ToolResult
+from .orchestration.dag_planner import DAGExecutor, ToolCallPlan
+from .orchestration.parallel_executor import ParallelExecutionEngine
 from .response_transformer import SecurityResponseTransformer
 
 logger = logging.getLogger(__name__)
@@ -81,6 +84,11 @@ class EnhancedSecurityAgent(Agent):
         # Store responses for comprehensive analysis
         self.session_responses = []
 
+        # Tool calls run as a dependency graph through the parallel execution engine
+        self.parallel_engine = ParallelExecutionEngine(max_concurrent_requests=10)
+        self.parallel_engine.set_executor_function(self._execute_tool_call)
+        self.dag_executor = DAGExecutor(self.parallel_engine)
+
         # Initialize MCP connections
         asyncio.create_task(self._initialize_all_mcp_connections())
 
@@ -563,7 +571,9 @@ Remember: You're not just a security assessment tool - you're a comprehensive AW
             word in user_message_lower
             for word in ["findings", "alerts", "vulnerabilities", "issues"]
         ):
-            # Get real-time findings
+            # Get real-time findings; when the service status is also checked, the
+            # findings call waits for it and reuses the status stored in context, but
+            # still runs (checking the service itself) if the status check fails
             tool_calls.append(
                 {
                     "tool": "GetSecurityFindings",
@@ -573,6 +583,7 @@ Remember: You're not just a security assessment tool - you're a comprehensive AW
                         "service": "guardduty",
                         "max_findings": 10,
                     },
+                    "after": ["CheckSecurityServices"],
                 }
             )
             # Get AWS security incident response documentation
@@ -657,6 +668,57 @@ Remember: You're not just a security assessment tool - you're a comprehensive AW
 
         return tool_calls
 
+    def _build_tool_call_plan(self, tool_calls: List[Dict[str, Any]]) -> ToolCallPlan:
+        """
+        Build a dependency graph from the tool calls of a strategy
+        Entries name the tools they depend on in "depends_on" and the tools they only
+        run after in "after"; each name refers to the earlier calls of that tool and is
+        ignored when no such call is planned
+        """
+        plan = ToolCallPlan()
+        call_ids_by_tool: Dict[str, List[str]] = {}
+
+        def earlier_calls(tools: List[str]) -> List[str]:
+            return [
+                call_id for tool in tools for call_id in call_ids_by_tool.get(tool, [])
+            ]
+
+        for index, tool_call in enumerate(tool_calls):
+            call_id = f"{index}:{tool_call['tool']}"
+            plan.add(
+                call_id,
+                ToolCall(
+                    tool_name=tool_call["tool"],
+                    mcp_server=tool_call["mcp_server"],
+                    arguments=tool_call["args"],
+                ),
+                depends_on=earlier_calls(tool_call.get("depends_on", [])),
+                after=earlier_calls(tool_call.get("after", [])),
+            )
+            call_ids_by_tool.setdefault(tool_call["tool"], []).append(call_id)
+
+        return plan
+
+    async def _execute_tool_call(self, tool_call: ToolCall) -> ToolResult:
+        """Execute a tool call on its MCP server for the parallel execution engine"""
+        if tool_call.mcp_server == "security":
+            result = await self._call_security_mcp_tool(
+                tool_name=tool_call.tool_name, arguments=tool_call.arguments
+            )
+        elif tool_call.mcp_server == "aws_knowledge":
+            result = await self._call_aws_knowledge_tool(
+                tool_name=tool_call.tool_name, arguments=tool_call.arguments
+            )
+        else:
+            raise ValueError(f"Unknown MCP server: {tool_call.mcp_server}")
+
+        return ToolResult(
+            tool_name=tool_call.tool_name,
+            mcp_server=tool_call.mcp_server,
+            success=True,
+            data=result,
+        )
+
     async def stream(self, user_query: str) -> AsyncGenerator[str, None]:
         """Stream enhanced response with both real-time data and AWS knowledge"""
         try:
@@ -667,47 +729,51 @@ Remember: You're not just a security assessment tool - you're a comprehensive AW
             # Determine enhanced strategy
             tool_calls = await self._determine_enhanced_strategy(user_query)
 
-            # Execute tool calls
+            # Execute tool calls: independent calls run concurrently and dependent
+            # calls start as soon as the calls they depend on have completed. Each
+            # result is streamed as soon as its call completes.
+            plan = self._build_tool_call_plan(tool_calls)
+            results_by_call: Dict[str, str] = {}
+
+            plan_results = self.dag_executor.iter_results(plan)
+            try:
+                async for call_id, tool_result in plan_results:
+                    tool_call = plan.calls[call_id].tool_call
+                    result = (
+                        tool_result.data
+                        if tool_result.success
+                        else f"Error calling {tool_call.tool_name}: {tool_result.error_message}"
+                    )
+                    if not result:
+                        continue
+
+                    if not results_by_call:
+                        yield "# 🔍 Enhanced Security Analysis\n\n"
+                    results_by_call[call_id] = result
+
+                    source = "🛡️" if tool_call.mcp_server == "security" else "📚"
+                    yield f"### {source} {tool_call.tool_name}\n\n"
+                    yield result + "\n\n"
+            finally:
+                # Cancel the calls still running if the client stops reading early
+                await plan_results.aclose()
+
+            # The synthesis needs every result; keep them in plan order
             security_results = []
             knowledge_results = []
+            for call_id, planned in plan.calls.items():
+                if call_id not in results_by_call:
+                    continue
+                entry = {
+                    "tool": planned.tool_call.tool_name,
+                    "result": results_by_call[call_id],
+                }
+                if planned.tool_call.mcp_server == "security":
+                    security_results.append(entry)
+                elif planned.tool_call.mcp_server == "aws_knowledge":
+                    knowledge_results.append(entry)
 
-            for tool_call in tool_calls:
-                if tool_call["mcp_server"] == "security":
-                    result = await self._call_security_mcp_tool(
-                        tool_name=tool_call["tool"], arguments=tool_call["args"]
-                    )
-                    if result:
-                        security_results.append(
-                            {"tool": tool_call["tool"], "result": result}
-                        )
-
-                elif tool_call["mcp_server"] == "aws_knowledge":
-                    result = await self._call_aws_knowledge_tool(
-                        tool_name=tool_call["tool"], arguments=tool_call["args"]
-                    )
-                    if result:
-                        knowledge_results.append(
-                            {"tool": tool_call["tool"], "result": result}
-                        )
-
-            # Stream results
             if security_results or knowledge_results:
-                yield "# 🔍 Enhanced Security Analysis\n\n"
-
-                # Stream security assessment results first
-                if security_results:
-                    yield "## 🛡️ Real-Time Security Assessment\n\n"
-                    for result in security_results:
-                        yield f"### {result['tool']}\n\n"
-                        yield result["result"] + "\n\n"
-
-                # Stream AWS knowledge results
-                if knowledge_results:
-                    yield "## 📚 AWS Official Guidance & Best Practices\n\n"
-                    for result in knowledge_results:
-                        yield f"### {result['tool']}\n\n"
-                        yield result["result"] + "\n\n"
-
                 # Generate enhanced analysis
                 yield "---\n\n"
                 yield "## 🧠 Enhanced Analysis & Strategic Recommendations\n\n"
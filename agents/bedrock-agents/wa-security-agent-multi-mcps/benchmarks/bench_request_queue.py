@@ -0,0 +1,132 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Queue-wait latency benchmark for the parallel execution engine
+Compares the original queue processor, which polled the request queue every 100 ms
+while idle, with the event-driven processor that wakes as soon as a request is
+enqueued. Tool calls arrive in small bursts separated by idle gaps, as they do when an
+agent plans a few tool calls per turn. Run from the agent directory:
+
+    python -m benchmarks.bench_request_queue
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime
+
+from agent_config.interfaces import ToolCall, ToolPriority, ToolResult
+from agent_config.orchestration.parallel_executor import (
+    ParallelExecutionEngine,
+    _percentile,
+)
+
+# Sleep of the original queue processor whenever the queue was empty
+POLL_INTERVAL = 0.1
+
+
+class PollingExecutionEngine(ParallelExecutionEngine):
+    """Reference implementation: the queue processor polls the queue while idle"""
+
+    async def _process_queue(self) -> None:
+        while not self._shutdown_event.is_set():
+            try:
+                request = await self.request_queue.dequeue()
+                if request is None:
+                    await asyncio.sleep(POLL_INTERVAL)
+                    continue
+
+                self.queue_wait_times.append(
+                    (datetime.now() - request.queued_at).total_seconds()
+                )
+                await self.request_semaphore.acquire()
+                asyncio.create_task(self._execute_request(request))
+            except asyncio.CancelledError:
+                break
+
+
+async def run_workload(
+    engine: ParallelExecutionEngine, bursts: int, burst_size: int, seed: int
+) -> dict:
+    """Send bursts of tool calls with idle gaps and return queue-wait percentiles"""
+    rng = random.Random(seed)
+
+    async def executor(tool_call: ToolCall) -> ToolResult:
+        await asyncio.sleep(rng.uniform(0.001, 0.005))
+        return ToolResult(
+            tool_name=tool_call.tool_name,
+            mcp_server=tool_call.mcp_server,
+            success=True,
+            data={"result": "success"},
+        )
+
+    engine.set_executor_function(executor)
+    await engine.start()
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for burst in range(bursts):
+        await asyncio.sleep(rng.uniform(0.0, 0.2))
+        await engine.execute_parallel_calls(
+            [
+                ToolCall(f"tool_{burst}_{i}", "server", {}, ToolPriority.NORMAL, 30)
+                for i in range(burst_size)
+            ]
+        )
+    wall_seconds = time.perf_counter() - wall_start
+    cpu_seconds = time.process_time() - cpu_start
+    await engine.stop()
+
+    waits = engine.queue_wait_times
+    return {
+        "p50_ms": _percentile(waits, 0.50) * 1000,
+        "p99_ms": _percentile(waits, 0.99) * 1000,
+        "wall_seconds": wall_seconds,
+        "cpu_seconds": cpu_seconds,
+    }
+
+
+async def run_benchmark(bursts: int, burst_size: int, seed: int) -> None:
+    """Run the workload on both engines and print queue-wait percentiles"""
+    print(f"Workload: {bursts} bursts of {burst_size} tool calls, 0-200 ms idle gaps")
+    for label, engine_class in (
+        ("Polling (100 ms)", PollingExecutionEngine),
+        ("Event-driven", ParallelExecutionEngine),
+    ):
+        stats = await run_workload(engine_class(), bursts, burst_size, seed)
+        print(
+            f"{label:18} queue wait p50={stats['p50_ms']:8.2f} ms "
+            f"p99={stats['p99_ms']:8.2f} ms  wall={stats['wall_seconds']:6.2f} s "
+            f"cpu={stats['cpu_seconds']:6.2f} s"
+        )
+
+
+def main():
+    """Parse arguments and run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bursts", type=int, default=100)
+    parser.add_argument("--burst-size", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.bursts, args.burst_size, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -58,7 +58,7 @@ class TestConnectionPoolManager:
         assert pool_manager.max_idle_time == 60
         assert len(pool_manager.pools) == 0
         assert len(pool_manager.stats) == 0
-        assert len(pool_manager.round_robin_counters) == 0
+        assert len(pool_manager.waiters) == 0
 
     @pytest.mark.asyncio
     async def test_get_connection_new_pool(self, pool_manager):
@@ -81,14 +81,25 @@ class TestConnectionPoolManager:
         # Create first connection
         connection1 = await pool_manager.get_connection("test_server")
         connection1.connection_object = mock_connection_object
+        await pool_manager.return_connection(connection1)
 
         # Get second connection (should reuse)
         connection2 = await pool_manager.get_connection("test_server")
 
         assert connection2 == connection1
         assert connection1.use_count == 2
+        assert connection1.in_use is True
         assert len(pool_manager.pools["test_server"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_connection_borrowed_not_shared(self, pool_manager):
+        """Test a borrowed connection isn't lent to another caller"""
+        connection1 = await pool_manager.get_connection("test_server")
+        connection2 = await pool_manager.get_connection("test_server")
+
+        assert connection1 is not connection2
+        assert len(pool_manager.pools["test_server"]) == 2
+
     @pytest.mark.asyncio
     async def test_get_connection_pool_full(self, pool_manager, mock_connection_object):
         """Test getting connection when pool is full"""
@@ -99,38 +110,165 @@ class TestConnectionPoolManager:
             conn.connection_object = mock_connection_object
             connections.append(conn)
 
-        # Try to get another connection
-        connection = await pool_manager.get_connection("test_server")
+        # Another borrower times out while every connection is borrowed
+        connection = await pool_manager.get_connection("test_server", timeout=0.01)
+
+        assert connection is None
+        assert len(pool_manager.pools["test_server"]) == 3
+        assert pool_manager.stats["test_server"].waited_requests == 1
+        assert len(pool_manager.waiters["test_server"]) == 0
+
+        # A waiting borrower gets the next returned connection
+        waiter = asyncio.create_task(pool_manager.get_connection("test_server"))
+        await asyncio.sleep(0)
+        await pool_manager.return_connection(connections[1])
 
-        # Should reuse one of the existing connections
-        assert connection in connections
+        assert await waiter is connections[1]
         assert len(pool_manager.pools["test_server"]) == 3
 
     @pytest.mark.asyncio
-    async def test_get_connection_round_robin(
+    async def test_waiters_served_in_arrival_order(
         self, pool_manager, mock_connection_object
     ):
-        """Test round-robin load balancing"""
-        # Create multiple connections
+        """Test borrowers waiting on a full pool are served first come, first served"""
         connections = []
         for i in range(3):
             conn = await pool_manager.get_connection("test_server")
             conn.connection_object = mock_connection_object
             connections.append(conn)
 
-        # Reset use counts
+        served = []
+
+        async def borrow(name):
+            conn = await pool_manager.get_connection("test_server")
+            served.append(name)
+            return conn
+
+        waiters = [asyncio.create_task(borrow(name)) for name in ["a", "b", "c"]]
+        await asyncio.sleep(0)
+
         for conn in connections:
-            conn.use_count = 1
+            await pool_manager.return_connection(conn)
+        await asyncio.gather(*waiters)
+
+        assert served == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_get_connection_server_limit(self, pool_manager):
+        """Test per-server connection limits"""
+        pool_manager.set_server_limit("small_server", 1)
+
+        first = await pool_manager.get_connection("small_server")
+        second = await pool_manager.get_connection("small_server", timeout=0.01)
+
+        assert first is not None
+        assert second is None
+        assert pool_manager.get_max_connections("small_server") == 1
+        assert pool_manager.get_max_connections("test_server") == 3
+
+    @pytest.mark.asyncio
+    async def test_get_connection_opens_with_connect(self, pool_manager):
+        """Test new connections are opened with the connect callable and reused"""
+        session = AsyncMock()
+        connect = AsyncMock(return_value=session)
+
+        connection = await pool_manager.get_connection("test_server", connect=connect)
+        await pool_manager.return_connection(connection)
+        reused = await pool_manager.get_connection("test_server", connect=connect)
+
+        assert reused is connection
+        assert reused.connection_object is session
+        connect.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_connection_connect_failure(self, pool_manager):
+        """Test a failed connect frees the reserved slot"""
+        connect = AsyncMock(side_effect=ConnectionError("refused"))
+
+        with pytest.raises(ConnectionError):
+            await pool_manager.get_connection("test_server", connect=connect)
+
+        assert len(pool_manager.pools["test_server"]) == 0
+        assert pool_manager.stats["test_server"].total_connections == 0
+
+    @pytest.mark.asyncio
+    async def test_liveness_probe_before_reuse(self, pool_manager):
+        """Test a connection idle past the probe interval is replaced if its probe fails"""
+        dead_session = AsyncMock()
+        dead_session.ping.side_effect = ConnectionError("session dropped")
+        new_session = AsyncMock()
+        connect = AsyncMock(side_effect=[dead_session, new_session])
+
+        connection = await pool_manager.get_connection("test_server", connect=connect)
+        await pool_manager.return_connection(connection)
+        connection.last_used = datetime.now() - timedelta(seconds=45)
+
+        replacement = await pool_manager.get_connection("test_server", connect=connect)
+
+        assert replacement.connection_object is new_session
+        dead_session.ping.assert_called_once()
+        dead_session.close.assert_called_once()
+        assert pool_manager.stats["test_server"].failed_probes == 1
+        assert len(pool_manager.pools["test_server"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_recently_used_connection_not_probed(self, pool_manager):
+        """Test a connection used within the probe interval is reused without a probe"""
+        session = AsyncMock()
+        connection = await pool_manager.get_connection(
+            "test_server", connect=AsyncMock(return_value=session)
+        )
+        await pool_manager.return_connection(connection)
+
+        await pool_manager.get_connection("test_server")
+
+        session.ping.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_expired_connection_not_reused(self, pool_manager):
+        """Test a connection idle past max_idle_time is closed instead of reused"""
+        old_session = AsyncMock()
+        new_session = AsyncMock()
+        connect = AsyncMock(side_effect=[old_session, new_session])
 
-        # Get connections and verify round-robin
-        selected_connections = []
-        for i in range(6):  # Get more connections than pool size
+        connection = await pool_manager.get_connection("test_server", connect=connect)
+        await pool_manager.return_connection(connection)
+        connection.last_used = datetime.now() - timedelta(seconds=120)
+
+        replacement = await pool_manager.get_connection("test_server", connect=connect)
+
+        assert replacement.connection_object is new_session
+        old_session.ping.assert_not_called()
+        old_session.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_return_connection_discard_hands_slot_to_waiter(
+        self, pool_manager, mock_connection_object
+    ):
+        """Test discarding a connection lets a waiting borrower open a new one"""
+        connections = []
+        for i in range(3):
             conn = await pool_manager.get_connection("test_server")
-            selected_connections.append(conn)
+            conn.connection_object = mock_connection_object
+            connections.append(conn)
 
-        # Each connection should be selected twice (6 requests / 3 connections = 2)
-        use_counts = [conn.use_count for conn in connections]
-        assert all(count == 3 for count in use_counts)  # 1 initial + 2 from round-robin
+        new_session = AsyncMock()
+        waiter = asyncio.create_task(
+            pool_manager.get_connection(
+                "test_server", connect=AsyncMock(return_value=new_session)
+            )
+        )
+        await asyncio.sleep(0)
+        await pool_manager.return_connection(
+            connections[0], success=False, discard=True
+        )
+        connection = await waiter
+
+        assert connection not in connections
+        assert connection.connection_object is new_session
+        assert connections[0] not in pool_manager.pools["test_server"]
+        assert len(pool_manager.pools["test_server"]) == 3
+        mock_connection_object.close.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_return_connection_success(self, pool_manager):
@@ -218,6 +356,7 @@ class TestConnectionPoolManager:
         # Create connection and make it idle
         connection = await pool_manager.get_connection("test_server")
         connection.connection_object = mock_connection_object
+        await pool_manager.return_connection(connection)
         connection.last_used = datetime.now() - timedelta(seconds=120)  # 2 minutes ago
 
         initial_count = len(pool_manager.pools["test_server"])
@@ -228,6 +367,20 @@ class TestConnectionPoolManager:
         assert len(pool_manager.pools["test_server"]) == initial_count - 1
         mock_connection_object.close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_cleanup_skips_borrowed_connections(
+        self, pool_manager, mock_connection_object
+    ):
+        """Test cleanup leaves borrowed connections alone"""
+        connection = await pool_manager.get_connection("test_server")
+        connection.connection_object = mock_connection_object
+        connection.last_used = datetime.now() - timedelta(seconds=120)
+
+        await pool_manager.cleanup_idle_connections()
+
+        assert connection in pool_manager.pools["test_server"]
+        mock_connection_object.close.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_cleanup_inactive_connections(
         self, pool_manager, mock_connection_object
@@ -236,6 +389,7 @@ class TestConnectionPoolManager:
         # Create inactive connection
         connection = await pool_manager.get_connection("test_server")
         connection.connection_object = mock_connection_object
+        await pool_manager.return_connection(connection)
         connection.is_active = False
 
         initial_count = len(pool_manager.pools["test_server"])
@@ -303,13 +457,33 @@ class TestConnectionPoolManager:
         # All pools should be empty
         assert len(pool_manager.pools) == 0
         assert len(pool_manager.stats) == 0
-        assert len(pool_manager.round_robin_counters) == 0
+        assert len(pool_manager.waiters) == 0
 
         # Cleanup task should be cancelled
         assert (
             pool_manager._cleanup_task.cancelled() or pool_manager._cleanup_task.done()
         )
 
+    @pytest.mark.asyncio
+    async def test_close_all_with_waiting_borrower(
+        self, pool_manager, mock_connection_object
+    ):
+        """Test a borrower waiting on a closed pool gets None and opens no session"""
+        for i in range(3):
+            conn = await pool_manager.get_connection("test_server")
+            conn.connection_object = mock_connection_object
+
+        connect = AsyncMock()
+        waiter = asyncio.create_task(
+            pool_manager.get_connection("test_server", connect=connect)
+        )
+        await asyncio.sleep(0)
+        await pool_manager.close_all()
+
+        assert await waiter is None
+        connect.assert_not_called()
+        assert len(pool_manager.pools) == 0
+
     def test_set_connection_object(self, pool_manager):
         """Test setting connection object"""
         connection = ConnectionInfo(
@@ -368,6 +542,7 @@ class TestConnectionInfo:
         assert conn.use_count == 0
         assert conn.error_count == 0
         assert conn.connection_object is None
+        assert conn.in_use is False
 
 
 class TestPoolStats:
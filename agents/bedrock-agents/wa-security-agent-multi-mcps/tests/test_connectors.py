@@ -19,11 +19,15 @@
 Unit tests for MCP Connectors
 """
 
+import asyncio
 import os
 import sys
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, INVALID_PARAMS, ErrorData
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
@@ -505,5 +509,149 @@ class TestAPIMCPConnector:
         assert len(api_connector.available_tools) == 0
 
 
+class TestPooledMCPSessions:
+    """Test cases for connectors borrowing pooled MCP sessions"""
+
+    @pytest.fixture
+    def security_config(self):
+        """Create security MCP server config with a small session limit"""
+        return MCPServerConfig(
+            name="security",
+            server_type=MCPServerType.SECURITY,
+            connection_type="agentcore",
+            timeout=120,
+            retry_attempts=1,
+            max_connections=2,
+        )
+
+    @pytest.fixture
+    def connection_pool(self):
+        """Create connection pool manager"""
+        return ConnectionPoolManager()
+
+    @pytest.fixture
+    def security_connector(self, security_config, connection_pool):
+        """Create an initialized security MCP connector with fake sessions"""
+        connector = SecurityMCPConnector(security_config, "us-east-1", connection_pool)
+        connector.is_initialized = True
+        connector.mcp_url = "https://test.com"
+        connector.mcp_headers = {"Content-Type": "application/json"}
+        connector.opened_sessions = []
+
+        async def open_session():
+            await asyncio.sleep(0.01)
+            pooled = Mock()
+            pooled.session = AsyncMock()
+            pooled.session.call_tool.return_value = Mock(content=[Mock(text="ok")])
+            pooled.close = AsyncMock()
+            connector.opened_sessions.append(pooled)
+            return pooled
+
+        connector._open_session = open_session
+        return connector
+
+    def test_server_limit_from_config(self, security_connector, connection_pool):
+        """Test the connector sets its server's session limit"""
+        assert connection_pool.get_max_connections("security") == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_sessions(
+        self, security_connector, connection_pool
+    ):
+        """Test concurrent tool calls share at most max_connections sessions"""
+        results = await asyncio.gather(
+            *[
+                security_connector.call_tool("CheckSecurityServices", {})
+                for _ in range(6)
+            ]
+        )
+
+        assert all(result.success for result in results)
+        assert len(security_connector.opened_sessions) == 2
+        calls = [
+            pooled.session.call_tool.await_count
+            for pooled in security_connector.opened_sessions
+        ]
+        assert sum(calls) == 6
+
+        # Later calls reuse the warm sessions
+        await security_connector.call_tool("CheckSecurityServices", {})
+        assert len(security_connector.opened_sessions) == 2
+        assert connection_pool.stats["security"].successful_requests == 7
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            McpError(ErrorData(code=CONNECTION_CLOSED, message="Connection closed")),
+            McpError(ErrorData(code=32600, message="Session terminated")),
+            McpError(ErrorData(code=408, message="Timed out while waiting")),
+            httpx.ConnectError("Connection refused"),
+        ],
+    )
+    async def test_transport_error_discards_session(
+        self, security_connector, connection_pool, error
+    ):
+        """Test a session whose transport failed is closed instead of reused"""
+        await security_connector.call_tool("CheckSecurityServices", {})
+        broken = security_connector.opened_sessions[0]
+        broken.session.call_tool.side_effect = error
+
+        result = await security_connector.call_tool("CheckSecurityServices", {})
+        assert result.success is False
+        broken.close.assert_called_once()
+
+        result = await security_connector.call_tool("CheckSecurityServices", {})
+        assert result.success is True
+        assert len(security_connector.opened_sessions) == 2
+
+    @pytest.mark.asyncio
+    async def test_request_error_keeps_session(
+        self, security_connector, connection_pool
+    ):
+        """Test a JSON-RPC error from the server leaves the session in the pool"""
+        await security_connector.call_tool("CheckSecurityServices", {})
+        session = security_connector.opened_sessions[0]
+        session.session.call_tool.side_effect = McpError(
+            ErrorData(code=INVALID_PARAMS, message="Invalid arguments")
+        )
+
+        result = await security_connector.call_tool("CheckSecurityServices", {})
+        assert result.success is False
+        session.session.call_tool.side_effect = None
+
+        result = await security_connector.call_tool("CheckSecurityServices", {})
+        assert result.success is True
+        session.close.assert_not_called()
+        assert len(security_connector.opened_sessions) == 1
+
+    @pytest.mark.asyncio
+    async def test_caller_error_keeps_session(
+        self, security_connector, connection_pool
+    ):
+        """Test an error raised by the borrower's own code doesn't discard the session"""
+        with pytest.raises(ValueError):
+            async with security_connector._borrow_session():
+                raise ValueError("Unexpected tool result")
+
+        async with security_connector._borrow_session():
+            pass
+
+        assert len(security_connector.opened_sessions) == 1
+        security_connector.opened_sessions[0].close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_pooled_sessions(
+        self, security_connector, connection_pool
+    ):
+        """Test closing the connector closes its pooled sessions"""
+        await security_connector.call_tool("CheckSecurityServices", {})
+
+        await security_connector.close()
+
+        security_connector.opened_sessions[0].close.assert_called_once()
+        assert connection_pool.pools["security"] == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,252 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Unit tests for Dependency-Aware Tool Call Planning
+Tests plan validation, concurrent execution of independent calls, dependency
+ordering and handling of failed dependencies
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent_config.interfaces import ToolCall, ToolResult
+from agent_config.orchestration.dag_planner import DAGExecutor, ToolCallPlan
+from agent_config.orchestration.parallel_executor import ParallelExecutionEngine
+
+
+def make_engine(durations, events, failing=()):
+    """Create an engine whose executor sleeps for each tool's duration"""
+    engine = ParallelExecutionEngine(max_concurrent_requests=10)
+
+    async def executor(tool_call):
+        events.append(("start", tool_call.tool_name))
+        await asyncio.sleep(durations.get(tool_call.tool_name, 0.0))
+        events.append(("end", tool_call.tool_name))
+        if tool_call.tool_name in failing:
+            raise Exception(f"{tool_call.tool_name} failed")
+        return ToolResult(
+            tool_name=tool_call.tool_name,
+            mcp_server=tool_call.mcp_server,
+            success=True,
+            data={"arguments": tool_call.arguments},
+        )
+
+    engine.set_executor_function(executor)
+    return engine
+
+
+class TestToolCallPlan:
+    """Test tool call plan construction"""
+
+    def test_plan_rejects_unknown_and_duplicate_calls(self):
+        """Test dependencies must already be in the plan and IDs must be unique"""
+        plan = ToolCallPlan()
+        plan.add("status", ToolCall("CheckSecurityServices", "security", {}))
+
+        with pytest.raises(ValueError):
+            plan.add(
+                "findings", ToolCall("GetSecurityFindings", "security", {}), ["docs"]
+            )
+        with pytest.raises(ValueError):
+            plan.add("status", ToolCall("CheckSecurityServices", "security", {}))
+
+    def test_plan_critical_path(self):
+        """Test the critical path is the longest dependency chain"""
+        plan = ToolCallPlan()
+        plan.add("status", ToolCall("CheckSecurityServices", "security", {}))
+        plan.add("docs", ToolCall("search_documentation", "aws_knowledge", {}))
+        plan.add(
+            "findings", ToolCall("GetSecurityFindings", "security", {}), ["status"]
+        )
+
+        durations = {"status": 0.2, "docs": 0.3, "findings": 0.2}
+        assert plan.critical_path(durations) == pytest.approx(0.4)
+        assert plan.dependents() == {"status": ["findings"]}
+
+
+class TestDAGExecutor:
+    """Test execution of tool call plans"""
+
+    @pytest.mark.asyncio
+    async def test_independent_calls_run_concurrently(self):
+        """Test end-to-end latency approaches the critical path"""
+        durations = {
+            "CheckSecurityServices": 0.2,
+            "search_documentation": 0.3,
+            "GetSecurityFindings": 0.2,
+        }
+        events = []
+        engine = make_engine(durations, events)
+
+        plan = ToolCallPlan()
+        plan.add("status", ToolCall("CheckSecurityServices", "security", {}))
+        plan.add("docs", ToolCall("search_documentation", "aws_knowledge", {}))
+        plan.add(
+            "findings", ToolCall("GetSecurityFindings", "security", {}), ["status"]
+        )
+
+        start_time = time.perf_counter()
+        results = await DAGExecutor(engine).execute(plan)
+        elapsed = time.perf_counter() - start_time
+
+        assert all(result.success for result in results.values())
+        # Critical path is 0.4 s (status -> findings); sequential execution takes 0.7 s
+        assert elapsed < 0.55
+        assert events.index(("end", "CheckSecurityServices")) < events.index(
+            ("start", "GetSecurityFindings")
+        )
+        assert events.index(("start", "search_documentation")) < events.index(
+            ("end", "CheckSecurityServices")
+        )
+
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_results_are_yielded_as_calls_complete(self):
+        """Test the first result arrives after the fastest call, not the slowest"""
+        durations = {"CheckStorageEncryption": 0.3, "search_documentation": 0.05}
+        engine = make_engine(durations, [])
+
+        plan = ToolCallPlan()
+        plan.add("storage", ToolCall("CheckStorageEncryption", "security", {}))
+        plan.add("docs", ToolCall("search_documentation", "aws_knowledge", {}))
+
+        start_time = time.perf_counter()
+        arrivals = []
+        async for call_id, result in DAGExecutor(engine).iter_results(plan):
+            arrivals.append((call_id, time.perf_counter() - start_time))
+
+        assert [call_id for call_id, _ in arrivals] == ["docs", "storage"]
+        assert arrivals[0][1] < 0.2
+
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_prepare_receives_dependency_results(self):
+        """Test a dependent call is built from the results of its dependencies"""
+        engine = make_engine({}, [])
+
+        def prepare(tool_call, inputs):
+            status = inputs["status"].data["arguments"]["region"]
+            return ToolCall(
+                tool_call.tool_name, tool_call.mcp_server, {"region": status}
+            )
+
+        plan = ToolCallPlan()
+        plan.add(
+            "status",
+            ToolCall("CheckSecurityServices", "security", {"region": "eu-west-1"}),
+        )
+        plan.add(
+            "findings",
+            ToolCall("GetSecurityFindings", "security", {}),
+            ["status"],
+            prepare=prepare,
+        )
+
+        results = await DAGExecutor(engine).execute(plan)
+
+        assert results["findings"].data["arguments"] == {"region": "eu-west-1"}
+
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_dependency_skips_dependents(self):
+        """Test calls depending on a failed call are not executed"""
+        events = []
+        engine = make_engine({}, events, failing={"CheckSecurityServices"})
+
+        plan = ToolCallPlan()
+        plan.add("status", ToolCall("CheckSecurityServices", "security", {}))
+        plan.add(
+            "findings", ToolCall("GetSecurityFindings", "security", {}), ["status"]
+        )
+        plan.add("summary", ToolCall("Summarize", "security", {}), ["findings"])
+        plan.add("docs", ToolCall("search_documentation", "aws_knowledge", {}))
+
+        results = await DAGExecutor(engine).execute(plan)
+
+        assert results["status"].success is False
+        assert results["findings"].success is False
+        assert "dependency status failed" in results["findings"].error_message
+        assert results["summary"].success is False
+        assert results["docs"].success is True
+        assert ("start", "GetSecurityFindings") not in events
+
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_call_does_not_skip_calls_ordered_after_it(self):
+        """Test calls only ordered after a failed call still run once it finishes"""
+        events = []
+        engine = make_engine(
+            {"CheckSecurityServices": 0.1}, events, failing={"CheckSecurityServices"}
+        )
+
+        plan = ToolCallPlan()
+        plan.add("status", ToolCall("CheckSecurityServices", "security", {}))
+        plan.add(
+            "findings",
+            ToolCall("GetSecurityFindings", "security", {}),
+            after=["status"],
+        )
+
+        results = await DAGExecutor(engine).execute(plan)
+
+        assert results["status"].success is False
+        assert results["findings"].success is True
+        assert events.index(("end", "CheckSecurityServices")) < events.index(
+            ("start", "GetSecurityFindings")
+        )
+
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_stopping_early_cancels_running_calls(self):
+        """Test calls still running are cancelled, not failed, when iteration stops"""
+        durations = {"CheckStorageEncryption": 0.3, "search_documentation": 0.01}
+        events = []
+        engine = make_engine(durations, events)
+
+        plan = ToolCallPlan()
+        plan.add("storage", ToolCall("CheckStorageEncryption", "security", {}))
+        plan.add("docs", ToolCall("search_documentation", "aws_knowledge", {}))
+
+        plan_results = DAGExecutor(engine).iter_results(plan)
+        call_id, result = await plan_results.__anext__()
+        await plan_results.aclose()
+        await asyncio.sleep(0.05)
+
+        assert call_id == "docs"
+        assert ("start", "CheckStorageEncryption") in events
+        assert ("end", "CheckStorageEncryption") not in events
+        assert engine.failed_requests == 0
+        assert engine.circuit_breakers["security"].failure_count == 0
+        assert engine.active_requests == 0
+
+        await engine.stop()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -243,6 +243,24 @@ class TestRequestQueue:
         result = await queue.dequeue()
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_queue_dequeue_wait_wakes_on_enqueue(self):
+        """Test a waiting dequeue returns as soon as a request is enqueued"""
+        queue = RequestQueue()
+        waiter = asyncio.create_task(queue.dequeue(wait=True))
+
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        tool_call = ToolCall("test", "server", {})
+        start_time = time.perf_counter()
+        await queue.enqueue(QueuedRequest(tool_call, asyncio.Future()))
+        request = await asyncio.wait_for(waiter, timeout=1.0)
+
+        assert request.tool_call.tool_name == "test"
+        assert time.perf_counter() - start_time < 0.05
+        assert queue.total_size == 0
+
     @pytest.mark.asyncio
     async def test_queue_stats(self):
         """Test queue statistics"""
@@ -554,6 +572,37 @@ class TestParallelExecutionEngine:
 
         await engine.stop()
 
+    @pytest.mark.asyncio
+    async def test_engine_queue_wait_without_polling(self):
+        """Test idle engines dispatch new requests without a polling delay"""
+        engine = ParallelExecutionEngine()
+
+        async def mock_executor(tool_call):
+            return ToolResult(
+                tool_name=tool_call.tool_name,
+                mcp_server=tool_call.mcp_server,
+                success=True,
+                data={"result": "success"},
+            )
+
+        engine.set_executor_function(mock_executor)
+        await engine.start()
+
+        # Let the processor go idle before each burst
+        for i in range(5):
+            await asyncio.sleep(0.02)
+            await engine.execute_parallel_calls(
+                [ToolCall(f"tool_{i}", "server", {}, ToolPriority.NORMAL, 10)]
+            )
+
+        stats = await engine.get_execution_stats()
+        assert stats["queue_wait_seconds"]["samples"] == 5
+        assert stats["queue_wait_seconds"]["p99"] < 0.05
+
+        start_time = time.perf_counter()
+        await engine.stop()
+        assert time.perf_counter() - start_time < 0.5
+
     @pytest.mark.asyncio
     async def test_engine_priority_handling(self):
         """Test priority-based execution"""
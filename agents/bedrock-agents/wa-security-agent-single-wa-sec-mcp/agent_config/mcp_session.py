@@ -0,0 +1,245 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Persistent MCP session for the Well-Architected Security Agent
+Keeps one streamable-HTTP session open so tool calls skip the TLS, HTTP and MCP handshakes
+"""
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+import anyio
+import httpx
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+
+logger = logging.getLogger(__name__)
+
+# Errors raised when the transport of a session is gone
+TRANSPORT_ERRORS = (
+    ConnectionError,
+    httpx.TransportError,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+)
+
+# Error the streamable HTTP client returns when the server no longer knows the session
+SESSION_TERMINATED_MESSAGE = "Session terminated"
+
+
+class PersistentMCPSession:
+    """
+    Long-lived MCP client session shared by every tool call of the agent.
+
+    The streamable-HTTP transport and the ClientSession are opened by a background task
+    that holds them until the session is closed, because their contexts must be entered
+    and exited by the same task. Concurrent tool calls are multiplexed over the session by
+    their JSON-RPC request IDs. A session that was idle for longer than ``ping_interval``
+    is pinged before it is reused, and a session the AgentCore runtime dropped is replaced
+    and the request retried once. Any other error, such as a JSON-RPC error or the read
+    timeout of one slow call, is raised to its caller and leaves the session to the other
+    calls.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        timeout: timedelta = timedelta(seconds=120),
+        ping_interval: float = 30.0,
+    ):
+        self.url = url
+        self.headers = headers
+        self.timeout = timeout
+        self.ping_interval = ping_interval
+
+        self._session: Optional[ClientSession] = None
+        self._owner_task: Optional[asyncio.Task] = None
+        self._closing: Optional[asyncio.Event] = None
+        self._connect_lock = asyncio.Lock()
+        self._last_used = 0.0
+
+        self.metrics = {
+            "handshakes": 0,
+            "handshake_seconds": 0.0,
+            "calls": 0,
+            "call_seconds": 0.0,
+            "failed_calls": 0,
+            "reconnects": 0,
+            "failed_pings": 0,
+        }
+
+    @property
+    def connected(self) -> bool:
+        """Whether a session is open and its transport is still running"""
+        return (
+            self._session is not None
+            and self._owner_task is not None
+            and not self._owner_task.done()
+        )
+
+    async def _hold_session(
+        self, ready: asyncio.Future, closing: asyncio.Event
+    ) -> None:
+        """Open the transport and session, then keep them open until closing is set"""
+        try:
+            async with streamablehttp_client(
+                self.url, self.headers, timeout=self.timeout
+            ) as (read_stream, write_stream, _):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    if not ready.done():
+                        ready.set_result(session)
+                    await closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"MCP session transport closed: {e}")
+        finally:
+            if not ready.done():
+                ready.set_exception(
+                    ConnectionError("MCP session closed before it was initialized")
+                )
+
+    async def _connect(self) -> ClientSession:
+        """Open a new session, recording the time taken by the handshakes"""
+        start = time.perf_counter()
+        ready = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._owner_task = asyncio.create_task(self._hold_session(ready, self._closing))
+        self._session = await ready
+
+        self.metrics["handshakes"] += 1
+        self.metrics["handshake_seconds"] += time.perf_counter() - start
+        self._last_used = time.monotonic()
+        logger.info("MCP session established")
+        return self._session
+
+    async def _disconnect(self) -> None:
+        """Close the current session, if any, and wait for its transport to shut down"""
+        owner_task = self._owner_task
+        self._session = None
+        self._owner_task = None
+        if owner_task is None:
+            return
+
+        self._closing.set()
+        try:
+            await asyncio.wait_for(owner_task, timeout=5)
+        except asyncio.TimeoutError:
+            owner_task.cancel()
+        except Exception as e:
+            logger.debug(f"Error while closing MCP session: {e}")
+
+    async def _get_session(self) -> ClientSession:
+        """Get the open session, opening a new one if it is missing, dead or unresponsive"""
+        async with self._connect_lock:
+            if self.connected:
+                if time.monotonic() - self._last_used < self.ping_interval:
+                    return self._session
+                try:
+                    await self._session.send_ping()
+                    self._last_used = time.monotonic()
+                    return self._session
+                except Exception as e:
+                    self.metrics["failed_pings"] += 1
+                    logger.info(f"MCP session failed its health check: {e}")
+
+            if self._owner_task is not None:
+                self.metrics["reconnects"] += 1
+                await self._disconnect()
+            return await self._connect()
+
+    def _is_connection_error(self, error: Exception) -> bool:
+        """Whether a request failed because the session or its transport is gone"""
+        if not self.connected:
+            return True
+        if isinstance(error, McpError):
+            return (
+                error.error.code == CONNECTION_CLOSED
+                or error.error.message == SESSION_TERMINATED_MESSAGE
+            )
+        return isinstance(error, TRANSPORT_ERRORS)
+
+    async def _invalidate(self, session: ClientSession) -> None:
+        """Drop a session after a failed request, unless another call already replaced it"""
+        async with self._connect_lock:
+            if self._session is session:
+                await self._disconnect()
+
+    async def _request(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Send a request over the session, reconnecting and retrying once if it was dropped"""
+        for attempt in range(2):
+            session = await self._get_session()
+            start = time.perf_counter()
+            try:
+                result = await getattr(session, method)(*args, **kwargs)
+            except Exception as e:
+                self.metrics["failed_calls"] += 1
+                if not self._is_connection_error(e):
+                    raise
+                await self._invalidate(session)
+                if attempt:
+                    raise
+                logger.info(f"MCP {method} failed, reconnecting: {e}")
+                self.metrics["reconnects"] += 1
+                continue
+
+            self.metrics["calls"] += 1
+            self.metrics["call_seconds"] += time.perf_counter() - start
+            self._last_used = time.monotonic()
+            return result
+
+    async def list_tools(self) -> Any:
+        """List the tools of the MCP server"""
+        return await self._request("list_tools")
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        """Call a tool of the MCP server"""
+        return await self._request("call_tool", name=name, arguments=arguments)
+
+    async def ping(self) -> None:
+        """Check that the MCP server answers, opening a session if needed"""
+        await self._request("send_ping")
+
+    async def close(self) -> None:
+        """Close the session"""
+        async with self._connect_lock:
+            await self._disconnect()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get handshake and call counts and timings of the session"""
+        metrics = dict(self.metrics)
+        metrics["connected"] = self.connected
+        metrics["avg_handshake_ms"] = (
+            1000 * metrics["handshake_seconds"] / metrics["handshakes"]
+            if metrics["handshakes"]
+            else 0.0
+        )
+        metrics["avg_call_ms"] = (
+            1000 * metrics["call_seconds"] / metrics["calls"]
+            if metrics["calls"]
+            else 0.0
+        )
+        return metrics
@@ -23,15 +23,13 @@ Includes comprehensive response transformation for human readability
 import asyncio
 import json
 import logging
-from datetime import timedelta
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
 import boto3
 from bedrock_agentcore.agent import Agent
 from bedrock_agentcore.memory import MemoryHook
-from mcp import ClientSession
-from mcp.client.streamable_http import streamablehttp_client
 
+from .mcp_session import PersistentMCPSession
 from .response_transformer import SecurityResponseTransformer
 
 logger = logging.getLogger(__name__)
@@ -106,6 +104,11 @@ class SecurityAgent(Agent):
                 "Content-Type": "application/json",
             }
 
+            # Open one session that every tool call reuses
+            if self.mcp_session:
+                await self.mcp_session.close()
+            self.mcp_session = PersistentMCPSession(self.mcp_url, self.mcp_headers)
+
             # Test connection and get available tools
             await self._discover_mcp_tools()
 
@@ -120,22 +123,17 @@ class SecurityAgent(Agent):
     async def _discover_mcp_tools(self):
         """Discover available MCP tools"""
         try:
-            async with streamablehttp_client(
-                self.mcp_url, self.mcp_headers, timeout=timedelta(seconds=60)
-            ) as (read_stream, write_stream, _):
-                async with ClientSession(read_stream, write_stream) as session:
-                    await session.initialize()
-                    tool_result = await session.list_tools()
-                    self.mcp_tools = [
-                        {
-                            "name": tool.name,
-                            "description": tool.description,
-                            "parameters": tool.inputSchema.get("properties", {})
-                            if hasattr(tool, "inputSchema") and tool.inputSchema
-                            else {},
-                        }
-                        for tool in tool_result.tools
-                    ]
+            tool_result = await self.mcp_session.list_tools()
+            self.mcp_tools = [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": tool.inputSchema.get("properties", {})
+                    if hasattr(tool, "inputSchema") and tool.inputSchema
+                    else {},
+                }
+                for tool in tool_result.tools
+            ]
         except Exception as e:
             logger.error(f"Failed to discover MCP tools: {e}")
             self.mcp_tools = []
@@ -147,38 +145,36 @@ class SecurityAgent(Agent):
         try:
             logger.info(f"Calling MCP tool: {tool_name} with args: {arguments}")
 
-            async with streamablehttp_client(
-                self.mcp_url, self.mcp_headers, timeout=timedelta(seconds=120)
-            ) as (read_stream, write_stream, _):
-                async with ClientSession(read_stream, write_stream) as session:
-                    await session.initialize()
-                    result = await session.call_tool(
-                        name=tool_name, arguments=arguments
-                    )
-                    raw_response = result.content[0].text
-
-                    logger.info(f"Raw MCP response received for {tool_name}")
-
-                    # Transform the response for human readability
-                    transformed_response = self.response_transformer.transform_response(
-                        tool_name=tool_name,
-                        raw_response=raw_response,
-                        user_query=user_query,
-                    )
-
-                    # Store response for session analysis
-                    self.session_responses.append(
-                        {
-                            "tool_name": tool_name,
-                            "arguments": arguments,
-                            "raw_response": raw_response,
-                            "transformed_response": transformed_response,
-                            "timestamp": asyncio.get_event_loop().time(),
-                        }
-                    )
+            if not self.mcp_session:
+                raise RuntimeError("MCP connection is not initialized")
+
+            result = await self.mcp_session.call_tool(
+                name=tool_name, arguments=arguments
+            )
+            raw_response = result.content[0].text
+
+            logger.info(f"Raw MCP response received for {tool_name}")
+
+            # Transform the response for human readability
+            transformed_response = self.response_transformer.transform_response(
+                tool_name=tool_name,
+                raw_response=raw_response,
+                user_query=user_query,
+            )
+
+            # Store response for session analysis
+            self.session_responses.append(
+                {
+                    "tool_name": tool_name,
+                    "arguments": arguments,
+                    "raw_response": raw_response,
+                    "transformed_response": transformed_response,
+                    "timestamp": asyncio.get_event_loop().time(),
+                }
+            )
 
-                    logger.info(f"Response transformed for {tool_name}")
-                    return transformed_response
+            logger.info(f"Response transformed for {tool_name}")
+            return transformed_response
 
         except Exception as e:
             logger.error(f"Failed to call MCP tool {tool_name}: {e}")
@@ -594,9 +590,9 @@ Use clear formatting with emojis and structured sections for better readability.
 
         try:
             # Test MCP connection
-            if self.mcp_url and self.mcp_headers:
-                # Try to list tools as a connectivity test
-                await self._discover_mcp_tools()
+            if self.mcp_session:
+                # Ping over the shared session, reconnecting if it was dropped
+                await self.mcp_session.ping()
                 health_status["mcp_connection"] = "healthy"
             else:
                 health_status["mcp_connection"] = "not_initialized"
@@ -604,4 +600,13 @@ Use clear formatting with emojis and structured sections for better readability.
             health_status["mcp_connection"] = f"error: {str(e)}"
             health_status["agent_status"] = "degraded"
 
+        if self.mcp_session:
+            health_status["mcp_session"] = self.mcp_session.get_metrics()
+
         return health_status
+
+    async def close(self):
+        """Close the MCP session"""
+        if self.mcp_session:
+            await self.mcp_session.close()
+            self.mcp_session = None
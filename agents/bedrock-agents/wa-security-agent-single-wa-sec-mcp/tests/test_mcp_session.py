@@ -0,0 +1,212 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Unit tests for the persistent MCP session
+"""
+
+import asyncio
+import os
+import sys
+from contextlib import asynccontextmanager
+
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from agent_config import mcp_session
+from agent_config.mcp_session import PersistentMCPSession
+
+
+class FakeServer:
+    """Stands in for the MCP server: counts handshakes and answers tool calls"""
+
+    def __init__(self):
+        self.handshakes = 0
+        self.calls = []
+        self.pings = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.call_delay = 0.01
+        # Errors raised by the next tool calls, in order
+        self.errors = []
+
+    @asynccontextmanager
+    async def client(self, url, headers, timeout):
+        yield None, None, None
+
+    def session_class(self):
+        server = self
+
+        class FakeClientSession:
+            def __init__(self, read_stream, write_stream):
+                self.handshake = None
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+            async def initialize(self):
+                server.handshakes += 1
+                self.handshake = server.handshakes
+
+            async def send_ping(self):
+                server.pings += 1
+
+            async def list_tools(self):
+                return ["CheckSecurityServices"]
+
+            async def call_tool(self, name, arguments):
+                server.calls.append((self.handshake, name))
+                server.in_flight += 1
+                server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    await asyncio.sleep(server.call_delay)
+                    if server.errors:
+                        raise server.errors.pop(0)
+                    return f"{name}:{arguments.get('id')}"
+                finally:
+                    server.in_flight -= 1
+
+        return FakeClientSession
+
+
+class TestPersistentMCPSession:
+    """Test cases for PersistentMCPSession"""
+
+    @pytest.fixture
+    def server(self, monkeypatch):
+        """Replace the streamable HTTP transport and ClientSession with a fake server"""
+        server = FakeServer()
+        monkeypatch.setattr(mcp_session, "streamablehttp_client", server.client)
+        monkeypatch.setattr(mcp_session, "ClientSession", server.session_class())
+        return server
+
+    @pytest.fixture
+    def session(self, server):
+        """Create a persistent session to the fake server"""
+        return PersistentMCPSession("https://test.com/mcp", {})
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_session(self, server, session):
+        """Test concurrent tool calls are multiplexed over one handshake"""
+        results = await asyncio.gather(
+            *[session.call_tool("CheckSecurityServices", {"id": i}) for i in range(10)]
+        )
+
+        assert results == [f"CheckSecurityServices:{i}" for i in range(10)]
+        assert server.handshakes == 1
+        assert server.max_in_flight == 10
+        assert {handshake for handshake, _ in server.calls} == {1}
+
+        await session.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            McpError(ErrorData(code=32600, message="Session terminated")),
+            ConnectionError("connection reset"),
+        ],
+    )
+    async def test_reconnect_after_dropped_session(self, server, session, error):
+        """Test a dropped session is replaced and the call retried once"""
+        await session.call_tool("CheckSecurityServices", {"id": 0})
+        server.errors.append(error)
+
+        result = await session.call_tool("CheckSecurityServices", {"id": 1})
+
+        assert result == "CheckSecurityServices:1"
+        assert server.handshakes == 2
+        assert server.calls[-2:] == [
+            (1, "CheckSecurityServices"),
+            (2, "CheckSecurityServices"),
+        ]
+        assert session.metrics["reconnects"] == 1
+        assert session.metrics["failed_calls"] == 1
+
+        await session.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            McpError(ErrorData(code=-32602, message="Unknown tool: Nope")),
+            McpError(
+                ErrorData(code=408, message="Timed out while waiting for response")
+            ),
+        ],
+    )
+    async def test_no_reconnect_on_request_error(self, server, session, error):
+        """Test a failed request is raised without retrying or closing the session"""
+        server.call_delay = 0.05
+        server.errors.append(error)
+
+        failed, other = await asyncio.gather(
+            session.call_tool("Nope", {"id": 0}),
+            session.call_tool("CheckSecurityServices", {"id": 1}),
+            return_exceptions=True,
+        )
+
+        assert failed is error
+        assert other == "CheckSecurityServices:1"
+        assert len(server.calls) == 2
+        assert server.handshakes == 1
+        assert session.connected
+        assert session.metrics["reconnects"] == 0
+
+        await session.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_session_pinged_before_reuse(self, server, session):
+        """Test a session idle past ping_interval is pinged before it is reused"""
+        session.ping_interval = 0
+        await session.call_tool("CheckSecurityServices", {"id": 0})
+        await session.call_tool("CheckSecurityServices", {"id": 1})
+
+        assert server.pings == 1
+        assert server.handshakes == 1
+
+        await session.close()
+
+    @pytest.mark.asyncio
+    async def test_metrics(self, server, session):
+        """Test handshake and call counts and timings are recorded separately"""
+        await session.list_tools()
+        await session.call_tool("CheckSecurityServices", {"id": 0})
+
+        metrics = session.get_metrics()
+
+        assert metrics["handshakes"] == 1
+        assert metrics["calls"] == 2
+        assert metrics["failed_calls"] == 0
+        assert metrics["connected"] is True
+        assert metrics["call_seconds"] >= server.call_delay
+        assert metrics["handshake_seconds"] > 0
+        assert metrics["avg_call_ms"] == pytest.approx(
+            1000 * metrics["call_seconds"] / 2
+        )
+
+        await session.close()
+        assert session.get_metrics()["connected"] is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -414,7 +414,11 @@ def generate_security_services_policy(config: RemoteRoleConfig) -> Dict[str, Any
                 "securityhub:DescribeHub",
                 "securityhub:GetFindings",
                 "securityhub:GetInsight",
+                "securityhub:GetInsights",
                 "securityhub:GetInsightResults",
+                # Custom insights that GetSecurityFindings counts findings with
+                "securityhub:CreateInsight",
+                "securityhub:UpdateInsight",
                 "securityhub:ListFindings",
                 # Inspector permissions
                 "inspector2:GetStatus",
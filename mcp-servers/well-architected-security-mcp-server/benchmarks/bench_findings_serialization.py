@@ -0,0 +1,199 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Micro-benchmark for datetime conversion of security findings.
+
+Compares the original per-finding recursive copy, which rebuilt every dict and list of a
+finding to convert its datetimes before summarizing it, with summarizing the findings as
+boto3 returns them and converting their datetimes in place once, with ``normalize_datetimes``.
+Uses synthetic payloads of 10,000 GuardDuty and Security Hub findings and reports CPU time and
+peak allocated memory. Run from the server directory:
+
+    python -m benchmarks.bench_findings_serialization
+"""
+
+import argparse
+import copy
+import datetime
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from src.util.security_services import (
+    _summarize_guardduty_findings,
+    _summarize_securityhub_findings,
+)
+from src.util.serialization import normalize_datetimes
+
+SEVERITY_LABELS = ["INFORMATIONAL", "LOW", "MEDIUM", "HIGH", "CRITICAL"]
+
+
+def _timestamp(rng: random.Random) -> datetime.datetime:
+    """Get a random timestamp within the last year."""
+    base = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    return base + datetime.timedelta(seconds=rng.randint(0, 365 * 24 * 3600))
+
+
+def build_guardduty_findings(count: int, seed: int) -> List[Dict[str, Any]]:
+    """Build GuardDuty findings shaped like get_findings results, with nested datetimes."""
+    rng = random.Random(seed)
+    findings = []
+    for index in range(count):
+        findings.append(
+            {
+                "Id": f"gd-{index:08x}",
+                "Type": rng.choice(
+                    [
+                        "Recon:EC2/PortProbeUnprotectedPort",
+                        "UnauthorizedAccess:IAMUser/ConsoleLogin",
+                        "CryptoCurrency:EC2/BitcoinTool.B",
+                    ]
+                ),
+                "Severity": rng.uniform(1, 9),
+                "CreatedAt": _timestamp(rng),
+                "UpdatedAt": _timestamp(rng),
+                "Resource": {
+                    "ResourceType": rng.choice(["Instance", "AccessKey", "S3Bucket"]),
+                    "InstanceDetails": {
+                        "InstanceId": f"i-{index:017x}",
+                        "LaunchTime": _timestamp(rng),
+                        "NetworkInterfaces": [
+                            {"PrivateIpAddress": f"10.0.{index % 256}.{i}"} for i in range(2)
+                        ],
+                        "Tags": [{"Key": "env", "Value": "prod"}],
+                    },
+                },
+                "Service": {
+                    "Count": rng.randint(1, 50),
+                    "EventFirstSeen": _timestamp(rng),
+                    "EventLastSeen": _timestamp(rng),
+                    "Action": {"ActionType": "NETWORK_CONNECTION"},
+                },
+            }
+        )
+    return findings
+
+
+def build_securityhub_findings(count: int, seed: int) -> List[Dict[str, Any]]:
+    """Build Security Hub findings shaped like get_findings results, with nested datetimes."""
+    rng = random.Random(seed)
+    findings = []
+    for index in range(count):
+        findings.append(
+            {
+                "Id": f"arn:aws:securityhub:us-east-1:123456789012:finding/{index:08x}",
+                "Title": "S3 buckets should prohibit public read access",
+                "Severity": {"Label": rng.choice(SEVERITY_LABELS)},
+                "Compliance": {"Status": rng.choice(["PASSED", "FAILED"])},
+                "CreatedAt": _timestamp(rng),
+                "UpdatedAt": _timestamp(rng),
+                "FirstObservedAt": _timestamp(rng),
+                "Resources": [
+                    {
+                        "Type": rng.choice(["AwsS3Bucket", "AwsEc2Instance", "AwsIamRole"]),
+                        "Id": f"resource-{index}",
+                        "Details": {"Other": {"CreatedAt": _timestamp(rng)}},
+                    }
+                ],
+                "Remediation": {"Recommendation": {"Text": "Block public access"}},
+            }
+        )
+    return findings
+
+
+def clean_datetime_objects(obj: Any) -> Any:
+    """Reference implementation: recursively copy a value, converting datetimes to strings."""
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+    elif isinstance(obj, list):
+        return [clean_datetime_objects(item) for item in obj]
+    elif isinstance(obj, dict):
+        return {k: clean_datetime_objects(v) for k, v in obj.items()}
+    else:
+        return obj
+
+
+def copy_then_summarize(findings: List[Dict], summarize: Callable) -> Dict[str, Any]:
+    """Original flow: clean each finding into a copy, then summarize the copies."""
+    processed = [clean_datetime_objects(finding) for finding in findings]
+    return {"findings": processed, "summary": summarize(processed)}
+
+
+def summarize_then_normalize(findings: List[Dict], summarize: Callable) -> Dict[str, Any]:
+    """Current flow: summarize the raw findings, then convert datetimes once in place."""
+    return normalize_datetimes({"findings": findings, "summary": summarize(findings)})
+
+
+def measure(flow: Callable, findings: List[Dict], summarize: Callable) -> tuple:
+    """Run a flow on fresh copies of the findings; return (CPU seconds, peak bytes, result).
+
+    Time and memory are measured in separate runs, as tracing allocations slows the code down.
+    """
+    timed_findings = copy.deepcopy(findings)
+    start = time.process_time()
+    result = flow(timed_findings, summarize)
+    seconds = time.process_time() - start
+
+    traced_findings = copy.deepcopy(findings)
+    tracemalloc.start()
+    flow(traced_findings, summarize)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak, result
+
+
+def main():
+    """Run the benchmark and print timings and peak allocations."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--findings", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    payloads = {
+        "GuardDuty": (
+            build_guardduty_findings(args.findings, args.seed),
+            _summarize_guardduty_findings,
+        ),
+        "Security Hub": (
+            build_securityhub_findings(args.findings, args.seed),
+            _summarize_securityhub_findings,
+        ),
+    }
+    print(f"Dataset: {args.findings} findings per service")
+
+    for service, (findings, summarize) in payloads.items():
+        copy_seconds, copy_peak, expected = measure(copy_then_summarize, findings, summarize)
+        single_seconds, single_peak, actual = measure(
+            summarize_then_normalize, findings, summarize
+        )
+
+        # Both flows must return the same findings and summary
+        assert actual == expected, "in-place conversion disagrees with the recursive copy"
+
+        print(f"{service}:")
+        print(
+            f"  Recursive copy:    {copy_seconds * 1000:10.1f} ms CPU {copy_peak / 2**20:8.1f} MiB peak"
+        )
+        print(
+            f"  In-place, once:    {single_seconds * 1000:10.1f} ms CPU {single_peak / 2**20:8.1f} MiB peak"
+        )
+        print(f"  Speedup:           {copy_seconds / single_seconds:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Micro-benchmark for sensitive-port matching in check_security_groups.
+
+Compares the original per-port range scan with the interval matching used by
+``find_open_sensitive_ports`` over a synthetic dataset of 5,000 security groups with 50,000
+ingress rules. Run from the server directory:
+
+    python -m benchmarks.bench_security_groups
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from src.util.network_security import SENSITIVE_PORTS, find_open_sensitive_ports
+
+
+def build_security_groups(group_count: int, rules_per_group: int, seed: int) -> List[Dict]:
+    """Build synthetic security groups with a mix of narrow, wide and all-port rules."""
+    rng = random.Random(seed)
+    security_groups = []
+
+    for group_index in range(group_count):
+        rules = []
+        for _ in range(rules_per_group):
+            kind = rng.random()
+            if kind < 0.1:
+                from_port, to_port = 0, 65535
+            elif kind < 0.3:
+                from_port = rng.randint(0, 60000)
+                to_port = from_port + rng.randint(100, 5000)
+            else:
+                from_port = to_port = rng.choice([22, 80, 443, 3306, 5432, 8080, 23, 21])
+
+            rule: Dict[str, Any] = {
+                "IpProtocol": "tcp",
+                "FromPort": from_port,
+                "ToPort": to_port,
+                "IpRanges": [{"CidrIp": rng.choice(["0.0.0.0/0", "10.0.0.0/8"])}],
+            }
+            if rng.random() < 0.3:
+                rule["Ipv6Ranges"] = [{"CidrIpv6": "::/0"}]
+            rules.append(rule)
+
+        security_groups.append({"GroupId": f"sg-{group_index:017x}", "IpPermissions": rules})
+
+    return security_groups
+
+
+def range_scan(ip_permissions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reference implementation: scan every port of every rule (IPv4 only)."""
+    open_sensitive_ports = []
+
+    for rule in ip_permissions:
+        from_port = rule.get("FromPort")
+        to_port = rule.get("ToPort")
+        if from_port is None or to_port is None:
+            continue
+
+        for port in range(from_port, to_port + 1):
+            if port in SENSITIVE_PORTS:
+                for ip_range in rule.get("IpRanges", []):
+                    if ip_range.get("CidrIp") == "0.0.0.0/0":
+                        open_sensitive_ports.append(
+                            {"port": port, "service": SENSITIVE_PORTS[port], "cidr": "0.0.0.0/0"}
+                        )
+                        break
+
+    return open_sensitive_ports
+
+
+def time_matcher(matcher, security_groups: List[Dict]) -> tuple:
+    """Run a matcher over all groups and return (seconds, findings per group)."""
+    start = time.perf_counter()
+    findings = [matcher(sg["IpPermissions"]) for sg in security_groups]
+    return time.perf_counter() - start, findings
+
+
+def main():
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=5000)
+    parser.add_argument("--rules-per-group", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    security_groups = build_security_groups(args.groups, args.rules_per_group, args.seed)
+    rule_count = args.groups * args.rules_per_group
+    print(f"Dataset: {args.groups} security groups, {rule_count} ingress rules")
+
+    scan_seconds, scan_findings = time_matcher(range_scan, security_groups)
+    interval_seconds, interval_findings = time_matcher(find_open_sensitive_ports, security_groups)
+
+    # The interval matcher must find the same IPv4 exposures as the range scan
+    for expected, actual in zip(scan_findings, interval_findings, strict=True):
+        ipv4 = [finding for finding in actual if finding["cidr"] == "0.0.0.0/0"]
+        assert ipv4 == expected, "interval matching disagrees with the range scan"
+
+    print(f"Range scan:        {scan_seconds * 1000:10.1f} ms")
+    print(f"Interval matching: {interval_seconds * 1000:10.1f} ms")
+    print(f"Speedup:           {scan_seconds / interval_seconds:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
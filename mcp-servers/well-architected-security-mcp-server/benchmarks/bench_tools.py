@@ -0,0 +1,275 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""End-to-end benchmark of the security tools against synthetic accounts.
+
+Runs CheckStorageEncryption, CheckNetworkSecurity and GetSecurityFindings against accounts of
+100, 1,000 and 10,000 buckets, volumes, security groups and load balancers served by
+``SyntheticAccount``, timing each tool and counting its API calls by operation. Every run
+starts from cold caches. The results are written as a JSON report; with ``--baseline``, tools
+that got slower than an earlier report by more than ``--tolerance`` are listed and the
+command exits with status 1. No request leaves the process. Run from the server directory:
+
+    python -m benchmarks.bench_tools --output bench-report.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from benchmarks.synthetic_account import SyntheticAccount
+from src.server import (
+    check_network_security_tool,
+    check_storage_encryption_tool,
+    get_security_findings,
+)
+from src.util import aws_calls
+from src.util.aws_calls import clear_rate_limiters
+from src.util.credential_utils import clear_session_cache, create_aws_session
+from src.util.network_security import clear_ssl_policy_catalogs
+from src.util.resource_inventory import clear_resource_inventories
+from src.util.s3_posture import clear_bucket_region_cache
+
+REGION = "us-east-1"
+
+# Rate limit used unless --keep-rate-limits is given, high enough to never delay a call
+UNLIMITED_RATE = 1e9
+
+
+class BenchmarkContext:
+    """MCP context that discards log messages and progress notifications."""
+
+    async def info(self, message: str, **kwargs: Any) -> None:
+        pass
+
+    async def debug(self, message: str, **kwargs: Any) -> None:
+        pass
+
+    async def warning(self, message: str, **kwargs: Any) -> None:
+        pass
+
+    async def error(self, message: str, **kwargs: Any) -> None:
+        pass
+
+    async def report_progress(self, progress: float, total: float = None, message: str = None):
+        pass
+
+
+def _tool_calls(ctx: BenchmarkContext) -> Dict[str, Callable[[], Awaitable[Dict]]]:
+    """Get the tool invocations to benchmark, with every argument given explicitly."""
+    return {
+        "CheckStorageEncryption": lambda: check_storage_encryption_tool(
+            ctx,
+            region=REGION,
+            services=["s3", "ebs"],
+            include_unencrypted_only=False,
+            store_in_context=False,
+            page_size=0,
+            since_snapshot=None,
+            output_format="full",
+        ),
+        "CheckNetworkSecurity": lambda: check_network_security_tool(
+            ctx,
+            region=REGION,
+            services=["elb", "vpc"],
+            include_non_compliant_only=False,
+            store_in_context=False,
+            page_size=0,
+            since_snapshot=None,
+            output_format="full",
+        ),
+        "GetSecurityFindings[guardduty]": lambda: get_security_findings(
+            ctx,
+            region=REGION,
+            service="guardduty",
+            max_findings=50,
+            severity_filter=None,
+            check_enabled=False,
+            aggregate_by=None,
+            resource_type=None,
+        ),
+        "GetSecurityFindings[securityhub]": lambda: get_security_findings(
+            ctx,
+            region=REGION,
+            service="securityhub",
+            max_findings=100,
+            severity_filter=None,
+            check_enabled=False,
+            aggregate_by=None,
+            resource_type=None,
+        ),
+        "GetSecurityFindings[securityhub-counts]": lambda: get_security_findings(
+            ctx,
+            region=REGION,
+            service="securityhub",
+            max_findings=100,
+            severity_filter=None,
+            check_enabled=False,
+            aggregate_by=["severity", "resource_type"],
+            resource_type=None,
+        ),
+    }
+
+
+def _reset_caches() -> None:
+    """Drop every process-wide cache, so each run pays for its sessions and sweeps again."""
+    clear_session_cache()
+    clear_resource_inventories()
+    clear_ssl_policy_catalogs()
+    clear_bucket_region_cache()
+    clear_rate_limiters()
+
+
+async def _run_tool(
+    account: SyntheticAccount, call: Callable[[], Awaitable[Dict]]
+) -> Dict[str, Any]:
+    """Run one tool invocation from cold caches and return its duration and result."""
+    _reset_caches()
+    account.attach(create_aws_session())
+    account.reset_counts()
+
+    # Keep the tools' debug output from dominating the timings
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        result = await call()
+        seconds = time.perf_counter() - start
+
+    return {"seconds": seconds, "result": result}
+
+
+async def benchmark_size(size: int, repeat: int, seed: int) -> List[Dict[str, Any]]:
+    """Benchmark every tool against a synthetic account of the given size."""
+    account = SyntheticAccount(size, REGION, seed)
+    ctx = BenchmarkContext()
+    entries = []
+
+    for tool, call in _tool_calls(ctx).items():
+        timings = []
+        for _ in range(repeat):
+            run = await _run_tool(account, call)
+            timings.append(run["seconds"])
+
+        calls = account.call_counts()
+        result = run["result"]
+        entry = {
+            "tool": tool,
+            "size": size,
+            "seconds": {
+                "min": min(timings),
+                "median": statistics.median(timings),
+                "max": max(timings),
+            },
+            "api_calls": sum(calls.values()),
+            "api_calls_by_operation": calls,
+            "resources_checked": result.get(
+                "resources_checked", result.get("total_count", len(result.get("findings", [])))
+            ),
+        }
+        if result.get("error"):
+            entry["error"] = result["error"]
+        if account.unhandled:
+            entry["unsimulated_operations"] = dict(account.unhandled)
+        entries.append(entry)
+        print(
+            f"{tool:34} size={size:<6} median={entry['seconds']['median'] * 1000:10.1f} ms "
+            f"api_calls={entry['api_calls']:<7} resources={entry['resources_checked']}"
+        )
+
+    return entries
+
+
+def find_regressions(
+    report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """List the tools whose median time grew by more than tolerance over the baseline."""
+    baseline_medians = {
+        (entry["tool"], entry["size"]): entry["seconds"]["median"]
+        for entry in baseline.get("results", [])
+    }
+    regressions = []
+    for entry in report["results"]:
+        previous = baseline_medians.get((entry["tool"], entry["size"]))
+        current = entry["seconds"]["median"]
+        if previous and current > previous * (1 + tolerance):
+            regressions.append(
+                f"{entry['tool']} size={entry['size']}: {previous * 1000:.1f} ms -> "
+                f"{current * 1000:.1f} ms"
+            )
+    return regressions
+
+
+def main():
+    """Run the benchmark, print timings and write the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="bench-report.json")
+    parser.add_argument("--baseline", help="Earlier report to compare median timings against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument(
+        "--keep-rate-limits",
+        action="store_true",
+        help="Pace calls with the configured AWS rate limits instead of disabling them",
+    )
+    args = parser.parse_args()
+
+    # Credentials are only needed to build clients; no request is signed or sent
+    for variable in ("AWS_PROFILE", "AWS_ASSUME_ROLE_ARN", "AWS_SESSION_TOKEN"):
+        os.environ.pop(variable, None)
+    os.environ["AWS_ACCESS_KEY_ID"] = "benchmark"
+    os.environ["AWS_SECRET_ACCESS_KEY"] = "benchmark"
+    os.environ["AWS_DEFAULT_REGION"] = REGION
+    if not args.keep_rate_limits:
+        aws_calls.AWS_RATE_LIMITS = {}
+        aws_calls.AWS_DEFAULT_RATE_LIMIT = UNLIMITED_RATE
+
+    results = []
+    for size in args.sizes:
+        results.extend(asyncio.run(benchmark_size(size, args.repeat, args.seed)))
+
+    report = {
+        "generated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "rate_limited": args.keep_rate_limits,
+        "results": results,
+    }
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print(f"Report written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = find_regressions(report, json.load(baseline_file), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
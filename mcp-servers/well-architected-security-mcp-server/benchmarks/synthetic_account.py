@@ -0,0 +1,468 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Synthetic AWS account served to real boto3 clients without network access.
+
+``SyntheticAccount`` generates S3 buckets, EBS volumes, security groups, load balancers and
+security findings, and answers the API calls the security checks make from that data. It hooks
+into botocore's event system the same way ``botocore.stub.Stubber`` does: request parameters
+are captured on ``before-parameter-build`` and a parsed response is returned on ``before-call``,
+so requests are serialized and endpoints resolved as usual but never signed or sent. A
+``before-send`` guard fails any request that would still reach AWS.
+
+Unlike a Stubber, responses do not depend on call order, so concurrent checks can be served,
+and every call is counted by service and operation.
+"""
+
+import datetime
+import random
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, List
+
+import boto3
+from botocore.awsrequest import AWSResponse
+
+from benchmarks.bench_security_groups import build_security_groups
+
+ACCOUNT_ID = "123456789012"
+
+# Predefined Classic Load Balancer policies; the second one still allows TLS 1.0
+ELB_PREDEFINED_POLICIES = {
+    "ELBSecurityPolicy-TLS-1-2-2017-01": ["TLSv1.2"],
+    "ELBSecurityPolicy-2016-08": ["TLSv1", "TLSv1.1", "TLSv1.2"],
+}
+
+# Predefined ALB/NLB SSL policies
+ELBV2_PREDEFINED_POLICIES = {
+    "ELBSecurityPolicy-TLS13-1-2-2021-06": ["TLSv1.2", "TLSv1.3"],
+    "ELBSecurityPolicy-TLS-1-2-2017-01": ["TLSv1.2"],
+    "ELBSecurityPolicy-2016-08": ["TLSv1", "TLSv1.1", "TLSv1.2"],
+}
+
+
+class SyntheticAccount:
+    """An account with ``size`` buckets, volumes, security groups, load balancers and findings.
+
+    Half of the load balancers are Classic Load Balancers and half are ALBs/NLBs. Roughly a
+    quarter of each resource type is non-compliant, so both branches of every check run.
+    """
+
+    def __init__(self, size: int, region: str = "us-east-1", seed: int = 42) -> None:
+        self.size = size
+        self.region = region
+        self.calls: Counter = Counter()
+        self.unhandled: Counter = Counter()
+        self._calls_lock = threading.Lock()
+
+        rng = random.Random(seed)
+        now = datetime.datetime.now(datetime.timezone.utc)
+
+        self.buckets = {
+            f"bench-bucket-{index:06d}": {
+                "encrypted": rng.random() < 0.75,
+                "public_access_block": rng.choice([True, True, True, False, None]),
+            }
+            for index in range(size)
+        }
+        self.volumes = {
+            f"vol-{index:017x}": {
+                "VolumeId": f"vol-{index:017x}",
+                "OwnerId": ACCOUNT_ID,
+                "Size": 8,
+                "State": "in-use",
+                "Encrypted": rng.random() < 0.75,
+                "KmsKeyId": f"arn:aws:kms:{region}:{ACCOUNT_ID}:key/{index:08d}",
+            }
+            for index in range(size)
+        }
+        self.security_groups = build_security_groups(size, 10, seed)
+        for security_group in self.security_groups:
+            security_group["OwnerId"] = ACCOUNT_ID
+            security_group["GroupName"] = security_group["GroupId"]
+
+        self.classic_load_balancers = {}
+        for index in range(size // 2):
+            name = f"bench-clb-{index:06d}"
+            policy = rng.choice([*ELB_PREDEFINED_POLICIES, f"bench-custom-policy-{index}"])
+            listeners = [
+                {
+                    "Listener": {"Protocol": "HTTPS", "LoadBalancerPort": 443},
+                    "PolicyNames": [policy],
+                }
+            ]
+            if rng.random() < 0.25:
+                listeners.append({"Listener": {"Protocol": "HTTP", "LoadBalancerPort": 80}})
+            self.classic_load_balancers[name] = {
+                "LoadBalancerName": name,
+                "ListenerDescriptions": listeners,
+            }
+
+        self.elbv2_load_balancers = {}
+        for index in range(size - size // 2):
+            kind = "net" if index % 3 == 2 else "app"
+            arn = (
+                f"arn:aws:elasticloadbalancing:{region}:{ACCOUNT_ID}:loadbalancer/"
+                f"{kind}/bench-{kind}-{index:06d}/{index:016x}"
+            )
+            secure_protocol = "TLS" if kind == "net" else "HTTPS"
+            listeners = [
+                {
+                    "ListenerArn": f"{arn.replace(':loadbalancer/', ':listener/')}/{index:016x}",
+                    "Protocol": secure_protocol,
+                    "Port": 443,
+                    "SslPolicy": rng.choice(list(ELBV2_PREDEFINED_POLICIES)),
+                }
+            ]
+            if kind == "app" and rng.random() < 0.25:
+                listeners.append({"Protocol": "HTTP", "Port": 80})
+            self.elbv2_load_balancers[arn] = listeners
+
+        severities = [("LOW", 2.0), ("MEDIUM", 5.0), ("HIGH", 7.0), ("CRITICAL", 8.0)]
+        self.guardduty_findings = []
+        self.securityhub_findings = []
+        for index in range(size):
+            label, score = rng.choice(severities)
+            timestamp = (now - datetime.timedelta(minutes=index)).isoformat()
+            self.guardduty_findings.append(
+                {
+                    "Id": f"gd-{index:032x}",
+                    "AccountId": ACCOUNT_ID,
+                    "Region": region,
+                    "Type": "Recon:EC2/PortProbeUnprotectedPort",
+                    "Severity": score,
+                    "Title": f"Unprotected port on instance {index}",
+                    "Resource": {"ResourceType": "Instance"},
+                    "CreatedAt": timestamp,
+                    "UpdatedAt": timestamp,
+                }
+            )
+            self.securityhub_findings.append(
+                {
+                    "Id": f"arn:aws:securityhub:{region}:{ACCOUNT_ID}:finding/{index:032x}",
+                    "AwsAccountId": ACCOUNT_ID,
+                    "ProductName": "Security Hub",
+                    "Title": f"Security group allows unrestricted access ({index})",
+                    "Severity": {"Label": label},
+                    "Resources": [{"Type": "AwsEc2SecurityGroup", "Id": f"sg-{index:017x}"}],
+                    "CreatedAt": timestamp,
+                    "UpdatedAt": timestamp,
+                }
+            )
+
+        # Custom Security Hub insights that have not been deleted yet
+        self.securityhub_insights: Dict[str, Dict[str, Any]] = {}
+        self.securityhub_insight_count = 0
+
+        self.inventory = self._build_inventory(now)
+
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "resource-explorer-2.ListViews": self._list_views,
+            "resource-explorer-2.ListResources": self._list_resources,
+            "s3.GetBucketEncryption": self._get_bucket_encryption,
+            "s3.GetPublicAccessBlock": self._get_public_access_block,
+            "ec2.DescribeVolumes": self._describe_volumes,
+            "ec2.DescribeSecurityGroups": self._describe_security_groups,
+            "ec2.DescribeVpcEndpoints": lambda params: {"VpcEndpoints": []},
+            "elb.DescribeLoadBalancers": self._describe_classic_load_balancers,
+            "elb.DescribeLoadBalancerPolicies": self._describe_load_balancer_policies,
+            "elbv2.DescribeLoadBalancers": self._describe_elbv2_load_balancers,
+            "elbv2.DescribeListeners": self._describe_listeners,
+            "elbv2.DescribeSSLPolicies": self._describe_ssl_policies,
+            "guardduty.ListDetectors": lambda params: {"DetectorIds": ["bench-detector"]},
+            "guardduty.GetDetector": lambda params: {
+                "Status": "ENABLED",
+                "FindingPublishingFrequency": "SIX_HOURS",
+            },
+            "guardduty.ListFindings": self._list_guardduty_findings,
+            "guardduty.GetFindings": self._get_guardduty_findings,
+            "securityhub.DescribeHub": lambda params: {
+                "HubArn": f"arn:aws:securityhub:{region}:{ACCOUNT_ID}:hub/default"
+            },
+            "securityhub.GetEnabledStandards": lambda params: {"StandardsSubscriptions": []},
+            "securityhub.GetFindings": self._get_securityhub_findings,
+            "securityhub.CreateInsight": self._create_securityhub_insight,
+            "securityhub.DeleteInsight": self._delete_securityhub_insight,
+            "securityhub.GetInsightResults": self._get_securityhub_insight_results,
+            "sts.GetCallerIdentity": lambda params: {
+                "Account": ACCOUNT_ID,
+                "Arn": f"arn:aws:iam::{ACCOUNT_ID}:user/bench",
+                "UserId": "AIDABENCHUSER",
+            },
+        }
+
+    def _build_inventory(self, now: datetime.datetime) -> List[Dict[str, Any]]:
+        """Build the Resource Explorer view of every generated resource."""
+        region_arn = f"{self.region}:{ACCOUNT_ID}"
+        resources = [
+            {"Arn": f"arn:aws:s3:::{name}", "ResourceType": "s3:bucket", "Service": "s3"}
+            for name in self.buckets
+        ]
+        resources += [
+            {
+                "Arn": f"arn:aws:ec2:{region_arn}:volume/{volume_id}",
+                "ResourceType": "ec2:volume",
+                "Service": "ec2",
+            }
+            for volume_id in self.volumes
+        ]
+        resources += [
+            {
+                "Arn": f"arn:aws:ec2:{region_arn}:security-group/{sg['GroupId']}",
+                "ResourceType": "ec2:security-group",
+                "Service": "ec2",
+            }
+            for sg in self.security_groups
+        ]
+        resources += [
+            {
+                "Arn": f"arn:aws:elasticloadbalancing:{region_arn}:loadbalancer/{name}",
+                "ResourceType": "elasticloadbalancing:loadbalancer",
+                "Service": "elasticloadbalancing",
+            }
+            for name in self.classic_load_balancers
+        ]
+        resources += [
+            {
+                "Arn": arn,
+                "ResourceType": "elasticloadbalancing:loadbalancer",
+                "Service": "elasticloadbalancing",
+            }
+            for arn in self.elbv2_load_balancers
+        ]
+        for resource in resources:
+            resource["Region"] = self.region
+            resource["OwningAccountId"] = ACCOUNT_ID
+            resource["LastReportedAt"] = now
+        return resources
+
+    def attach(self, session: boto3.Session) -> None:
+        """Serve this account to every client created from session after this call."""
+        session.events.register("before-parameter-build", self._capture_params)
+        session.events.register("before-call", self._respond)
+        session.events.register("before-send", self._refuse_network)
+
+    def call_counts(self) -> Dict[str, int]:
+        """Get the number of API calls made so far, keyed by ``service.Operation``."""
+        with self._calls_lock:
+            return dict(sorted(self.calls.items()))
+
+    def reset_counts(self) -> None:
+        """Forget the API calls counted so far."""
+        with self._calls_lock:
+            self.calls.clear()
+            self.unhandled.clear()
+
+    def _capture_params(self, params: Dict[str, Any], context: Dict[str, Any], **kwargs) -> None:
+        """Keep the API parameters of the call, before they are serialized into a request."""
+        context["synthetic_account_params"] = dict(params)
+
+    def _respond(self, model: Any, context: Dict[str, Any], **kwargs) -> tuple:
+        """Answer a call from the synthetic data instead of sending it."""
+        operation = f"{model.service_model.service_name}.{model.name}"
+        with self._calls_lock:
+            self.calls[operation] += 1
+
+        handler = self._handlers.get(operation)
+        if handler is None:
+            with self._calls_lock:
+                self.unhandled[operation] += 1
+            return _error(400, "UnsupportedOperation", f"{operation} is not simulated")
+
+        result = handler(context.get("synthetic_account_params", {}))
+        if isinstance(result, tuple):
+            return result
+        return AWSResponse(None, 200, {}, None), {**result, "ResponseMetadata": {}}
+
+    def _refuse_network(self, request: Any, **kwargs) -> None:
+        """Fail any request that was not answered by the synthetic account."""
+        raise RuntimeError(f"Benchmark request would reach AWS: {request.url}")
+
+    def _list_views(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        view_arn = f"arn:aws:resource-explorer-2:{self.region}:{ACCOUNT_ID}:view/default/1"
+        return {"Views": [{"ViewArn": view_arn, "Filters": {"FilterString": ""}}]}
+
+    def _list_resources(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return _page(self.inventory, params, "Resources", default_page_size=1000)
+
+    def _get_bucket_encryption(self, params: Dict[str, Any]) -> Any:
+        bucket = self.buckets.get(params["Bucket"])
+        if bucket is None:
+            return _error(404, "NoSuchBucket", "The specified bucket does not exist")
+        if not bucket["encrypted"]:
+            return _error(
+                404,
+                "ServerSideEncryptionConfigurationNotFoundError",
+                "The server side encryption configuration was not found",
+            )
+        rule = {"ApplyServerSideEncryptionByDefault": {"SSEAlgorithm": "aws:kms"}}
+        return {"ServerSideEncryptionConfiguration": {"Rules": [rule]}}
+
+    def _get_public_access_block(self, params: Dict[str, Any]) -> Any:
+        bucket = self.buckets.get(params["Bucket"])
+        if bucket is None or bucket["public_access_block"] is None:
+            return _error(
+                404,
+                "NoSuchPublicAccessBlockConfiguration",
+                "The public access block configuration was not found",
+            )
+        blocked = bucket["public_access_block"]
+        return {
+            "PublicAccessBlockConfiguration": {
+                "BlockPublicAcls": True,
+                "IgnorePublicAcls": True,
+                "BlockPublicPolicy": blocked,
+                "RestrictPublicBuckets": blocked,
+            }
+        }
+
+    def _describe_volumes(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if params.get("VolumeIds"):
+            volumes = [self.volumes[v] for v in params["VolumeIds"] if v in self.volumes]
+            return {"Volumes": volumes}
+        return _page(list(self.volumes.values()), params, "Volumes")
+
+    def _describe_security_groups(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if params.get("GroupIds"):
+            group_ids = set(params["GroupIds"])
+            groups = [sg for sg in self.security_groups if sg["GroupId"] in group_ids]
+            return {"SecurityGroups": groups}
+        return _page(self.security_groups, params, "SecurityGroups")
+
+    def _describe_classic_load_balancers(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        names = params.get("LoadBalancerNames") or list(self.classic_load_balancers)
+        return {
+            "LoadBalancerDescriptions": [
+                self.classic_load_balancers[name]
+                for name in names
+                if name in self.classic_load_balancers
+            ]
+        }
+
+    def _describe_load_balancer_policies(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        names = params.get("PolicyNames") or list(ELB_PREDEFINED_POLICIES)
+        descriptions = []
+        for name in names:
+            # Custom policies are copies of the TLS 1.2 policy under their own name
+            protocols = ELB_PREDEFINED_POLICIES.get(name, ["TLSv1.2"])
+            descriptions.append(
+                {
+                    "PolicyName": name,
+                    "PolicyTypeName": "SSLNegotiationPolicyType",
+                    "PolicyAttributeDescriptions": [
+                        {"AttributeName": f"Protocol-{protocol}", "AttributeValue": "true"}
+                        for protocol in protocols
+                    ],
+                }
+            )
+        return {"PolicyDescriptions": descriptions}
+
+    def _describe_elbv2_load_balancers(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        arns = params.get("LoadBalancerArns") or list(self.elbv2_load_balancers)
+        return {
+            "LoadBalancers": [
+                {"LoadBalancerArn": arn, "Type": "network" if "/net/" in arn else "application"}
+                for arn in arns
+                if arn in self.elbv2_load_balancers
+            ]
+        }
+
+    def _describe_listeners(self, params: Dict[str, Any]) -> Any:
+        listeners = self.elbv2_load_balancers.get(params.get("LoadBalancerArn"))
+        if listeners is None:
+            return _error(400, "LoadBalancerNotFound", "One or more load balancers not found")
+        return {"Listeners": listeners}
+
+    def _describe_ssl_policies(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "SslPolicies": [
+                {"Name": name, "SslProtocols": protocols}
+                for name, protocols in ELBV2_PREDEFINED_POLICIES.items()
+            ]
+        }
+
+    def _list_guardduty_findings(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        page = _page(self.guardduty_findings, params, "Findings", default_page_size=50)
+        return {
+            "FindingIds": [finding["Id"] for finding in page["Findings"]],
+            **({"NextToken": page["NextToken"]} if "NextToken" in page else {}),
+        }
+
+    def _get_guardduty_findings(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        finding_ids = set(params.get("FindingIds", []))
+        return {"Findings": [f for f in self.guardduty_findings if f["Id"] in finding_ids]}
+
+    def _get_securityhub_findings(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return _page(self.securityhub_findings, params, "Findings", default_page_size=100)
+
+    def _create_securityhub_insight(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.securityhub_insight_count += 1
+        arn = (
+            f"arn:aws:securityhub:{self.region}:{ACCOUNT_ID}:insight/{ACCOUNT_ID}/custom/"
+            f"{self.securityhub_insight_count:08x}"
+        )
+        self.securityhub_insights[arn] = {"InsightArn": arn, **params}
+        return {"InsightArn": arn}
+
+    def _delete_securityhub_insight(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        del self.securityhub_insights[params["InsightArn"]]
+        return {"InsightArn": params["InsightArn"]}
+
+    def _get_securityhub_insight_results(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        # Filters are not applied: every generated finding is active and recent
+        attribute = self.securityhub_insights[params["InsightArn"]]["GroupByAttribute"]
+        counts: Counter = Counter()
+        for finding in self.securityhub_findings:
+            if attribute == "SeverityLabel":
+                counts[finding["Severity"]["Label"]] += 1
+            elif attribute == "ResourceType":
+                counts.update(resource["Type"] for resource in finding["Resources"])
+            else:
+                counts[finding.get(attribute, "unknown")] += 1
+        return {
+            "InsightResults": {
+                "InsightArn": params["InsightArn"],
+                "GroupByAttribute": attribute,
+                "ResultValues": [
+                    {"GroupByAttributeValue": value, "Count": count}
+                    for value, count in counts.most_common(100)
+                ],
+            }
+        }
+
+
+def _page(
+    items: List[Dict[str, Any]],
+    params: Dict[str, Any],
+    key: str,
+    default_page_size: int = 1000,
+) -> Dict[str, Any]:
+    """Return one page of items for the NextToken and MaxResults of a request."""
+    start = int(params.get("NextToken") or 0)
+    end = start + (params.get("MaxResults") or default_page_size)
+    response: Dict[str, Any] = {key: items[start:end]}
+    if end < len(items):
+        response["NextToken"] = str(end)
+    return response
+
+
+def _error(status_code: int, code: str, message: str) -> tuple:
+    """Build the HTTP response and parsed body of an AWS error."""
+    return AWSResponse(None, status_code, {}, None), {
+        "Error": {"Code": code, "Message": message},
+        "ResponseMetadata": {"HTTPStatusCode": status_code},
+    }
@@ -42,6 +42,10 @@ providing a comprehensive overview of your security posture.
 Retrieves security findings from various AWS security services including GuardDuty, Security Hub,
 Inspector, IAM Access Analyzer, Trusted Advisor, and Macie with filtering options by severity.
 
+### GetAggregatedSecurityFindings
+Retrieves findings from several security services across several regions in a single call,
+merged into one list ordered by normalized severity and capped at a global max_findings budget.
+
 ### CheckStorageEncryption
 Identifies storage resources using Resource Explorer and checks if they are properly configured
 for data protection at rest according to AWS Well-Architected Framework Security Pillar best practices.
@@ -50,6 +54,25 @@ for data protection at rest according to AWS Well-Architected Framework Security
 Identifies network resources using Resource Explorer and checks if they are properly configured
 for data protection in transit according to AWS Well-Architected Framework Security Pillar best practices.
 This tool helps ensure your network configurations follow security best practices for protecting data in transit.
+Both checks record a snapshot of per-resource results; pass its snapshot_id (or 'latest') as
+since_snapshot to re-check only new, changed and previously non-compliant resources and get a diff.
+
+### RefreshResourceInventory
+Sweeps Resource Explorer again for a region. CheckStorageEncryption, CheckNetworkSecurity and
+ListServicesInRegion share one cached inventory per region, refreshed after a TTL or by this tool.
+
+### StartAssessmentSweep
+Starts a background sweep that assumes each of a list of role ARNs and runs the storage, network
+and security services checks in every requested region. Returns a job_id right away.
+
+### GetAssessmentSweepStatus
+Returns the progress of a sweep and one compact report aggregated over every account, region and
+check completed so far. Poll it until the status is completed. CancelAssessmentSweep stops a sweep.
+
+### GetResultPage
+Returns the next page of resource_details from a CheckStorageEncryption or CheckNetworkSecurity
+call made with page_size, using the next_cursor from the previous page. Those calls return their
+first page while the check keeps running; keep reading pages until next_cursor is None.
 
 ### GetStoredSecurityContext
 Retrieves security services data that was stored in context from a previous CheckSecurityServices call
@@ -114,3 +137,15 @@ SEVERITY_LEVELS = {
     "LOW": 1,
     "INFORMATIONAL": 0,
 }
+
+# Timeouts (in seconds) for each service check run by CheckSecurityServices. A service that
+# does not respond in time is reported with a "timeout" status instead of holding up the others.
+DEFAULT_SERVICE_CHECK_TIMEOUT = 30.0
+SERVICE_CHECK_TIMEOUTS = {
+    "guardduty": 20.0,
+    "inspector": 30.0,
+    "accessanalyzer": 30.0,
+    "securityhub": 20.0,
+    "trustedadvisor": 45.0,
+    "macie": 20.0,
+}
@@ -18,10 +18,12 @@
 """AWS Well-Architected Security Assessment Tool MCP Server"""
 
 import argparse
+import asyncio
+import copy
 import datetime
 import os
 import sys
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
 import boto3
 from botocore.config import Config
@@ -30,14 +32,22 @@ from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
 
 from src import __version__
-from src.consts import INSTRUCTIONS
+from src.consts import (
+    DEFAULT_SERVICE_CHECK_TIMEOUT,
+    INSTRUCTIONS,
+    SERVICE_CHECK_TIMEOUTS,
+)
+from src.util.assessment_scheduler import get_sweep, start_sweep
 from src.util.network_security import (
+    NETWORK_SERVICES,
     check_network_security,
 )
+from src.util.resource_inventory import get_resource_inventory
 from src.util.resource_utils import (
     list_services_in_region,
 )
 from src.util.security_services import (
+    SECURITYHUB_GROUP_BY_ATTRIBUTES,
     check_access_analyzer,
     check_guard_duty,
     check_inspector,
@@ -48,14 +58,30 @@ from src.util.security_services import (
     get_guardduty_findings,
     get_inspector_findings,
     get_macie_findings,
+    get_securityhub_finding_counts,
     get_securityhub_findings,
     get_trusted_advisor_findings,
+    merge_findings,
 )
 from src.util.storage_security import (
+    STORAGE_SERVICES,
     check_storage_encryption,
 )
+from src.util.aws_calls import get_throttle_stats
+from src.util.compact_output import compact_results, validate_output_format
+from src.util.serialization import normalize_datetimes
+from src.util.context_store import create_context_store
+from src.util.result_pages import (
+    RESULT_PAGE_WAIT,
+    DetachableContext,
+    ResultPages,
+    get_running_pages,
+    start_result_pages,
+)
+from src.util.snapshots import SNAPSHOT_MAX_ENTRIES, SNAPSHOT_TTL, AssessmentSnapshot
 from src.util.credential_utils import (
     create_aws_session,
+    get_session_cache_stats,
     get_session_info,
     validate_assume_role_config,
 )
@@ -102,6 +128,10 @@ FIELD_STORE_IN_CONTEXT_TRUE = Field(
 FIELD_DEBUG_TRUE = Field(
     True, description="Whether to include detailed debug information in the response"
 )
+FIELD_CONCURRENT_TRUE = Field(
+    True,
+    description="Whether to check the security services concurrently, each with its own timeout",
+)
 FIELD_SECURITY_SERVICES = Field(
     ["guardduty", "inspector", "accessanalyzer", "securityhub", "trustedadvisor", "macie"],
     description="List of security services to check. Options: guardduty, inspector, accessanalyzer, securityhub, trustedadvisor, macie",
@@ -112,11 +142,27 @@ FIELD_ACCOUNT_ID = Field(
 FIELD_MAX_FINDINGS = Field(100, description="Maximum number of findings to retrieve")
 FIELD_SEVERITY_FILTER = Field(
     None,
-    description="Optional severity filter (e.g., 'HIGH', 'CRITICAL', or for Trusted Advisor: 'ERROR', 'WARNING')",
+    description="Optional severity filter (e.g., 'HIGH', 'CRITICAL', or for Trusted Advisor: 'ERROR', 'WARNING'; IAM Access Analyzer only supports 'HIGH' for public access and 'MEDIUM' for other external access)",
+)
+FIELD_REGIONS = Field([AWS_REGION], description="List of AWS regions to retrieve findings from")
+FIELD_MAX_FINDINGS_TOTAL = Field(
+    100, description="Maximum number of findings to return across all services and regions"
+)
+FIELD_NORMALIZED_SEVERITY_FILTER = Field(
+    None,
+    description="Optional normalized severity to keep ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'INFORMATIONAL')",
 )
 FIELD_CHECK_ENABLED = Field(
     True, description="Whether to check if service is enabled before retrieving findings"
 )
+FIELD_AGGREGATE_BY = Field(
+    None,
+    description="Security Hub only: count findings by these attributes ('severity', 'resource_type', 'product', 'compliance_status', 'type', 'resource', 'account') with server-side insights instead of retrieving them",
+)
+FIELD_RESOURCE_TYPE = Field(
+    None,
+    description="IAM Access Analyzer only: resource type to filter by (e.g., 'AWS::S3::Bucket', 'AWS::IAM::Role')",
+)
 FIELD_DETAILED_FALSE = Field(
     False, description="Whether to return the full details of the stored security services data"
 )
@@ -137,9 +183,258 @@ FIELD_NETWORK_SERVICES = Field(
 FIELD_INCLUDE_NON_COMPLIANT_ONLY = Field(
     False, description="Whether to include only non-compliant resources in the results"
 )
+FIELD_PAGE_SIZE = Field(
+    0,
+    description="Number of resource_details to return per page; 0 returns every resource at once",
+)
+FIELD_OUTPUT_FORMAT = Field(
+    "full",
+    description="'full' for per-resource details, or 'compact' for a columnar resources table with issue and remediation lookup tables and a size report",
+)
+FIELD_SINCE_SNAPSHOT = Field(
+    None,
+    description="snapshot_id of a previous run, or 'latest', to re-check only new, changed and previously non-compliant resources and return a diff",
+)
+FIELD_ROLE_ARNS = Field(
+    [],
+    description="IAM role ARNs to assume, one per account; leave empty to use the server's own credentials",
+)
+FIELD_SWEEP_REGIONS = Field([AWS_REGION], description="List of AWS regions to check in every account")
+FIELD_SWEEP_CHECKS = Field(
+    ["storage", "network", "services"],
+    description="Checks to run in every account and region. Options: storage, network, services",
+)
+FIELD_JOB_ID = Field(..., description="The job_id returned by StartAssessmentSweep")
+FIELD_INCLUDE_RESULTS_TRUE = Field(
+    True, description="Whether to include the per account, region and check results"
+)
+FIELD_CURSOR = Field(
+    ..., description="The next_cursor value from a previous paginated response"
+)
+
+# Global context storage for sharing data between tool calls (TTL/LRU bounded, see
+# src/util/context_store.py for the available backends)
+context_storage = create_context_store()
+
+# Per-resource compliance snapshots of storage and network checks, kept for delta checks
+snapshot_storage = create_context_store(SNAPSHOT_TTL, SNAPSHOT_MAX_ENTRIES, table="snapshots")
+
+# Security services GetSecurityFindings can retrieve findings from
+SUPPORTED_FINDINGS_SERVICES = [
+    "guardduty",
+    "securityhub",
+    "inspector",
+    "accessanalyzer",
+    "trustedadvisor",
+    "macie",
+]
+
+# Maximum number of service/region findings requests GetAggregatedSecurityFindings runs at once
+FINDINGS_FANOUT_CONCURRENCY = int(os.environ.get("SECURITY_MCP_FINDINGS_CONCURRENCY", "8"))
+
+# Context storage key prefix for the resource_details held back by paginated responses
+RESULT_PAGES_PREFIX = "result_pages_"
+
+
+def _start_snapshot(kind: str, region: str, since_snapshot: Optional[str]) -> AssessmentSnapshot:
+    """Start the snapshot of a check run, loading the snapshot it is compared against."""
+    previous = None
+    if since_snapshot:
+        snapshot_id = (
+            snapshot_storage.get(f"latest_snapshot_{kind}_{region}")
+            if since_snapshot == "latest"
+            else since_snapshot
+        )
+        previous = snapshot_storage.get(f"snapshot_{snapshot_id}")
+        if previous and (previous["kind"] != kind or previous["region"] != region):
+            print(f"Snapshot {snapshot_id} is not a {kind} snapshot for region {region}")
+            previous = None
+    return AssessmentSnapshot(kind, region, previous)
+
+
+def _finish_snapshot(
+    snapshot: AssessmentSnapshot, results: Dict, since_snapshot: Optional[str]
+) -> None:
+    """Store the snapshot of a completed check run and add its ID and delta to the results."""
+    snapshot_storage[f"snapshot_{snapshot.snapshot_id}"] = snapshot.to_dict()
+    snapshot_storage[f"latest_snapshot_{snapshot.kind}_{snapshot.region}"] = snapshot.snapshot_id
+    results["snapshot_id"] = snapshot.snapshot_id
+    if since_snapshot:
+        results["delta"] = {
+            "previous_snapshot_found": snapshot.previous is not None,
+            **snapshot.delta(),
+        }
+
+
+def _store_result_pages(pages: ResultPages) -> None:
+    """Keep the resource_details of a finished paginated check for GetResultPage.
+
+    The full resource_details list is held in context storage, so the pages expire with the
+    rest of the stored context. A check that failed keeps its error instead.
+    """
+    record: Dict = {"region": pages.region, "page_size": pages.page_size}
+    if pages.error:
+        record["error"] = pages.error
+    elif len(pages.resource_details) > pages.page_size:
+        record["resource_details"] = pages.resource_details
+    else:
+        return
+    context_storage[f"{RESULT_PAGES_PREFIX}{pages.result_id}"] = record
+
+
+async def _first_page(
+    region: str,
+    page_size: int,
+    ctx: Context,
+    run: Callable[[Context, Optional[Callable[[Dict], None]]], Awaitable[Dict]],
+) -> Dict:
+    """Run a check in the background and return as soon as its first page is ready.
 
-# Global context storage for sharing data between tool calls
-context_storage = {}
+    The response holds the first page_size resource_details and a pagination.next_cursor for
+    GetResultPage. If the check is still running, the counts cover the services checked so far
+    and pagination.complete is False; the check keeps running after the tool call returns.
+    Results that fit in one page are returned unchanged.
+    """
+    check_ctx = DetachableContext(ctx)
+    pages = start_result_pages(
+        region, page_size, lambda on_update: run(check_ctx, on_update), _store_result_pages
+    )
+    await pages.wait_for(page_size + 1)
+    if pages.error:
+        raise Exception(pages.error)
+
+    resource_details = pages.resource_details
+    if pages.complete and len(resource_details) <= page_size:
+        return pages.results
+
+    check_ctx.detach()
+    results = copy.deepcopy(
+        {key: value for key, value in pages.results.items() if key != "resource_details"}
+    )
+    return {
+        **results,
+        "resource_details": resource_details[:page_size],
+        "pagination": {
+            "total_resource_details": len(resource_details),
+            "returned": page_size,
+            "next_cursor": f"{pages.result_id}:{page_size}",
+            "complete": pages.complete,
+        },
+    }
+
+
+def _add_throttle_stats(results: Dict) -> None:
+    """Report the AWS throttling counts of the process in the debug_info of check results."""
+    results.setdefault("debug_info", {})["throttling"] = get_throttle_stats()
+
+
+def _format_results(results: Dict, output_format: str) -> Dict:
+    """Encode check results in the requested output format ('full' or 'compact')."""
+    return compact_results(results) if output_format == "compact" else results
+
+
+async def _run_service_check(
+    service_name: str, region: str, session: boto3.Session, ctx: Context
+) -> Optional[Dict]:
+    """Run the status check for a single security service.
+
+    Returns None for services this server does not know how to check.
+    """
+    print(f"Checking {service_name} status in {region}...")
+
+    if service_name.lower() == "guardduty":
+        return await check_guard_duty(region, session, ctx)
+    elif service_name.lower() == "inspector":
+        return await check_inspector(region, session, ctx)
+    elif service_name.lower() == "accessanalyzer":
+        # Call the access analyzer check with additional debugging
+        print(f"[DEBUG:CheckSecurityServices] Calling check_access_analyzer for region {region}")
+        service_result = await check_access_analyzer(region, session, ctx)
+        print(
+            f"[DEBUG:CheckSecurityServices] check_access_analyzer returned: enabled={service_result.get('enabled', False)}"
+        )
+
+        # If service_result says not enabled but analyzers are present, override the enabled flag
+        analyzers = service_result.get("analyzers", [])
+        if not service_result.get("enabled", False) and analyzers and len(analyzers) > 0:
+            print(
+                "[DEBUG:CheckSecurityServices] OVERRIDING: Access Analyzer has analyzers but reported as disabled. Setting enabled=True"
+            )
+            service_result["enabled"] = True
+            service_result["message"] = (
+                f"IAM Access Analyzer is enabled with {len(analyzers)} analyzer(s)."
+            )
+
+        # Always log the analyzers we found
+        analyzers = service_result.get("analyzers", [])
+        if analyzers:
+            print(
+                f"[DEBUG:CheckSecurityServices] Access Analyzer check found {len(analyzers)} analyzers:"
+            )
+            for idx, analyzer in enumerate(analyzers):
+                print(
+                    f"[DEBUG:CheckSecurityServices]   Analyzer {idx + 1}: name={analyzer.get('name')}, status={analyzer.get('status')}"
+                )
+        else:
+            print("[DEBUG:CheckSecurityServices] Access Analyzer check found no analyzers")
+
+        return service_result
+    elif service_name.lower() == "securityhub":
+        return await check_security_hub(region, session, ctx)
+    elif service_name.lower() == "trustedadvisor":
+        return await check_trusted_advisor(region, session, ctx)
+    elif service_name.lower() == "macie":
+        return await check_macie(region, session, ctx)
+
+    # Log warning
+    print(f"WARNING: Unknown service: {service_name}. Skipping.")
+    return None
+
+
+async def _run_service_check_with_timeout(
+    service_name: str, region: str, session: boto3.Session, ctx: Context
+) -> Tuple[str, Optional[Dict], str, float, datetime.datetime]:
+    """Run a single service check bounded by that service's timeout.
+
+    A check that times out or raises is turned into a partial result for that service, so
+    the remaining services are still reported.
+
+    Returns:
+        Tuple of (service name, service result, status, duration in seconds, end time)
+    """
+    timeout = SERVICE_CHECK_TIMEOUTS.get(service_name.lower(), DEFAULT_SERVICE_CHECK_TIMEOUT)
+    service_start_time = datetime.datetime.now()
+    status = "success"
+
+    try:
+        service_result = await asyncio.wait_for(
+            _run_service_check(service_name, region, session, ctx), timeout=timeout
+        )
+        if service_result is None:
+            status = "skipped"
+    except asyncio.TimeoutError:
+        print(
+            f"WARNING: {service_name} check in {region} did not complete within {timeout} seconds"
+        )
+        status = "timeout"
+        service_result = {
+            "enabled": False,
+            "status": "timeout",
+            "error": f"Check did not complete within {timeout} seconds",
+            "message": f"Timed out checking {service_name} status. Retry the check for this service.",
+        }
+    except Exception as e:
+        print(f"ERROR: Error checking {service_name} status: {e}")
+        status = "error"
+        service_result = {
+            "enabled": False,
+            "error": str(e),
+            "message": f"Error checking {service_name} status.",
+        }
+
+    service_end_time = datetime.datetime.now()
+    service_duration = (service_end_time - service_start_time).total_seconds()
+    return service_name, service_result, status, service_duration, service_end_time
 
 
 @mcp.tool(name="CheckSecurityServices")
@@ -150,6 +445,7 @@ async def check_security_services(
     account_id: Optional[str] = FIELD_ACCOUNT_ID,
     store_in_context: bool = FIELD_STORE_IN_CONTEXT_TRUE,
     debug: bool = FIELD_DEBUG_TRUE,
+    concurrent: bool = FIELD_CONCURRENT_TRUE,
 ) -> Dict:
     """Verify if selected AWS security services are enabled in the specified region and account.
 
@@ -164,6 +460,10 @@ async def check_security_services(
     - service_statuses: Dictionary with detailed status for each service
     - summary: Summary of security recommendations
 
+    With concurrent=True (the default) all services are checked at the same time, each bounded
+    by its own timeout. A service that times out is reported with status "timeout" while the
+    results for the other services are still returned.
+
     ## AWS permissions required
     The AgentCore Runtime IAM role must have the following permissions:
     - guardduty:ListDetectors, guardduty:GetDetector (if checking GuardDuty)
@@ -209,64 +509,28 @@ async def check_security_services(
                 "service_details": {},
             }
 
-        # Check each requested service
-        for service_name in services:
-            # Process status update
-            service_start_time = datetime.datetime.now()
-            print(f"Checking {service_name} status in {region}...")
-            if debug:
-                print(f"[DEBUG:CheckSecurityServices] Starting check for {service_name}")
-
-            service_result = None
-
-            # Call the appropriate check function based on service name
-            if service_name.lower() == "guardduty":
-                service_result = await check_guard_duty(region, session, ctx)
-            elif service_name.lower() == "inspector":
-                service_result = await check_inspector(region, session, ctx)
-            elif service_name.lower() == "accessanalyzer":
-                # Call the access analyzer check with additional debugging
-                print(
-                    f"[DEBUG:CheckSecurityServices] Calling check_access_analyzer for region {region}"
-                )
-                service_result = await check_access_analyzer(region, session, ctx)
-                print(
-                    f"[DEBUG:CheckSecurityServices] check_access_analyzer returned: enabled={service_result.get('enabled', False)}"
+        # Check each requested service, either concurrently or one after another
+        if concurrent:
+            print(
+                f"[DEBUG:CheckSecurityServices] Checking {len(services)} services concurrently"
+            )
+            service_outcomes = await asyncio.gather(
+                *[
+                    _run_service_check_with_timeout(service_name, region, session, ctx)
+                    for service_name in services
+                ]
+            )
+        else:
+            service_outcomes = []
+            for service_name in services:
+                service_outcomes.append(
+                    await _run_service_check_with_timeout(service_name, region, session, ctx)
                 )
 
-                # If service_result says not enabled but analyzers are present, override the enabled flag
-                analyzers = service_result.get("analyzers", [])
-                if not service_result.get("enabled", False) and analyzers and len(analyzers) > 0:
-                    print(
-                        "[DEBUG:CheckSecurityServices] OVERRIDING: Access Analyzer has analyzers but reported as disabled. Setting enabled=True"
-                    )
-                    service_result["enabled"] = True
-                    service_result["message"] = (
-                        f"IAM Access Analyzer is enabled with {len(analyzers)} analyzer(s)."
-                    )
-
-                # Always log the analyzers we found
-                analyzers = service_result.get("analyzers", [])
-                if analyzers:
-                    print(
-                        f"[DEBUG:CheckSecurityServices] Access Analyzer check found {len(analyzers)} analyzers:"
-                    )
-                    for idx, analyzer in enumerate(analyzers):
-                        print(
-                            f"[DEBUG:CheckSecurityServices]   Analyzer {idx + 1}: name={analyzer.get('name')}, status={analyzer.get('status')}"
-                        )
-                else:
-                    print("[DEBUG:CheckSecurityServices] Access Analyzer check found no analyzers")
-
-            elif service_name.lower() == "securityhub":
-                service_result = await check_security_hub(region, session, ctx)
-            elif service_name.lower() == "trustedadvisor":
-                service_result = await check_trusted_advisor(region, session, ctx)
-            elif service_name.lower() == "macie":
-                service_result = await check_macie(region, session, ctx)
-            else:
-                # Log warning
-                print(f"WARNING: Unknown service: {service_name}. Skipping.")
+        for service_name, service_result, service_status, service_duration, service_end_time in (
+            service_outcomes
+        ):
+            if service_status == "skipped":
                 continue
 
             # Add service result to the output
@@ -278,9 +542,6 @@ async def check_security_services(
 
             # Add debug info for this service if debug is enabled
             if debug:
-                service_end_time = datetime.datetime.now()
-                service_duration = (service_end_time - service_start_time).total_seconds()
-
                 if "debug_info" in results and "service_details" in results["debug_info"]:
                     results["debug_info"]["service_details"][service_name] = {
                         "duration_seconds": service_duration,
@@ -288,13 +549,21 @@ async def check_security_services(
                         if service_result
                         else False,
                         "timestamp": service_end_time.isoformat(),
-                        "status": "success" if service_result else "error",
+                        "status": service_status,
                     }
 
                 print(
                     f"[DEBUG:CheckSecurityServices] {service_name} check completed in {service_duration:.2f} seconds"
                 )
 
+        if debug and "debug_info" in results:
+            results["debug_info"]["concurrent"] = bool(concurrent)
+            results["debug_info"]["session_cache"] = get_session_cache_stats()
+            results["debug_info"]["throttling"] = get_throttle_stats()
+            results["debug_info"]["total_duration_seconds"] = (
+                datetime.datetime.now() - start_time
+            ).total_seconds()
+
         # Generate summary based on results
         enabled_services = [
             name
@@ -348,6 +617,8 @@ async def get_security_findings(
     max_findings: int = FIELD_MAX_FINDINGS,
     severity_filter: Optional[str] = FIELD_SEVERITY_FILTER,
     check_enabled: bool = FIELD_CHECK_ENABLED,
+    aggregate_by: Optional[List[str]] = FIELD_AGGREGATE_BY,
+    resource_type: Optional[str] = FIELD_RESOURCE_TYPE,
 ) -> Dict:
     """Retrieve security findings from AWS security services.
 
@@ -365,8 +636,19 @@ async def get_security_findings(
     - summary: Summary statistics about the findings (if service is enabled)
     - message: Status message or error information
 
+    With aggregate_by (Security Hub only), findings are counted by Security Hub instead of being
+    retrieved, in a few calls per attribute whatever the number of findings. The result then
+    holds counts (attribute -> value -> number of findings), the filters used and, when
+    counting by severity, total_count. counted_from_findings lists the attributes that had to
+    be counted from the findings themselves because no insight could be created.
+
+    With resource_type (IAM Access Analyzer only), only findings for that resource type are
+    retrieved; the filter is applied by Access Analyzer itself.
+
     ## AWS permissions required
     - Read permissions for the specified security service
+    - securityhub:CreateInsight, GetInsightResults and DeleteInsight for aggregate_by; without
+      them, or once the custom insight quota is reached, findings are counted from GetFindings
 
     ## Note
     For optimal performance, run CheckSecurityServices with store_in_context=True
@@ -377,18 +659,22 @@ async def get_security_findings(
         service_name = service.lower()
 
         # Check if service is supported
-        if service_name not in [
-            "guardduty",
-            "securityhub",
-            "inspector",
-            "accessanalyzer",
-            "trustedadvisor",
-            "macie",
-        ]:
+        if service_name not in SUPPORTED_FINDINGS_SERVICES:
             raise ValueError(
                 f"Unsupported security service: {service}. "
                 + "Supported services are: guardduty, securityhub, inspector, accessanalyzer, trustedadvisor, macie"
             )
+        if aggregate_by:
+            if service_name != "securityhub":
+                raise ValueError("aggregate_by is only supported for the securityhub service")
+            unsupported = [a for a in aggregate_by if a not in SECURITYHUB_GROUP_BY_ATTRIBUTES]
+            if unsupported:
+                raise ValueError(
+                    f"Unsupported aggregate_by attributes: {', '.join(unsupported)}. "
+                    f"Supported attributes are: {', '.join(SECURITYHUB_GROUP_BY_ATTRIBUTES)}"
+                )
+        if resource_type and service_name != "accessanalyzer":
+            raise ValueError("resource_type is only supported for the accessanalyzer service")
 
         # Get context key for security services data
         context_key = f"security_services_{region}"
@@ -397,9 +683,9 @@ async def get_security_findings(
         # First check if we need to verify service is enabled
         if check_enabled:
             # Check if security services data is available in context
-            if context_key in context_storage:
+            security_data = context_storage.get(context_key)
+            if security_data is not None:
                 print(f"Using stored security services data for region: {region}")
-                security_data = context_storage[context_key]
 
                 # Check if the requested service is in the stored data
                 service_statuses = security_data.get("service_statuses", {})
@@ -471,6 +757,11 @@ async def get_security_findings(
             result = await get_guardduty_findings(
                 region, session, ctx, max_findings, filter_criteria
             )
+        elif service_name == "securityhub" and aggregate_by:
+            print(f"Counting Security Hub findings in {region} by {', '.join(aggregate_by)}...")
+            result = await get_securityhub_finding_counts(
+                region, session, ctx, aggregate_by, filter_criteria
+            )
         elif service_name == "securityhub":
             print(f"Retrieving Security Hub findings from {region}...")
             result = await get_securityhub_findings(
@@ -483,7 +774,14 @@ async def get_security_findings(
             )
         elif service_name == "accessanalyzer":
             print(f"Retrieving IAM Access Analyzer findings from {region}...")
-            result = await get_access_analyzer_findings(region, session, ctx)
+            result = await get_access_analyzer_findings(
+                region,
+                session,
+                ctx,
+                max_findings=max_findings,
+                severity_filter=severity_filter,
+                resource_types=[resource_type] if resource_type else None,
+            )
         elif service_name == "trustedadvisor":
             print("Retrieving Trusted Advisor security checks with Error/Warning status...")
             # For Trusted Advisor, we'll focus on security category checks
@@ -510,14 +808,20 @@ async def get_security_findings(
         result["service"] = service_name
 
         # If the result indicates the service isn't enabled, store this information
-        if not result.get("enabled", True) and context_key in context_storage:
-            security_data = context_storage[context_key]
+        security_data = None
+        if not result.get("enabled", True):
+            security_data = context_storage.get(context_key)
+        if security_data is not None:
             service_statuses = security_data.get("service_statuses", {})
             if service_name not in service_statuses:
                 service_statuses[service_name] = {"enabled": False}
+                security_data["service_statuses"] = service_statuses
+                # Write back so stores that hold copies (e.g. SQLite) see the update
+                context_storage[context_key] = security_data
                 print(f"Updated context with status for {service_name}: not enabled")
 
-        return result
+        # Convert the datetimes of the raw findings once, as the result leaves the tool
+        return normalize_datetimes(result)
 
     except Exception as e:
         # Log error
@@ -525,6 +829,92 @@ async def get_security_findings(
         raise e
 
 
+@mcp.tool(name="GetAggregatedSecurityFindings")
+async def get_aggregated_security_findings(
+    ctx: Context,
+    regions: List[str] = FIELD_REGIONS,
+    services: List[str] = FIELD_SECURITY_SERVICES,
+    max_findings: int = FIELD_MAX_FINDINGS_TOTAL,
+    severity_filter: Optional[str] = FIELD_NORMALIZED_SEVERITY_FILTER,
+    check_enabled: bool = FIELD_CHECK_ENABLED,
+) -> Dict:
+    """Retrieve security findings from several services and regions in a single call.
+
+    Runs GetSecurityFindings for every service/region combination concurrently and merges the
+    results. Each service's own severity (GuardDuty and Macie scores, Security Hub and Inspector
+    labels, Trusted Advisor statuses) is normalized to CRITICAL, HIGH, MEDIUM, LOW or
+    INFORMATIONAL, and the merged list is ordered by that severity before the global
+    max_findings budget is applied.
+
+    ## Response format
+    Returns a dictionary with:
+    - regions: The regions findings were retrieved from
+    - services: The services findings were retrieved from
+    - findings: Merged findings, each with service, region, severity and the original finding
+    - truncated: Whether findings were dropped to stay within max_findings
+    - summary: Counts by normalized severity, service and region (before truncation)
+    - sources: Status of each service/region request (enabled, findings retrieved, errors)
+
+    ## AWS permissions required
+    - Read permissions for each of the specified security services
+    """
+    start_time = datetime.datetime.now()
+    supported_services = [s.lower() for s in services if s.lower() in SUPPORTED_FINDINGS_SERVICES]
+    unsupported_services = [s for s in services if s.lower() not in SUPPORTED_FINDINGS_SERVICES]
+    if unsupported_services:
+        print(f"WARNING: Skipping unsupported services: {', '.join(unsupported_services)}")
+
+    semaphore = asyncio.Semaphore(FINDINGS_FANOUT_CONCURRENCY)
+
+    async def fetch(service_name: str, region: str) -> Dict:
+        # Trusted Advisor interprets severity_filter as a check status, so it is only passed
+        # to the services that filter on severity server-side
+        service_severity_filter = (
+            severity_filter
+            if service_name in ("guardduty", "securityhub", "inspector", "accessanalyzer")
+            else None
+        )
+        async with semaphore:
+            try:
+                result = await get_security_findings(
+                    ctx,
+                    region=region,
+                    service=service_name,
+                    max_findings=max_findings,
+                    severity_filter=service_severity_filter,
+                    check_enabled=check_enabled,
+                    aggregate_by=None,
+                    resource_type=None,
+                )
+            except Exception as e:
+                result = {
+                    "enabled": False,
+                    "error": str(e),
+                    "message": f"Error retrieving {service_name} findings",
+                    "findings": [],
+                }
+        return {**result, "service": service_name, "region": region}
+
+    print(
+        f"Retrieving findings for {len(supported_services)} services in {len(regions)} regions"
+    )
+    source_results = await asyncio.gather(
+        *[fetch(service_name, region) for region in regions for service_name in supported_services]
+    )
+
+    merged = merge_findings(source_results, max_findings, severity_filter)
+    merged["debug_info"] = {
+        "requests": len(source_results),
+        "concurrency": FINDINGS_FANOUT_CONCURRENCY,
+        "throttling": get_throttle_stats(),
+        "total_duration_seconds": (datetime.datetime.now() - start_time).total_seconds(),
+    }
+    if unsupported_services:
+        merged["unsupported_services"] = unsupported_services
+
+    return normalize_datetimes({"regions": regions, "services": supported_services, **merged})
+
+
 @mcp.tool(name="GetStoredSecurityContext")
 async def get_stored_security_context(
     ctx: Context,
@@ -544,6 +934,7 @@ async def get_stored_security_context(
     - data: The stored security services data (if available and detailed=True)
     - summary: A summary of the stored data (if available)
     - timestamp: When the data was stored (if available)
+    - expires_at: When the stored data expires (if available)
 
     ## Note
     This tool requires that CheckSecurityServices was previously called with store_in_context=True
@@ -551,7 +942,9 @@ async def get_stored_security_context(
     """
     context_key = f"security_services_{region}"
 
-    if context_key not in context_storage:
+    # Read the entry once, since it can expire or be evicted between two lookups
+    stored_data = context_storage.get(context_key)
+    if stored_data is None:
         print(f"No stored security services data found for region: {region}")
         return {
             "region": region,
@@ -559,7 +952,7 @@ async def get_stored_security_context(
             "message": f"No security services data has been stored for region {region}. Call CheckSecurityServices with store_in_context=True first.",
         }
 
-    stored_data = context_storage[context_key]
+    entry_metadata = context_storage.metadata(context_key) or {}
 
     # Prepare response
     response = {
@@ -569,6 +962,13 @@ async def get_stored_security_context(
         "all_enabled": stored_data.get("all_enabled", False),
         "services_checked": stored_data.get("services_checked", []),
     }
+    if "stored_at" in entry_metadata:
+        response["timestamp"] = datetime.datetime.fromtimestamp(
+            entry_metadata["stored_at"], datetime.timezone.utc
+        ).isoformat()
+        response["expires_at"] = datetime.datetime.fromtimestamp(
+            entry_metadata["expires_at"], datetime.timezone.utc
+        ).isoformat()
 
     # Include full data if requested
     if detailed:
@@ -585,6 +985,9 @@ async def check_storage_encryption_tool(
     services: List[str] = FIELD_STORAGE_SERVICES,
     include_unencrypted_only: bool = FIELD_INCLUDE_UNENCRYPTED_ONLY,
     store_in_context: bool = FIELD_STORE_IN_CONTEXT_TRUE,
+    page_size: int = FIELD_PAGE_SIZE,
+    since_snapshot: Optional[str] = FIELD_SINCE_SNAPSHOT,
+    output_format: str = FIELD_OUTPUT_FORMAT,
 ) -> Dict:
     """Check if AWS storage resources have encryption enabled.
 
@@ -601,12 +1004,29 @@ async def check_storage_encryption_tool(
     - compliance_by_service: Breakdown of compliance by service type
     - resource_details: Details about each resource checked
     - recommendations: Recommendations for improving data protection at rest
+    - snapshot_id: ID of the per-resource compliance snapshot recorded for this run
+    - delta: With since_snapshot, the services and resources reused from that snapshot and a
+      diff (added, removed, changed, newly_non_compliant, resolved) against it
+    - debug_info: throttling holds the requests, throttling errors and retries of each AWS
+      service called by the server, to help tune SECURITY_MCP_RATE_LIMITS and concurrency
+    - pagination: Present when page_size is set and more resources remain; pass its next_cursor
+      to GetResultPage for the next page of resource_details. With page_size the tool returns
+      as soon as the first page is ready; while pagination.complete is False the check is
+      still running and the counts cover the services checked so far
+
+    With output_format='compact', resource_details is replaced by a resources table (columns
+    and rows) whose type, issue and remediation columns index the types, issue_codes and
+    remediations lookup tables, and a size_report gives the bytes and estimated tokens of
+    both formats. Per-resource checks are only returned in the full format.
+
+    Progress notifications are sent as each service and batch of resources completes.
 
     ## AWS permissions required
     - resource-explorer-2:ListResources
     - Read permissions for each storage service being analyzed (s3:GetEncryptionConfiguration, etc.)
     """
     try:
+        output_format = validate_output_format(output_format)
         print(f"Starting storage encryption check for region: {region}")
         print(f"Services to check: {', '.join(services)}")
         print("Using enhanced AWS credentials chain (supports AssumeRole)")
@@ -614,16 +1034,24 @@ async def check_storage_encryption_tool(
         # Create a session using enhanced credential chain (supports AssumeRole via environment variables)
         session = create_aws_session()
 
-        # Call the storage security utility function
-        results = await check_storage_encryption(
-            region, services, session, ctx, include_unencrypted_only
-        )
+        async def run(check_ctx: Context, on_update: Optional[Callable[[Dict], None]] = None):
+            # Call the storage security utility function
+            snapshot = _start_snapshot("storage", region, since_snapshot)
+            results = await check_storage_encryption(
+                region, services, session, check_ctx, include_unencrypted_only, snapshot, on_update
+            )
+            _finish_snapshot(snapshot, results, since_snapshot)
+            _add_throttle_stats(results)
 
-        # Store results in context if requested
-        if store_in_context:
-            context_key = f"storage_encryption_{region}"
-            context_storage[context_key] = results
-        return results
+            # Store results in context if requested
+            if store_in_context:
+                context_key = f"storage_encryption_{region}"
+                context_storage[context_key] = results
+            return results
+
+        if page_size <= 0:
+            return _format_results(await run(ctx), output_format)
+        return _format_results(await _first_page(region, page_size, ctx, run), output_format)
 
     except Exception as e:
         # Log error
@@ -654,8 +1082,11 @@ async def list_services_in_region_tool(
     - service_counts: Dictionary mapping service names to resource counts
     - total_resources: Total number of resources found across all services
 
+    Resources come from the shared Resource Explorer inventory, which is swept at most once
+    per SECURITY_MCP_INVENTORY_TTL and reused by CheckStorageEncryption and CheckNetworkSecurity.
+
     ## AWS permissions required
-    - resource-explorer-2:Search (if Resource Explorer is set up)
+    - resource-explorer-2:ListViews, resource-explorer-2:ListResources (if Resource Explorer is set up)
     - Read permissions for various AWS services
     """
     print(f"Starting service discovery for region: {region}")
@@ -693,6 +1124,60 @@ async def list_services_in_region_tool(
     return results
 
 
+@mcp.tool(name="RefreshResourceInventory")
+async def refresh_resource_inventory(
+    ctx: Context,
+    region: str = FIELD_AWS_REGION,
+) -> Dict:
+    """Sweep Resource Explorer again for a region, replacing the cached resource inventory.
+
+    CheckStorageEncryption, CheckNetworkSecurity and ListServicesInRegion share one cached
+    Resource Explorer inventory per region. Use this tool after creating or deleting resources
+    to make those tools see the changes before the cached inventory expires.
+
+    ## Response format
+    Returns a dictionary with:
+    - region: The region that was swept
+    - available: Whether a default Resource Explorer view exists in the region
+    - total_resources: Number of resources in the inventory
+    - service_counts: Dictionary mapping service names to resource counts
+    - last_refresh: Resources added, updated, removed and unchanged since the previous sweep
+
+    ## AWS permissions required
+    - resource-explorer-2:ListViews
+    - resource-explorer-2:ListResources
+    """
+    try:
+        session = create_aws_session()
+        inventory = await get_resource_inventory(region, session, ctx, force_refresh=True)
+        if inventory is None:
+            return {
+                "region": region,
+                "available": False,
+                "message": f"No default Resource Explorer view found in region {region}.",
+            }
+
+        return {
+            "region": region,
+            "available": True,
+            "total_resources": len(inventory.resources),
+            "service_counts": inventory.service_counts(),
+            "swept_at": datetime.datetime.fromtimestamp(
+                inventory.swept_at, datetime.timezone.utc
+            ).isoformat(),
+            "last_refresh": inventory.last_refresh,
+        }
+
+    except Exception as e:
+        print(f"ERROR: Error refreshing resource inventory: {e}")
+        return {
+            "region": region,
+            "available": False,
+            "error": str(e),
+            "message": f"Error refreshing the resource inventory for region {region}.",
+        }
+
+
 @mcp.tool(name="ValidateCredentialConfiguration")
 async def validate_credential_configuration(
     ctx: Context,
@@ -751,6 +1236,7 @@ async def validate_credential_configuration(
             "validation_status": "valid" if assume_role_config["valid"] and not session_info.get("error") else "invalid",
             "assume_role_config": assume_role_config,
             "session_info": session_info,
+            "session_cache": get_session_cache_stats(),
             "recommendations": recommendations,
             "message": "Credential configuration validated successfully" if not session_info.get("error") else "Credential validation encountered issues",
         }
@@ -774,6 +1260,9 @@ async def check_network_security_tool(
     services: List[str] = FIELD_NETWORK_SERVICES,
     include_non_compliant_only: bool = FIELD_INCLUDE_NON_COMPLIANT_ONLY,
     store_in_context: bool = FIELD_STORE_IN_CONTEXT_TRUE,
+    page_size: int = FIELD_PAGE_SIZE,
+    since_snapshot: Optional[str] = FIELD_SINCE_SNAPSHOT,
+    output_format: str = FIELD_OUTPUT_FORMAT,
 ) -> Dict:
     """Check if AWS network resources are configured for secure data-in-transit.
 
@@ -790,12 +1279,29 @@ async def check_network_security_tool(
     - compliance_by_service: Breakdown of compliance by service type
     - resource_details: Details about each resource checked
     - recommendations: Recommendations for improving data protection in transit
+    - snapshot_id: ID of the per-resource compliance snapshot recorded for this run
+    - delta: With since_snapshot, the services and resources reused from that snapshot and a
+      diff (added, removed, changed, newly_non_compliant, resolved) against it
+    - debug_info: throttling holds the requests, throttling errors and retries of each AWS
+      service called by the server, to help tune SECURITY_MCP_RATE_LIMITS and concurrency
+    - pagination: Present when page_size is set and more resources remain; pass its next_cursor
+      to GetResultPage for the next page of resource_details. With page_size the tool returns
+      as soon as the first page is ready; while pagination.complete is False the check is
+      still running and the counts cover the services checked so far
+
+    With output_format='compact', resource_details is replaced by a resources table (columns
+    and rows) whose type, issue and remediation columns index the types, issue_codes and
+    remediations lookup tables, and a size_report gives the bytes and estimated tokens of
+    both formats. Per-resource checks are only returned in the full format.
+
+    Progress notifications are sent as each service check completes.
 
     ## AWS permissions required
     - resource-explorer-2:ListResources
     - Read permissions for each network service being analyzed (elb:DescribeLoadBalancers, etc.)
     """
     try:
+        output_format = validate_output_format(output_format)
         print(f"Starting network security check for region: {region}")
         print(f"Services to check: {', '.join(services)}")
         print("Using enhanced AWS credentials chain (supports AssumeRole)")
@@ -803,16 +1309,24 @@ async def check_network_security_tool(
         # Create a session using enhanced credential chain (supports AssumeRole via environment variables)
         session = create_aws_session()
 
-        # Call the network security utility function
-        results = await check_network_security(
-            region, services, session, ctx, include_non_compliant_only
-        )
+        async def run(check_ctx: Context, on_update: Optional[Callable[[Dict], None]] = None):
+            # Call the network security utility function
+            snapshot = _start_snapshot("network", region, since_snapshot)
+            results = await check_network_security(
+                region, services, session, check_ctx, include_non_compliant_only, snapshot, on_update
+            )
+            _finish_snapshot(snapshot, results, since_snapshot)
+            _add_throttle_stats(results)
 
-        # Store results in context if requested
-        if store_in_context:
-            context_key = f"network_security_{region}"
-            context_storage[context_key] = results
-        return results
+            # Store results in context if requested
+            if store_in_context:
+                context_key = f"network_security_{region}"
+                context_storage[context_key] = results
+            return results
+
+        if page_size <= 0:
+            return _format_results(await run(ctx), output_format)
+        return _format_results(await _first_page(region, page_size, ctx, run), output_format)
 
     except Exception as e:
         # Log error
@@ -825,6 +1339,231 @@ async def check_network_security_tool(
         }
 
 
+@mcp.tool(name="GetResultPage")
+async def get_result_page(
+    ctx: Context,
+    cursor: str = FIELD_CURSOR,
+    page_size: int = FIELD_PAGE_SIZE,
+    output_format: str = FIELD_OUTPUT_FORMAT,
+) -> Dict:
+    """Retrieve the next page of resource_details from a paginated check response.
+
+    CheckStorageEncryption and CheckNetworkSecurity called with page_size return the first page
+    of resource_details and a pagination.next_cursor as soon as that page is ready, while the
+    rest of the check keeps running. Pass that cursor here to read the following pages without
+    running the check again. If the check is still running, this waits up to
+    SECURITY_MCP_RESULT_PAGE_WAIT seconds for the resources of the page.
+
+    ## Response format
+    Returns a dictionary with:
+    - region: The region the paginated check ran in
+    - available: Boolean indicating if the paginated results are still stored
+    - resource_details: The next page of resource details
+    - pagination: total_resource_details (found so far while the check runs), returned,
+      next_cursor (None on the last page) and complete (False while the check is running)
+    - error: Present when the check failed after its first page was returned
+
+    With output_format='compact', the page is returned as a resources table with lookup tables,
+    as described for CheckStorageEncryption.
+
+    ## Note
+    Pages are kept in the stored context and expire with it (SECURITY_MCP_CONTEXT_TTL).
+    page_size defaults to the page size of the original call.
+    """
+    output_format = validate_output_format(output_format)
+    result_id, _, offset = cursor.partition(":")
+    context_key = f"{RESULT_PAGES_PREFIX}{result_id}"
+    running_pages = get_running_pages(result_id) if offset.isdigit() else None
+    start = int(offset) if offset.isdigit() else 0
+
+    if running_pages is not None:
+        if page_size <= 0:
+            page_size = running_pages.page_size
+        # Give a running check time to find the resources of this page
+        await running_pages.wait_for(start + page_size, RESULT_PAGE_WAIT)
+        running_pages = get_running_pages(result_id)
+
+    if running_pages is not None:
+        stored_pages = {
+            "region": running_pages.region,
+            "page_size": running_pages.page_size,
+            "resource_details": running_pages.resource_details,
+        }
+    else:
+        stored_pages = context_storage.get(context_key) if offset.isdigit() else None
+
+    if stored_pages is None:
+        print(f"No paginated results found for cursor: {cursor}")
+        return {
+            "available": False,
+            "message": f"No paginated results found for cursor {cursor}. They may have expired; run the check again.",
+        }
+
+    if stored_pages.get("error"):
+        return {
+            "region": stored_pages.get("region"),
+            "available": False,
+            "error": stored_pages["error"],
+            "message": "The paginated check failed before all of its results were found.",
+        }
+
+    resource_details = stored_pages["resource_details"]
+    if page_size <= 0:
+        page_size = stored_pages["page_size"]
+    page_details = resource_details[start : start + page_size]
+    end = start + len(page_details)
+    complete = running_pages is None
+
+    page = {
+        "region": stored_pages.get("region"),
+        "available": True,
+        "resource_details": page_details,
+        "pagination": {
+            "total_resource_details": len(resource_details),
+            "returned": len(page_details),
+            "next_cursor": f"{result_id}:{end}"
+            if not complete or end < len(resource_details)
+            else None,
+            "complete": complete,
+        },
+    }
+    return _format_results(page, output_format)
+
+
+async def _sweep_storage(region: str, session: boto3.Session, ctx: Context) -> Dict:
+    """Run every storage check of an assessment sweep."""
+    return await check_storage_encryption(region, STORAGE_SERVICES, session, ctx)
+
+
+async def _sweep_network(region: str, session: boto3.Session, ctx: Context) -> Dict:
+    """Run every network check of an assessment sweep."""
+    return await check_network_security(region, NETWORK_SERVICES, session, ctx)
+
+
+async def _sweep_security_services(region: str, session: boto3.Session, ctx: Context) -> Dict:
+    """Check the status of every security service for an assessment sweep."""
+    service_outcomes = await asyncio.gather(
+        *[
+            _run_service_check_with_timeout(service_name, region, session, ctx)
+            for service_name in SUPPORTED_FINDINGS_SERVICES
+        ]
+    )
+    return {
+        "service_statuses": {
+            service_name: service_result
+            for service_name, service_result, status, _, _ in service_outcomes
+            if status != "skipped"
+        }
+    }
+
+
+# Checks StartAssessmentSweep can run in every account and region
+SWEEP_CHECK_RUNNERS = {
+    "storage": _sweep_storage,
+    "network": _sweep_network,
+    "services": _sweep_security_services,
+}
+
+
+@mcp.tool(name="StartAssessmentSweep")
+async def start_assessment_sweep(
+    ctx: Context,
+    role_arns: List[str] = FIELD_ROLE_ARNS,
+    regions: List[str] = FIELD_SWEEP_REGIONS,
+    checks: List[str] = FIELD_SWEEP_CHECKS,
+) -> Dict:
+    """Start a background assessment of many accounts and regions and return its job ID.
+
+    The sweep assumes each role, then runs the requested checks in every region: storage
+    (CheckStorageEncryption over all storage services), network (CheckNetworkSecurity over all
+    network services) and services (CheckSecurityServices over all security services). It keeps
+    running after this call returns; poll GetAssessmentSweepStatus with the job_id for progress
+    and the aggregated report.
+
+    Concurrency is bounded overall (SECURITY_MCP_SWEEP_CONCURRENCY), per account
+    (SECURITY_MCP_SWEEP_ACCOUNT_CONCURRENCY) and per check
+    (SECURITY_MCP_SWEEP_STORAGE_CONCURRENCY, _NETWORK_, _SERVICES_).
+
+    ## Response format
+    Returns a dictionary with:
+    - job_id: ID to pass to GetAssessmentSweepStatus
+    - status: running
+    - total_tasks: Number of account, region and check combinations to run
+    - checks: Checks the sweep runs
+    - unsupported_checks: Requested checks this server does not know (if any)
+
+    ## AWS permissions required
+    - sts:AssumeRole on every role ARN
+    - The permissions of CheckStorageEncryption, CheckNetworkSecurity and CheckSecurityServices
+      in every account
+    """
+    supported_checks = {
+        check: SWEEP_CHECK_RUNNERS[check] for check in checks if check in SWEEP_CHECK_RUNNERS
+    }
+    unsupported_checks = [check for check in checks if check not in SWEEP_CHECK_RUNNERS]
+    if not supported_checks or not regions:
+        return {
+            "status": "rejected",
+            "unsupported_checks": unsupported_checks,
+            "message": "Provide at least one region and one of the checks: "
+            + ", ".join(SWEEP_CHECK_RUNNERS),
+        }
+
+    sweep = start_sweep(role_arns or [None], regions, supported_checks, create_aws_session)
+    response = {
+        "job_id": sweep.job_id,
+        "status": sweep.status,
+        "total_tasks": len(sweep.tasks),
+        "checks": list(supported_checks),
+    }
+    if unsupported_checks:
+        response["unsupported_checks"] = unsupported_checks
+    return response
+
+
+@mcp.tool(name="GetAssessmentSweepStatus")
+async def get_assessment_sweep_status(
+    ctx: Context,
+    job_id: str = FIELD_JOB_ID,
+    include_results: bool = FIELD_INCLUDE_RESULTS_TRUE,
+) -> Dict:
+    """Get the progress and aggregated report of an assessment sweep.
+
+    The report covers the checks completed so far, so it can be read while the sweep runs.
+
+    ## Response format
+    Returns a dictionary with:
+    - job_id, status (running, completed, cancelled or failed), created_at and finished_at
+    - progress: total_tasks, completed_tasks and failed_tasks
+    - totals: Per check, the number completed, errors, resources checked, non-compliant
+      resources and the accounts with non-compliant resources or disabled services
+    - results: One compact entry per account, region and check (if include_results=True), with
+      counts and up to 25 non-compliant resource ARNs, or the enabled and disabled services
+    """
+    sweep = get_sweep(job_id)
+    if sweep is None:
+        return {
+            "job_id": job_id,
+            "status": "not_found",
+            "message": f"No assessment sweep found with job_id {job_id}. It may have expired.",
+        }
+    return sweep.report(include_results)
+
+
+@mcp.tool(name="CancelAssessmentSweep")
+async def cancel_assessment_sweep(ctx: Context, job_id: str = FIELD_JOB_ID) -> Dict:
+    """Cancel a running assessment sweep, keeping the results of the checks already completed."""
+    sweep = get_sweep(job_id)
+    if sweep is None:
+        return {"job_id": job_id, "status": "not_found"}
+    cancelled = sweep.cancel()
+    return {
+        "job_id": job_id,
+        "cancelled": cancelled,
+        "status": "cancelling" if cancelled else sweep.status,
+    }
+
+
 @mcp.prompt(name="wa-sec-check-findings")
 async def security_assessment_precheck(ctx: Context) -> str:
     """Provides guidance on using CheckSecurityServices and GetSecurityFindings tools in sequence
@@ -0,0 +1,320 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Multi-account, multi-region assessment sweeps that run in the background.
+
+A sweep runs a set of checks (storage, network, security services) for every pair of role
+ARN and region. It runs as an asyncio task and is identified by a job ID, so a client starts
+it with one tool call and polls it with short calls instead of holding one call open for the
+whole sweep. Concurrency is bounded three ways: overall, per account, and per check, since
+each check drives its own set of AWS service APIs and their rate limits.
+
+Each (account, region, check) result is reduced to a compact summary as soon as it completes,
+so a sweep over hundreds of accounts keeps only counts and non-compliant resource ARNs.
+"""
+
+import asyncio
+import datetime
+import os
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import boto3
+
+from src.util.aws_calls import call_aws, get_throttle_stats
+
+# Maximum number of checks a sweep runs at the same time
+SWEEP_CONCURRENCY = int(os.environ.get("SECURITY_MCP_SWEEP_CONCURRENCY", "16"))
+
+# Maximum number of checks a sweep runs at the same time in one account
+SWEEP_ACCOUNT_CONCURRENCY = int(os.environ.get("SECURITY_MCP_SWEEP_ACCOUNT_CONCURRENCY", "3"))
+
+# Maximum number of each check a sweep runs at the same time across all accounts, which bounds
+# the request rate the sweep sends to the service APIs behind that check
+SWEEP_CHECK_BUDGETS = {
+    "storage": int(os.environ.get("SECURITY_MCP_SWEEP_STORAGE_CONCURRENCY", "8")),
+    "network": int(os.environ.get("SECURITY_MCP_SWEEP_NETWORK_CONCURRENCY", "8")),
+    "services": int(os.environ.get("SECURITY_MCP_SWEEP_SERVICES_CONCURRENCY", "8")),
+}
+
+# Seconds a finished sweep stays available to GetAssessmentSweepStatus
+SWEEP_JOB_TTL = float(os.environ.get("SECURITY_MCP_SWEEP_JOB_TTL", "3600"))
+
+# Maximum number of non-compliant resource ARNs kept per account, region and check
+SWEEP_MAX_ARNS = 25
+
+# A check takes a region, a session and a context, and returns the check's result dictionary
+CheckRunner = Callable[[str, boto3.Session, Any], Awaitable[Dict[str, Any]]]
+
+_sweeps: Dict[str, "AssessmentSweep"] = {}
+
+
+class SweepContext:
+    """Stand-in for the MCP context while a sweep runs after its tool call has returned.
+
+    Errors and warnings reported by the checks are printed and kept for the sweep report.
+    """
+
+    def __init__(self) -> None:
+        self.messages: List[Dict[str, str]] = []
+
+    async def _log(self, level: str, message: str) -> None:
+        print(f"[DEBUG:AssessmentSweep] {level}: {message}")
+        self.messages.append({"level": level, "message": str(message)})
+
+    async def error(self, message: str, **kwargs: Any) -> None:
+        await self._log("error", message)
+
+    async def warning(self, message: str, **kwargs: Any) -> None:
+        await self._log("warning", message)
+
+    async def info(self, message: str, **kwargs: Any) -> None:
+        pass
+
+    async def report_progress(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+def summarize_check_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a check result to the counts and identifiers a sweep report keeps."""
+    summary: Dict[str, Any] = {}
+    if "service_statuses" in result:
+        statuses = result["service_statuses"]
+        summary["services_enabled"] = sorted(
+            name for name, status in statuses.items() if status and status.get("enabled")
+        )
+        summary["services_not_enabled"] = sorted(
+            name for name, status in statuses.items() if not status or not status.get("enabled")
+        )
+    else:
+        non_compliant = [
+            resource.get("arn") or resource.get("id") or resource.get("name")
+            for resource in result.get("resource_details", [])
+            if not resource.get("compliant", True)
+        ]
+        summary.update(
+            {
+                "resources_checked": result.get("resources_checked", 0),
+                "compliant_resources": result.get("compliant_resources", 0),
+                "non_compliant_resources": result.get("non_compliant_resources", 0),
+                "non_compliant_arns": non_compliant[:SWEEP_MAX_ARNS],
+            }
+        )
+    if result.get("error"):
+        summary["error"] = result["error"]
+    return summary
+
+
+def _account_id(role_arn: Optional[str]) -> Optional[str]:
+    """Get the account ID from a role ARN, or None for the server's own credentials."""
+    parts = (role_arn or "").split(":")
+    return parts[4] if len(parts) > 4 else None
+
+
+class AssessmentSweep:
+    """One background sweep of checks over role ARNs and regions."""
+
+    def __init__(
+        self,
+        role_arns: List[Optional[str]],
+        regions: List[str],
+        checks: Dict[str, CheckRunner],
+        session_factory: Callable[[Optional[str]], boto3.Session],
+    ) -> None:
+        """Prepare a sweep.
+
+        Args:
+            role_arns: Roles to assume, one per account; None uses the server's own credentials
+            regions: Regions to check in every account
+            checks: Check name -> runner for every check to run
+            session_factory: Creates the session of a role ARN
+        """
+        self.job_id = uuid.uuid4().hex
+        self.role_arns = role_arns
+        self.regions = regions
+        self.checks = checks
+        self.session_factory = session_factory
+        self.status = "pending"
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.tasks: List[Tuple[Optional[str], str, str]] = [
+            (role_arn, region, check)
+            for role_arn in role_arns
+            for region in regions
+            for check in checks
+        ]
+        self.results: List[Dict[str, Any]] = []
+        self._sessions: Dict[Optional[str], "asyncio.Future[boto3.Session]"] = {}
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        """Start the sweep as an asyncio task on the running loop."""
+        self.status = "running"
+        self._task = asyncio.create_task(self._run())
+
+    def cancel(self) -> bool:
+        """Cancel a sweep that is still running."""
+        if self._task is None or self._task.done():
+            return False
+        self._task.cancel()
+        return True
+
+    def is_expired(self) -> bool:
+        """Check whether a finished sweep has outlived SWEEP_JOB_TTL."""
+        return self.finished_at is not None and time.time() - self.finished_at > SWEEP_JOB_TTL
+
+    async def _run(self) -> None:
+        sweep_slots = asyncio.Semaphore(SWEEP_CONCURRENCY)
+        account_slots = {
+            role_arn: asyncio.Semaphore(SWEEP_ACCOUNT_CONCURRENCY) for role_arn in self.role_arns
+        }
+        check_slots = {
+            check: asyncio.Semaphore(SWEEP_CHECK_BUDGETS.get(check, SWEEP_CONCURRENCY))
+            for check in self.checks
+        }
+
+        async def run_task(role_arn: Optional[str], region: str, check: str) -> None:
+            # Take the narrowest slots first so waiting tasks do not hold sweep-wide slots
+            async with account_slots[role_arn], check_slots[check], sweep_slots:
+                self.results.append(await self._run_check(role_arn, region, check))
+
+        try:
+            await asyncio.gather(*[run_task(*task) for task in self.tasks])
+            self.status = "completed"
+        except asyncio.CancelledError:
+            self.status = "cancelled"
+        except Exception as e:
+            print(f"[DEBUG:AssessmentSweep] Sweep {self.job_id} failed: {e}")
+            self.status = "failed"
+        finally:
+            self.finished_at = time.time()
+
+    async def _session(self, role_arn: Optional[str]) -> boto3.Session:
+        """Create the session of a role once, shared by every check in the account."""
+        if role_arn not in self._sessions:
+            self._sessions[role_arn] = asyncio.ensure_future(
+                call_aws(self.session_factory, role_arn)
+            )
+        return await self._sessions[role_arn]
+
+    async def _run_check(self, role_arn: Optional[str], region: str, check: str) -> Dict[str, Any]:
+        """Run one check and summarize its result, turning failures into an error entry."""
+        entry: Dict[str, Any] = {
+            "account_id": _account_id(role_arn),
+            "role_arn": role_arn,
+            "region": region,
+            "check": check,
+        }
+        ctx = SweepContext()
+        started = time.monotonic()
+        try:
+            session = await self._session(role_arn)
+            result = await self.checks[check](region, session, ctx)
+            entry["status"] = "error" if result.get("error") else "success"
+            entry.update(summarize_check_result(result))
+        except Exception as e:
+            print(f"[DEBUG:AssessmentSweep] {check} in {region} for {role_arn} failed: {e}")
+            entry["status"] = "error"
+            entry["error"] = str(e)
+        entry["duration_seconds"] = round(time.monotonic() - started, 3)
+        errors = [message["message"] for message in ctx.messages if message["level"] == "error"]
+        if errors:
+            entry["errors"] = errors
+        return entry
+
+    def report(self, include_results: bool = True) -> Dict[str, Any]:
+        """Get the status of the sweep and the aggregated report of the checks completed so far."""
+        totals: Dict[str, Dict[str, Any]] = {}
+        for entry in self.results:
+            check_totals = totals.setdefault(
+                entry["check"],
+                {
+                    "completed": 0,
+                    "errors": 0,
+                    "non_compliant_resources": 0,
+                    "accounts_affected": [],
+                },
+            )
+            check_totals["completed"] += 1
+            if entry["status"] == "error":
+                check_totals["errors"] += 1
+            if "resources_checked" in entry:
+                check_totals["resources_checked"] = (
+                    check_totals.get("resources_checked", 0) + entry["resources_checked"]
+                )
+                check_totals["non_compliant_resources"] += entry["non_compliant_resources"]
+            affected = entry.get("non_compliant_resources") or entry.get("services_not_enabled")
+            if affected and entry["account_id"] not in check_totals["accounts_affected"]:
+                check_totals["accounts_affected"].append(entry["account_id"])
+
+        report: Dict[str, Any] = {
+            "job_id": self.job_id,
+            "status": self.status,
+            "created_at": datetime.datetime.fromtimestamp(
+                self.created_at, datetime.timezone.utc
+            ).isoformat(),
+            "progress": {
+                "total_tasks": len(self.tasks),
+                "completed_tasks": len(self.results),
+                "failed_tasks": sum(1 for entry in self.results if entry["status"] == "error"),
+            },
+            "accounts": len(self.role_arns),
+            "regions": self.regions,
+            "checks": list(self.checks),
+            "totals": totals,
+            "throttling": get_throttle_stats(),
+        }
+        if self.finished_at is not None:
+            report["finished_at"] = datetime.datetime.fromtimestamp(
+                self.finished_at, datetime.timezone.utc
+            ).isoformat()
+        if include_results:
+            report["results"] = sorted(
+                self.results,
+                key=lambda entry: (entry["role_arn"] or "", entry["region"], entry["check"]),
+            )
+        return report
+
+
+def start_sweep(
+    role_arns: List[Optional[str]],
+    regions: List[str],
+    checks: Dict[str, CheckRunner],
+    session_factory: Callable[[Optional[str]], boto3.Session],
+) -> AssessmentSweep:
+    """Start a sweep in the background and register it under its job ID."""
+    for job_id in [job_id for job_id, sweep in _sweeps.items() if sweep.is_expired()]:
+        del _sweeps[job_id]
+
+    sweep = AssessmentSweep(role_arns, regions, checks, session_factory)
+    _sweeps[sweep.job_id] = sweep
+    sweep.start()
+    print(f"[DEBUG:AssessmentSweep] Started sweep {sweep.job_id} with {len(sweep.tasks)} checks")
+    return sweep
+
+
+def get_sweep(job_id: str) -> Optional[AssessmentSweep]:
+    """Get a registered sweep by job ID."""
+    return _sweeps.get(job_id)
+
+
+def clear_sweeps() -> None:
+    """Cancel running sweeps and forget every sweep."""
+    for sweep in _sweeps.values():
+        sweep.cancel()
+    _sweeps.clear()
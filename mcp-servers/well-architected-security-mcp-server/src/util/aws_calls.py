@@ -0,0 +1,417 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Async execution layer for blocking boto3 calls.
+
+boto3 clients are synchronous. Calling them directly from an ``async def`` tool blocks the
+event loop, so one slow ``describe_*`` call stalls every other MCP request served by the
+process. The helpers in this module run boto3 calls on a shared, sized worker pool, bound each
+call by a deadline, and stop paginated sweeps as soon as the awaiting task is cancelled.
+
+Concurrent checks also make EC2, ELB and Support return throttling errors. Every call to a
+boto3 client goes through a token bucket per AWS service, shared by all tools in the process.
+A throttling error halves the rate of its service and the call is retried after a jittered
+backoff; successful calls restore the rate step by step. Transient errors (5xx responses,
+request timeouts and dropped connections) are retried with the same backoff, without
+slowing the service down.
+"""
+
+import asyncio
+import functools
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+import botocore.exceptions
+import botocore.session
+import jmespath
+from botocore.paginate import TokenEncoder
+
+# Size of the worker pool shared by all tools in the process
+AWS_CALL_MAX_WORKERS = int(os.environ.get("SECURITY_MCP_MAX_WORKERS", "16"))
+
+# Default deadline (in seconds) for a single AWS API call or page of results
+AWS_CALL_TIMEOUT = float(os.environ.get("SECURITY_MCP_AWS_CALL_TIMEOUT", "60"))
+
+_aws_call_executor = ThreadPoolExecutor(
+    max_workers=AWS_CALL_MAX_WORKERS, thread_name_prefix="security-mcp-aws"
+)
+
+# Marks the end of a page iterator when advancing it on the worker pool
+_NO_MORE_PAGES = object()
+
+# Requests per second allowed by default for each AWS service, by boto3 service name
+DEFAULT_SERVICE_RATE_LIMITS = {"ec2": 20.0, "elb": 10.0, "elbv2": 10.0, "support": 5.0}
+
+# Requests per second for services without a default or configured rate limit
+AWS_DEFAULT_RATE_LIMIT = float(os.environ.get("SECURITY_MCP_DEFAULT_RATE_LIMIT", "20"))
+
+# Lowest rate a service is slowed down to after throttling errors
+AWS_MIN_RATE_LIMIT = float(os.environ.get("SECURITY_MCP_MIN_RATE_LIMIT", "0.5"))
+
+# Retries of a throttled or transiently failing call before the error is raised
+AWS_MAX_RETRIES = int(os.environ.get("SECURITY_MCP_AWS_MAX_RETRIES", "4"))
+
+# Base and maximum delay (in seconds) of the jittered exponential backoff between retries
+AWS_RETRY_BASE_DELAY = float(os.environ.get("SECURITY_MCP_AWS_RETRY_BASE_DELAY", "0.5"))
+AWS_RETRY_MAX_DELAY = float(os.environ.get("SECURITY_MCP_AWS_RETRY_MAX_DELAY", "20"))
+
+# Error codes AWS services use to report throttling
+THROTTLING_ERROR_CODES = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "TooManyRequestsException",
+        "ProvisionedThroughputExceededException",
+        "SlowDown",
+    }
+)
+
+# Error codes and HTTP status codes of transient server-side errors worth retrying
+TRANSIENT_ERROR_CODES = frozenset(
+    {
+        "RequestTimeout",
+        "RequestTimeoutException",
+        "PriorRequestNotComplete",
+        "InternalError",
+        "InternalFailure",
+        "ServiceUnavailable",
+    }
+)
+TRANSIENT_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+
+def _parse_rate_limits(value: str) -> Dict[str, float]:
+    """Parse rate limits in the form ``service=rate,service=rate``."""
+    rate_limits = {}
+    for entry in value.split(","):
+        service, _, rate = entry.partition("=")
+        if service.strip() and rate.strip():
+            rate_limits[service.strip()] = float(rate)
+    return rate_limits
+
+
+# Rate limits by service, e.g. SECURITY_MCP_RATE_LIMITS="ec2=40,support=2"
+AWS_RATE_LIMITS = {
+    **DEFAULT_SERVICE_RATE_LIMITS,
+    **_parse_rate_limits(os.environ.get("SECURITY_MCP_RATE_LIMITS", "")),
+}
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Check whether an exception is an AWS throttling error."""
+    if not isinstance(error, botocore.exceptions.ClientError):
+        return False
+    return error.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Check whether an exception is a transient AWS error, such as a 5xx or a dropped connection."""
+    if isinstance(error, botocore.exceptions.ClientError):
+        code = error.response.get("Error", {}).get("Code")
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return code in TRANSIENT_ERROR_CODES or status in TRANSIENT_STATUS_CODES
+    return isinstance(
+        error, (botocore.exceptions.ConnectionError, botocore.exceptions.HTTPClientError)
+    )
+
+
+class ServiceRateLimiter:
+    """Token bucket for the calls to one AWS service, slowed down by throttling errors.
+
+    The bucket holds up to one second of requests. Each throttling error halves the rate
+    (down to AWS_MIN_RATE_LIMIT) and each successful call adds back a twentieth of the
+    configured rate. Transient errors are retried without changing the rate. Callers wait for their token on the event loop, never in a worker
+    thread, so the wait does not count against the deadline of the call.
+    """
+
+    def __init__(self, service: str, rate: float) -> None:
+        self.service = service
+        self.max_rate = rate
+        self.rate = rate
+        self.tokens = max(1.0, rate)
+        self.updated = time.monotonic()
+        self.requests = 0
+        self.throttled = 0
+        self.transient_errors = 0
+        self.retries = 0
+        self.gave_up = 0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token for one request and return the seconds to wait before sending it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(max(1.0, self.rate), self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            self.requests += 1
+            return max(0.0, -self.tokens / self.rate)
+
+    def succeeded(self) -> None:
+        """Restore part of the configured rate after a successful call."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+    def retry_delay(self, error: BaseException, attempt: int) -> Optional[float]:
+        """Record a failed call and get the backoff before retrying it.
+
+        Args:
+            error: Exception raised by the call
+            attempt: Number of retries already made for the call
+
+        Returns:
+            Seconds to wait before the retry, or None if the error must be raised
+        """
+        throttled = is_throttling_error(error)
+        if not throttled and not is_transient_error(error):
+            return None
+        with self._lock:
+            if throttled:
+                self.throttled += 1
+                self.rate = max(AWS_MIN_RATE_LIMIT, self.rate / 2)
+                self.tokens = min(self.tokens, 0.0)
+            else:
+                self.transient_errors += 1
+            if attempt >= AWS_MAX_RETRIES:
+                self.gave_up += 1
+                return None
+            self.retries += 1
+        reason = "throttled" if throttled else f"transient error ({error})"
+        print(
+            f"[DEBUG:AwsCalls] {self.service} {reason}, retry {attempt + 1}/{AWS_MAX_RETRIES} "
+            f"at {self.rate:.2f} requests/s"
+        )
+        return random.uniform(0, min(AWS_RETRY_MAX_DELAY, AWS_RETRY_BASE_DELAY * 2**attempt))
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the request and throttling counts of the service."""
+        return {
+            "rate_limit": self.max_rate,
+            "current_rate": round(self.rate, 2),
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "transient_errors": self.transient_errors,
+            "retries": self.retries,
+            "gave_up": self.gave_up,
+        }
+
+
+_rate_limiters: Dict[str, ServiceRateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(service: str) -> ServiceRateLimiter:
+    """Get the process-wide rate limiter of an AWS service."""
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(service)
+        if limiter is None:
+            rate = AWS_RATE_LIMITS.get(service, AWS_DEFAULT_RATE_LIMIT)
+            limiter = _rate_limiters[service] = ServiceRateLimiter(service, rate)
+        return limiter
+
+
+def get_throttle_stats() -> Dict[str, Any]:
+    """Get the throttling counts of every AWS service called so far."""
+    with _rate_limiters_lock:
+        limiters = list(_rate_limiters.values())
+    services = {limiter.service: limiter.stats() for limiter in limiters}
+    return {
+        "total_throttled": sum(stats["throttled"] for stats in services.values()),
+        "total_retries": sum(stats["retries"] for stats in services.values()),
+        "services": services,
+    }
+
+
+def clear_rate_limiters() -> None:
+    """Drop all rate limiters and their throttling counts."""
+    with _rate_limiters_lock:
+        _rate_limiters.clear()
+
+
+def _service_name(method: Any) -> Optional[str]:
+    """Get the AWS service of a bound boto3 client method, or None for any other callable."""
+    try:
+        service = method.__self__.meta.service_model.service_name
+    except AttributeError:
+        return None
+    return service if isinstance(service, str) else None
+
+
+class AwsCallTimeoutError(botocore.exceptions.BotoCoreError):
+    """Raised when an AWS API call does not complete before its deadline."""
+
+    fmt = "AWS call {operation} did not complete within {timeout} seconds"
+
+
+def _operation_name(func: Callable[..., Any]) -> str:
+    """Return a readable name for a boto3 client method."""
+    return getattr(func, "__name__", None) or repr(func)
+
+
+async def call_aws(
+    func: Callable[..., Any],
+    *args: Any,
+    call_timeout: Optional[float] = None,
+    **kwargs: Any,
+) -> Any:
+    """Run a blocking boto3 client method on the shared worker pool.
+
+    If the awaiting task is cancelled before the call has started, the queued call is dropped.
+    A call that is already running finishes in its worker thread, but its result is discarded.
+    Calls to boto3 client methods wait for the rate limiter of their service, and throttled or
+    transiently failing calls are retried with a jittered backoff; the deadline applies to each
+    attempt.
+
+    Args:
+        func: Bound boto3 client method (or any blocking callable) to run
+        *args: Positional arguments for the call
+        call_timeout: Deadline in seconds for this call (defaults to AWS_CALL_TIMEOUT)
+        **kwargs: Keyword arguments for the call
+
+    Returns:
+        The value returned by the call
+
+    Raises:
+        AwsCallTimeoutError: If the call does not complete before its deadline
+    """
+    timeout = AWS_CALL_TIMEOUT if call_timeout is None else call_timeout
+    loop = asyncio.get_running_loop()
+    service = _service_name(func)
+    limiter = get_rate_limiter(service) if service else None
+
+    attempt = 0
+    while True:
+        if limiter is not None:
+            await asyncio.sleep(limiter.reserve())
+        future = loop.run_in_executor(_aws_call_executor, functools.partial(func, *args, **kwargs))
+        try:
+            result = await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise AwsCallTimeoutError(operation=_operation_name(func), timeout=timeout) from None
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            delay = limiter.retry_delay(e, attempt) if limiter is not None else None
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+        if limiter is not None:
+            limiter.succeeded()
+        return result
+
+
+@functools.lru_cache(maxsize=None)
+def _pagination_model(service: str, api_version: str) -> Any:
+    """Load the botocore pagination model of a service."""
+    return botocore.session.get_session().get_paginator_model(service, api_version)
+
+
+def _resume_kwargs(
+    client: Any, operation_name: str, page: Optional[Dict[str, Any]], kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build ``paginate`` arguments that continue a sweep after the given page.
+
+    Args:
+        client: boto3 client the sweep runs on
+        operation_name: Paginated client method, e.g. ``describe_volumes``
+        page: Last page returned by the sweep, or None to start over
+        kwargs: Arguments the sweep was started with
+
+    Returns:
+        The arguments with a starting token for the page after ``page``
+    """
+    if page is None:
+        return kwargs
+    service_model = client.meta.service_model
+    config = _pagination_model(
+        service_model.service_name, service_model.api_version
+    ).get_paginator(client.meta.method_to_api_mapping[operation_name])
+    input_tokens = config["input_token"]
+    output_tokens = config["output_token"]
+    if not isinstance(input_tokens, list):
+        input_tokens, output_tokens = [input_tokens], [output_tokens]
+    next_token = {
+        input_token: jmespath.search(output_token, page)
+        for input_token, output_token in zip(input_tokens, output_tokens, strict=True)
+    }
+    starting_token = TokenEncoder().encode(next_token)
+    return {
+        **kwargs,
+        "PaginationConfig": {
+            **kwargs.get("PaginationConfig", {}),
+            "StartingToken": starting_token,
+        },
+    }
+
+
+async def paginate_aws(
+    client: Any, operation_name: str, call_timeout: Optional[float] = None, **kwargs: Any
+) -> AsyncIterator[Dict[str, Any]]:
+    """Iterate over the pages of a paginated boto3 operation without blocking the event loop.
+
+    Each page is fetched on the shared worker pool under its own deadline. The sweep stops
+    between pages when the consuming task is cancelled or stops iterating. Page requests are
+    paced by the rate limiter of the service on the event loop. A throttled or transiently
+    failing page request ends the botocore page iterator, so after the backoff the sweep
+    resumes from the last page it returned and the error does not end the sweep early.
+
+    Args:
+        client: boto3 client to paginate on
+        operation_name: Paginated client method, e.g. ``describe_volumes``
+        call_timeout: Deadline in seconds for each page (defaults to AWS_CALL_TIMEOUT)
+        **kwargs: Arguments passed to ``paginator.paginate``
+
+    Yields:
+        Each page of results
+    """
+    paginator = client.get_paginator(operation_name)
+    service = _service_name(getattr(client, operation_name, None))
+    limiter = get_rate_limiter(service) if service else None
+    pages = iter(paginator.paginate(**kwargs))
+    last_page = None
+
+    attempt = 0
+    while True:
+        if limiter is not None:
+            await asyncio.sleep(limiter.reserve())
+        try:
+            page = await call_aws(next, pages, _NO_MORE_PAGES, call_timeout=call_timeout)
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            delay = limiter.retry_delay(e, attempt) if limiter is not None else None
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            attempt += 1
+            pages = iter(
+                paginator.paginate(**_resume_kwargs(client, operation_name, last_page, kwargs))
+            )
+            continue
+        if page is _NO_MORE_PAGES:
+            return
+        if limiter is not None:
+            limiter.succeeded()
+        attempt = 0
+        last_page = page
+        yield page
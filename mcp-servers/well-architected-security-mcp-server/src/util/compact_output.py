@@ -0,0 +1,125 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Compact, columnar encoding of storage and network check results.
+
+Full results repeat the ``checks``, ``issues`` and ``remediation`` keys and texts for every
+resource, which makes them expensive to place in an LLM context. The compact encoding replaces
+``resource_details`` with one table of resources, one row per resource. Resource types, issues
+and remediation steps are stored once in lookup tables and referenced by their index, and the
+per-resource ``checks`` are left out. A size report compares the two encodings.
+"""
+
+import json
+from typing import Any, Dict, List
+
+from src.util.serialization import json_default
+
+# Output formats accepted by the storage and network tools
+OUTPUT_FORMATS = ("full", "compact")
+
+# Columns of each row in the compact resources table
+COMPACT_COLUMNS = ["id", "type", "compliant", "issues", "remediation"]
+
+# Average number of bytes of JSON per LLM token, used to estimate token counts
+BYTES_PER_TOKEN = 4
+
+
+def validate_output_format(output_format: str) -> str:
+    """Normalize an output format name, raising ValueError if it is not supported."""
+    normalized = output_format.lower()
+    if normalized not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unsupported output format: {output_format}. "
+            f"Supported formats are: {', '.join(OUTPUT_FORMATS)}"
+        )
+    return normalized
+
+
+def json_size(value: Any) -> int:
+    """Get the size in bytes of a value serialized as compact JSON."""
+    return len(json.dumps(value, separators=(",", ":"), default=json_default).encode("utf-8"))
+
+
+def size_report(full: Dict[str, Any], compact: Dict[str, Any]) -> Dict[str, Any]:
+    """Compare the JSON size and estimated token count of the full and compact encodings."""
+    full_bytes = json_size(full)
+    compact_bytes = json_size(compact)
+    return {
+        "full_bytes": full_bytes,
+        "compact_bytes": compact_bytes,
+        "estimated_full_tokens": -(-full_bytes // BYTES_PER_TOKEN),
+        "estimated_compact_tokens": -(-compact_bytes // BYTES_PER_TOKEN),
+        "reduction_percent": round(100 * (1 - compact_bytes / full_bytes), 1),
+    }
+
+
+class _LookupTable:
+    """Distinct values in order of first appearance, referenced by their index."""
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        """Get the index of a value, adding it to the table if it is new."""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def compact_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Encode check results with a columnar resources table instead of resource_details.
+
+    Every field other than ``resource_details`` is kept as is. Each row of ``resources.rows``
+    holds, in the order of ``resources.columns``: the resource name or ID (its ARN if it has
+    neither), the index of its type in ``types``, 1 if it is compliant and 0 otherwise, the
+    indexes of its issues in ``issue_codes`` and the indexes of its remediation steps in
+    ``remediations``.
+
+    Args:
+        results: Results of a storage or network check, or a page of them
+
+    Returns:
+        The compact results, with a ``size_report`` comparing them to the full results
+    """
+    types = _LookupTable()
+    issues = _LookupTable()
+    remediations = _LookupTable()
+
+    rows = []
+    for resource in results.get("resource_details", []):
+        rows.append(
+            [
+                resource.get("name") or resource.get("id") or resource.get("arn"),
+                types.code(resource.get("type", "unknown")),
+                int(bool(resource.get("compliant", True))),
+                [issues.code(issue) for issue in resource.get("issues", [])],
+                [remediations.code(step) for step in resource.get("remediation", [])],
+            ]
+        )
+
+    compact = {key: value for key, value in results.items() if key != "resource_details"}
+    compact["output_format"] = "compact"
+    compact["resources"] = {"columns": COMPACT_COLUMNS, "rows": rows}
+    compact["types"] = types.values
+    compact["issue_codes"] = issues.values
+    compact["remediations"] = remediations.values
+    compact["size_report"] = size_report(results, compact)
+    return compact
@@ -0,0 +1,316 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Context stores for sharing tool results between MCP tool calls.
+
+Tools such as CheckSecurityServices store their results so later calls (GetSecurityFindings,
+GetStoredSecurityContext) can reuse them without calling AWS again. Two backends are available:
+
+- ``MemoryContextStore``: an in-process LRU cache whose entries expire after a TTL (default)
+- ``SQLiteContextStore``: a SQLite file shared by every server process on the host
+
+Both behave like a dictionary and also support explicit invalidation and per-key size
+accounting. ``create_context_store`` picks the backend from environment variables.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Optional
+
+from src.util.serialization import json_default
+
+# Backend used by create_context_store: "memory" or "sqlite"
+CONTEXT_STORE_BACKEND = os.environ.get("SECURITY_MCP_CONTEXT_STORE", "memory")
+
+# Path of the SQLite database used by the sqlite backend
+CONTEXT_STORE_PATH = os.environ.get("SECURITY_MCP_CONTEXT_DB", "security_mcp_context.db")
+
+# Seconds before a stored entry expires
+CONTEXT_STORE_TTL = float(os.environ.get("SECURITY_MCP_CONTEXT_TTL", "3600"))
+
+# Maximum number of entries kept before the least recently used ones are evicted
+CONTEXT_STORE_MAX_ENTRIES = int(os.environ.get("SECURITY_MCP_CONTEXT_MAX_ENTRIES", "256"))
+
+
+def _serialize(value: Any) -> str:
+    """Serialize a stored value to JSON, converting unsupported types such as datetimes."""
+    return json.dumps(value, default=json_default)
+
+
+class ContextStore(MutableMapping):
+    """Dictionary-like store of tool results with expiry, LRU eviction and size accounting."""
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: Optional[int] = None):
+        """Initialize the store.
+
+        Args:
+            ttl: Seconds before an entry expires (defaults to CONTEXT_STORE_TTL)
+            max_entries: Maximum number of entries (defaults to CONTEXT_STORE_MAX_ENTRIES)
+        """
+        self.ttl = CONTEXT_STORE_TTL if ttl is None else ttl
+        self.max_entries = CONTEXT_STORE_MAX_ENTRIES if max_entries is None else max_entries
+
+    @abstractmethod
+    def metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the size and timestamps of an entry.
+
+        Args:
+            key: Key of the entry
+
+        Returns:
+            Dictionary with size_bytes, stored_at and expires_at, or None if the key is absent
+        """
+
+    @abstractmethod
+    def invalidate(self, key: Optional[str] = None, prefix: Optional[str] = None) -> int:
+        """Remove one entry, every entry whose key starts with a prefix, or everything.
+
+        Args:
+            key: Exact key to remove
+            prefix: Remove every key starting with this prefix
+
+        Returns:
+            Number of entries removed
+        """
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the number of entries, their total size and the size of each entry."""
+        sizes = {}
+        for key in list(self):
+            entry = self.metadata(key)
+            if entry is not None:
+                sizes[key] = entry["size_bytes"]
+
+        return {
+            "backend": self.backend,
+            "entries": len(sizes),
+            "total_bytes": sum(sizes.values()),
+            "size_by_key": sizes,
+            "ttl_seconds": self.ttl,
+            "max_entries": self.max_entries,
+        }
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self.invalidate()
+
+
+class MemoryContextStore(ContextStore):
+    """In-process context store with LRU eviction and per-entry TTL."""
+
+    backend = "memory"
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: Optional[int] = None):
+        """Initialize an empty in-memory store."""
+        super().__init__(ttl, max_entries)
+        # key -> (value, size_bytes, stored_at, expires_at), least recently used first
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _live_entry(self, key: str) -> Optional[tuple]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[3] <= time.time():
+            del self._entries[key]
+            return None
+        return entry
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                raise KeyError(key)
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        now = time.time()
+        size_bytes = len(_serialize(value).encode("utf-8"))
+        with self._lock:
+            self._entries[key] = (value, size_bytes, now, now + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self._entries[key]
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            keys = [key for key in list(self._entries) if self._live_entry(key) is not None]
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return len(list(iter(self)))
+
+    def metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the size and timestamps of an entry."""
+        with self._lock:
+            entry = self._live_entry(key)
+        if entry is None:
+            return None
+        return {"size_bytes": entry[1], "stored_at": entry[2], "expires_at": entry[3]}
+
+    def invalidate(self, key: Optional[str] = None, prefix: Optional[str] = None) -> int:
+        """Remove one entry, every entry whose key starts with a prefix, or everything."""
+        with self._lock:
+            if key is not None:
+                return 1 if self._entries.pop(key, None) is not None else 0
+            doomed = [k for k in self._entries if prefix is None or k.startswith(prefix)]
+            for k in doomed:
+                del self._entries[k]
+            return len(doomed)
+
+
+class SQLiteContextStore(ContextStore):
+    """Context store backed by a SQLite file, shared by every process that opens it.
+
+    Values are stored as JSON, so reading an entry returns a copy: changes to the returned
+    object must be written back with ``store[key] = value``.
+    """
+
+    backend = "sqlite"
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        table: str = "context",
+    ):
+        """Open (and create if needed) the SQLite database at path.
+
+        Stores that share a database file keep their entries in separate tables.
+        """
+        super().__init__(ttl, max_entries)
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+
+    def _execute(self, sql: str, params: tuple = ()) -> list:
+        with self._lock, self._connection:
+            return self._connection.execute(sql, params).fetchall()
+
+    def __getitem__(self, key: str) -> Any:
+        now = time.time()
+        rows = self._execute(
+            f"SELECT value FROM {self.table} WHERE key = ? AND expires_at > ?", (key, now)
+        )
+        if not rows:
+            raise KeyError(key)
+        self._execute(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(rows[0][0])
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        now = time.time()
+        serialized = _serialize(value)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?, ?, ?)",
+                (key, serialized, len(serialized.encode("utf-8")), now, now + self.ttl, now),
+            )
+            # Drop expired entries, then evict the least recently used beyond max_entries
+            self._connection.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (now,))
+            self._connection.execute(
+                f"""
+                DELETE FROM {self.table} WHERE key IN (
+                    SELECT key FROM {self.table} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    def __delitem__(self, key: str) -> None:
+        if not self.invalidate(key=key):
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        rows = self._execute(f"SELECT key FROM {self.table} WHERE expires_at > ?", (time.time(),))
+        return iter([row[0] for row in rows])
+
+    def __len__(self) -> int:
+        rows = self._execute(
+            f"SELECT COUNT(*) FROM {self.table} WHERE expires_at > ?", (time.time(),)
+        )
+        return rows[0][0]
+
+    def metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the size and timestamps of an entry."""
+        rows = self._execute(
+            f"SELECT size_bytes, stored_at, expires_at FROM {self.table} "
+            "WHERE key = ? AND expires_at > ?",
+            (key, time.time()),
+        )
+        if not rows:
+            return None
+        size_bytes, stored_at, expires_at = rows[0]
+        return {"size_bytes": size_bytes, "stored_at": stored_at, "expires_at": expires_at}
+
+    def invalidate(self, key: Optional[str] = None, prefix: Optional[str] = None) -> int:
+        """Remove one entry, every entry whose key starts with a prefix, or everything."""
+        with self._lock, self._connection:
+            if key is not None:
+                cursor = self._connection.execute(
+                    f"DELETE FROM {self.table} WHERE key = ?", (key,)
+                )
+            elif prefix is not None:
+                cursor = self._connection.execute(
+                    f"DELETE FROM {self.table} WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+                )
+            else:
+                cursor = self._connection.execute(f"DELETE FROM {self.table}")
+            return cursor.rowcount
+
+
+def create_context_store(
+    ttl: Optional[float] = None, max_entries: Optional[int] = None, table: str = "context"
+) -> ContextStore:
+    """Create the context store selected by SECURITY_MCP_CONTEXT_STORE.
+
+    Args:
+        ttl: Seconds before an entry expires (defaults to CONTEXT_STORE_TTL)
+        max_entries: Maximum number of entries (defaults to CONTEXT_STORE_MAX_ENTRIES)
+        table: SQLite table holding the entries, so several stores can share one database
+
+    Returns:
+        A SQLiteContextStore at SECURITY_MCP_CONTEXT_DB for ``sqlite``, otherwise a
+        MemoryContextStore
+    """
+    if CONTEXT_STORE_BACKEND.lower() == "sqlite":
+        return SQLiteContextStore(CONTEXT_STORE_PATH, ttl, max_entries, table)
+    return MemoryContextStore(ttl, max_entries)
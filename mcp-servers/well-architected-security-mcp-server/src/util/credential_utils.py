@@ -18,21 +18,52 @@
 """Utility functions for AWS credential management including AssumeRole support."""
 
 import os
-from typing import Optional
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple
 
 import boto3
+import botocore.session
 from botocore.config import Config
+from botocore.credentials import RefreshableCredentials
 from loguru import logger
 
 from src import __version__
+from src.util.aws_calls import AWS_CALL_MAX_WORKERS, call_aws
 
 # User agent configuration for AWS API calls
 USER_AGENT_CONFIG = Config(
     user_agent_extra=f"awslabs/mcp/well-architected-security-mcp-server/{__version__}"
 )
 
+# Cached clients are shared by every worker thread, so size their connection pools to match.
+# call_aws and paginate_aws retry throttled and transient errors on the event loop, so
+# botocore must not retry them a second time inside the worker thread.
+CLIENT_POOL_CONFIG = Config(
+    max_pool_connections=AWS_CALL_MAX_WORKERS,
+    retries={"mode": "standard", "total_max_attempts": 1},
+)
+
+# Process-wide session cache keyed by (role ARN, external ID, session name). The global lock
+# only guards the dictionaries; sessions are created under a per-key lock so that a slow
+# AssumeRole for one role never blocks callers of another.
+SessionCacheKey = Tuple[Optional[str], Optional[str], Optional[str]]
+_session_cache: Dict[SessionCacheKey, boto3.Session] = {}
+_session_key_locks: Dict[SessionCacheKey, threading.Lock] = {}
+_session_cache_lock = threading.Lock()
+_session_cache_stats = {
+    "session_hits": 0,
+    "session_misses": 0,
+    "client_hits": 0,
+    "client_misses": 0,
+    "sts_assume_role_calls": 0,
+}
+
+# Caller identity ARN of each session, dropped together with the session
+_session_identities: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
 
-def create_aws_session() -> boto3.Session:
+
+def create_aws_session(role_arn: Optional[str] = None) -> boto3.Session:
     """Create an AWS session with support for AssumeRole via environment variables.
     
     This function checks for AssumeRole environment variables and creates an appropriate
@@ -44,24 +75,144 @@ def create_aws_session() -> boto3.Session:
     - AWS_ASSUME_ROLE_SESSION_NAME: Session name for the assumed role (optional, defaults to 'mcp-server-session')
     - AWS_ASSUME_ROLE_EXTERNAL_ID: External ID for enhanced security (optional)
     
+    Sessions are cached for the life of the process, keyed by the role ARN, external ID and
+    session name, so AssumeRole is only called when the configuration changes or the assumed
+    role credentials are about to expire. Clients created from a cached session are cached
+    per service and region as well.
+
+    Args:
+        role_arn: Role to assume instead of AWS_ASSUME_ROLE_ARN, used by multi-account sweeps
+
     Returns:
         boto3.Session: Configured AWS session
         
     Raises:
         Exception: If AssumeRole operation fails
     """
-    assume_role_arn = os.environ.get("AWS_ASSUME_ROLE_ARN")
-    
-    if assume_role_arn:
-        logger.info(f"AssumeRole configuration detected. Assuming role: {assume_role_arn}")
-        return _create_assume_role_session(assume_role_arn)
-    else:
-        logger.info("Using default AWS credentials chain")
-        return boto3.Session()
+    assume_role_arn = role_arn or os.environ.get("AWS_ASSUME_ROLE_ARN")
+    cache_key = (
+        assume_role_arn,
+        os.environ.get("AWS_ASSUME_ROLE_EXTERNAL_ID") if assume_role_arn else None,
+        os.environ.get("AWS_ASSUME_ROLE_SESSION_NAME") if assume_role_arn else None,
+    )
+
+    with _session_cache_lock:
+        session = _session_cache.get(cache_key)
+        if session is not None:
+            _session_cache_stats["session_hits"] += 1
+            return session
+        key_lock = _session_key_locks.setdefault(cache_key, threading.Lock())
+
+    with key_lock:
+        # Another caller may have created the session while we waited for the key lock
+        with _session_cache_lock:
+            session = _session_cache.get(cache_key)
+            if session is not None:
+                _session_cache_stats["session_hits"] += 1
+                return session
+            _session_cache_stats["session_misses"] += 1
+
+        if assume_role_arn:
+            logger.info(f"AssumeRole configuration detected. Assuming role: {assume_role_arn}")
+            session = _create_assume_role_session(assume_role_arn)
+        else:
+            logger.info("Using default AWS credentials chain")
+            session = boto3.Session()
+
+        session = _cache_clients(session)
+        with _session_cache_lock:
+            _session_cache[cache_key] = session
+        return session
+
+
+def get_session_cache_stats() -> dict:
+    """Get hit/miss and STS call counters for the session and client caches.
+
+    Returns:
+        dict: Counters since the cache was last cleared, plus the number of cached sessions
+    """
+    with _session_cache_lock:
+        return {**_session_cache_stats, "cached_sessions": len(_session_cache)}
+
+
+def clear_session_cache() -> None:
+    """Drop all cached sessions and clients and reset the cache counters."""
+    with _session_cache_lock:
+        _session_cache.clear()
+        _session_key_locks.clear()
+        _session_identities.clear()
+        for counter in _session_cache_stats:
+            _session_cache_stats[counter] = 0
+
+
+def _cache_clients(session: boto3.Session) -> boto3.Session:
+    """Make ``session.client`` return one shared client per service, region and config.
+
+    boto3 clients are thread-safe and each keeps its own urllib3 connection pool, so reusing
+    them keeps connections open across tool calls instead of rebuilding clients every time.
+
+    Args:
+        session: The boto3 session to wrap
+
+    Returns:
+        boto3.Session: The same session with a caching ``client`` method
+    """
+    if not isinstance(session, boto3.session.Session):
+        return session
+
+    create_client = session.client
+    clients: Dict[Tuple[str, Optional[str], Optional[str]], Any] = {}
+    clients_lock = threading.Lock()
+
+    def client(
+        service_name: str,
+        region_name: Optional[str] = None,
+        config: Optional[Config] = None,
+        **kwargs: Any,
+    ) -> Any:
+        if kwargs:
+            return create_client(service_name, region_name=region_name, config=config, **kwargs)
+
+        key = (service_name, region_name or session.region_name, _config_key(config))
+        with clients_lock:
+            cached_client = clients.get(key)
+            if cached_client is not None:
+                _session_cache_stats["client_hits"] += 1
+                return cached_client
+
+            _session_cache_stats["client_misses"] += 1
+            pool_config = CLIENT_POOL_CONFIG if config is None else config.merge(CLIENT_POOL_CONFIG)
+            cached_client = create_client(service_name, region_name=region_name, config=pool_config)
+            clients[key] = cached_client
+            return cached_client
+
+    session.client = client
+    return session
+
+
+def _config_key(config: Optional[Config]) -> Optional[str]:
+    """Build a cache key from the option values of a client config.
+
+    Keying on the values rather than the object means equal configs share a client, and a
+    config created inline for a single call cannot grow the cache or be confused with another
+    config that later reuses its ``id``.
+
+    Args:
+        config: The client config, or None for the defaults
+
+    Returns:
+        A string describing every option of the config, or None for the defaults
+    """
+    if config is None:
+        return None
+    return repr([(option, getattr(config, option)) for option in Config.OPTION_DEFAULTS])
 
 
 def _create_assume_role_session(role_arn: str) -> boto3.Session:
     """Create a session using AssumeRole with the specified role ARN.
+
+    The session's credentials are refreshable: botocore calls AssumeRole again shortly before
+    the current credentials expire, so a cached session stays usable indefinitely.
     
     Args:
         role_arn: The ARN of the role to assume
@@ -93,17 +244,28 @@ def _create_assume_role_session(role_arn: str) -> boto3.Session:
             logger.info("Using external ID for AssumeRole operation")
         
         logger.info(f"Attempting to assume role with session name: {session_name}")
-        
+
+        def assume_role() -> dict:
+            with _session_cache_lock:
+                _session_cache_stats["sts_assume_role_calls"] += 1
+            return sts_client.assume_role(**assume_role_params)
+
+        def refresh_credentials() -> dict:
+            logger.info(f"Refreshing credentials for assumed role: {role_arn}")
+            return _credential_metadata(assume_role()["Credentials"])
+
         # Assume the role
-        response = sts_client.assume_role(**assume_role_params)
-        credentials = response["Credentials"]
-        
-        # Create new session with assumed role credentials
-        assumed_session = boto3.Session(
-            aws_access_key_id=credentials["AccessKeyId"],
-            aws_secret_access_key=credentials["SecretAccessKey"],
-            aws_session_token=credentials["SessionToken"],
+        response = assume_role()
+        credentials = RefreshableCredentials.create_from_metadata(
+            metadata=_credential_metadata(response["Credentials"]),
+            refresh_using=refresh_credentials,
+            method="sts-assume-role",
         )
+
+        # Create new session with the refreshable assumed role credentials
+        botocore_session = botocore.session.get_session()
+        botocore_session._credentials = credentials
+        assumed_session = boto3.Session(botocore_session=botocore_session)
         
         logger.info("Successfully assumed role and created session")
         
@@ -119,6 +281,16 @@ def _create_assume_role_session(role_arn: str) -> boto3.Session:
         raise Exception(f"AssumeRole operation failed: {str(e)}")
 
 
+def _credential_metadata(credentials: dict) -> dict:
+    """Convert STS credentials into the metadata format used by RefreshableCredentials."""
+    return {
+        "access_key": credentials["AccessKeyId"],
+        "secret_key": credentials["SecretAccessKey"],
+        "token": credentials["SessionToken"],
+        "expiry_time": credentials["Expiration"].isoformat(),
+    }
+
+
 def get_session_info(session: boto3.Session) -> dict:
     """Get information about the current AWS session for debugging purposes.
     
@@ -146,6 +318,35 @@ def get_session_info(session: boto3.Session) -> dict:
         }
 
 
+async def get_credential_identity(session: boto3.Session) -> Optional[str]:
+    """Get the caller identity ARN of a session, used to scope cached AWS data.
+
+    Unlike the access key ID, the ARN of a user or assumed role stays the same when its
+    credentials are rotated or refreshed, so cached data keeps one entry per identity. The ARN
+    is looked up with GetCallerIdentity once per session.
+
+    Args:
+        session: The boto3 session to inspect
+
+    Returns:
+        The ARN of the session's identity, or None if it cannot be determined
+    """
+    identity = _session_identities.get(session)
+    if identity is not None:
+        return identity
+
+    try:
+        sts_client = session.client("sts", config=USER_AGENT_CONFIG)
+        identity = (await call_aws(sts_client.get_caller_identity)).get("Arn")
+    except Exception as e:
+        logger.warning(f"Could not determine the identity of the session: {str(e)}")
+        return None
+
+    if identity is not None:
+        _session_identities[session] = identity
+    return identity
+
+
 def validate_assume_role_config() -> dict:
     """Validate AssumeRole configuration from environment variables.
     
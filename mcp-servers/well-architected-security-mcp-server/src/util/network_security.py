@@ -17,7 +17,11 @@
 
 """Utility functions for checking AWS network services for data-in-transit security."""
 
-from typing import Any, Dict, List
+import asyncio
+import os
+from bisect import bisect_left, bisect_right
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import boto3
 import botocore.exceptions
@@ -25,12 +29,29 @@ from botocore.config import Config
 from mcp.server.fastmcp import Context
 
 from src import __version__
+from src.util.aws_calls import call_aws, paginate_aws
+from src.util.progress import ProgressReporter
+from src.util.resource_inventory import get_resource_inventory
+from src.util.snapshots import AssessmentSnapshot
 
 # User agent configuration for AWS API calls
 USER_AGENT_CONFIG = Config(
     user_agent_extra=f"awslabs/mcp/well-architected-security-mcp-server/{__version__}"
 )
 
+# Network services check_network_security knows how to check
+NETWORK_SERVICES = ["elb", "vpc", "apigateway", "cloudfront"]
+
+# Keys of find_network_resources' resources_by_service covered by each service check
+NETWORK_INVENTORY_KEYS = {
+    "elb": ["elb"],
+    "elbv2": ["elb"],
+    "vpc": ["vpc", "vpc_endpoints"],
+    "security_groups": ["security_groups"],
+    "apigateway": ["apigateway"],
+    "cloudfront": ["cloudfront"],
+}
+
 # Acceptable TLS versions for secure data in transit
 ACCEPTABLE_TLS_VERSIONS = ["TLSv1.2", "TLSv1.3"]
 
@@ -40,6 +61,36 @@ MIN_TLS_VERSION = "TLSv1.2"
 # Insecure protocols that should be avoided
 INSECURE_PROTOCOLS = ["TLSv1.0", "TLSv1.1", "SSLv3", "SSLv2"]
 
+# Maximum number of load balancers checked at the same time
+LOAD_BALANCER_CONCURRENCY = int(os.environ.get("SECURITY_MCP_LB_CONCURRENCY", "16"))
+
+# Maximum number of names accepted by a single Classic Load Balancer describe call
+CLASSIC_LB_DESCRIBE_BATCH_SIZE = 20
+
+# Predefined ALB/NLB SSL policies keyed by region; they are the same for every account
+_ssl_policy_catalogs: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+# Sensitive ports for data in transit
+SENSITIVE_PORTS = {
+    20: "FTP-Data",
+    21: "FTP",
+    23: "Telnet",
+    25: "SMTP",
+    69: "TFTP",
+    80: "HTTP",
+    110: "POP3",
+    143: "IMAP",
+}
+
+# Sorted sensitive port numbers, for matching against rule port ranges
+_SENSITIVE_PORT_NUMBERS = sorted(SENSITIVE_PORTS)
+
+# (ranges key, CIDR key, CIDR) for ingress sources that are open to the world
+_WORLD_OPEN_CIDRS = [
+    ("IpRanges", "CidrIp", "0.0.0.0/0"),
+    ("Ipv6Ranges", "CidrIpv6", "::/0"),
+]
+
 
 async def check_network_security(
     region: str,
@@ -47,6 +98,8 @@ async def check_network_security(
     session: boto3.Session,
     ctx: Context,
     include_non_compliant_only: bool = False,
+    snapshot: Optional[AssessmentSnapshot] = None,
+    on_update: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> Dict[str, Any]:
     """Check AWS network resources for data-in-transit security best practices.
 
@@ -56,6 +109,10 @@ async def check_network_security(
         session: boto3 Session for AWS API calls
         ctx: MCP context for error reporting
         include_non_compliant_only: Whether to include only non-compliant resources in the results
+        snapshot: Snapshot recording this run; unchanged results of its previous snapshot are
+            reused instead of being checked again
+        on_update: Called with the running results each time a service check completes, so
+            the resource_details found so far can be read before the whole check finishes
 
     Returns:
         Dictionary with network security status
@@ -71,47 +128,79 @@ async def check_network_security(
         "recommendations": [],
     }
 
+    # Report progress to the client as each service check completes; elb and vpc run two checks
+    check_counts = {"elb": 2, "vpc": 2, "apigateway": 1, "cloudfront": int(region == "us-east-1")}
+    progress = ProgressReporter(
+        ctx,
+        sum(count for service, count in check_counts.items() if service in services),
+        f"Network security check in {region}",
+    )
+
     # Find all network resources using Resource Explorer
     network_resources = await find_network_resources(region, session, services, ctx)
+    if snapshot:
+        snapshot.index_inventory(network_resources, NETWORK_INVENTORY_KEYS)
+
+    async def run_check(
+        service: str, check: Callable[..., Awaitable[Dict[str, Any]]], per_resource: bool = False
+    ) -> None:
+        """Run one service check, reusing unchanged results of the previous snapshot."""
+        service_results = snapshot.reusable_service(service) if snapshot else None
+        if service_results is None:
+            if per_resource and snapshot:
+                service_results = await check(reuse=snapshot.reusable_resources(service))
+            else:
+                service_results = await check()
+        if snapshot:
+            snapshot.record(service, service_results)
+        await _update_results(results, service_results, service, include_non_compliant_only)
+        if on_update:
+            on_update(results)
+        await progress.service_done(service, service_results.get("resources_checked", 0))
 
     # Check each service as requested
     if "elb" in services:
         # Check classic load balancers
         elb_client = session.client("elb", region_name=region, config=USER_AGENT_CONFIG)
-        elb_results = await check_classic_load_balancers(
-            region, elb_client, ctx, network_resources
+        await run_check(
+            "elb",
+            partial(check_classic_load_balancers, region, elb_client, ctx, network_resources),
         )
-        await _update_results(results, elb_results, "elb", include_non_compliant_only)
 
         # Check application and network load balancers
         elbv2_client = session.client("elbv2", region_name=region, config=USER_AGENT_CONFIG)
-        elbv2_results = await check_elbv2_load_balancers(
-            region, elbv2_client, ctx, network_resources
+        await run_check(
+            "elbv2",
+            partial(check_elbv2_load_balancers, region, elbv2_client, ctx, network_resources),
+            per_resource=True,
         )
-        await _update_results(results, elbv2_results, "elbv2", include_non_compliant_only)
 
     if "vpc" in services:
         vpc_client = session.client("ec2", region_name=region, config=USER_AGENT_CONFIG)
-        vpc_results = await check_vpc_endpoints(region, vpc_client, ctx, network_resources)
-        await _update_results(results, vpc_results, "vpc", include_non_compliant_only)
+        await run_check(
+            "vpc", partial(check_vpc_endpoints, region, vpc_client, ctx, network_resources)
+        )
 
         # Check security groups
-        sg_results = await check_security_groups(region, vpc_client, ctx, network_resources)
-        await _update_results(results, sg_results, "security_groups", include_non_compliant_only)
+        await run_check(
+            "security_groups",
+            partial(check_security_groups, region, vpc_client, ctx, network_resources),
+        )
 
     if "apigateway" in services:
         apigw_client = session.client("apigateway", region_name=region, config=USER_AGENT_CONFIG)
-        apigw_results = await check_api_gateway(region, apigw_client, ctx, network_resources)
-        await _update_results(results, apigw_results, "apigateway", include_non_compliant_only)
+        await run_check(
+            "apigateway", partial(check_api_gateway, region, apigw_client, ctx, network_resources)
+        )
 
     if "cloudfront" in services:
         # CloudFront is a global service, but we'll check it if requested
         if region == "us-east-1":
             cf_client = session.client("cloudfront", region_name=region, config=USER_AGENT_CONFIG)
-            cf_results = await check_cloudfront_distributions(
-                region, cf_client, ctx, network_resources
+            await run_check(
+                "cloudfront",
+                partial(check_cloudfront_distributions, region, cf_client, ctx, network_resources),
             )
-            await _update_results(results, cf_results, "cloudfront", include_non_compliant_only)
 
     # Generate overall recommendations based on findings
     results["recommendations"] = await generate_recommendations(results)
@@ -237,59 +326,30 @@ async def find_network_resources(
             f"[DEBUG:NetworkSecurity] Finding network resources in {region} using Resource Explorer"
         )
 
-        # Initialize resource explorer client
-        resource_explorer = session.client(
-            "resource-explorer-2", region_name=region, config=USER_AGENT_CONFIG
-        )
-
-        # Try to get the default view for Resource Explorer
-        print("[DEBUG:NetworkSecurity] Listing Resource Explorer views...")
-        views = resource_explorer.list_views()
-        print(f"[DEBUG:NetworkSecurity] Found {len(views.get('Views', []))} views")
-
-        default_view = None
-        # Find the default view
-        for view in views.get("Views", []):
-            print(f"[DEBUG:NetworkSecurity] View: {view.get('ViewArn')}")
-            if view.get("Filters", {}).get("FilterString", "") == "":
-                default_view = view.get("ViewArn")
-                print(f"[DEBUG:NetworkSecurity] Found default view: {default_view}")
-                break
-
-        if not default_view:
+        # Query the shared Resource Explorer inventory instead of sweeping for each check
+        inventory = await get_resource_inventory(region, session, ctx)
+        if inventory is None:
             print("[DEBUG:NetworkSecurity] No default view found. Cannot use Resource Explorer.")
             await ctx.warning(
                 "No default Resource Explorer view found. Will fall back to direct service API calls."
             )
             return {"error": "No default Resource Explorer view found"}
 
-        # Build filter strings for each service
-        service_filters = []
-
+        # Map the requested services onto Resource Explorer services and resource types
+        service_names = []
+        resource_types = []
         if "elb" in services:
-            service_filters.append("service:elasticloadbalancing")
+            service_names.append("elasticloadbalancing")
         if "vpc" in services:
-            service_filters.append("service:ec2 resourcetype:ec2:vpc")
-            service_filters.append("service:ec2 resourcetype:ec2:vpc-endpoint")
-            service_filters.append("service:ec2 resourcetype:ec2:security-group")
+            resource_types.extend(["ec2:vpc", "ec2:vpc-endpoint", "ec2:security-group"])
         if "apigateway" in services:
-            service_filters.append("service:apigateway")
+            service_names.append("apigateway")
         if "cloudfront" in services and region == "us-east-1":
-            service_filters.append("service:cloudfront")
-
-        # Combine with OR
-        filter_string = " OR ".join(service_filters)
-        print(f"[DEBUG:NetworkSecurity] Using filter string: {filter_string}")
-
-        # Get resources
-        resources = []
-        paginator = resource_explorer.get_paginator("list_resources")
-        page_iterator = paginator.paginate(
-            Filters={"FilterString": filter_string}, MaxResults=100, ViewArn=default_view
+            service_names.append("cloudfront")
+        print(
+            f"[DEBUG:NetworkSecurity] Selecting services {service_names} and types {resource_types}"
         )
-
-        for page in page_iterator:
-            resources.extend(page.get("Resources", []))
+        resources = inventory.select(service_names, resource_types)
 
         print(f"[DEBUG:NetworkSecurity] Found {len(resources)} total network resources")
 
@@ -355,6 +415,7 @@ async def check_classic_load_balancers(
     try:
         # Get load balancer list - either from Resource Explorer or directly
         load_balancers = []
+        described = {}
 
         if "error" not in network_resources and "elb" in network_resources.get(
             "resources_by_service", {}
@@ -367,113 +428,35 @@ async def check_classic_load_balancers(
                 if ":loadbalancer/app/" not in arn and ":loadbalancer/net/" not in arn:
                     lb_name = arn.split("/")[-1]
                     load_balancers.append(lb_name)
+
+            # Describe the load balancers in batches instead of one call per load balancer
+            described = await _describe_classic_load_balancers(elb_client, load_balancers)
         else:
             # Fall back to direct API call
-            response = elb_client.describe_load_balancers()
+            response = await call_aws(elb_client.describe_load_balancers)
             for lb in response["LoadBalancerDescriptions"]:
                 load_balancers.append(lb["LoadBalancerName"])
+                described[lb["LoadBalancerName"]] = lb
 
         print(
             f"[DEBUG:NetworkSecurity] Found {len(load_balancers)} Classic Load Balancers in region {region}"
         )
         results["resources_checked"] = len(load_balancers)
 
-        # Check each load balancer
-        for lb_name in load_balancers:
-            lb_result = {
-                "name": lb_name,
-                "arn": f"arn:aws:elasticloadbalancing:{region}:loadbalancer/{lb_name}",
-                "type": "classic_load_balancer",
-                "compliant": True,
-                "issues": [],
-                "checks": {},
-            }
-
-            # Get load balancer details
-            lb_details = elb_client.describe_load_balancers(LoadBalancerNames=[lb_name])[
-                "LoadBalancerDescriptions"
-            ][0]
-
-            # Check for HTTPS listeners
-            listeners = lb_details.get("ListenerDescriptions", [])
-            https_listeners = [
-                lst for lst in listeners if lst["Listener"].get("Protocol") in ["HTTPS", "SSL"]
-            ]
-            http_listeners = [
-                lst for lst in listeners if lst["Listener"].get("Protocol") in ["HTTP", "TCP"]
-            ]
-
-            lb_result["checks"]["https_listeners"] = {
-                "count": len(https_listeners),
-                "total_listeners": len(listeners),
-            }
-
-            # Check if all listeners are secure
-            all_secure = len(http_listeners) == 0 and len(https_listeners) > 0
-            lb_result["checks"]["all_listeners_secure"] = all_secure
-
-            if not all_secure:
-                lb_result["compliant"] = False
-                lb_result["issues"].append(f"Found {len(http_listeners)} non-encrypted listeners")
-
-            # Check SSL policies for each HTTPS listener
-            for https_listener in https_listeners:
-                ssl_policy = None
-                try:
-                    policy_response = elb_client.describe_load_balancer_policies(
-                        LoadBalancerName=lb_name,
-                        PolicyNames=[https_listener["PolicyNames"][0]]
-                        if https_listener.get("PolicyNames")
-                        else [],
-                    )
-
-                    if policy_response.get("PolicyDescriptions"):
-                        ssl_policy = policy_response["PolicyDescriptions"][0]
-
-                        # Check for secure protocols
-                        protocol_policies = [
-                            attr
-                            for attr in ssl_policy.get("PolicyAttributeDescriptions", [])
-                            if attr["AttributeName"].startswith("Protocol-")
-                            and attr["AttributeValue"] == "true"
-                        ]
-
-                        insecure_protocols = [
-                            p["AttributeName"].replace("Protocol-", "")
-                            for p in protocol_policies
-                            if p["AttributeName"].replace("Protocol-", "") in INSECURE_PROTOCOLS
-                        ]
-
-                        if insecure_protocols:
-                            lb_result["compliant"] = False
-                            lb_result["issues"].append(
-                                f"Using insecure protocols: {', '.join(insecure_protocols)}"
-                            )
-
-                            if "ssl_policies" not in lb_result["checks"]:
-                                lb_result["checks"]["ssl_policies"] = []
-
-                            lb_result["checks"]["ssl_policies"].append(
-                                {
-                                    "name": ssl_policy.get("PolicyName"),
-                                    "insecure_protocols": insecure_protocols,
-                                }
-                            )
-                except Exception as e:
-                    print(f"[DEBUG:NetworkSecurity] Error checking SSL policy for {lb_name}: {e}")
-                    lb_result["issues"].append("Error checking SSL policy")
-
-            # Generate remediation steps
-            lb_result["remediation"] = []
+        # Check the load balancers concurrently
+        semaphore = asyncio.Semaphore(LOAD_BALANCER_CONCURRENCY)
 
-            if not all_secure:
-                lb_result["remediation"].append("Replace HTTP listeners with HTTPS listeners")
+        async def check_load_balancer(lb_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await _check_classic_load_balancer(
+                    region, elb_client, lb_name, described.get(lb_name)
+                )
 
-            if lb_result["checks"].get("ssl_policies") and any(
-                p.get("insecure_protocols") for p in lb_result["checks"].get("ssl_policies", [])
-            ):
-                lb_result["remediation"].append("Update SSL policy to use only TLSv1.2 or later")
+        lb_results = await asyncio.gather(
+            *[check_load_balancer(lb_name) for lb_name in load_balancers]
+        )
 
+        for lb_result in lb_results:
             # Update counts
             if lb_result["compliant"]:
                 results["compliant_resources"] += 1
@@ -497,10 +480,170 @@ async def check_classic_load_balancers(
         }
 
 
+async def _describe_classic_load_balancers(
+    elb_client: Any, load_balancer_names: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Describe Classic Load Balancers by name in batches, keyed by load balancer name.
+
+    A batch that fails (for example because one of its load balancers was deleted) is left
+    out, and its load balancers are described one by one when they are checked.
+    """
+    described = {}
+
+    for i in range(0, len(load_balancer_names), CLASSIC_LB_DESCRIBE_BATCH_SIZE):
+        batch = load_balancer_names[i : i + CLASSIC_LB_DESCRIBE_BATCH_SIZE]
+        try:
+            response = await call_aws(elb_client.describe_load_balancers, LoadBalancerNames=batch)
+        except botocore.exceptions.ClientError as e:
+            print(f"[DEBUG:NetworkSecurity] Error describing Classic Load Balancers {batch}: {e}")
+            continue
+
+        for lb in response.get("LoadBalancerDescriptions", []):
+            if lb.get("LoadBalancerName") in batch:
+                described[lb["LoadBalancerName"]] = lb
+
+    return described
+
+
+async def _check_classic_load_balancer(
+    region: str,
+    elb_client: Any,
+    lb_name: str,
+    lb_details: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Evaluate the listeners and SSL policies of one Classic Load Balancer."""
+    lb_result = {
+        "name": lb_name,
+        "arn": f"arn:aws:elasticloadbalancing:{region}:loadbalancer/{lb_name}",
+        "type": "classic_load_balancer",
+        "compliant": True,
+        "issues": [],
+        "checks": {},
+    }
+
+    # Get load balancer details if the batched describe did not return them
+    if lb_details is None:
+        lb_response = await call_aws(
+            elb_client.describe_load_balancers, LoadBalancerNames=[lb_name]
+        )
+        lb_details = lb_response["LoadBalancerDescriptions"][0]
+
+    # Check for HTTPS listeners
+    listeners = lb_details.get("ListenerDescriptions", [])
+    https_listeners = [
+        lst for lst in listeners if lst["Listener"].get("Protocol") in ["HTTPS", "SSL"]
+    ]
+    http_listeners = [
+        lst for lst in listeners if lst["Listener"].get("Protocol") in ["HTTP", "TCP"]
+    ]
+
+    lb_result["checks"]["https_listeners"] = {
+        "count": len(https_listeners),
+        "total_listeners": len(listeners),
+    }
+
+    # Check if all listeners are secure
+    all_secure = len(http_listeners) == 0 and len(https_listeners) > 0
+    lb_result["checks"]["all_listeners_secure"] = all_secure
+
+    if not all_secure:
+        lb_result["compliant"] = False
+        lb_result["issues"].append(f"Found {len(http_listeners)} non-encrypted listeners")
+
+    # Describe the policies of all HTTPS listeners in one call. A policy may share its name
+    # with a predefined policy and still have different protocols, so always describe this
+    # load balancer's own copy.
+    listener_policies = {}
+    policy_names = list(
+        dict.fromkeys(name for lst in https_listeners for name in lst.get("PolicyNames", []))
+    )
+    if policy_names:
+        try:
+            policy_response = await call_aws(
+                elb_client.describe_load_balancer_policies,
+                LoadBalancerName=lb_name,
+                PolicyNames=policy_names,
+            )
+            listener_policies = {
+                policy.get("PolicyName"): policy
+                for policy in policy_response.get("PolicyDescriptions", [])
+            }
+        except Exception as e:
+            print(f"[DEBUG:NetworkSecurity] Error checking SSL policy for {lb_name}: {e}")
+            lb_result["issues"].append("Error checking SSL policy")
+
+    # Check SSL policies for each HTTPS listener
+    for https_listener in https_listeners:
+        ssl_policy = None
+        try:
+            policies = [
+                listener_policies[name]
+                for name in https_listener.get("PolicyNames", [])
+                if name in listener_policies
+            ]
+            ssl_policy = next(
+                (
+                    policy
+                    for policy in policies
+                    if policy.get("PolicyTypeName") == "SSLNegotiationPolicyType"
+                ),
+                policies[0] if policies else None,
+            )
+
+            if ssl_policy:
+                # Check for secure protocols
+                enabled_protocols = [
+                    attr["AttributeName"].replace("Protocol-", "")
+                    for attr in ssl_policy.get("PolicyAttributeDescriptions", [])
+                    if attr["AttributeName"].startswith("Protocol-")
+                    and attr["AttributeValue"] == "true"
+                ]
+                insecure_protocols = _find_insecure_protocols(enabled_protocols)
+
+                if insecure_protocols:
+                    lb_result["compliant"] = False
+                    lb_result["issues"].append(
+                        f"Using insecure protocols: {', '.join(insecure_protocols)}"
+                    )
+
+                    if "ssl_policies" not in lb_result["checks"]:
+                        lb_result["checks"]["ssl_policies"] = []
+
+                    lb_result["checks"]["ssl_policies"].append(
+                        {
+                            "name": ssl_policy.get("PolicyName"),
+                            "insecure_protocols": insecure_protocols,
+                        }
+                    )
+        except Exception as e:
+            print(f"[DEBUG:NetworkSecurity] Error checking SSL policy for {lb_name}: {e}")
+            lb_result["issues"].append("Error checking SSL policy")
+
+    # Generate remediation steps
+    lb_result["remediation"] = []
+
+    if not all_secure:
+        lb_result["remediation"].append("Replace HTTP listeners with HTTPS listeners")
+
+    if lb_result["checks"].get("ssl_policies") and any(
+        p.get("insecure_protocols") for p in lb_result["checks"].get("ssl_policies", [])
+    ):
+        lb_result["remediation"].append("Update SSL policy to use only TLSv1.2 or later")
+
+    return lb_result
+
+
 async def check_elbv2_load_balancers(
-    region: str, elbv2_client: Any, ctx: Context, network_resources: Dict[str, Any]
+    region: str,
+    elbv2_client: Any,
+    ctx: Context,
+    network_resources: Dict[str, Any],
+    reuse: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
-    """Check Application and Network Load Balancers for data-in-transit security best practices."""
+    """Check Application and Network Load Balancers for data-in-transit security best practices.
+
+    Load balancers whose ARN is in reuse keep that earlier result instead of being checked again.
+    """
     print(f"[DEBUG:NetworkSecurity] Checking ALB/NLB Load Balancers in {region}")
 
     results = {
@@ -527,7 +670,7 @@ async def check_elbv2_load_balancers(
                     load_balancers.append(arn)
         else:
             # Fall back to direct API call
-            response = elbv2_client.describe_load_balancers()
+            response = await call_aws(elbv2_client.describe_load_balancers)
             for lb in response["LoadBalancers"]:
                 load_balancers.append(lb["LoadBalancerArn"])
 
@@ -536,135 +679,25 @@ async def check_elbv2_load_balancers(
         )
         results["resources_checked"] = len(load_balancers)
 
-        # Check each load balancer
-        for lb_arn in load_balancers:
-            lb_name = (
-                lb_arn.split("/")[-2]
-                if "/app/" in lb_arn or "/net/" in lb_arn
-                else lb_arn.split("/")[-1]
-            )
-            lb_type = (
-                "application"
-                if "/app/" in lb_arn
-                else "network"
-                if "/net/" in lb_arn
-                else "unknown"
-            )
-
-            lb_result = {
-                "name": lb_name,
-                "arn": lb_arn,
-                "type": f"{lb_type}_load_balancer",
-                "compliant": True,
-                "issues": [],
-                "checks": {},
-            }
-
-            # Get listeners
-            try:
-                listeners_response = elbv2_client.describe_listeners(LoadBalancerArn=lb_arn)
-                listeners = listeners_response.get("Listeners", [])
-
-                # For ALBs, check for HTTPS listeners
-                if lb_type == "application":
-                    https_listeners = [lst for lst in listeners if lst.get("Protocol") == "HTTPS"]
-                    http_listeners = [lst for lst in listeners if lst.get("Protocol") == "HTTP"]
+        # Fetch listeners for the load balancers concurrently, sharing the SSL policy catalog
+        reuse = reuse or {}
+        to_check = [lb_arn for lb_arn in load_balancers if lb_arn not in reuse]
+        policy_catalog = await get_ssl_policy_catalog(region, elbv2_client) if to_check else {}
+        semaphore = asyncio.Semaphore(LOAD_BALANCER_CONCURRENCY)
 
-                    lb_result["checks"]["https_listeners"] = {
-                        "count": len(https_listeners),
-                        "total_listeners": len(listeners),
-                    }
+        async def check_load_balancer(lb_arn: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await _check_elbv2_load_balancer(elbv2_client, lb_arn, policy_catalog)
 
-                    # Check if all listeners are secure
-                    all_secure = len(http_listeners) == 0 and len(https_listeners) > 0
-                    lb_result["checks"]["all_listeners_secure"] = all_secure
-
-                    if not all_secure:
-                        lb_result["compliant"] = False
-                        lb_result["issues"].append(
-                            f"Found {len(http_listeners)} non-encrypted HTTP listeners"
-                        )
-
-                    # Check SSL policies for each HTTPS listener
-                    for https_listener in https_listeners:
-                        ssl_policy = https_listener.get("SslPolicy")
-
-                        # Check if the SSL policy is secure
-                        if (
-                            ssl_policy
-                            and not ssl_policy.startswith("ELBSecurityPolicy-TLS-1-2")
-                            and not ssl_policy.startswith("ELBSecurityPolicy-FS-1-2")
-                        ):
-                            lb_result["compliant"] = False
-                            lb_result["issues"].append(
-                                f"Using potentially insecure SSL policy: {ssl_policy}"
-                            )
-
-                            if "ssl_policies" not in lb_result["checks"]:
-                                lb_result["checks"]["ssl_policies"] = []
-
-                            lb_result["checks"]["ssl_policies"].append(
-                                {
-                                    "name": ssl_policy,
-                                    "listener_arn": https_listener.get("ListenerArn"),
-                                }
-                            )
-
-                # For NLBs, check for TLS listeners
-                elif lb_type == "network":
-                    tls_listeners = [lst for lst in listeners if lst.get("Protocol") == "TLS"]
-                    # tcp_listeners = [lst for lst in listeners if lst.get('Protocol') == 'TCP']
-
-                    lb_result["checks"]["tls_listeners"] = {
-                        "count": len(tls_listeners),
-                        "total_listeners": len(listeners),
-                    }
-
-                    # For NLBs, we don't require all listeners to be TLS
-                    # but we check the SSL policies of TLS listeners
-                    for tls_listener in tls_listeners:
-                        ssl_policy = tls_listener.get("SslPolicy")
-
-                        # Check if the SSL policy is secure
-                        if (
-                            ssl_policy
-                            and not ssl_policy.startswith("ELBSecurityPolicy-TLS-1-2")
-                            and not ssl_policy.startswith("ELBSecurityPolicy-FS-1-2")
-                        ):
-                            lb_result["compliant"] = False
-                            lb_result["issues"].append(
-                                f"Using potentially insecure SSL policy: {ssl_policy}"
-                            )
-
-                            if "ssl_policies" not in lb_result["checks"]:
-                                lb_result["checks"]["ssl_policies"] = []
-
-                            lb_result["checks"]["ssl_policies"].append(
-                                {
-                                    "name": ssl_policy,
-                                    "listener_arn": tls_listener.get("ListenerArn"),
-                                }
-                            )
-
-            except Exception as e:
-                print(f"[DEBUG:NetworkSecurity] Error checking listeners for {lb_arn}: {e}")
-                lb_result["issues"].append("Error checking listeners")
-                lb_result["compliant"] = False
-
-            # Generate remediation steps
-            lb_result["remediation"] = []
-
-            if lb_type == "application" and not lb_result["checks"].get(
-                "all_listeners_secure", True
-            ):
-                lb_result["remediation"].append("Replace HTTP listeners with HTTPS listeners")
-                lb_result["remediation"].append("Configure HTTP to HTTPS redirection")
-
-            if lb_result["checks"].get("ssl_policies"):
-                lb_result["remediation"].append(
-                    "Update SSL policy to ELBSecurityPolicy-TLS-1-2-2017-01 or newer"
-                )
+        checked_results = await asyncio.gather(
+            *[check_load_balancer(lb_arn) for lb_arn in to_check]
+        )
+        checked = dict(zip(to_check, checked_results, strict=True))
+        lb_results = [
+            reuse[lb_arn] if lb_arn in reuse else checked[lb_arn] for lb_arn in load_balancers
+        ]
 
+        for lb_result in lb_results:
             # Update counts
             if lb_result["compliant"]:
                 results["compliant_resources"] += 1
@@ -688,6 +721,176 @@ async def check_elbv2_load_balancers(
         }
 
 
+async def _check_elbv2_load_balancer(
+    elbv2_client: Any, lb_arn: str, policy_catalog: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Evaluate the listeners and SSL policies of one Application or Network Load Balancer."""
+    lb_name = (
+        lb_arn.split("/")[-2] if "/app/" in lb_arn or "/net/" in lb_arn else lb_arn.split("/")[-1]
+    )
+    lb_type = "application" if "/app/" in lb_arn else "network" if "/net/" in lb_arn else "unknown"
+
+    lb_result = {
+        "name": lb_name,
+        "arn": lb_arn,
+        "type": f"{lb_type}_load_balancer",
+        "compliant": True,
+        "issues": [],
+        "checks": {},
+    }
+
+    # Get listeners
+    try:
+        listeners_response = await call_aws(
+            elbv2_client.describe_listeners, LoadBalancerArn=lb_arn
+        )
+        listeners = listeners_response.get("Listeners", [])
+
+        # For ALBs, check for HTTPS listeners
+        if lb_type == "application":
+            https_listeners = [lst for lst in listeners if lst.get("Protocol") == "HTTPS"]
+            http_listeners = [lst for lst in listeners if lst.get("Protocol") == "HTTP"]
+
+            lb_result["checks"]["https_listeners"] = {
+                "count": len(https_listeners),
+                "total_listeners": len(listeners),
+            }
+
+            # Check if all listeners are secure
+            all_secure = len(http_listeners) == 0 and len(https_listeners) > 0
+            lb_result["checks"]["all_listeners_secure"] = all_secure
+
+            if not all_secure:
+                lb_result["compliant"] = False
+                lb_result["issues"].append(
+                    f"Found {len(http_listeners)} non-encrypted HTTP listeners"
+                )
+
+            secure_listeners = https_listeners
+
+        # For NLBs, check for TLS listeners
+        elif lb_type == "network":
+            tls_listeners = [lst for lst in listeners if lst.get("Protocol") == "TLS"]
+
+            lb_result["checks"]["tls_listeners"] = {
+                "count": len(tls_listeners),
+                "total_listeners": len(listeners),
+            }
+
+            # For NLBs, we don't require all listeners to be TLS
+            # but we check the SSL policies of TLS listeners
+            secure_listeners = tls_listeners
+
+        else:
+            secure_listeners = []
+
+        # Check the SSL policy of each HTTPS/TLS listener
+        for secure_listener in secure_listeners:
+            ssl_policy = secure_listener.get("SslPolicy")
+
+            if ssl_policy and _is_insecure_elbv2_ssl_policy(ssl_policy, policy_catalog):
+                lb_result["compliant"] = False
+                lb_result["issues"].append(f"Using potentially insecure SSL policy: {ssl_policy}")
+
+                if "ssl_policies" not in lb_result["checks"]:
+                    lb_result["checks"]["ssl_policies"] = []
+
+                lb_result["checks"]["ssl_policies"].append(
+                    {
+                        "name": ssl_policy,
+                        "listener_arn": secure_listener.get("ListenerArn"),
+                    }
+                )
+
+    except Exception as e:
+        print(f"[DEBUG:NetworkSecurity] Error checking listeners for {lb_arn}: {e}")
+        lb_result["issues"].append("Error checking listeners")
+        lb_result["compliant"] = False
+
+    # Generate remediation steps
+    lb_result["remediation"] = []
+
+    if lb_type == "application" and not lb_result["checks"].get("all_listeners_secure", True):
+        lb_result["remediation"].append("Replace HTTP listeners with HTTPS listeners")
+        lb_result["remediation"].append("Configure HTTP to HTTPS redirection")
+
+    if lb_result["checks"].get("ssl_policies"):
+        lb_result["remediation"].append(
+            "Update SSL policy to ELBSecurityPolicy-TLS-1-2-2017-01 or newer"
+        )
+
+    return lb_result
+
+
+async def get_ssl_policy_catalog(region: str, client: Any) -> Dict[str, Dict[str, Any]]:
+    """Get the predefined ALB/NLB SSL policies of a region, keyed by policy name.
+
+    Predefined policies are the same for every account in a region, so each catalog is
+    fetched once per process. If the catalog cannot be fetched, an empty catalog is returned
+    and the next call tries again.
+
+    Args:
+        region: AWS region of the client
+        client: boto3 ELBv2 client
+
+    Returns:
+        Dictionary mapping policy name to its description
+    """
+    if region in _ssl_policy_catalogs:
+        return _ssl_policy_catalogs[region]
+
+    catalog = {}
+    params = {"PageSize": 400}
+    try:
+        while True:
+            response = await call_aws(client.describe_ssl_policies, **params)
+            for policy in response.get("SslPolicies", []):
+                if isinstance(policy, dict):
+                    catalog[policy.get("Name")] = policy
+
+            # Handle pagination if needed, stopping if the marker does not advance
+            next_marker = response.get("NextMarker")
+            if not next_marker or next_marker == params.get("Marker"):
+                break
+            params["Marker"] = next_marker
+    except Exception as e:
+        print(f"[DEBUG:NetworkSecurity] Error fetching SSL policy catalog: {e}")
+        return {}
+
+    if catalog:
+        _ssl_policy_catalogs[region] = catalog
+    return catalog
+
+
+def clear_ssl_policy_catalogs() -> None:
+    """Forget all cached SSL policy catalogs."""
+    _ssl_policy_catalogs.clear()
+
+
+def _find_insecure_protocols(protocols: List[str]) -> List[str]:
+    """Return the protocols that are insecure for data in transit."""
+    # ELBv2 policies report TLS 1.0 as "TLSv1"
+    return [
+        protocol
+        for protocol in protocols
+        if ("TLSv1.0" if protocol == "TLSv1" else protocol) in INSECURE_PROTOCOLS
+    ]
+
+
+def _is_insecure_elbv2_ssl_policy(
+    ssl_policy: str, policy_catalog: Dict[str, Dict[str, Any]]
+) -> bool:
+    """Check whether an ALB/NLB SSL policy allows protocols older than TLS 1.2."""
+    policy = policy_catalog.get(ssl_policy)
+    if policy is not None:
+        return bool(_find_insecure_protocols(policy.get("SslProtocols", [])))
+
+    # Without a catalog entry, fall back to the names of the TLS 1.2+ policies
+    return not ssl_policy.startswith("ELBSecurityPolicy-TLS-1-2") and not ssl_policy.startswith(
+        "ELBSecurityPolicy-FS-1-2"
+    )
+
+
 async def check_vpc_endpoints(
     region: str, ec2_client: Any, ctx: Context, network_resources: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -715,7 +918,7 @@ async def check_vpc_endpoints(
                 vpc_endpoints.append(resource.get("Arn", ""))
         else:
             # Fall back to direct API call
-            response = ec2_client.describe_vpc_endpoints()
+            response = await call_aws(ec2_client.describe_vpc_endpoints)
             vpc_endpoints = [
                 endpoint["VpcEndpointId"] for endpoint in response.get("VpcEndpoints", [])
             ]
@@ -732,7 +935,9 @@ async def check_vpc_endpoints(
                 endpoint_id = endpoint_id.split("/")[-1]
 
             # Get endpoint details
-            endpoint_response = ec2_client.describe_vpc_endpoints(VpcEndpointIds=[endpoint_id])
+            endpoint_response = await call_aws(
+                ec2_client.describe_vpc_endpoints, VpcEndpointIds=[endpoint_id]
+            )
 
             if not endpoint_response.get("VpcEndpoints"):
                 continue
@@ -819,6 +1024,9 @@ async def check_security_groups(
     }
 
     try:
+        # Describe every security group in one sweep instead of one call per group
+        described = await _describe_all_security_groups(ec2_client)
+
         # Get security group list - either from Resource Explorer or directly
         security_groups = []
 
@@ -831,37 +1039,21 @@ async def check_security_groups(
                 sg_id = resource.get("Arn", "").split("/")[-1]
                 security_groups.append(sg_id)
         else:
-            # Fall back to direct API call
-            response = ec2_client.describe_security_groups()
-            security_groups = [sg["GroupId"] for sg in response.get("SecurityGroups", [])]
+            security_groups = list(described)
 
         print(
             f"[DEBUG:NetworkSecurity] Found {len(security_groups)} security groups in region {region}"
         )
         results["resources_checked"] = len(security_groups)
 
-        # Define sensitive ports for data in transit
-        sensitive_ports = {
-            80: "HTTP",
-            23: "Telnet",
-            21: "FTP",
-            20: "FTP-Data",
-            25: "SMTP",
-            110: "POP3",
-            143: "IMAP",
-            69: "TFTP",
-        }
-
         # Check each security group
         for sg_id in security_groups:
-            # Get security group details
-            sg_response = ec2_client.describe_security_groups(GroupIds=[sg_id])
+            sg = described.get(sg_id)
 
-            if not sg_response.get("SecurityGroups"):
+            # Skip groups deleted since Resource Explorer indexed them
+            if sg is None:
                 continue
 
-            sg = sg_response["SecurityGroups"][0]
-
             sg_result = {
                 "id": sg_id,
                 "name": sg.get("GroupName", ""),
@@ -874,39 +1066,17 @@ async def check_security_groups(
             }
 
             # Check for open sensitive ports
-            open_sensitive_ports = []
-
-            for rule in sg.get("IpPermissions", []):
-                from_port = rule.get("FromPort")
-                to_port = rule.get("ToPort")
-
-                # Skip if ports are not defined
-                if from_port is None or to_port is None:
-                    continue
-
-                # Check for sensitive ports
-                for port in range(from_port, to_port + 1):
-                    if port in sensitive_ports:
-                        # Check if open to the world (0.0.0.0/0)
-                        for ip_range in rule.get("IpRanges", []):
-                            if ip_range.get("CidrIp") == "0.0.0.0/0":
-                                open_sensitive_ports.append(
-                                    {
-                                        "port": port,
-                                        "service": sensitive_ports[port],
-                                        "cidr": "0.0.0.0/0",
-                                    }
-                                )
-                                break
+            open_sensitive_ports = find_open_sensitive_ports(sg.get("IpPermissions", []))
 
             sg_result["checks"]["open_sensitive_ports"] = open_sensitive_ports
 
             if open_sensitive_ports:
                 sg_result["compliant"] = False
                 for port_info in open_sensitive_ports:
-                    sg_result["issues"].append(
-                        f"Port {port_info['port']} ({port_info['service']}) open to the world"
-                    )
+                    issue = f"Port {port_info['port']} ({port_info['service']}) open to the world"
+                    if port_info["cidr"] == "::/0":
+                        issue += " over IPv6"
+                    sg_result["issues"].append(issue)
 
             # Generate remediation steps
             sg_result["remediation"] = []
@@ -945,6 +1115,57 @@ async def check_security_groups(
         }
 
 
+async def _describe_all_security_groups(ec2_client: Any) -> Dict[str, Dict[str, Any]]:
+    """Describe every security group in the region, keyed by group ID."""
+    security_groups = {}
+    async for page in paginate_aws(ec2_client, "describe_security_groups", MaxResults=1000):
+        for sg in page.get("SecurityGroups", []):
+            security_groups[sg["GroupId"]] = sg
+    return security_groups
+
+
+def find_open_sensitive_ports(ip_permissions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Find sensitive ports that ingress rules open to the world over IPv4 or IPv6.
+
+    Each rule's port range is matched against the sorted sensitive-port table with a binary
+    search, so the cost depends on the number of sensitive ports in the range rather than on
+    the width of the range.
+
+    Args:
+        ip_permissions: The ``IpPermissions`` of a security group
+
+    Returns:
+        List of dictionaries with the port, its service name and the open CIDR
+    """
+    open_sensitive_ports = []
+
+    for rule in ip_permissions:
+        from_port = rule.get("FromPort")
+        to_port = rule.get("ToPort")
+
+        # Skip if ports are not defined
+        if from_port is None or to_port is None:
+            continue
+
+        open_cidrs = [
+            cidr
+            for ranges_key, cidr_key, cidr in _WORLD_OPEN_CIDRS
+            if any(ip_range.get(cidr_key) == cidr for ip_range in rule.get(ranges_key, []))
+        ]
+        if not open_cidrs:
+            continue
+
+        first = bisect_left(_SENSITIVE_PORT_NUMBERS, from_port)
+        last = bisect_right(_SENSITIVE_PORT_NUMBERS, to_port)
+        for port in _SENSITIVE_PORT_NUMBERS[first:last]:
+            for cidr in open_cidrs:
+                open_sensitive_ports.append(
+                    {"port": port, "service": SENSITIVE_PORTS[port], "cidr": cidr}
+                )
+
+    return open_sensitive_ports
+
+
 async def check_api_gateway(
     region: str, apigw_client: Any, ctx: Context, network_resources: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -973,7 +1194,7 @@ async def check_api_gateway(
                 apis.append(api_id)
         else:
             # Fall back to direct API call
-            response = apigw_client.get_rest_apis()
+            response = await call_aws(apigw_client.get_rest_apis)
             apis = [api["id"] for api in response.get("items", [])]
 
         print(f"[DEBUG:NetworkSecurity] Found {len(apis)} APIs in region {region}")
@@ -982,7 +1203,7 @@ async def check_api_gateway(
         # Check each API
         for api_id in apis:
             # Get API details
-            api_response = apigw_client.get_rest_api(restApiId=api_id)
+            api_response = await call_aws(apigw_client.get_rest_api, restApiId=api_id)
 
             api_result = {
                 "id": api_id,
@@ -996,7 +1217,7 @@ async def check_api_gateway(
 
             # Check for HTTPS enforcement
             try:
-                stages_response = apigw_client.get_stages(restApiId=api_id)
+                stages_response = await call_aws(apigw_client.get_stages, restApiId=api_id)
                 stages = stages_response.get("item", [])
 
                 for stage in stages:
@@ -1028,14 +1249,16 @@ async def check_api_gateway(
 
             # Check for custom domain names with secure TLS
             try:
-                domains_response = apigw_client.get_domain_names()
+                domains_response = await call_aws(apigw_client.get_domain_names)
                 domains = domains_response.get("items", [])
 
                 for domain in domains:
                     domain_name = domain.get("domainName", "")
 
                     # Check if this domain is mapped to our API
-                    mappings_response = apigw_client.get_base_path_mappings(domainName=domain_name)
+                    mappings_response = await call_aws(
+                        apigw_client.get_base_path_mappings, domainName=domain_name
+                    )
                     mappings = mappings_response.get("items", [])
 
                     for mapping in mappings:
@@ -1125,7 +1348,7 @@ async def check_cloudfront_distributions(
                 distributions.append(dist_id)
         else:
             # Fall back to direct API call
-            response = cf_client.list_distributions()
+            response = await call_aws(cf_client.list_distributions)
             if "DistributionList" in response and "Items" in response["DistributionList"]:
                 distributions = [dist["Id"] for dist in response["DistributionList"]["Items"]]
 
@@ -1135,7 +1358,7 @@ async def check_cloudfront_distributions(
         # Check each distribution
         for dist_id in distributions:
             # Get distribution details
-            dist_response = cf_client.get_distribution(Id=dist_id)
+            dist_response = await call_aws(cf_client.get_distribution, Id=dist_id)
 
             if "Distribution" not in dist_response:
                 continue
@@ -0,0 +1,93 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""MCP progress notifications for long-running assessments.
+
+Storage and network checks can run for minutes in large accounts. ``ProgressReporter`` sends a
+progress notification through the MCP context each time a service check or a batch of resources
+completes, with running counts and an estimate of the time remaining. Progress is best effort:
+a client that did not ask for progress, or a failing notification, never fails the check.
+"""
+
+import os
+import time
+from typing import Optional
+
+from mcp.server.fastmcp import Context
+
+# Number of resources checked between two progress notifications within one service
+PROGRESS_BATCH_SIZE = max(1, int(os.environ.get("SECURITY_MCP_PROGRESS_BATCH_SIZE", "25")))
+
+
+class ProgressReporter:
+    """Report the progress of an assessment made of a fixed number of service checks.
+
+    Progress is measured in service checks. Resource batches within a service move the
+    progress by a fraction of one check, so clients see steady progress in large services.
+    """
+
+    def __init__(self, ctx: Context, total: int, label: str) -> None:
+        self.ctx = ctx
+        self.total = total
+        self.label = label
+        self.completed = 0
+        self.resources_checked = 0
+        self.started = time.monotonic()
+
+    def eta_seconds(self, progress: float) -> Optional[float]:
+        """Estimate the seconds remaining from the average time per completed check."""
+        if progress <= 0 or self.total <= 0:
+            return None
+        elapsed = time.monotonic() - self.started
+        return max(0.0, elapsed / progress * (self.total - progress))
+
+    async def service_done(self, service: str, resources_checked: int) -> None:
+        """Record a completed service check and notify the client."""
+        self.completed += 1
+        self.resources_checked += resources_checked
+        await self.report(self.completed, f"{service} done, {resources_checked} resources checked")
+
+    async def batch_done(self, service: str, done: int, total: int) -> None:
+        """Notify the client every PROGRESS_BATCH_SIZE resources checked within a service.
+
+        The last batch is left to service_done, which reports the completed service.
+        """
+        if done % PROGRESS_BATCH_SIZE or done >= total:
+            return
+        await self.report(
+            self.completed + done / total, f"{service} {done}/{total} resources checked"
+        )
+
+    async def report(self, progress: float, detail: str) -> None:
+        """Send one progress notification with the running counts and ETA."""
+        message = (
+            f"{self.label}: {detail} ({self.completed}/{self.total} services, "
+            f"{self.resources_checked} resources checked"
+        )
+        eta = self.eta_seconds(progress)
+        if eta is not None:
+            message += f", about {eta:.0f}s remaining"
+        message += ")"
+
+        try:
+            try:
+                await self.ctx.report_progress(progress, self.total, message)
+            except TypeError:
+                # Older mcp releases do not accept a progress message
+                await self.ctx.report_progress(progress, self.total)
+        except Exception as e:
+            print(f"[DEBUG:Progress] Could not report progress: {e}")
@@ -0,0 +1,254 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Shared Resource Explorer inventory for storage, network and service listing checks.
+
+CheckStorageEncryption, CheckNetworkSecurity and ListServicesInRegion all need the resources
+Resource Explorer knows about in a region. Instead of each listing views and paging through
+list_resources with its own filter, one sweep of the default view is cached per identity
+and region and indexed by service and resource type, so an assessment pays for a single sweep.
+
+Once the TTL has passed the next lookup sweeps again and merges the result into the cached
+inventory, comparing each resource's LastReportedAt to count what was added, updated and
+removed. Resource Explorer cannot filter list_resources on LastReportedAt, so the refresh
+still lists every resource; it saves re-indexing unchanged resources and tells callers what
+changed.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+from mcp.server.fastmcp import Context
+
+from src import __version__
+from src.util.aws_calls import call_aws, paginate_aws
+from src.util.credential_utils import get_credential_identity
+
+# User agent configuration for AWS API calls
+USER_AGENT_CONFIG = Config(
+    user_agent_extra=f"awslabs/mcp/well-architected-security-mcp-server/{__version__}"
+)
+
+# Seconds before a cached inventory is refreshed
+RESOURCE_INVENTORY_TTL = float(os.environ.get("SECURITY_MCP_INVENTORY_TTL", "900"))
+
+# Maximum number of inventories kept. Inventories past the TTL are dropped whenever another one
+# is stored, and the least recently swept ones beyond this limit after them.
+RESOURCE_INVENTORY_MAX_ENTRIES = int(os.environ.get("SECURITY_MCP_INVENTORY_MAX_ENTRIES", "32"))
+
+# Process-wide inventories keyed by (identity ARN, region)
+_inventories: Dict[Tuple[Optional[str], str], "ResourceInventory"] = {}
+_inventory_locks: Dict[Tuple[Optional[str], str], asyncio.Lock] = {}
+
+
+def clear_resource_inventories() -> None:
+    """Forget all cached inventories, so the next lookup in each region sweeps again."""
+    _inventories.clear()
+    _inventory_locks.clear()
+
+
+def _evict_inventories(keep: Tuple[Optional[str], str]) -> None:
+    """Drop inventories past the TTL and the least recently swept ones beyond the limit.
+
+    Args:
+        keep: Key of the inventory just stored, which is never dropped
+    """
+    oldest_first = sorted(
+        (key for key in _inventories if key != keep),
+        key=lambda key: _inventories[key].swept_at,
+    )
+    excess = len(_inventories) - RESOURCE_INVENTORY_MAX_ENTRIES
+    for index, key in enumerate(oldest_first):
+        if index < excess or not _inventories[key].is_fresh(RESOURCE_INVENTORY_TTL):
+            del _inventories[key]
+    for key, lock in list(_inventory_locks.items()):
+        if key not in _inventories and not lock.locked():
+            del _inventory_locks[key]
+
+
+def _arn_service(arn: str) -> Optional[str]:
+    """Get the service part of an ARN, or None if the ARN is malformed."""
+    parts = arn.split(":")
+    return parts[2] if len(parts) >= 6 and parts[2] else None
+
+
+def _resource_type(resource: Dict[str, Any]) -> Optional[str]:
+    """Get the Resource Explorer resource type (e.g. 'ec2:volume') of a resource.
+
+    Falls back to the service and resource segment of the ARN when ResourceType is missing.
+    """
+    if resource.get("ResourceType"):
+        return resource["ResourceType"]
+    arn = resource.get("Arn", "")
+    service = _arn_service(arn)
+    if service is None:
+        return None
+    resource_part = arn.split(":", 5)[5]
+    return f"{service}:{resource_part.split('/')[0]}"
+
+
+class ResourceInventory:
+    """Resources in one region from a Resource Explorer sweep, indexed by service and type."""
+
+    def __init__(self, region: str, view_arn: str):
+        """Create an empty inventory for resources listed through view_arn."""
+        self.region = region
+        self.view_arn = view_arn
+        self.resources: Dict[str, Dict[str, Any]] = {}
+        self.by_service: Dict[str, List[str]] = {}
+        self.by_resource_type: Dict[str, List[str]] = {}
+        self.swept_at = 0.0
+        self.sweeps = 0
+        self.last_refresh: Dict[str, Any] = {}
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Check whether the last sweep happened less than ttl seconds ago."""
+        return time.time() - self.swept_at < ttl
+
+    def apply_sweep(self, resources: Iterable[Dict[str, Any]], duration: float) -> None:
+        """Merge the resources of a new sweep into the inventory and rebuild the indexes.
+
+        Resources whose LastReportedAt is unchanged keep their cached entry.
+        """
+        counts = {"added": 0, "updated": 0, "unchanged": 0}
+        swept = {}
+        for resource in resources:
+            arn = resource.get("Arn")
+            if not arn:
+                continue
+            previous = self.resources.get(arn)
+            if previous is None:
+                counts["added"] += 1
+            elif previous.get("LastReportedAt") != resource.get("LastReportedAt"):
+                counts["updated"] += 1
+            else:
+                counts["unchanged"] += 1
+                resource = previous
+            swept[arn] = resource
+
+        counts["removed"] = len(self.resources.keys() - swept.keys())
+        self.resources = swept
+        self.by_service = {}
+        self.by_resource_type = {}
+        for arn, resource in swept.items():
+            service = _arn_service(arn) or resource.get("Service")
+            if service:
+                self.by_service.setdefault(service, []).append(arn)
+            resource_type = _resource_type(resource)
+            if resource_type:
+                self.by_resource_type.setdefault(resource_type, []).append(arn)
+
+        self.sweeps += 1
+        self.swept_at = time.time()
+        self.last_refresh = {
+            "mode": "full" if self.sweeps == 1 else "incremental",
+            "duration_seconds": duration,
+            **counts,
+        }
+
+    def select(
+        self, services: Iterable[str] = (), resource_types: Iterable[str] = ()
+    ) -> List[Dict[str, Any]]:
+        """Get the resources of the given services plus those of the given resource types.
+
+        Resources are returned in sweep order.
+        """
+        arns = set()
+        for service in services:
+            arns.update(self.by_service.get(service, []))
+        for resource_type in resource_types:
+            arns.update(self.by_resource_type.get(resource_type, []))
+        return [resource for arn, resource in self.resources.items() if arn in arns]
+
+    def service_counts(self) -> Dict[str, int]:
+        """Get the number of resources of each service."""
+        return {service: len(arns) for service, arns in self.by_service.items()}
+
+
+async def _find_default_view(resource_explorer: Any) -> Optional[str]:
+    """Get the ARN of the Resource Explorer view without filters, if there is one."""
+    views = await call_aws(resource_explorer.list_views)
+    print(f"[DEBUG:ResourceInventory] Found {len(views.get('Views', []))} views")
+    for view in views.get("Views", []):
+        if view.get("Filters", {}).get("FilterString", "") == "":
+            return view.get("ViewArn")
+    return None
+
+
+async def get_resource_inventory(
+    region: str, session: boto3.Session, ctx: Context, force_refresh: bool = False
+) -> Optional[ResourceInventory]:
+    """Get the Resource Explorer inventory of a region, sweeping only when needed.
+
+    Concurrent lookups for the same identity and region share a single sweep.
+
+    Args:
+        region: AWS region to get the inventory for
+        session: boto3 Session for AWS API calls
+        ctx: MCP context for error reporting
+        force_refresh: Sweep again even if the cached inventory is still fresh
+
+    Returns:
+        The inventory, or None if the region has no default Resource Explorer view
+
+    Raises:
+        Exceptions from the Resource Explorer API calls
+    """
+    key = (await get_credential_identity(session), region)
+    lock = _inventory_locks.setdefault(key, asyncio.Lock())
+
+    async with lock:
+        inventory = _inventories.get(key)
+        if (
+            inventory is not None
+            and not force_refresh
+            and inventory.is_fresh(RESOURCE_INVENTORY_TTL)
+        ):
+            print(f"[DEBUG:ResourceInventory] Using cached inventory for {region}")
+            return inventory
+
+        resource_explorer = session.client(
+            "resource-explorer-2", region_name=region, config=USER_AGENT_CONFIG
+        )
+        view_arn = await _find_default_view(resource_explorer)
+        if not view_arn:
+            print(f"[DEBUG:ResourceInventory] No default view found in {region}")
+            return None
+
+        if inventory is None or inventory.view_arn != view_arn:
+            inventory = ResourceInventory(region, view_arn)
+
+        print(f"[DEBUG:ResourceInventory] Sweeping Resource Explorer view {view_arn}")
+        start_time = time.time()
+        resources = []
+        async for page in paginate_aws(
+            resource_explorer, "list_resources", MaxResults=1000, ViewArn=view_arn
+        ):
+            resources.extend(page.get("Resources", []))
+
+        inventory.apply_sweep(resources, time.time() - start_time)
+        print(
+            f"[DEBUG:ResourceInventory] Indexed {len(inventory.resources)} resources in {region}: {inventory.last_refresh}"
+        )
+        if key[0] is not None:
+            _inventories[key] = inventory
+            _evict_inventories(key)
+        return inventory
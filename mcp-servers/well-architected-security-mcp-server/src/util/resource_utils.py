@@ -24,6 +24,7 @@ from botocore.config import Config
 from mcp.server.fastmcp import Context
 
 from src import __version__
+from src.util.resource_inventory import get_resource_inventory
 
 # User agent configuration for AWS API calls
 USER_AGENT_CONFIG = Config(
@@ -48,57 +49,28 @@ async def list_services_in_region(
         # Initialize the result dictionary
         result = {"region": region, "services": [], "service_counts": {}, "total_resources": 0}
 
-        # Use Resource Explorer to efficiently discover resources
+        # Use the shared Resource Explorer inventory to discover resources
         try:
-            resource_explorer = session.client(
-                "resource-explorer-2", region_name=region, config=USER_AGENT_CONFIG
-            )
-
-            # Check if Resource Explorer is available in this region
-            try:
-                # Try to search with Resource Explorer
-                resource_explorer.search(
-                    QueryString="*",
-                    MaxResults=1,  # Just checking if it works
+            inventory = await get_resource_inventory(region, session, ctx)
+            if inventory is None:
+                await ctx.warning(
+                    f"No default Resource Explorer view found in {region}. Using alternative method."
                 )
-            except Exception as e:
-                if "Resource Explorer has not been set up" in str(e):
-                    await ctx.warning(
-                        f"Resource Explorer not set up in {region}. Using alternative method."
-                    )
-                    return {"region": region, "services": [], "error": str(e)}
-                else:
-                    raise e
-
-            # Resource Explorer is available, use it to get all resources
-            paginator = resource_explorer.get_paginator("search")
-            page_iterator = paginator.paginate(QueryString="*", MaxResults=1000)
-
-            # Track unique services
-            services_set = set()
-            service_resource_counts = {}
-
-            # Process each page of results
-            for page in page_iterator:
-                for resource in page.get("Resources", []):
-                    # Extract service from ARN
-                    arn = resource.get("Arn", "")
-                    if arn:
-                        arn_parts = arn.split(":")
-                        if len(arn_parts) >= 3:
-                            service = arn_parts[2]
-                            services_set.add(service)
-
-                            # Update count for this service
-                            if service in service_resource_counts:
-                                service_resource_counts[service] += 1
-                            else:
-                                service_resource_counts[service] = 1
+                return {
+                    "region": region,
+                    "services": [],
+                    "error": "No default Resource Explorer view found",
+                }
 
             # Update result with discovered services
-            result["services"] = sorted(list(services_set))
+            service_resource_counts = inventory.service_counts()
+            result["services"] = sorted(service_resource_counts)
             result["service_counts"] = service_resource_counts
             result["total_resources"] = sum(service_resource_counts.values())
+            result["inventory"] = {
+                "swept_at": inventory.swept_at,
+                "last_refresh": inventory.last_refresh,
+            }
 
         except Exception as e:
             await ctx.warning(f"Error using Resource Explorer in {region}: {e}")
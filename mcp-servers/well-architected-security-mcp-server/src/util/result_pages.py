@@ -0,0 +1,151 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Paged resource_details of checks that keep running after their first page is returned.
+
+A storage or network check called with a page_size runs as a background task. The tool call
+returns as soon as the first page of resource_details is ready, and GetResultPage reads the
+following pages while the remaining service checks complete. When the check finishes, its
+pages are handed to a store callback, which keeps them in the context store for the pages
+still to be read.
+"""
+
+import asyncio
+import os
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.util.assessment_scheduler import SweepContext
+
+# Seconds GetResultPage waits for more resource_details of a check that is still running
+RESULT_PAGE_WAIT = float(os.environ.get("SECURITY_MCP_RESULT_PAGE_WAIT", "30"))
+
+# A check runner takes a callback called with the running results after each service check
+ResultsRunner = Callable[[Callable[[Dict[str, Any]], None]], Awaitable[Dict[str, Any]]]
+
+_running_pages: Dict[str, "ResultPages"] = {}
+
+
+class DetachableContext:
+    """MCP context of a check that outlives its tool call.
+
+    Calls are forwarded to the tool call's context until ``detach`` is called, then to a
+    SweepContext, since the client no longer listens for notifications of the finished call.
+    """
+
+    def __init__(self, ctx: Any) -> None:
+        self._ctx = ctx
+
+    def detach(self) -> None:
+        self._ctx = SweepContext()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._ctx, name)
+
+
+class ResultPages:
+    """The resource_details of one check, readable page by page while the check runs."""
+
+    def __init__(
+        self, region: str, page_size: int, store: Callable[["ResultPages"], None]
+    ) -> None:
+        """Prepare the pages of a check.
+
+        Args:
+            region: Region the check runs in
+            page_size: Number of resource_details per page
+            store: Called with the pages once the check has finished or failed
+        """
+        self.result_id = uuid.uuid4().hex
+        self.region = region
+        self.page_size = page_size
+        self.store = store
+        self.results: Dict[str, Any] = {"region": region, "resource_details": []}
+        self.error: Optional[str] = None
+        self._task: Optional["asyncio.Task[Dict[str, Any]]"] = None
+        self._changed = asyncio.Event()
+
+    @property
+    def resource_details(self) -> List[Dict[str, Any]]:
+        return self.results.get("resource_details", [])
+
+    @property
+    def complete(self) -> bool:
+        return self._task is not None and self._task.done()
+
+    def update(self, results: Dict[str, Any]) -> None:
+        """Record the running results of the check after a service check completes."""
+        self.results = results
+        self._changed.set()
+
+    def start(self, run: ResultsRunner) -> None:
+        """Run the check as an asyncio task on the running loop."""
+        self._task = asyncio.create_task(run(self.update))
+        self._task.add_done_callback(self._finished)
+
+    def _finished(self, task: "asyncio.Task[Dict[str, Any]]") -> None:
+        if task.cancelled():
+            self.error = "The check was cancelled"
+        elif task.exception() is not None:
+            self.error = str(task.exception())
+        else:
+            self.results = task.result()
+        try:
+            self.store(self)
+        finally:
+            _running_pages.pop(self.result_id, None)
+            self._changed.set()
+
+    async def wait_for(self, count: int, timeout: Optional[float] = None) -> None:
+        """Wait until the check has found ``count`` resource_details or has finished."""
+
+        async def available() -> None:
+            while len(self.resource_details) < count and not self.complete:
+                self._changed.clear()
+                await self._changed.wait()
+
+        try:
+            await asyncio.wait_for(available(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def cancel(self) -> None:
+        """Cancel the check if it is still running."""
+        if self._task is not None:
+            self._task.cancel()
+
+
+def start_result_pages(
+    region: str, page_size: int, run: ResultsRunner, store: Callable[[ResultPages], None]
+) -> ResultPages:
+    """Start a check in the background and register its pages under their result ID."""
+    pages = ResultPages(region, page_size, store)
+    _running_pages[pages.result_id] = pages
+    pages.start(run)
+    return pages
+
+
+def get_running_pages(result_id: str) -> Optional[ResultPages]:
+    """Get the pages of a check that is still running."""
+    return _running_pages.get(result_id)
+
+
+def clear_result_pages() -> None:
+    """Cancel running checks and forget their pages."""
+    for pages in list(_running_pages.values()):
+        pages.cancel()
+    _running_pages.clear()
@@ -0,0 +1,237 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Concurrent S3 bucket posture collection.
+
+Checking buckets one at a time takes minutes in accounts with thousands of buckets. The helpers
+in this module resolve bucket regions and probe each bucket's default encryption and public
+access block concurrently, cache bucket regions for the life of the process, and yield
+per-bucket results as soon as they are ready.
+"""
+
+import asyncio
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from mcp.server.fastmcp import Context
+
+from src.util.aws_calls import call_aws
+
+# Maximum number of buckets probed at the same time
+S3_BUCKET_CONCURRENCY = int(os.environ.get("SECURITY_MCP_S3_BUCKET_CONCURRENCY", "16"))
+
+# Optional time budget (in seconds) for probing the buckets of one region
+S3_TIME_BUDGET = (
+    float(os.environ["SECURITY_MCP_S3_TIME_BUDGET"])
+    if os.environ.get("SECURITY_MCP_S3_TIME_BUDGET")
+    else None
+)
+
+# Bucket names are globally unique, so bucket regions can be shared across calls and regions
+_bucket_region_cache: Dict[str, str] = {}
+
+
+def clear_bucket_region_cache() -> None:
+    """Forget all cached bucket regions."""
+    _bucket_region_cache.clear()
+
+
+async def resolve_bucket_regions(
+    s3_client: Any,
+    buckets: List[Dict[str, Any]],
+    ctx: Context,
+    concurrency: Optional[int] = None,
+) -> Dict[str, str]:
+    """Map bucket names to regions, looking up only buckets whose region is not yet known.
+
+    Regions come from the ``BucketRegion`` field of ``list_buckets`` when present, then from
+    the process-wide cache, and finally from concurrent ``get_bucket_location`` calls.
+    Buckets whose location cannot be read are reported through the context and left out.
+
+    Args:
+        s3_client: boto3 S3 client
+        buckets: Bucket entries returned by ``list_buckets``
+        ctx: MCP context for warnings
+        concurrency: Maximum number of concurrent lookups (defaults to S3_BUCKET_CONCURRENCY)
+
+    Returns:
+        Dictionary mapping bucket name to region
+    """
+    semaphore = asyncio.Semaphore(concurrency or S3_BUCKET_CONCURRENCY)
+
+    async def get_location(bucket_name: str) -> str:
+        async with semaphore:
+            location = await call_aws(s3_client.get_bucket_location, Bucket=bucket_name)
+        # us-east-1 returns None for the location constraint
+        return location.get("LocationConstraint") or "us-east-1"
+
+    pending = []
+    for bucket in buckets:
+        if bucket.get("BucketRegion"):
+            _bucket_region_cache[bucket["Name"]] = bucket["BucketRegion"]
+        elif bucket["Name"] not in _bucket_region_cache:
+            pending.append(bucket["Name"])
+
+    locations = await asyncio.gather(
+        *[get_location(bucket_name) for bucket_name in pending], return_exceptions=True
+    )
+    for bucket_name, location in zip(pending, locations, strict=True):
+        if isinstance(location, BaseException):
+            print(
+                f"[DEBUG:StorageSecurity] Error getting location for bucket {bucket_name}: "
+                f"{location}"
+            )
+            await ctx.warning(f"Error getting location for bucket {bucket_name}: {location}")
+        else:
+            _bucket_region_cache[bucket_name] = location
+
+    return {
+        bucket["Name"]: _bucket_region_cache[bucket["Name"]]
+        for bucket in buckets
+        if bucket["Name"] in _bucket_region_cache
+    }
+
+
+async def iter_bucket_posture(
+    s3_client: Any,
+    bucket_names: List[str],
+    concurrency: Optional[int] = None,
+    time_budget: Optional[float] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Probe buckets concurrently and yield each bucket's result as soon as it is ready.
+
+    Results are yielded in completion order, not in the order of ``bucket_names``. When the
+    time budget runs out, or the consumer stops iterating, probes still in flight are cancelled.
+
+    Args:
+        s3_client: boto3 S3 client
+        bucket_names: Names of the buckets to probe
+        concurrency: Maximum number of buckets probed at once (defaults to S3_BUCKET_CONCURRENCY)
+        time_budget: Seconds to spend on probes before giving up on the rest (defaults to
+            S3_TIME_BUDGET, which is no limit unless configured)
+
+    Yields:
+        Per-bucket result dictionaries as built by ``build_bucket_result``
+    """
+    semaphore = asyncio.Semaphore(concurrency or S3_BUCKET_CONCURRENCY)
+    time_budget = S3_TIME_BUDGET if time_budget is None else time_budget
+
+    async def probe(bucket_name: str) -> Dict[str, Any]:
+        async with semaphore:
+            encryption, public_access = await asyncio.gather(
+                call_aws(s3_client.get_bucket_encryption, Bucket=bucket_name),
+                call_aws(s3_client.get_public_access_block, Bucket=bucket_name),
+                return_exceptions=True,
+            )
+        return build_bucket_result(bucket_name, encryption, public_access)
+
+    tasks = [asyncio.ensure_future(probe(bucket_name)) for bucket_name in bucket_names]
+    try:
+        for next_result in asyncio.as_completed(tasks, timeout=time_budget):
+            try:
+                bucket_result = await next_result
+            except asyncio.TimeoutError:
+                return
+            yield bucket_result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def build_bucket_result(bucket_name: str, encryption: Any, public_access: Any) -> Dict[str, Any]:
+    """Evaluate one bucket from its encryption and public access block responses.
+
+    Args:
+        bucket_name: Name of the bucket
+        encryption: ``get_bucket_encryption`` response, or the exception it raised
+        public_access: ``get_public_access_block`` response, or the exception it raised
+
+    Returns:
+        Dictionary with the bucket's compliance status, issues, checks and remediation
+    """
+    bucket_result = {
+        "name": bucket_name,
+        "arn": f"arn:aws:s3:::{bucket_name}",
+        "type": "s3",
+        "compliant": True,
+        "issues": [],
+        "checks": {},
+    }
+
+    # Check default encryption
+    encryption_rules = []
+    if not isinstance(encryption, BaseException):
+        encryption_rules = encryption.get("ServerSideEncryptionConfiguration", {}).get("Rules", [])
+
+    if encryption_rules:
+        default_encryption = encryption_rules[0].get("ApplyServerSideEncryptionByDefault", {})
+        bucket_result["checks"]["default_encryption"] = {
+            "enabled": True,
+            "type": default_encryption.get("SSEAlgorithm"),
+        }
+        bucket_result["checks"]["using_cmk"] = default_encryption.get("KMSMasterKeyID") is not None
+        bucket_result["checks"]["bucket_key_enabled"] = encryption_rules[0].get(
+            "BucketKeyEnabled", False
+        )
+    else:
+        # No encryption configuration found
+        bucket_result["compliant"] = False
+        bucket_result["issues"].append("Default encryption not enabled")
+        bucket_result["checks"]["default_encryption"] = {"enabled": False}
+        bucket_result["checks"]["using_cmk"] = False
+
+    # Check public access block
+    try:
+        if isinstance(public_access, BaseException):
+            raise public_access
+        configuration = public_access["PublicAccessBlockConfiguration"]
+        block_public_access = all(
+            [
+                configuration["BlockPublicAcls"],
+                configuration["IgnorePublicAcls"],
+                configuration["BlockPublicPolicy"],
+                configuration["RestrictPublicBuckets"],
+            ]
+        )
+
+        bucket_result["checks"]["block_public_access"] = {
+            "enabled": block_public_access,
+            "configuration": configuration,
+        }
+
+        if not block_public_access:
+            bucket_result["compliant"] = False
+            bucket_result["issues"].append("Public access not fully blocked")
+    except Exception as e:
+        print(f"[DEBUG:StorageSecurity] Error checking public access block for {bucket_name}: {e}")
+        bucket_result["checks"]["block_public_access"] = {
+            "enabled": False,
+            "error": str(e),
+        }
+        bucket_result["compliant"] = False
+        bucket_result["issues"].append("Public access block status unknown")
+
+    # Generate remediation steps
+    bucket_result["remediation"] = []
+
+    if not bucket_result["checks"].get("default_encryption", {}).get("enabled", False):
+        bucket_result["remediation"].append("Enable default encryption using SSE-KMS or SSE-S3")
+
+    if not bucket_result["checks"].get("block_public_access", {}).get("enabled", False):
+        bucket_result["remediation"].append("Enable block public access settings for this bucket")
+
+    return bucket_result
@@ -17,21 +17,101 @@
 
 """Utility functions for checking AWS security services and retrieving findings."""
 
+import asyncio
 import datetime
 import json
-from typing import Any, Dict, List, Optional
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
+import botocore.exceptions
 from botocore.config import Config
 from mcp.server.fastmcp import Context
 
 from src import __version__
+from src.consts import SEVERITY_LEVELS
+from src.util.aws_calls import call_aws, paginate_aws
+from src.util.credential_utils import get_credential_identity
 
 # User agent configuration for AWS API calls
 USER_AGENT_CONFIG = Config(
     user_agent_extra=f"awslabs/mcp/well-architected-security-mcp-server/{__version__}"
 )
 
+# Maximum number of Trusted Advisor check results fetched at the same time
+TRUSTED_ADVISOR_CONCURRENCY = int(os.environ.get("SECURITY_MCP_TA_CONCURRENCY", "8"))
+
+# Seconds a Trusted Advisor check result is reused. A cached result is only used while the
+# check summary still reports the same refresh timestamp, so a refreshed check is always re-read.
+TRUSTED_ADVISOR_CACHE_TTL = float(os.environ.get("SECURITY_MCP_TA_CACHE_TTL", "3600"))
+
+# Maximum number of cached Trusted Advisor check results, across all identities
+TRUSTED_ADVISOR_CACHE_MAX_ENTRIES = int(
+    os.environ.get("SECURITY_MCP_TA_CACHE_MAX_ENTRIES", "1000")
+)
+
+# Number of check IDs sent in each describe_trusted_advisor_check_summaries call
+TRUSTED_ADVISOR_SUMMARY_BATCH_SIZE = 100
+
+# Process-wide cache of Trusted Advisor check results, oldest first:
+# (identity ARN, check ID) -> (expires at, refresh timestamp, result)
+_trusted_advisor_results: Dict[Tuple[Any, str], Tuple[float, Any, Dict]] = {}
+
+
+# Attributes Security Hub findings can be counted by without retrieving them:
+# name accepted by GetSecurityFindings -> GroupByAttribute of a Security Hub insight
+SECURITYHUB_GROUP_BY_ATTRIBUTES = {
+    "severity": "SeverityLabel",
+    "resource_type": "ResourceType",
+    "product": "ProductName",
+    "compliance_status": "ComplianceStatus",
+    "type": "Type",
+    "resource": "ResourceId",
+    "account": "AwsAccountId",
+}
+
+# Filters of the Security Hub count insights, extended by any filter criteria given: active,
+# unresolved findings updated in the last 30 days. The date range is relative, so the filters of
+# an insight stay the same from one day to the next.
+SECURITYHUB_COUNT_FILTERS = {
+    "RecordState": [{"Comparison": "EQUALS", "Value": "ACTIVE"}],
+    "WorkflowStatus": [
+        {"Comparison": "EQUALS", "Value": "NEW"},
+        {"Comparison": "EQUALS", "Value": "NOTIFIED"},
+    ],
+    "UpdatedAt": [{"DateRange": {"Value": 30, "Unit": "DAYS"}}],
+}
+
+# Prefix of the names of the temporary custom insights used to count Security Hub findings
+SECURITYHUB_INSIGHT_NAME_PREFIX = "well-architected-security-mcp"
+
+# Errors of create_insight after which findings are counted from get_findings instead
+SECURITYHUB_INSIGHT_FALLBACK_ERRORS = frozenset(
+    {"LimitExceededException", "AccessDeniedException"}
+)
+
+
+def clear_trusted_advisor_cache() -> None:
+    """Forget all cached Trusted Advisor check results."""
+    _trusted_advisor_results.clear()
+
+
+def _cache_trusted_advisor_result(cache_key: Tuple[Any, str], check_result: Dict) -> None:
+    """Cache a check result, dropping expired results and the oldest ones beyond the limit."""
+    now = time.time()
+    # Re-insert rather than overwrite, so the cache stays ordered by expiry
+    _trusted_advisor_results.pop(cache_key, None)
+    _trusted_advisor_results[cache_key] = (
+        now + TRUSTED_ADVISOR_CACHE_TTL,
+        check_result.get("timestamp"),
+        check_result,
+    )
+    for key, (expires_at, _, _) in list(_trusted_advisor_results.items()):
+        if expires_at > now and len(_trusted_advisor_results) <= TRUSTED_ADVISOR_CACHE_MAX_ENTRIES:
+            break
+        del _trusted_advisor_results[key]
+
 
 async def get_analyzer_findings_count(
     analyzer_arn: str, analyzer_client: Any, ctx: Context
@@ -47,7 +127,7 @@ async def get_analyzer_findings_count(
         Count of findings as string, or "Unknown" if there was an error
     """
     try:
-        response = analyzer_client.list_findings(analyzerArn=analyzer_arn)
+        response = await call_aws(analyzer_client.list_findings, analyzerArn=analyzer_arn)
         return str(len(response.get("findings", [])))
     except Exception as e:
         await ctx.warning(f"Error getting findings count: {e}")
@@ -69,7 +149,7 @@ async def check_access_analyzer(region: str, session: boto3.Session, ctx: Contex
         analyzer_client = session.client(
             "accessanalyzer", region_name=region, config=USER_AGENT_CONFIG
         )
-        response = analyzer_client.list_analyzers()
+        response = await call_aws(analyzer_client.list_analyzers)
 
         # Extract analyzers - verify the field exists to prevent KeyError
         flag = True
@@ -124,6 +204,7 @@ async def check_access_analyzer(region: str, session: boto3.Session, ctx: Contex
 
             analyzer_details.append(
                 {
+                    "arn": analyzer_arn,
                     "name": analyzer.get("name"),
                     "type": analyzer.get("type"),
                     "status": analyzer.get("status"),
@@ -166,11 +247,11 @@ async def check_security_hub(region: str, session: boto3.Session, ctx: Context)
 
         try:
             # Check if Security Hub is enabled
-            hub_response = securityhub_client.describe_hub()
+            hub_response = await call_aws(securityhub_client.describe_hub)
 
             # Security Hub is enabled, get enabled standards
             try:
-                standards_response = securityhub_client.get_enabled_standards()
+                standards_response = await call_aws(securityhub_client.get_enabled_standards)
                 standards = standards_response.get("StandardsSubscriptions", [])
 
                 # Safely process standards with better error handling
@@ -274,7 +355,7 @@ async def check_guard_duty(region: str, session: boto3.Session, ctx: Context) ->
         )
 
         # List detectors
-        detector_response = guardduty_client.list_detectors()
+        detector_response = await call_aws(guardduty_client.list_detectors)
         detector_ids = detector_response.get("DetectorIds", [])
 
         if not detector_ids:
@@ -300,7 +381,7 @@ async def check_guard_duty(region: str, session: boto3.Session, ctx: Context) ->
 
         # GuardDuty is enabled, get detector details
         detector_id = detector_ids[0]  # Use the first detector
-        detector_details = guardduty_client.get_detector(DetectorId=detector_id)
+        detector_details = await call_aws(guardduty_client.get_detector, DetectorId=detector_id)
 
         return {
             "enabled": True,
@@ -339,7 +420,7 @@ async def check_inspector(region: str, session: boto3.Session, ctx: Context) ->
             # Get Inspector status
             try:
                 # First try using get_status API
-                status_response = inspector_client.get_status()
+                status_response = await call_aws(inspector_client.get_status)
                 print(
                     f"[DEBUG:Inspector] get_status() successful, raw response: {status_response}"
                 )
@@ -462,7 +543,7 @@ async def check_inspector(region: str, session: boto3.Session, ctx: Context) ->
             # If get_status failed or didn't find scan types, try another approach
             # Try calling batch_get_account_status which may give different information
             try:
-                account_status = inspector_client.batch_get_account_status()
+                account_status = await call_aws(inspector_client.batch_get_account_status)
 
                 # If we get here, the service is enabled
                 if "accounts" in account_status and account_status["accounts"]:
@@ -503,7 +584,7 @@ async def check_inspector(region: str, session: boto3.Session, ctx: Context) ->
             # If this works, it means Inspector is enabled
             try:
                 # Try listing a small number of findings just to test API access
-                findings_response = inspector_client.list_findings(maxResults=1)
+                findings_response = await call_aws(inspector_client.list_findings, maxResults=1)
                 flag = False
                 if findings_response:
                     flag = True
@@ -645,8 +726,11 @@ async def get_guardduty_findings(
 
         # List findings with the filter criteria
         print(f"[DEBUG:GuardDuty] Calling list_findings with max results: {max_findings}")
-        findings_response = guardduty_client.list_findings(
-            DetectorId=detector_id, FindingCriteria=filter_criteria, MaxResults=max_findings
+        findings_response = await call_aws(
+            guardduty_client.list_findings,
+            DetectorId=detector_id,
+            FindingCriteria=filter_criteria,
+            MaxResults=max_findings,
         )
 
         finding_ids = findings_response.get("FindingIds", [])
@@ -663,22 +747,17 @@ async def get_guardduty_findings(
 
         # Get finding details
         print(f"[DEBUG:GuardDuty] Retrieving details for {len(finding_ids)} findings")
-        findings_details = guardduty_client.get_findings(
-            DetectorId=detector_id, FindingIds=finding_ids
+        findings_details = await call_aws(
+            guardduty_client.get_findings, DetectorId=detector_id, FindingIds=finding_ids
         )
 
-        # Process findings to clean up non-serializable objects (like datetime)
-        findings = []
-        raw_findings_count = len(findings_details.get("Findings", []))
+        # Findings are summarized as returned; datetimes are converted when the tool returns
+        findings = findings_details.get("Findings", [])
+        raw_findings_count = len(findings)
         print(
             f"[DEBUG:GuardDuty] Processing {raw_findings_count} findings from get_findings response"
         )
 
-        for finding in findings_details.get("Findings", []):
-            # Convert datetime objects to strings
-            finding = _clean_datetime_objects(finding)
-            findings.append(finding)
-
         print(f"[DEBUG:GuardDuty] Successfully processed {len(findings)} findings")
 
         # Generate summary
@@ -766,8 +845,8 @@ async def get_securityhub_findings(
             }
 
         # Get findings with the filter criteria
-        findings_response = securityhub_client.get_findings(
-            Filters=filter_criteria, MaxResults=max_findings
+        findings_response = await call_aws(
+            securityhub_client.get_findings, Filters=filter_criteria, MaxResults=max_findings
         )
 
         findings = findings_response.get("Findings", [])
@@ -779,18 +858,11 @@ async def get_securityhub_findings(
                 "findings": [],
             }
 
-        # Process findings to clean up non-serializable objects (like datetime)
-        processed_findings = []
-        for finding in findings:
-            # Convert datetime objects to strings
-            finding = _clean_datetime_objects(finding)
-            processed_findings.append(finding)
-
         return {
             "enabled": True,
-            "message": f"Retrieved {len(processed_findings)} Security Hub findings",
-            "findings": processed_findings,
-            "summary": _summarize_securityhub_findings(processed_findings),
+            "message": f"Retrieved {len(findings)} Security Hub findings",
+            "findings": findings,
+            "summary": _summarize_securityhub_findings(findings),
         }
     except Exception as e:
         await ctx.error(f"Error getting Security Hub findings: {e}")
@@ -802,6 +874,166 @@ async def get_securityhub_findings(
         }
 
 
+async def _get_securityhub_insight_results(
+    securityhub_client: Any, group_by_attribute: str, filters: Dict
+) -> Dict:
+    """Count findings by an attribute with a temporary custom insight.
+
+    The insight is deleted as soon as its results are read, so counting never leaves insights
+    behind in the account or uses up its custom insight quota.
+    """
+    response = await call_aws(
+        securityhub_client.create_insight,
+        Name=f"{SECURITYHUB_INSIGHT_NAME_PREFIX}/{group_by_attribute}",
+        Filters=filters,
+        GroupByAttribute=group_by_attribute,
+    )
+    insight_arn = response["InsightArn"]
+    try:
+        return await call_aws(securityhub_client.get_insight_results, InsightArn=insight_arn)
+    finally:
+        try:
+            await call_aws(securityhub_client.delete_insight, InsightArn=insight_arn)
+        except botocore.exceptions.ClientError as e:
+            print(f"[DEBUG:SecurityHub] Error deleting count insight {insight_arn}: {e}")
+
+
+def _securityhub_attribute_values(finding: Dict, group_by_attribute: str) -> List[str]:
+    """Get the values of an insight GroupByAttribute in a Security Hub finding."""
+    resources = finding.get("Resources", [])
+    if group_by_attribute == "SeverityLabel":
+        values = [finding.get("Severity", {}).get("Label")]
+    elif group_by_attribute == "ResourceType":
+        values = [resource.get("Type") for resource in resources]
+    elif group_by_attribute == "ResourceId":
+        values = [resource.get("Id") for resource in resources]
+    elif group_by_attribute == "ComplianceStatus":
+        values = [finding.get("Compliance", {}).get("Status")]
+    elif group_by_attribute == "Type":
+        values = finding.get("Types", [])
+    else:
+        values = [finding.get(group_by_attribute)]
+    return list(dict.fromkeys(value for value in values if value))
+
+
+async def _count_securityhub_findings(
+    securityhub_client: Any, group_by_attributes: List[str], filters: Dict
+) -> Dict[str, Dict[str, int]]:
+    """Count findings by several attributes from one get_findings sweep.
+
+    This is the fallback for when insights cannot be created. Like an insight, it keeps the
+    100 most frequent values of each attribute.
+    """
+    counts: Dict[str, Dict[str, int]] = {attribute: {} for attribute in group_by_attributes}
+    async for page in paginate_aws(
+        securityhub_client, "get_findings", Filters=filters, PaginationConfig={"PageSize": 100}
+    ):
+        for finding in page.get("Findings", []):
+            for attribute, values in counts.items():
+                for value in _securityhub_attribute_values(finding, attribute):
+                    values[value] = values.get(value, 0) + 1
+
+    return {
+        attribute: dict(sorted(values.items(), key=lambda item: -item[1])[:100])
+        for attribute, values in counts.items()
+    }
+
+
+async def get_securityhub_finding_counts(
+    region: str,
+    session: boto3.Session,
+    ctx: Context,
+    group_by: List[str],
+    filter_criteria: Optional[Dict] = None,
+) -> Dict:
+    """Count Security Hub findings by attribute without retrieving the findings.
+
+    The grouping is done by Security Hub: each attribute is counted with a temporary custom
+    insight and a get_insight_results call, whatever the number of findings. Security Hub
+    returns the 100 most frequent values of each attribute. If insights cannot be created
+    (the custom insight quota is used up or the caller may not create them), the remaining
+    attributes are counted from a single get_findings sweep instead.
+
+    Args:
+        region: AWS region to count findings in
+        session: boto3 Session for AWS API calls
+        ctx: MCP context for error reporting
+        group_by: Attributes to count findings by (keys of SECURITYHUB_GROUP_BY_ATTRIBUTES)
+        filter_criteria: Optional filter criteria, added to SECURITYHUB_COUNT_FILTERS
+
+    Returns:
+        Dictionary containing the finding counts of each attribute
+    """
+    filters = {**SECURITYHUB_COUNT_FILTERS, **(filter_criteria or {})}
+    try:
+        securityhub_client = session.client(
+            "securityhub", region_name=region, config=USER_AGENT_CONFIG
+        )
+
+        counts = {}
+        counted_from_findings = []
+        for attribute in group_by:
+            response = None
+            if not counted_from_findings:
+                try:
+                    response = await _get_securityhub_insight_results(
+                        securityhub_client, SECURITYHUB_GROUP_BY_ATTRIBUTES[attribute], filters
+                    )
+                except botocore.exceptions.ClientError as e:
+                    code = e.response.get("Error", {}).get("Code")
+                    if code not in SECURITYHUB_INSIGHT_FALLBACK_ERRORS:
+                        raise
+                    print(f"[DEBUG:SecurityHub] Counting from findings after {code}")
+            if response is None:
+                counted_from_findings.append(attribute)
+                continue
+
+            counts[attribute] = {
+                value["GroupByAttributeValue"]: value["Count"]
+                for value in response.get("InsightResults", {}).get("ResultValues", [])
+            }
+
+        if counted_from_findings:
+            fallback_counts = await _count_securityhub_findings(
+                securityhub_client,
+                [SECURITYHUB_GROUP_BY_ATTRIBUTES[a] for a in counted_from_findings],
+                filters,
+            )
+            for attribute in counted_from_findings:
+                counts[attribute] = fallback_counts[SECURITYHUB_GROUP_BY_ATTRIBUTES[attribute]]
+
+        result = {
+            "enabled": True,
+            "message": f"Counted Security Hub findings by {', '.join(group_by)}",
+            "counts": counts,
+            "filters": filters,
+        }
+        if counted_from_findings:
+            result["counted_from_findings"] = counted_from_findings
+        # Every finding has exactly one severity label, so its counts add up to the total
+        if "severity" in counts:
+            result["total_count"] = sum(counts["severity"].values())
+        return result
+    except Exception as e:
+        # Security Hub raises InvalidAccessException when it is not enabled in the region
+        if (
+            isinstance(e, botocore.exceptions.ClientError)
+            and e.response.get("Error", {}).get("Code") == "InvalidAccessException"
+        ):
+            return {
+                "enabled": False,
+                "message": "AWS Security Hub is not enabled in this region",
+                "counts": {},
+            }
+        await ctx.error(f"Error counting Security Hub findings: {e}")
+        return {
+            "enabled": True,
+            "error": str(e),
+            "message": "Error counting Security Hub findings",
+            "counts": {},
+        }
+
+
 async def get_inspector_findings(
     region: str,
     session: boto3.Session,
@@ -848,8 +1080,8 @@ async def get_inspector_findings(
             }
 
         # List findings with the filter criteria
-        findings_response = inspector_client.list_findings(
-            filterCriteria=filter_criteria, maxResults=max_findings
+        findings_response = await call_aws(
+            inspector_client.list_findings, filterCriteria=filter_criteria, maxResults=max_findings
         )
 
         findings = findings_response.get("findings", [])
@@ -861,18 +1093,11 @@ async def get_inspector_findings(
                 "findings": [],
             }
 
-        # Process findings to clean up non-serializable objects (like datetime)
-        processed_findings = []
-        for finding in findings:
-            # Convert datetime objects to strings
-            finding = _clean_datetime_objects(finding)
-            processed_findings.append(finding)
-
         return {
             "enabled": True,
-            "message": f"Retrieved {len(processed_findings)} Inspector findings",
-            "findings": processed_findings,
-            "summary": _summarize_inspector_findings(processed_findings),
+            "message": f"Retrieved {len(findings)} Inspector findings",
+            "findings": findings,
+            "summary": _summarize_inspector_findings(findings),
         }
     except Exception as e:
         await ctx.error(f"Error getting Inspector findings: {e}")
@@ -884,16 +1109,34 @@ async def get_inspector_findings(
         }
 
 
+# Access Analyzer has no severity; public access is reported as HIGH and other external
+# access as MEDIUM (see normalize_finding_severity), so severities map onto isPublic
+_ACCESS_ANALYZER_SEVERITY_IS_PUBLIC = {"HIGH": "true", "MEDIUM": "false"}
+
+
 async def get_access_analyzer_findings(
-    region: str, session: boto3.Session, ctx: Context, analyzer_arn: Optional[str] = None
+    region: str,
+    session: boto3.Session,
+    ctx: Context,
+    analyzer_arn: Optional[str] = None,
+    max_findings: int = 100,
+    severity_filter: Optional[str] = None,
+    resource_types: Optional[List[str]] = None,
 ) -> Dict:
     """Get findings from IAM Access Analyzer in the specified region.
 
+    Findings are read from the paginated list_findings responses, which already carry the
+    finding details, so no per-finding get_finding calls are made.
+
     Args:
         region: AWS region to get findings from
         session: boto3 Session for AWS API calls
         ctx: MCP context for error reporting
         analyzer_arn: Optional ARN of a specific analyzer to get findings from
+        max_findings: Maximum number of findings to return across all analyzers (default: 100)
+        severity_filter: Optional severity to filter by ('HIGH' for public access, 'MEDIUM'
+            for other external access); other severities are ignored
+        resource_types: Optional list of resource types to filter by (e.g., ['AWS::S3::Bucket'])
 
     Returns:
         Dictionary containing IAM Access Analyzer findings
@@ -921,46 +1164,74 @@ async def get_access_analyzer_findings(
                 "findings": [],
             }
 
+        # Push the filters down to list_findings. Access Analyzer has no severity of its own,
+        # so only the severities that isPublic can express are applied.
+        finding_filter = {}
+        note = ""
+        if severity_filter:
+            is_public = _ACCESS_ANALYZER_SEVERITY_IS_PUBLIC.get(severity_filter.upper())
+            if is_public is None:
+                print(f"[DEBUG:AccessAnalyzer] Ignoring unsupported severity {severity_filter}")
+                note = f" (severity filter {severity_filter} is not supported and was ignored)"
+            else:
+                finding_filter["isPublic"] = {"eq": [is_public]}
+        if resource_types:
+            finding_filter["resourceType"] = {"eq": list(resource_types)}
+
         all_findings = []
+        list_calls = 0
 
         # If analyzer_arn is provided, only get findings for that analyzer
         if analyzer_arn:
             analyzers = [a for a in analyzers if a.get("arn") == analyzer_arn]
 
-        # Get findings for each analyzer
+        # Page through the findings of each analyzer until the budget is spent
         for analyzer in analyzers:
             analyzer_arn = analyzer.get("arn")
             if not analyzer_arn:
                 continue
 
-            findings_response = analyzer_client.list_findings(
-                analyzerArn=analyzer_arn, maxResults=100
-            )
+            next_token = None
+            while len(all_findings) < max_findings:
+                request = {
+                    "analyzerArn": analyzer_arn,
+                    "maxResults": min(100, max_findings - len(all_findings)),
+                }
+                if finding_filter:
+                    request["filter"] = finding_filter
+                if next_token:
+                    request["nextToken"] = next_token
 
-            finding_ids = findings_response.get("findings", [])
+                findings_response = await call_aws(analyzer_client.list_findings, **request)
+                list_calls += 1
 
-            # Get details for each finding
-            for finding_id in finding_ids:
-                finding_details = analyzer_client.get_finding(
-                    analyzerArn=analyzer_arn, id=finding_id
-                )
+                all_findings.extend(findings_response.get("findings", []))
 
-                # Clean up non-serializable objects
-                finding_details = _clean_datetime_objects(finding_details)
-                all_findings.append(finding_details)
+                next_token = findings_response.get("nextToken")
+                if not next_token:
+                    break
+
+            if len(all_findings) >= max_findings:
+                break
+
+        all_findings = all_findings[:max_findings]
+        print(
+            f"[DEBUG:AccessAnalyzer] Retrieved {len(all_findings)} findings with {list_calls} list_findings calls"
+        )
 
         if not all_findings:
             return {
                 "enabled": True,
-                "message": "No IAM Access Analyzer findings found",
+                "message": f"No IAM Access Analyzer findings found{note}",
                 "findings": [],
             }
 
         return {
             "enabled": True,
-            "message": f"Retrieved {len(all_findings)} IAM Access Analyzer findings",
+            "message": f"Retrieved {len(all_findings)} IAM Access Analyzer findings{note}",
             "findings": all_findings,
             "summary": _summarize_access_analyzer_findings(all_findings),
+            "debug_info": {"list_findings_calls": list_calls, "filter": finding_filter},
         }
     except Exception as e:
         await ctx.error(f"Error getting IAM Access Analyzer findings: {e}")
@@ -975,30 +1246,11 @@ async def get_access_analyzer_findings(
 # Helper functions for processing findings
 
 
-def _clean_datetime_objects(obj: Any) -> Any:
-    """Convert datetime objects in a nested dictionary to ISO format strings.
-
-    Args:
-        obj: Object that may contain datetime objects
-
-    Returns:
-        Object with datetime objects converted to strings
-    """
-    if isinstance(obj, datetime.datetime):
-        return obj.isoformat()
-    elif isinstance(obj, list):
-        return [_clean_datetime_objects(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {k: _clean_datetime_objects(v) for k, v in obj.items()}
-    else:
-        return obj
-
-
 def _summarize_guardduty_findings(findings: List[Dict]) -> Dict:
     """Generate a summary of GuardDuty findings.
 
     Args:
-        findings: List of GuardDuty finding dictionaries
+        findings: GuardDuty findings as returned by boto3; datetimes are not read
 
     Returns:
         Dictionary with summary information
@@ -1041,7 +1293,7 @@ def _summarize_securityhub_findings(findings: List[Dict]) -> Dict:
     """Generate a summary of Security Hub findings.
 
     Args:
-        findings: List of Security Hub finding dictionaries
+        findings: Security Hub findings as returned by boto3; datetimes are not read
 
     Returns:
         Dictionary with summary information
@@ -1088,7 +1340,7 @@ def _summarize_inspector_findings(findings: List[Dict]) -> Dict:
     """Generate a summary of Inspector findings.
 
     Args:
-        findings: List of Inspector finding dictionaries
+        findings: Inspector findings as returned by boto3; datetimes are not read
 
     Returns:
         Dictionary with summary information
@@ -1133,7 +1385,7 @@ def _summarize_access_analyzer_findings(findings: List[Dict]) -> Dict:
     """Generate a summary of IAM Access Analyzer findings.
 
     Args:
-        findings: List of IAM Access Analyzer finding dictionaries
+        findings: IAM Access Analyzer findings as returned by boto3; datetimes are not read
 
     Returns:
         Dictionary with summary information
@@ -1184,7 +1436,9 @@ async def check_trusted_advisor(region: str, session: boto3.Session, ctx: Contex
         try:
             # Try to describe Trusted Advisor checks to see if we have access
             print("[DEBUG:TrustedAdvisor] Calling describe_trusted_advisor_checks API")
-            checks_response = support_client.describe_trusted_advisor_checks(language="en")
+            checks_response = await call_aws(
+                support_client.describe_trusted_advisor_checks, language="en"
+            )
 
             # If we get here, we have access to Trusted Advisor
             checks = checks_response.get("checks", [])
@@ -1296,7 +1550,9 @@ async def get_trusted_advisor_findings(
 
         # Get all available checks
         print("[DEBUG:TrustedAdvisor] Getting all available checks")
-        checks_response = support_client.describe_trusted_advisor_checks(language="en")
+        checks_response = await call_aws(
+            support_client.describe_trusted_advisor_checks, language="en"
+        )
         all_checks = checks_response.get("checks", [])
 
         # Filter checks by category if specified
@@ -1311,62 +1567,99 @@ async def get_trusted_advisor_findings(
                 f"[DEBUG:TrustedAdvisor] Filtered to {len(filtered_checks)} {category_filter} checks"
             )
 
-        # Limit the number of checks to process based on max_findings
-        checks_to_process = filtered_checks[:max_findings]
+        # Fetch the summaries of all checks in bulk, so only checks whose status matches the
+        # filter need their full results (with every flagged resource) fetched
+        summaries = await _get_trusted_advisor_check_summaries(
+            support_client, [check.get("id") for check in filtered_checks], ctx
+        )
+        checks_to_process = [
+            check
+            for check in filtered_checks
+            if not status_filter
+            or check.get("id") not in summaries
+            or summaries[check.get("id")].get("status", "").lower() in status_filter
+        ][:max_findings]
+        print(
+            f"[DEBUG:TrustedAdvisor] Fetching results for {len(checks_to_process)} of {len(filtered_checks)} checks"
+        )
+
+        identity = await get_credential_identity(session)
+        semaphore = asyncio.Semaphore(TRUSTED_ADVISOR_CONCURRENCY)
+
+        async def get_check_result(check: Dict) -> Optional[Dict]:
+            check_id = check.get("id", "unknown")
+            summary = summaries.get(check_id)
+            cache_key = (identity, check_id)
+            cached = _trusted_advisor_results.get(cache_key)
+            if (
+                cached is not None
+                and summary is not None
+                and cached[0] > time.time()
+                and cached[1] == summary.get("timestamp")
+            ):
+                return cached[2]
 
-        # Get check results
-        findings = []
-        for check in checks_to_process:
-            check_id = check.get("id", "unknown")  # Initialize check_id outside try block
             try:
-                result = support_client.describe_trusted_advisor_check_result(
-                    checkId=check_id, language="en"
+                async with semaphore:
+                    result = await call_aws(
+                        support_client.describe_trusted_advisor_check_result,
+                        checkId=check_id,
+                        language="en",
+                    )
+            except Exception as check_error:
+                await ctx.warning(
+                    f"Error getting results for Trusted Advisor check {check_id}: {check_error}"
                 )
+                return None
 
-                # Extract the result
-                check_result = result.get("result", {})
-                status = check_result.get("status", "").lower()
-
-                # Skip checks that don't match the status filter
-                if status_filter and status not in status_filter:
-                    continue
-
-                # Format the finding
-                finding = {
-                    "check_id": check_id,
-                    "name": check.get("name"),
-                    "description": check.get("description"),
-                    "category": check.get("category"),
-                    "status": status,
-                    "timestamp": check_result.get("timestamp"),
-                    "resources_flagged": check_result.get("resourcesSummary", {}).get(
-                        "resourcesFlagged", 0
-                    ),
-                    "resources_processed": check_result.get("resourcesSummary", {}).get(
-                        "resourcesProcessed", 0
-                    ),
-                    "resources_suppressed": check_result.get("resourcesSummary", {}).get(
-                        "resourcesSuppressed", 0
-                    ),
-                    "flagged_resources": [],
-                }
+            check_result = result.get("result", {})
+            if identity is not None:
+                _cache_trusted_advisor_result(cache_key, check_result)
+            return check_result
 
-                # Add flagged resources
-                flagged_resources = check_result.get("flaggedResources", [])
-                for resource in flagged_resources:
-                    # Clean up the resource data
-                    resource_data = _clean_datetime_objects(resource)
-                    finding["flagged_resources"].append(resource_data)
+        check_results = await asyncio.gather(
+            *[get_check_result(check) for check in checks_to_process]
+        )
 
-                findings.append(finding)
-                print(
-                    f"[DEBUG:TrustedAdvisor] Added finding: {finding['name']} (status: {finding['status']}, resources: {finding['resources_flagged']})"
-                )
+        # Turn the check results into findings
+        findings = []
+        for check, check_result in zip(checks_to_process, check_results, strict=True):
+            if check_result is None:
+                continue
+            check_id = check.get("id", "unknown")
+            status = check_result.get("status", "").lower()
 
-            except Exception as check_error:
-                await ctx.warning(
-                    f"Error getting results for Trusted Advisor check {check_id}: {check_error}"
-                )
+            # Skip checks that don't match the status filter
+            if status_filter and status not in status_filter:
+                continue
+
+            # Format the finding
+            finding = {
+                "check_id": check_id,
+                "name": check.get("name"),
+                "description": check.get("description"),
+                "category": check.get("category"),
+                "status": status,
+                "timestamp": check_result.get("timestamp"),
+                "resources_flagged": check_result.get("resourcesSummary", {}).get(
+                    "resourcesFlagged", 0
+                ),
+                "resources_processed": check_result.get("resourcesSummary", {}).get(
+                    "resourcesProcessed", 0
+                ),
+                "resources_suppressed": check_result.get("resourcesSummary", {}).get(
+                    "resourcesSuppressed", 0
+                ),
+                "flagged_resources": [],
+            }
+
+            # Add flagged resources
+            finding["flagged_resources"].extend(check_result.get("flaggedResources", []))
+
+            findings.append(finding)
+            print(
+                f"[DEBUG:TrustedAdvisor] Added finding: {finding['name']} (status: {finding['status']}, resources: {finding['resources_flagged']})"
+            )
 
         # Generate summary
         summary = _summarize_trusted_advisor_findings(findings)
@@ -1389,6 +1682,36 @@ async def get_trusted_advisor_findings(
         }
 
 
+async def _get_trusted_advisor_check_summaries(
+    support_client: Any, check_ids: List[str], ctx: Context
+) -> Dict[str, Dict]:
+    """Get the status summaries of Trusted Advisor checks in bulk.
+
+    Args:
+        support_client: boto3 client for AWS Support
+        check_ids: IDs of the checks to summarize
+        ctx: MCP context for error reporting
+
+    Returns:
+        Dictionary mapping check ID to its summary. Checks whose summary could not be
+        retrieved are left out, so callers fall back to fetching their full results.
+    """
+    summaries = {}
+    for start in range(0, len(check_ids), TRUSTED_ADVISOR_SUMMARY_BATCH_SIZE):
+        batch = check_ids[start : start + TRUSTED_ADVISOR_SUMMARY_BATCH_SIZE]
+        try:
+            response = await call_aws(
+                support_client.describe_trusted_advisor_check_summaries, checkIds=batch
+            )
+        except Exception as e:
+            await ctx.warning(f"Error getting Trusted Advisor check summaries: {e}")
+            continue
+
+        for summary in response.get("summaries", []):
+            summaries[summary.get("checkId")] = summary
+    return summaries
+
+
 def _summarize_trusted_advisor_findings(findings: List[Dict]) -> Dict:
     """Generate a summary of Trusted Advisor findings.
 
@@ -1445,7 +1768,7 @@ async def check_macie(region: str, session: boto3.Session, ctx: Context) -> Dict
         # Check if Macie is enabled
         try:
             print("[DEBUG:Macie] Calling get_macie_session() API")
-            status = macie_client.get_macie_session()
+            status = await call_aws(macie_client.get_macie_session)
             print(f"[DEBUG:Macie] get_macie_session() successful, status: {status.get('status')}")
 
             # If we get here without exception, Macie is enabled
@@ -1524,8 +1847,8 @@ async def get_macie_findings(
             filter_criteria = {"criterion": {"severity.score": {"gt": 7}}}
 
         # List findings with the filter criteria
-        findings_response = macie_client.list_findings(
-            findingCriteria=filter_criteria, maxResults=max_findings
+        findings_response = await call_aws(
+            macie_client.list_findings, findingCriteria=filter_criteria, maxResults=max_findings
         )
 
         finding_ids = findings_response.get("findingIds", [])
@@ -1540,18 +1863,13 @@ async def get_macie_findings(
 
         # Get finding details
         print(f"[DEBUG:Macie] Retrieving details for {len(finding_ids)} findings")
-        findings_details = macie_client.get_findings(findingIds=finding_ids)
+        findings_details = await call_aws(macie_client.get_findings, findingIds=finding_ids)
 
-        # Process findings to clean up non-serializable objects (like datetime)
-        findings = []
-        raw_findings_count = len(findings_details.get("findings", []))
+        # Findings are summarized as returned; datetimes are converted when the tool returns
+        findings = findings_details.get("findings", [])
+        raw_findings_count = len(findings)
         print(f"[DEBUG:Macie] Processing {raw_findings_count} findings from get_findings response")
 
-        for finding in findings_details.get("findings", []):
-            # Convert datetime objects to strings
-            finding = _clean_datetime_objects(finding)
-            findings.append(finding)
-
         print(f"[DEBUG:Macie] Successfully processed {len(findings)} findings")
 
         # Generate summary
@@ -1578,7 +1896,7 @@ def _summarize_macie_findings(findings: List[Dict]) -> Dict:
     """Generate a summary of Macie findings.
 
     Args:
-        findings: List of Macie finding dictionaries
+        findings: Macie findings as returned by boto3; datetimes are not read
 
     Returns:
         Dictionary with summary information
@@ -1616,3 +1934,120 @@ def _summarize_macie_findings(findings: List[Dict]) -> Dict:
             summary["bucket_counts"][bucket_name] = 1
 
     return summary
+
+
+# Helper functions for merging findings from several services and regions
+
+
+def _severity_from_score(score: float, critical: float, high: float, medium: float) -> str:
+    """Map a numeric severity score onto a normalized label using the given thresholds."""
+    if score >= critical:
+        return "CRITICAL"
+    elif score >= high:
+        return "HIGH"
+    elif score >= medium:
+        return "MEDIUM"
+    return "LOW"
+
+
+def normalize_finding_severity(service: str, finding: Dict) -> str:
+    """Get the normalized severity label of a finding returned by one of the get_*_findings helpers.
+
+    GuardDuty uses a 1-10 score, Macie a 1-3 score (with a description), Security Hub and
+    Inspector use labels, Trusted Advisor uses check statuses and Access Analyzer has no
+    severity at all, so each is mapped onto the SEVERITY_LEVELS labels.
+
+    Args:
+        service: Service the finding came from (e.g. 'guardduty', 'securityhub')
+        finding: Finding dictionary
+
+    Returns:
+        One of the SEVERITY_LEVELS labels
+    """
+    service = service.lower()
+    if service == "guardduty":
+        return _severity_from_score(finding.get("Severity", 0), critical=9, high=7, medium=4)
+    elif service == "securityhub":
+        label = finding.get("Severity", {}).get("Label", "MEDIUM")
+    elif service == "inspector":
+        label = finding.get("severity", "MEDIUM")
+    elif service == "macie":
+        severity = finding.get("severity", {})
+        label = severity.get("description")
+        if not label:
+            return _severity_from_score(severity.get("score", 1), critical=4, high=3, medium=2)
+    elif service == "trustedadvisor":
+        status = finding.get("status", "").lower()
+        label = {"error": "HIGH", "warning": "MEDIUM"}.get(status, "INFORMATIONAL")
+    elif service == "accessanalyzer":
+        label = "HIGH" if finding.get("isPublic") else "MEDIUM"
+    else:
+        label = "MEDIUM"
+
+    label = str(label).upper()
+    return label if label in SEVERITY_LEVELS else "INFORMATIONAL"
+
+
+def merge_findings(
+    source_results: List[Dict], max_findings: int, severity_filter: Optional[str] = None
+) -> Dict:
+    """Merge findings from several services and regions into one severity-ordered list.
+
+    Args:
+        source_results: Results of get_*_findings calls, each with "service" and "region" keys
+        max_findings: Maximum number of findings to return across all sources
+        severity_filter: Optional normalized severity label to keep
+
+    Returns:
+        Dictionary with the merged findings, a summary and the status of each source
+    """
+    merged = []
+    sources = []
+    for source in source_results:
+        service = source.get("service", "unknown")
+        region = source.get("region", "unknown")
+        source_findings = source.get("findings", [])
+        sources.append(
+            {
+                "service": service,
+                "region": region,
+                "enabled": source.get("enabled", False),
+                "findings_retrieved": len(source_findings),
+                "message": source.get("message", ""),
+                **({"error": source["error"]} if source.get("error") else {}),
+            }
+        )
+
+        for finding in source_findings:
+            severity = normalize_finding_severity(service, finding)
+            if severity_filter and severity != severity_filter.upper():
+                continue
+            merged.append(
+                {"service": service, "region": region, "severity": severity, "finding": finding}
+            )
+
+    # Stable sort keeps each service's own ordering within a severity
+    merged.sort(key=lambda entry: SEVERITY_LEVELS[entry["severity"]], reverse=True)
+
+    summary = {
+        "total_count": len(merged),
+        "returned_count": min(len(merged), max_findings),
+        "severity_counts": {label.lower(): 0 for label in SEVERITY_LEVELS},
+        "service_counts": {},
+        "region_counts": {},
+    }
+    for entry in merged:
+        summary["severity_counts"][entry["severity"].lower()] += 1
+        summary["service_counts"][entry["service"]] = (
+            summary["service_counts"].get(entry["service"], 0) + 1
+        )
+        summary["region_counts"][entry["region"]] = (
+            summary["region_counts"].get(entry["region"], 0) + 1
+        )
+
+    return {
+        "findings": merged[:max_findings],
+        "truncated": len(merged) > max_findings,
+        "summary": summary,
+        "sources": sources,
+    }
@@ -0,0 +1,64 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Conversion of boto3 responses to JSON-compatible values at the output boundary.
+
+boto3 returns timestamps as ``datetime`` objects. Findings are kept as boto3 returned them
+while they are filtered and summarized, and datetimes are converted to ISO 8601 strings only
+once, when a tool returns its result or a value is serialized to JSON.
+"""
+
+import datetime
+from typing import Any
+
+
+def json_default(value: Any) -> Any:
+    """JSON ``default`` hook: ISO 8601 strings for dates and datetimes, ``str`` for the rest."""
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
+def normalize_datetimes(value: Any) -> Any:
+    """Replace every date and datetime in nested dicts and lists with its ISO 8601 string.
+
+    Containers are updated in place in a single pass, without copying them, so the result of
+    a tool can be made JSON-compatible right before it is returned.
+
+    Args:
+        value: A dict, list, date or datetime, or any other value
+
+    Returns:
+        The same container with its datetimes converted, the ISO string of a date or datetime,
+        or the value unchanged
+    """
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if not isinstance(value, (dict, list)):
+        return value
+
+    pending = [value]
+    while pending:
+        container = pending.pop()
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, item in items:
+            if isinstance(item, (dict, list)):
+                pending.append(item)
+            elif isinstance(item, datetime.date):
+                # Replacing the value of an existing key or index is safe while iterating
+                container[key] = item.isoformat()
+    return value
@@ -0,0 +1,230 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Compliance snapshots for incremental (delta) storage and network assessments.
+
+Every storage or network check records a snapshot of its per-resource results, each with a
+content hash and the Resource Explorer ``LastReportedAt`` timestamp of the resource. A later
+check run against that snapshot re-checks only what may have changed:
+
+- a service whose Resource Explorer resources (ARNs and timestamps) are unchanged and that had
+  no non-compliant resources reuses its previous results without any API calls
+- services that check resources one by one (S3 buckets, ALB/NLB load balancers) reuse the
+  previous result of every compliant resource whose timestamp is unchanged, and re-check the
+  new, changed and previously non-compliant ones
+
+Without a Resource Explorer inventory there is nothing to detect changes with, so every
+resource is checked again. The run still returns a diff against the previous snapshot.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import uuid
+from typing import Any, Dict, List, Optional
+
+# Seconds a snapshot is kept for later delta checks
+SNAPSHOT_TTL = float(os.environ.get("SECURITY_MCP_SNAPSHOT_TTL", "604800"))
+
+# Maximum number of snapshots kept; the least recently used are evicted first
+SNAPSHOT_MAX_ENTRIES = int(os.environ.get("SECURITY_MCP_SNAPSHOT_MAX_ENTRIES", "64"))
+
+
+def resource_hash(resource: Dict[str, Any]) -> str:
+    """Hash the content of a resource result so changed results can be told apart."""
+    content = json.dumps(resource, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _inventory_fingerprint(resources: List[Dict[str, Any]]) -> str:
+    """Hash the ARNs and LastReportedAt timestamps of the inventory resources of a service."""
+    entries = sorted(
+        f"{resource.get('Arn', '')}@{resource.get('LastReportedAt')}" for resource in resources
+    )
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+class AssessmentSnapshot:
+    """Per-resource compliance results of one check run, compared against a previous run."""
+
+    def __init__(self, kind: str, region: str, previous: Optional[Dict[str, Any]] = None):
+        """Start a snapshot.
+
+        Args:
+            kind: Kind of check, ``storage`` or ``network``
+            region: AWS region the check runs in
+            previous: Snapshot of an earlier run to reuse unchanged results from
+        """
+        self.snapshot_id = uuid.uuid4().hex
+        self.kind = kind
+        self.region = region
+        self.previous = previous
+        self.created_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        self.fingerprints: Optional[Dict[str, str]] = None
+        self.timestamps: Dict[str, str] = {}
+        self.services: Dict[str, Dict[str, Any]] = {}
+        self.services_reused: List[str] = []
+        self._offered: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def index_inventory(
+        self, inventory_resources: Dict[str, Any], inventory_keys: Dict[str, List[str]]
+    ) -> None:
+        """Fingerprint the Resource Explorer resources behind each service check.
+
+        Args:
+            inventory_resources: Result of find_storage_resources or find_network_resources
+            inventory_keys: Service check name -> keys of resources_by_service it covers
+        """
+        if "error" in inventory_resources:
+            return
+
+        resources_by_service = inventory_resources.get("resources_by_service", {})
+        self.fingerprints = {}
+        for service, keys in inventory_keys.items():
+            resources = [
+                resource for key in keys for resource in resources_by_service.get(key, [])
+            ]
+            self.fingerprints[service] = _inventory_fingerprint(resources)
+            for resource in resources:
+                if resource.get("LastReportedAt") is not None:
+                    self.timestamps[resource.get("Arn", "")] = str(resource["LastReportedAt"])
+
+    def reusable_service(self, service: str) -> Optional[Dict[str, Any]]:
+        """Get the previous results of a service that does not need to be checked again.
+
+        A service is reused only if its inventory is unchanged and its previous check completed
+        without errors, skipped resources or non-compliant resources.
+        """
+        if not self.previous or self.fingerprints is None:
+            return None
+        previous_results = self.previous.get("services", {}).get(service)
+        previous_fingerprints = self.previous.get("inventory_fingerprints") or {}
+        if (
+            previous_results is None
+            or previous_fingerprints.get(service) != self.fingerprints.get(service)
+            or previous_results.get("error")
+            or previous_results.get("buckets_not_checked")
+            or previous_results.get("non_compliant_resources", 0)
+        ):
+            return None
+
+        self.services_reused.append(service)
+        return previous_results
+
+    def reusable_resources(self, service: str) -> Dict[str, Dict[str, Any]]:
+        """Get the previous results, by ARN, of compliant resources whose timestamp is unchanged."""
+        if not self.previous or self.fingerprints is None:
+            return {}
+        previous_resources = self.previous.get("resources", {})
+        previous_results = self.previous.get("services", {}).get(service, {})
+
+        reusable = {}
+        for resource in previous_results.get("resource_details", []):
+            arn = resource.get("arn")
+            entry = previous_resources.get(arn)
+            if (
+                entry is not None
+                and entry["compliant"]
+                and arn in self.timestamps
+                and entry["last_reported_at"] == self.timestamps[arn]
+            ):
+                reusable[arn] = resource
+        self._offered[service] = reusable
+        return reusable
+
+    def record(self, service: str, service_results: Dict[str, Any]) -> None:
+        """Record the full (unfiltered) results of a service check."""
+        self.services[service] = service_results
+
+    def resources(self) -> Dict[str, Dict[str, Any]]:
+        """Get the hash, compliance and inventory timestamp of every recorded resource by ARN."""
+        resources = {}
+        for service, service_results in self.services.items():
+            for resource in service_results.get("resource_details", []):
+                arn = resource.get("arn")
+                if not arn:
+                    continue
+                resources[arn] = {
+                    "service": service,
+                    "hash": resource_hash(resource),
+                    "compliant": resource.get("compliant", True),
+                    "last_reported_at": self.timestamps.get(arn),
+                }
+        return resources
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the snapshot in the form kept in the snapshot store."""
+        return {
+            "snapshot_id": self.snapshot_id,
+            "kind": self.kind,
+            "region": self.region,
+            "created_at": self.created_at,
+            "inventory_fingerprints": self.fingerprints,
+            "services": self.services,
+            "resources": self.resources(),
+        }
+
+    def delta(self) -> Dict[str, Any]:
+        """Summarize what was reused from the previous snapshot and what changed since."""
+        current = self.resources()
+        previous = (self.previous or {}).get("resources", {})
+        # Only compare services checked in both runs
+        previous = {
+            arn: entry for arn, entry in previous.items() if entry["service"] in self.services
+        }
+
+        resources_reused = sum(
+            len(self.services[service].get("resource_details", []))
+            for service in self.services_reused
+        ) + sum(
+            1
+            for service, offered in self._offered.items()
+            for resource in self.services.get(service, {}).get("resource_details", [])
+            if offered.get(resource.get("arn")) is resource
+        )
+
+        added = sorted(arn for arn in current if arn not in previous)
+        removed = sorted(arn for arn in previous if arn not in current)
+        common = [arn for arn in current if arn in previous]
+        return {
+            "since_snapshot": (self.previous or {}).get("snapshot_id"),
+            "services_reused": self.services_reused,
+            "resources_reused": resources_reused,
+            "resources_rechecked": len(current) - resources_reused,
+            "diff": {
+                "added": added,
+                "removed": removed,
+                "changed": sorted(
+                    arn for arn in common if current[arn]["hash"] != previous[arn]["hash"]
+                ),
+                "newly_non_compliant": sorted(
+                    arn
+                    for arn in current
+                    if not current[arn]["compliant"]
+                    and (arn not in previous or previous[arn]["compliant"])
+                ),
+                "resolved": sorted(
+                    arn
+                    for arn in common
+                    if current[arn]["compliant"] and not previous[arn]["compliant"]
+                ),
+                "unchanged": sum(
+                    1 for arn in common if current[arn]["hash"] == previous[arn]["hash"]
+                ),
+            },
+        }
@@ -17,7 +17,8 @@
 
 """Utility functions for checking AWS storage services encryption and security."""
 
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import boto3
 import botocore.exceptions
@@ -25,12 +26,30 @@ from botocore.config import Config
 from mcp.server.fastmcp import Context
 
 from src import __version__
+from src.util.aws_calls import call_aws, paginate_aws
+from src.util.progress import ProgressReporter
+from src.util.resource_inventory import get_resource_inventory
+from src.util.s3_posture import iter_bucket_posture, resolve_bucket_regions
+from src.util.snapshots import AssessmentSnapshot
 
 # User agent configuration for AWS API calls
 USER_AGENT_CONFIG = Config(
     user_agent_extra=f"awslabs/mcp/well-architected-security-mcp-server/{__version__}"
 )
 
+# Storage services check_storage_encryption knows how to check, in the order they are checked
+STORAGE_SERVICES = ["s3", "ebs", "rds", "dynamodb", "efs", "elasticache"]
+
+# Keys of find_storage_resources' resources_by_service covered by each service check
+STORAGE_INVENTORY_KEYS = {
+    "s3": ["s3"],
+    "ebs": ["ebs"],
+    "rds": ["rds"],
+    "dynamodb": ["dynamodb"],
+    "efs": ["elasticfilesystem"],
+    "elasticache": ["elasticache"],
+}
+
 
 async def check_storage_encryption(
     region: str,
@@ -38,6 +57,8 @@ async def check_storage_encryption(
     session: boto3.Session,
     ctx: Context,
     include_unencrypted_only: bool = False,
+    snapshot: Optional[AssessmentSnapshot] = None,
+    on_update: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> Dict[str, Any]:
     """Check AWS storage resources for encryption and security best practices.
 
@@ -47,6 +68,10 @@ async def check_storage_encryption(
         session: boto3 Session for AWS API calls
         ctx: MCP context for error reporting
         include_unencrypted_only: Whether to include only unencrypted resources in the results
+        snapshot: Snapshot recording this run; unchanged results of its previous snapshot are
+            reused instead of being checked again
+        on_update: Called with the running results each time a service check completes, so
+            the resource_details found so far can be read before the whole check finishes
 
     Returns:
         Dictionary with storage encryption and security status
@@ -62,46 +87,80 @@ async def check_storage_encryption(
         "recommendations": [],
     }
 
+    # Report progress to the client as each service completes
+    progress = ProgressReporter(
+        ctx,
+        len([service for service in STORAGE_SERVICES if service in services]),
+        f"Storage encryption check in {region}",
+    )
+
     # Find all storage resources using Resource Explorer
     storage_resources = await find_storage_resources(region, session, services, ctx)
+    if snapshot:
+        snapshot.index_inventory(storage_resources, STORAGE_INVENTORY_KEYS)
+
+    async def run_check(
+        service: str, check: Callable[..., Awaitable[Dict[str, Any]]], per_resource: bool = False
+    ) -> None:
+        """Run one service check, reusing unchanged results of the previous snapshot."""
+        service_results = snapshot.reusable_service(service) if snapshot else None
+        if service_results is None:
+            if per_resource and snapshot:
+                service_results = await check(reuse=snapshot.reusable_resources(service))
+            else:
+                service_results = await check()
+        if snapshot:
+            snapshot.record(service, service_results)
+        await _update_results(results, service_results, service, include_unencrypted_only)
+        if on_update:
+            on_update(results)
+        await progress.service_done(service, service_results.get("resources_checked", 0))
 
     # Check each service as requested
     if "s3" in services:
         s3_client = session.client("s3", region_name=region, config=USER_AGENT_CONFIG)
-        s3_results = await check_s3_buckets(region, s3_client, ctx, storage_resources)
-        await _update_results(results, s3_results, "s3", include_unencrypted_only)
+        await run_check(
+            "s3",
+            partial(
+                check_s3_buckets, region, s3_client, ctx, storage_resources, progress=progress
+            ),
+            per_resource=True,
+        )
 
     if "ebs" in services:
         ec2_client = session.client("ec2", region_name=region, config=USER_AGENT_CONFIG)
-        ebs_results = await check_ebs_volumes(region, ec2_client, ctx, storage_resources)
-        await _update_results(results, ebs_results, "ebs", include_unencrypted_only)
+        await run_check(
+            "ebs", partial(check_ebs_volumes, region, ec2_client, ctx, storage_resources)
+        )
 
     if "rds" in services:
         rds_client = session.client("rds", region_name=region, config=USER_AGENT_CONFIG)
-        rds_results = await check_rds_instances(region, rds_client, ctx, storage_resources)
-        await _update_results(results, rds_results, "rds", include_unencrypted_only)
+        await run_check(
+            "rds", partial(check_rds_instances, region, rds_client, ctx, storage_resources)
+        )
 
     if "dynamodb" in services:
         dynamodb_client = session.client("dynamodb", region_name=region, config=USER_AGENT_CONFIG)
-        dynamodb_results = await check_dynamodb_tables(
-            region, dynamodb_client, ctx, storage_resources
+        await run_check(
+            "dynamodb",
+            partial(check_dynamodb_tables, region, dynamodb_client, ctx, storage_resources),
         )
-        await _update_results(results, dynamodb_results, "dynamodb", include_unencrypted_only)
 
     if "efs" in services:
         efs_client = session.client("efs", region_name=region, config=USER_AGENT_CONFIG)
-        efs_results = await check_efs_filesystems(region, efs_client, ctx, storage_resources)
-        await _update_results(results, efs_results, "efs", include_unencrypted_only)
+        await run_check(
+            "efs", partial(check_efs_filesystems, region, efs_client, ctx, storage_resources)
+        )
 
     if "elasticache" in services:
         elasticache_client = session.client(
             "elasticache", region_name=region, config=USER_AGENT_CONFIG
         )
-        elasticache_results = await check_elasticache_clusters(
-            region, elasticache_client, ctx, storage_resources
-        )
-        await _update_results(
-            results, elasticache_results, "elasticache", include_unencrypted_only
+        await run_check(
+            "elasticache",
+            partial(
+                check_elasticache_clusters, region, elasticache_client, ctx, storage_resources
+            ),
         )
 
     # Generate overall recommendations based on findings
@@ -129,12 +188,33 @@ async def _update_results(
         "non_compliant_resources": service_results.get("non_compliant_resources", 0),
     }
 
+    # Record resources skipped because the service ran out of time
+    if service_results.get("buckets_not_checked"):
+        main_results["compliance_by_service"][service_name]["resources_not_checked"] = len(
+            service_results["buckets_not_checked"]
+        )
+
     # Add resource details
     for resource in service_results.get("resource_details", []):
         if not include_unencrypted_only or not resource.get("compliant", True):
             main_results["resource_details"].append(resource)
 
 
+async def _describe_all(
+    client: Any, operation: str, result_key: str, id_key: str
+) -> Dict[str, Dict[str, Any]]:
+    """Describe every resource of a type with one paginated sweep, keyed by resource ID.
+
+    The list pages already carry the encryption settings the checks need, so resources found
+    here do not need a describe call of their own.
+    """
+    described = {}
+    async for page in paginate_aws(client, operation):
+        for resource in page.get(result_key, []):
+            described[resource[id_key]] = resource
+    return described
+
+
 async def generate_recommendations(results: Dict[str, Any]) -> List[str]:
     """Generate recommendations based on the scan results."""
     recommendations = []
@@ -207,61 +287,32 @@ async def find_storage_resources(
             f"[DEBUG:StorageSecurity] Finding storage resources in {region} using Resource Explorer"
         )
 
-        # Initialize resource explorer client
-        resource_explorer = session.client(
-            "resource-explorer-2", region_name=region, config=USER_AGENT_CONFIG
-        )
-
-        # Try to get the default view for Resource Explorer
-        print("[DEBUG:StorageSecurity] Listing Resource Explorer views...")
-        views = resource_explorer.list_views()
-        print(f"[DEBUG:StorageSecurity] Found {len(views.get('Views', []))} views")
-
-        default_view = None
-        # Find the default view
-        for view in views.get("Views", []):
-            print(f"[DEBUG:StorageSecurity] View: {view.get('ViewArn')}")
-            if view.get("Filters", {}).get("FilterString", "") == "":
-                default_view = view.get("ViewArn")
-                print(f"[DEBUG:StorageSecurity] Found default view: {default_view}")
-                break
-
-        if not default_view:
+        # Query the shared Resource Explorer inventory instead of sweeping for each check
+        inventory = await get_resource_inventory(region, session, ctx)
+        if inventory is None:
             print("[DEBUG:StorageSecurity] No default view found. Cannot use Resource Explorer.")
             await ctx.warning(
                 "No default Resource Explorer view found. Will fall back to direct service API calls."
             )
             return {"error": "No default Resource Explorer view found"}
 
-        # Build filter strings for each service
-        service_filters = []
-
-        if "s3" in services:
-            service_filters.append("service:s3")
-        if "ebs" in services:
-            service_filters.append("service:ec2 resourcetype:ec2:volume")
-        if "rds" in services:
-            service_filters.append("service:rds")
-        if "dynamodb" in services:
-            service_filters.append("service:dynamodb")
-        if "efs" in services:
-            service_filters.append("service:elasticfilesystem")
-        if "elasticache" in services:
-            service_filters.append("service:elasticache")
-
-        # Combine with OR
-        filter_string = " OR ".join(service_filters)
-        print(f"[DEBUG:StorageSecurity] Using filter string: {filter_string}")
-
-        # Get resources
-        resources = []
-        paginator = resource_explorer.get_paginator("list_resources")
-        page_iterator = paginator.paginate(
-            Filters={"FilterString": filter_string}, MaxResults=100, ViewArn=default_view
+        # Map the requested services onto Resource Explorer services and resource types
+        service_names = [
+            name
+            for service, name in (
+                ("s3", "s3"),
+                ("rds", "rds"),
+                ("dynamodb", "dynamodb"),
+                ("efs", "elasticfilesystem"),
+                ("elasticache", "elasticache"),
+            )
+            if service in services
+        ]
+        resource_types = ["ec2:volume"] if "ebs" in services else []
+        print(
+            f"[DEBUG:StorageSecurity] Selecting services {service_names} and types {resource_types}"
         )
-
-        for page in page_iterator:
-            resources.extend(page.get("Resources", []))
+        resources = inventory.select(service_names, resource_types)
 
         print(f"[DEBUG:StorageSecurity] Found {len(resources)} total storage resources")
 
@@ -299,9 +350,22 @@ async def find_storage_resources(
 
 
 async def check_s3_buckets(
-    region: str, s3_client: Any, ctx: Context, storage_resources: Dict[str, Any]
+    region: str,
+    s3_client: Any,
+    ctx: Context,
+    storage_resources: Dict[str, Any],
+    max_concurrency: Optional[int] = None,
+    time_budget: Optional[float] = None,
+    progress: Optional[ProgressReporter] = None,
+    reuse: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
-    """Check S3 buckets for encryption and security best practices."""
+    """Check S3 buckets for encryption and security best practices.
+
+    Bucket regions are resolved and buckets are probed concurrently, up to max_concurrency
+    buckets at a time. If time_budget runs out, the buckets that were not checked are listed
+    in ``buckets_not_checked``. Batches of checked buckets are reported through progress.
+    Buckets whose ARN is in reuse keep that earlier result instead of being probed again.
+    """
     print(f"[DEBUG:StorageSecurity] Checking S3 buckets in {region}")
 
     results = {
@@ -326,124 +390,53 @@ async def check_s3_buckets(
                 if ":bucket/" in arn or ":bucket:" in arn:
                     bucket_name = arn.split(":")[-1]
                     buckets.append(bucket_name)
+                elif ":s3:::" in arn and "/" not in arn:
+                    # Resource Explorer reports buckets as arn:aws:s3:::bucket-name
+                    buckets.append(arn.split(":::")[-1])
         else:
-            # Fall back to direct API call
-            response = s3_client.list_buckets()
-            for bucket in response["Buckets"]:
-                # Check if bucket is in the specified region
-                try:
-                    location = s3_client.get_bucket_location(Bucket=bucket["Name"])
-                    bucket_region = location.get("LocationConstraint")
-                    # us-east-1 returns None for the location constraint
-                    if bucket_region is None:
-                        bucket_region = "us-east-1"
-
-                    if bucket_region == region:
-                        buckets.append(bucket["Name"])
-                except Exception as e:
-                    print(
-                        f"[DEBUG:StorageSecurity] Error getting location for bucket {bucket['Name']}: {e}"
-                    )
-                    await ctx.warning(f"Error getting location for bucket {bucket['Name']}: {e}")
+            # Fall back to direct API call and keep the buckets in the specified region
+            response = await call_aws(s3_client.list_buckets)
+            bucket_regions = await resolve_bucket_regions(
+                s3_client, response["Buckets"], ctx, max_concurrency
+            )
+            buckets = [
+                bucket["Name"]
+                for bucket in response["Buckets"]
+                if bucket_regions.get(bucket["Name"]) == region
+            ]
 
         print(f"[DEBUG:StorageSecurity] Found {len(buckets)} S3 buckets in region {region}")
-        results["resources_checked"] = len(buckets)
 
-        # Check each bucket
-        for bucket_name in buckets:
-            bucket_result = {
-                "name": bucket_name,
-                "arn": f"arn:aws:s3:::{bucket_name}",
-                "type": "s3",
-                "compliant": True,
-                "issues": [],
-                "checks": {},
-            }
-
-            # Check default encryption
-            try:
-                encryption = s3_client.get_bucket_encryption(Bucket=bucket_name)
-                encryption_rules = encryption.get("ServerSideEncryptionConfiguration", {}).get(
-                    "Rules", []
-                )
-
-                if encryption_rules:
-                    encryption_type = (
-                        encryption_rules[0]
-                        .get("ApplyServerSideEncryptionByDefault", {})
-                        .get("SSEAlgorithm")
-                    )
-                    bucket_result["checks"]["default_encryption"] = {
-                        "enabled": True,
-                        "type": encryption_type,
-                    }
-
-                    # Check if using CMK
-                    kms_key = (
-                        encryption_rules[0]
-                        .get("ApplyServerSideEncryptionByDefault", {})
-                        .get("KMSMasterKeyID")
-                    )
-                    bucket_result["checks"]["using_cmk"] = kms_key is not None
-
-                    # Check if using bucket key
-                    bucket_key_enabled = encryption_rules[0].get("BucketKeyEnabled", False)
-                    bucket_result["checks"]["bucket_key_enabled"] = bucket_key_enabled
-                else:
-                    bucket_result["compliant"] = False
-                    bucket_result["issues"].append("Default encryption not enabled")
-                    bucket_result["checks"]["default_encryption"] = {"enabled": False}
-                    bucket_result["checks"]["using_cmk"] = False
-            except Exception:
-                # No encryption configuration found
-                bucket_result["compliant"] = False
-                bucket_result["issues"].append("Default encryption not enabled")
-                bucket_result["checks"]["default_encryption"] = {"enabled": False}
-                bucket_result["checks"]["using_cmk"] = False
-
-            # Check public access block
-            try:
-                public_access = s3_client.get_public_access_block(Bucket=bucket_name)
-                block_public_access = all(
-                    [
-                        public_access["PublicAccessBlockConfiguration"]["BlockPublicAcls"],
-                        public_access["PublicAccessBlockConfiguration"]["IgnorePublicAcls"],
-                        public_access["PublicAccessBlockConfiguration"]["BlockPublicPolicy"],
-                        public_access["PublicAccessBlockConfiguration"]["RestrictPublicBuckets"],
-                    ]
-                )
-
-                bucket_result["checks"]["block_public_access"] = {
-                    "enabled": block_public_access,
-                    "configuration": public_access["PublicAccessBlockConfiguration"],
-                }
-
-                if not block_public_access:
-                    bucket_result["compliant"] = False
-                    bucket_result["issues"].append("Public access not fully blocked")
-            except Exception as e:
-                print(
-                    f"[DEBUG:StorageSecurity] Error checking public access block for {bucket_name}: {e}"
-                )
-                bucket_result["checks"]["block_public_access"] = {
-                    "enabled": False,
-                    "error": str(e),
-                }
-                bucket_result["compliant"] = False
-                bucket_result["issues"].append("Public access block status unknown")
-
-            # Generate remediation steps
-            bucket_result["remediation"] = []
-
-            if not bucket_result["checks"].get("default_encryption", {}).get("enabled", False):
-                bucket_result["remediation"].append(
-                    "Enable default encryption using SSE-KMS or SSE-S3"
-                )
+        # Check the buckets concurrently, then report them in their original order
+        reuse = reuse or {}
+        checked = {
+            bucket_name: reuse[f"arn:aws:s3:::{bucket_name}"]
+            for bucket_name in buckets
+            if f"arn:aws:s3:::{bucket_name}" in reuse
+        }
+        async for bucket_result in iter_bucket_posture(
+            s3_client,
+            [bucket_name for bucket_name in buckets if bucket_name not in checked],
+            max_concurrency,
+            time_budget,
+        ):
+            checked[bucket_result["name"]] = bucket_result
+            if progress:
+                await progress.batch_done("s3", len(checked), len(buckets))
+
+        not_checked = [bucket_name for bucket_name in buckets if bucket_name not in checked]
+        if not_checked:
+            print(
+                f"[DEBUG:StorageSecurity] Time budget exceeded, {len(not_checked)} S3 buckets "
+                "were not checked"
+            )
+            results["buckets_not_checked"] = not_checked
 
-            if not bucket_result["checks"].get("block_public_access", {}).get("enabled", False):
-                bucket_result["remediation"].append(
-                    "Enable block public access settings for this bucket"
-                )
+        for bucket_name in buckets:
+            if bucket_name not in checked:
+                continue
+            bucket_result = checked[bucket_name]
+            results["resources_checked"] += 1
 
             # Update counts
             if bucket_result["compliant"]:
@@ -497,10 +490,7 @@ async def check_ebs_volumes(
                     volumes.append(volume_id)
         else:
             # Fall back to direct API call
-            paginator = ec2_client.get_paginator("describe_volumes")
-            page_iterator = paginator.paginate()
-
-            for page in page_iterator:
+            async for page in paginate_aws(ec2_client, "describe_volumes"):
                 for volume in page.get("Volumes", []):
                     volumes.append(volume["VolumeId"])
 
@@ -513,7 +503,7 @@ async def check_ebs_volumes(
             batch = volumes[i : i + batch_size]
 
             try:
-                response = ec2_client.describe_volumes(VolumeIds=batch)
+                response = await call_aws(ec2_client.describe_volumes, VolumeIds=batch)
 
                 for volume in response.get("Volumes", []):
                     volume_result = {
@@ -601,6 +591,7 @@ async def check_rds_instances(
     try:
         # Get RDS instance list - either from Resource Explorer or directly
         instances = []
+        described = {}
 
         if "error" not in storage_resources and "rds" in storage_resources.get(
             "resources_by_service", {}
@@ -612,14 +603,20 @@ async def check_rds_instances(
                 if ":db:" in arn:
                     db_id = arn.split(":")[-1]
                     instances.append(db_id)
+
+            # Describe all instances in one sweep instead of one call per instance
+            try:
+                described = await _describe_all(
+                    rds_client, "describe_db_instances", "DBInstances", "DBInstanceIdentifier"
+                )
+            except Exception as e:
+                print(f"[DEBUG:StorageSecurity] Error listing RDS instances: {e}")
         else:
             # Fall back to direct API call
-            paginator = rds_client.get_paginator("describe_db_instances")
-            page_iterator = paginator.paginate()
-
-            for page in page_iterator:
-                for instance in page.get("DBInstances", []):
-                    instances.append(instance["DBInstanceIdentifier"])
+            described = await _describe_all(
+                rds_client, "describe_db_instances", "DBInstances", "DBInstanceIdentifier"
+            )
+            instances = list(described)
 
         print(f"[DEBUG:StorageSecurity] Found {len(instances)} RDS instances in region {region}")
         results["resources_checked"] = len(instances)
@@ -627,12 +624,16 @@ async def check_rds_instances(
         # Check each RDS instance
         for db_id in instances:
             try:
-                response = rds_client.describe_db_instances(DBInstanceIdentifier=db_id)
+                instance = described.get(db_id)
+                if instance is None:
+                    response = await call_aws(
+                        rds_client.describe_db_instances, DBInstanceIdentifier=db_id
+                    )
 
-                if not response.get("DBInstances"):
-                    continue
+                    if not response.get("DBInstances"):
+                        continue
 
-                instance = response["DBInstances"][0]
+                    instance = response["DBInstances"][0]
 
                 instance_result = {
                     "id": instance["DBInstanceIdentifier"],
@@ -744,13 +745,14 @@ async def check_dynamodb_tables(
                     tables.append(table_name)
         else:
             # Fall back to direct API call
-            response = dynamodb_client.list_tables()
+            response = await call_aws(dynamodb_client.list_tables)
             tables = response.get("TableNames", [])
 
             # Handle pagination if needed
             while "LastEvaluatedTableName" in response:
-                response = dynamodb_client.list_tables(
-                    ExclusiveStartTableName=response["LastEvaluatedTableName"]
+                response = await call_aws(
+                    dynamodb_client.list_tables,
+                    ExclusiveStartTableName=response["LastEvaluatedTableName"],
                 )
                 tables.extend(response.get("TableNames", []))
 
@@ -760,7 +762,7 @@ async def check_dynamodb_tables(
         # Check each DynamoDB table
         for table_name in tables:
             try:
-                response = dynamodb_client.describe_table(TableName=table_name)
+                response = await call_aws(dynamodb_client.describe_table, TableName=table_name)
 
                 if not response.get("Table"):
                     continue
@@ -776,11 +778,9 @@ async def check_dynamodb_tables(
                     "checks": {},
                 }
 
-                # Check SSE settings
+                # Check SSE settings from the same describe_table response
                 try:
-                    sse_response = dynamodb_client.describe_table(TableName=table_name)
-
-                    sse_description = sse_response.get("Table", {}).get("SSEDescription", {})
+                    sse_description = table.get("SSEDescription", {})
                     sse_status = sse_description.get("Status")
                     sse_type = sse_description.get("SSEType")
                     kms_key_id = sse_description.get("KMSMasterKeyArn")
@@ -872,6 +872,7 @@ async def check_efs_filesystems(
     try:
         # Get EFS filesystem list - either from Resource Explorer or directly
         filesystems = []
+        described = {}
 
         if "error" not in storage_resources and "elasticfilesystem" in storage_resources.get(
             "resources_by_service", {}
@@ -883,14 +884,20 @@ async def check_efs_filesystems(
                 if ":file-system/" in arn:
                     fs_id = arn.split("/")[-1]
                     filesystems.append(fs_id)
+
+            # Describe all filesystems in one sweep instead of one call per filesystem
+            try:
+                described = await _describe_all(
+                    efs_client, "describe_file_systems", "FileSystems", "FileSystemId"
+                )
+            except Exception as e:
+                print(f"[DEBUG:StorageSecurity] Error listing EFS filesystems: {e}")
         else:
             # Fall back to direct API call
-            paginator = efs_client.get_paginator("describe_file_systems")
-            page_iterator = paginator.paginate()
-
-            for page in page_iterator:
-                for fs in page.get("FileSystems", []):
-                    filesystems.append(fs["FileSystemId"])
+            described = await _describe_all(
+                efs_client, "describe_file_systems", "FileSystems", "FileSystemId"
+            )
+            filesystems = list(described)
 
         print(
             f"[DEBUG:StorageSecurity] Found {len(filesystems)} EFS filesystems in region {region}"
@@ -900,12 +907,14 @@ async def check_efs_filesystems(
         # Check each EFS filesystem
         for fs_id in filesystems:
             try:
-                response = efs_client.describe_file_systems(FileSystemId=fs_id)
+                fs = described.get(fs_id)
+                if fs is None:
+                    response = await call_aws(efs_client.describe_file_systems, FileSystemId=fs_id)
 
-                if not response.get("FileSystems"):
-                    continue
+                    if not response.get("FileSystems"):
+                        continue
 
-                fs = response["FileSystems"][0]
+                    fs = response["FileSystems"][0]
 
                 fs_result = {
                     "id": fs["FileSystemId"],
@@ -994,6 +1003,7 @@ async def check_elasticache_clusters(
     try:
         # Get ElastiCache cluster list - either from Resource Explorer or directly
         clusters = []
+        described = {}
 
         if "error" not in storage_resources and "elasticache" in storage_resources.get(
             "resources_by_service", {}
@@ -1005,14 +1015,23 @@ async def check_elasticache_clusters(
                 if ":cluster:" in arn:
                     cluster_id = arn.split(":")[-1]
                     clusters.append(cluster_id)
+
+            # Describe all clusters in one sweep instead of one call per cluster
+            try:
+                described = await _describe_all(
+                    elasticache_client,
+                    "describe_cache_clusters",
+                    "CacheClusters",
+                    "CacheClusterId",
+                )
+            except Exception as e:
+                print(f"[DEBUG:StorageSecurity] Error listing ElastiCache clusters: {e}")
         else:
             # Fall back to direct API call
-            paginator = elasticache_client.get_paginator("describe_cache_clusters")
-            page_iterator = paginator.paginate()
-
-            for page in page_iterator:
-                for cluster in page.get("CacheClusters", []):
-                    clusters.append(cluster["CacheClusterId"])
+            described = await _describe_all(
+                elasticache_client, "describe_cache_clusters", "CacheClusters", "CacheClusterId"
+            )
+            clusters = list(described)
 
         print(
             f"[DEBUG:StorageSecurity] Found {len(clusters)} ElastiCache clusters in region {region}"
@@ -1022,14 +1041,18 @@ async def check_elasticache_clusters(
         # Check each ElastiCache cluster
         for cluster_id in clusters:
             try:
-                response = elasticache_client.describe_cache_clusters(
-                    CacheClusterId=cluster_id, ShowCacheNodeInfo=True
-                )
+                cluster = described.get(cluster_id)
+                if cluster is None:
+                    response = await call_aws(
+                        elasticache_client.describe_cache_clusters,
+                        CacheClusterId=cluster_id,
+                        ShowCacheNodeInfo=True,
+                    )
 
-                if not response.get("CacheClusters"):
-                    continue
+                    if not response.get("CacheClusters"):
+                        continue
 
-                cluster = response["CacheClusters"][0]
+                    cluster = response["CacheClusters"][0]
 
                 cluster_result = {
                     "id": cluster["CacheClusterId"],
@@ -35,6 +35,79 @@ from unittest import mock
 
 import pytest
 
+from src.util.assessment_scheduler import clear_sweeps
+from src.util.aws_calls import clear_rate_limiters
+from src.util.credential_utils import clear_session_cache
+from src.util.network_security import clear_ssl_policy_catalogs
+from src.util.resource_inventory import clear_resource_inventories
+from src.util.result_pages import clear_result_pages
+from src.util.s3_posture import clear_bucket_region_cache
+from src.util.security_services import clear_trusted_advisor_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_aws_session_cache():
+    """Start every test without cached AWS sessions or clients."""
+    clear_session_cache()
+    yield
+    clear_session_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_s3_bucket_regions():
+    """Start every test without cached S3 bucket regions."""
+    clear_bucket_region_cache()
+    yield
+    clear_bucket_region_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_load_balancer_ssl_policies():
+    """Start every test without cached SSL policy catalogs."""
+    clear_ssl_policy_catalogs()
+    yield
+    clear_ssl_policy_catalogs()
+
+
+@pytest.fixture(autouse=True)
+def clear_trusted_advisor_results():
+    """Start every test without cached Trusted Advisor check results."""
+    clear_trusted_advisor_cache()
+    yield
+    clear_trusted_advisor_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_resource_explorer_inventories():
+    """Start every test without cached Resource Explorer inventories."""
+    clear_resource_inventories()
+    yield
+    clear_resource_inventories()
+
+
+@pytest.fixture(autouse=True)
+def clear_running_result_pages():
+    """Start every test without paginated checks running in the background."""
+    clear_result_pages()
+    yield
+    clear_result_pages()
+
+
+@pytest.fixture(autouse=True)
+def clear_assessment_sweeps():
+    """Start every test without registered assessment sweeps."""
+    clear_sweeps()
+    yield
+    clear_sweeps()
+
+
+@pytest.fixture(autouse=True)
+def clear_aws_rate_limiters():
+    """Start every test without AWS rate limiters or throttling counts."""
+    clear_rate_limiters()
+    yield
+    clear_rate_limiters()
+
 
 @pytest.fixture
 def mock_ctx():
@@ -211,25 +284,27 @@ def mock_ec2_client(mock_boto3_session):
         ]
     }
 
-    # Set up default responses for security groups
-    ec2_client.describe_security_groups.return_value = {
-        "SecurityGroups": [
-            {
-                "GroupId": "sg-1234567890abcdef0",
-                "GroupName": "default",
-                "VpcId": "vpc-1234567890abcdef0",
-                "OwnerId": "123456789012",
-                "IpPermissions": [
-                    {
-                        "FromPort": 443,
-                        "ToPort": 443,
-                        "IpProtocol": "tcp",
-                        "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
-                    }
-                ],
-            }
-        ]
-    }
+    # Set up the paginator for security groups
+    ec2_client.get_paginator.return_value.paginate.return_value = [
+        {
+            "SecurityGroups": [
+                {
+                    "GroupId": "sg-1234567890abcdef0",
+                    "GroupName": "default",
+                    "VpcId": "vpc-1234567890abcdef0",
+                    "OwnerId": "123456789012",
+                    "IpPermissions": [
+                        {
+                            "FromPort": 443,
+                            "ToPort": 443,
+                            "IpProtocol": "tcp",
+                            "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
+                        }
+                    ],
+                }
+            ]
+        }
+    ]
 
     yield ec2_client
 
@@ -472,21 +547,21 @@ def mock_accessanalyzer_client(mock_boto3_session):
         ]
     }
 
-    # Mock findings
+    # Mock findings (list_findings returns the finding details)
     analyzer_client.list_findings.return_value = {
-        "findings": ["12345678-1234-1234-1234-123456789012"]
-    }
-
-    analyzer_client.get_finding.return_value = {
-        "id": "12345678-1234-1234-1234-123456789012",
-        "principal": {"AWS": "123456789012"},
-        "action": ["s3:GetObject", "s3:ListBucket"],
-        "resource": "arn:aws:s3:::example-bucket",
-        "resourceType": "AWS::S3::Bucket",
-        "isPublic": True,
-        "status": "ACTIVE",
-        "createdAt": "2023-01-01T00:00:00Z",
-        "updatedAt": "2023-01-01T01:00:00Z",
+        "findings": [
+            {
+                "id": "12345678-1234-1234-1234-123456789012",
+                "principal": {"AWS": "123456789012"},
+                "action": ["s3:GetObject", "s3:ListBucket"],
+                "resource": "arn:aws:s3:::example-bucket",
+                "resourceType": "AWS::S3::Bucket",
+                "isPublic": True,
+                "status": "ACTIVE",
+                "createdAt": "2023-01-01T00:00:00Z",
+                "updatedAt": "2023-01-01T01:00:00Z",
+            }
+        ]
     }
 
     yield analyzer_client
@@ -559,6 +634,34 @@ def mock_support_client(mock_boto3_session):
         ]
     }
 
+    # Mock check summaries
+    support_client.describe_trusted_advisor_check_summaries.return_value = {
+        "summaries": [
+            {
+                "checkId": "Pfx0RwqBli",
+                "timestamp": "2023-01-01T00:00:00Z",
+                "status": "warning",
+                "hasFlaggedResources": True,
+                "resourcesSummary": {
+                    "resourcesProcessed": 10,
+                    "resourcesFlagged": 2,
+                    "resourcesSuppressed": 0,
+                },
+            },
+            {
+                "checkId": "7DAFEmoDos",
+                "timestamp": "2023-01-01T00:00:00Z",
+                "status": "ok",
+                "hasFlaggedResources": False,
+                "resourcesSummary": {
+                    "resourcesProcessed": 1,
+                    "resourcesFlagged": 0,
+                    "resourcesSuppressed": 0,
+                },
+            },
+        ]
+    }
+
     # Mock check results
     support_client.describe_trusted_advisor_check_result.return_value = {
         "result": {
@@ -0,0 +1,181 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the assessment_scheduler module and the assessment sweep tools."""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from src.server import (
+    cancel_assessment_sweep,
+    get_assessment_sweep_status,
+    start_assessment_sweep,
+)
+from src.util.assessment_scheduler import get_sweep, start_sweep
+
+ROLES = [f"arn:aws:iam::{account:012d}:role/Audit" for account in range(1, 5)]
+
+
+async def _wait(sweep):
+    """Wait for a sweep to finish."""
+    await asyncio.wait_for(sweep._task, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_sweep_respects_concurrency_limits():
+    """Test that a sweep bounds its checks overall, per account and per check."""
+    running = {"total": 0, "storage": 0}
+    per_account = {}
+    peaks = {"total": 0, "storage": 0, "account": 0}
+
+    async def storage(region, session, ctx):
+        running["total"] += 1
+        running["storage"] += 1
+        per_account[session] = per_account.get(session, 0) + 1
+        peaks["total"] = max(peaks["total"], running["total"])
+        peaks["storage"] = max(peaks["storage"], running["storage"])
+        peaks["account"] = max(peaks["account"], per_account[session])
+        await asyncio.sleep(0.01)
+        running["total"] -= 1
+        running["storage"] -= 1
+        per_account[session] -= 1
+        return {
+            "resources_checked": 2,
+            "compliant_resources": 1,
+            "non_compliant_resources": 1,
+            "resource_details": [
+                {"arn": f"arn:aws:s3:::{session}-{region}-ok", "compliant": True},
+                {"arn": f"arn:aws:s3:::{session}-{region}-open", "compliant": False},
+            ],
+        }
+
+    with (
+        mock.patch("src.util.assessment_scheduler.SWEEP_CONCURRENCY", 4),
+        mock.patch("src.util.assessment_scheduler.SWEEP_ACCOUNT_CONCURRENCY", 1),
+        mock.patch.dict("src.util.assessment_scheduler.SWEEP_CHECK_BUDGETS", {"storage": 3}),
+    ):
+        sweep = start_sweep(
+            ROLES, ["us-east-1", "eu-west-1"], {"storage": storage}, lambda role: role
+        )
+        await _wait(sweep)
+
+    assert peaks == {"total": 3, "storage": 3, "account": 1}
+    report = sweep.report()
+    assert report["status"] == "completed"
+    assert report["progress"] == {"total_tasks": 8, "completed_tasks": 8, "failed_tasks": 0}
+    assert report["totals"]["storage"]["resources_checked"] == 16
+    assert report["totals"]["storage"]["non_compliant_resources"] == 8
+    assert report["totals"]["storage"]["accounts_affected"] == [
+        f"{account:012d}" for account in range(1, 5)
+    ]
+    assert report["results"][0]["non_compliant_arns"] == [
+        f"arn:aws:s3:::{ROLES[0]}-eu-west-1-open"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sweep_reports_session_failures_once_per_account():
+    """Test that an account whose role cannot be assumed fails its checks without retrying."""
+    session_factory = mock.MagicMock(side_effect=Exception("AccessDenied"))
+
+    async def services(region, session, ctx):
+        return {"service_statuses": {}}
+
+    sweep = start_sweep(
+        ROLES[:1], ["us-east-1", "us-west-2"], {"services": services}, session_factory
+    )
+    await _wait(sweep)
+
+    report = sweep.report()
+    assert report["progress"]["failed_tasks"] == 2
+    assert all(entry["error"] == "AccessDenied" for entry in report["results"])
+    session_factory.assert_called_once_with(ROLES[0])
+
+
+@pytest.mark.asyncio
+async def test_assessment_sweep_tools(mock_ctx):
+    """Test starting, polling and cancelling a sweep through the MCP tools."""
+    started = asyncio.Event()
+
+    async def slow_check(region, session, ctx):
+        started.set()
+        await ctx.warning("slow")
+        await asyncio.sleep(10)
+        return {}
+
+    async def services(region, session, ctx):
+        await ctx.error("GuardDuty API error")
+        return {"service_statuses": {"guardduty": {"enabled": False}, "macie": {"enabled": True}}}
+
+    runners = {"services": services, "network": slow_check}
+    with (
+        mock.patch.dict("src.server.SWEEP_CHECK_RUNNERS", runners, clear=True),
+        mock.patch("src.server.create_aws_session", return_value=mock.MagicMock()),
+    ):
+        response = await start_assessment_sweep(
+            mock_ctx,
+            role_arns=ROLES[:1],
+            regions=["us-east-1"],
+            checks=["services", "network", "x"],
+        )
+        assert response["total_tasks"] == 2
+        assert response["unsupported_checks"] == ["x"]
+
+        await asyncio.wait_for(started.wait(), timeout=5)
+        await asyncio.sleep(0)
+        status = await get_assessment_sweep_status(
+            mock_ctx, job_id=response["job_id"], include_results=True
+        )
+        assert status["status"] == "running"
+        assert status["results"] == [
+            {
+                "account_id": "000000000001",
+                "role_arn": ROLES[0],
+                "region": "us-east-1",
+                "check": "services",
+                "status": "success",
+                "services_enabled": ["macie"],
+                "services_not_enabled": ["guardduty"],
+                "duration_seconds": mock.ANY,
+                "errors": ["GuardDuty API error"],
+            }
+        ]
+
+        cancelled = await cancel_assessment_sweep(mock_ctx, job_id=response["job_id"])
+        assert cancelled["cancelled"] is True
+        await asyncio.sleep(0.01)
+        assert get_sweep(response["job_id"]).status == "cancelled"
+
+    missing = await get_assessment_sweep_status(mock_ctx, job_id="missing", include_results=True)
+    assert missing["status"] == "not_found"
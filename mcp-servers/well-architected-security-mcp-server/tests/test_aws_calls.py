@@ -0,0 +1,312 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the async AWS call layer."""
+
+import asyncio
+import time
+from unittest import mock
+
+import boto3
+import botocore.exceptions
+import pytest
+from botocore.stub import Stubber
+
+from src.util import aws_calls
+from src.util.aws_calls import (
+    AwsCallTimeoutError,
+    ServiceRateLimiter,
+    call_aws,
+    get_throttle_stats,
+    paginate_aws,
+)
+from src.util.storage_security import check_s3_buckets
+
+
+@pytest.mark.asyncio
+async def test_call_aws_returns_result():
+    """Test that call_aws passes arguments through and returns the call result."""
+    client = mock.MagicMock()
+    client.describe_things.return_value = {"Things": ["a"]}
+
+    result = await call_aws(client.describe_things, MaxResults=10)
+
+    assert result == {"Things": ["a"]}
+    client.describe_things.assert_called_once_with(MaxResults=10)
+
+
+@pytest.mark.asyncio
+async def test_call_aws_propagates_errors():
+    """Test that exceptions raised by the call reach the caller."""
+    client = mock.MagicMock()
+    client.describe_things.side_effect = Exception("API Error")
+
+    with pytest.raises(Exception, match="API Error"):
+        await call_aws(client.describe_things)
+
+
+@pytest.mark.asyncio
+async def test_call_aws_deadline():
+    """Test that a call exceeding its deadline raises AwsCallTimeoutError."""
+
+    def slow_call():
+        time.sleep(0.5)
+
+    with pytest.raises(AwsCallTimeoutError, match="slow_call"):
+        await call_aws(slow_call, call_timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_paginate_aws():
+    """Test that paginate_aws yields every page and forwards paginate arguments."""
+    client = mock.MagicMock()
+    paginator = client.get_paginator.return_value
+    paginator.paginate.return_value = iter([{"Items": [1]}, {"Items": [2]}])
+
+    pages = [page async for page in paginate_aws(client, "list_items", Filter="x")]
+
+    assert pages == [{"Items": [1]}, {"Items": [2]}]
+    client.get_paginator.assert_called_once_with("list_items")
+    paginator.paginate.assert_called_once_with(Filter="x")
+
+
+def make_ec2_client():
+    """Create a real EC2 client that never reaches AWS, for use with a Stubber."""
+    return boto3.client(
+        "ec2",
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+    )
+
+
+@pytest.mark.asyncio
+async def test_call_aws_retries_throttled_calls(monkeypatch):
+    """Test that throttled calls are retried, slow the service down and are counted."""
+    monkeypatch.setattr(aws_calls, "AWS_RETRY_BASE_DELAY", 0.0)
+    ec2 = make_ec2_client()
+    with Stubber(ec2) as stubber:
+        stubber.add_client_error("describe_vpcs", service_error_code="RequestLimitExceeded")
+        stubber.add_client_error("describe_vpcs", service_error_code="Throttling")
+        stubber.add_response("describe_vpcs", {"Vpcs": [{"VpcId": "vpc-1"}]})
+
+        result = await call_aws(ec2.describe_vpcs)
+
+    assert result["Vpcs"] == [{"VpcId": "vpc-1"}]
+    stats = get_throttle_stats()
+    assert stats["total_throttled"] == 2
+    assert stats["services"]["ec2"]["retries"] == 2
+    assert stats["services"]["ec2"]["requests"] == 3
+    assert stats["services"]["ec2"]["current_rate"] < stats["services"]["ec2"]["rate_limit"]
+
+
+@pytest.mark.asyncio
+async def test_call_aws_gives_up_and_skips_other_errors(monkeypatch):
+    """Test that throttling errors are raised after the last retry and other errors at once."""
+    monkeypatch.setattr(aws_calls, "AWS_RETRY_BASE_DELAY", 0.0)
+    monkeypatch.setattr(aws_calls, "AWS_MAX_RETRIES", 1)
+    ec2 = make_ec2_client()
+    with Stubber(ec2) as stubber:
+        stubber.add_client_error("describe_vpcs", service_error_code="Throttling")
+        stubber.add_client_error("describe_vpcs", service_error_code="Throttling")
+        stubber.add_client_error("describe_vpcs", service_error_code="UnauthorizedOperation")
+
+        with pytest.raises(botocore.exceptions.ClientError, match="Throttling"):
+            await call_aws(ec2.describe_vpcs)
+        with pytest.raises(botocore.exceptions.ClientError, match="UnauthorizedOperation"):
+            await call_aws(ec2.describe_vpcs)
+
+    ec2_stats = get_throttle_stats()["services"]["ec2"]
+    assert ec2_stats["throttled"] == 2
+    assert ec2_stats["retries"] == 1
+    assert ec2_stats["gave_up"] == 1
+
+
+@pytest.mark.asyncio
+async def test_call_aws_retries_transient_errors(monkeypatch):
+    """Test that a 503 and a dropped connection are retried without slowing the service."""
+    monkeypatch.setattr(aws_calls, "AWS_RETRY_BASE_DELAY", 0.0)
+    ec2 = make_ec2_client()
+    outcomes = [
+        botocore.exceptions.EndpointConnectionError(endpoint_url="https://ec2.amazonaws.com"),
+        (
+            mock.Mock(status_code=503),
+            {"Error": {"Code": "Unavailable"}, "ResponseMetadata": {"HTTPStatusCode": 503}},
+        ),
+        (mock.Mock(status_code=200), {"Vpcs": [{"VpcId": "vpc-1"}]}),
+    ]
+
+    def respond(**kwargs):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    ec2.meta.events.register("before-call.ec2.DescribeVpcs", respond)
+
+    result = await call_aws(ec2.describe_vpcs)
+
+    assert result["Vpcs"] == [{"VpcId": "vpc-1"}]
+    ec2_stats = get_throttle_stats()["services"]["ec2"]
+    assert ec2_stats["transient_errors"] == 2
+    assert ec2_stats["retries"] == 2
+    assert ec2_stats["throttled"] == 0
+    assert ec2_stats["current_rate"] == ec2_stats["rate_limit"]
+
+
+@pytest.mark.asyncio
+async def test_paginate_aws_resumes_after_transient_error(monkeypatch):
+    """Test that a page failing with a 503 is fetched again without ending the sweep."""
+    monkeypatch.setattr(aws_calls, "AWS_RETRY_BASE_DELAY", 0.0)
+    ec2 = make_ec2_client()
+    with Stubber(ec2) as stubber:
+        stubber.add_response(
+            "describe_vpcs", {"Vpcs": [{"VpcId": "vpc-1"}], "NextToken": "page-2"}
+        )
+        stubber.add_client_error(
+            "describe_vpcs", service_error_code="InternalError", http_status_code=503
+        )
+        stubber.add_response(
+            "describe_vpcs", {"Vpcs": [{"VpcId": "vpc-2"}]}, {"NextToken": "page-2"}
+        )
+
+        pages = [page async for page in paginate_aws(ec2, "describe_vpcs")]
+
+    assert [page["Vpcs"][0]["VpcId"] for page in pages] == ["vpc-1", "vpc-2"]
+    assert get_throttle_stats()["services"]["ec2"]["transient_errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_paginate_aws_retries_throttled_page_in_place(monkeypatch):
+    """Test that a throttled page request is retried without ending the sweep."""
+    monkeypatch.setattr(aws_calls, "AWS_RETRY_BASE_DELAY", 0.0)
+    ec2 = make_ec2_client()
+    with Stubber(ec2) as stubber:
+        stubber.add_response(
+            "describe_vpcs", {"Vpcs": [{"VpcId": "vpc-1"}], "NextToken": "page-2"}
+        )
+        stubber.add_client_error("describe_vpcs", service_error_code="RequestLimitExceeded")
+        stubber.add_response(
+            "describe_vpcs", {"Vpcs": [{"VpcId": "vpc-2"}]}, {"NextToken": "page-2"}
+        )
+
+        pages = [page async for page in paginate_aws(ec2, "describe_vpcs")]
+
+    assert [page["Vpcs"][0]["VpcId"] for page in pages] == ["vpc-1", "vpc-2"]
+    assert get_throttle_stats()["services"]["ec2"]["retries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_paginate_aws_backs_off_on_the_event_loop(monkeypatch):
+    """Test that throttling backoff is awaited outside the per-page deadline."""
+    monkeypatch.setattr(aws_calls, "AWS_RETRY_BASE_DELAY", 0.2)
+    monkeypatch.setattr(aws_calls.random, "uniform", lambda low, high: high)
+    ec2 = make_ec2_client()
+    with Stubber(ec2) as stubber:
+        stubber.add_client_error("describe_vpcs", service_error_code="RequestLimitExceeded")
+        stubber.add_response("describe_vpcs", {"Vpcs": [{"VpcId": "vpc-1"}]})
+
+        pages = [page async for page in paginate_aws(ec2, "describe_vpcs", call_timeout=0.1)]
+
+    assert [page["Vpcs"][0]["VpcId"] for page in pages] == ["vpc-1"]
+
+
+def test_rate_limiter_paces_requests_beyond_burst():
+    """Test that the token bucket allows one second of requests, then spaces them out."""
+    limiter = ServiceRateLimiter("support", 2.0)
+
+    delays = [limiter.reserve() for _ in range(4)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.5, abs=0.05)
+    assert delays[3] == pytest.approx(1.0, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tools_do_not_block_event_loop(mock_ctx):
+    """Test that slow boto3 calls in concurrent tool invocations leave the loop responsive."""
+    call_latency = 0.2
+    invocations = 8
+
+    def make_s3_client():
+        s3_client = mock.MagicMock()
+
+        def slow_encryption(Bucket):
+            time.sleep(call_latency)
+            return {
+                "ServerSideEncryptionConfiguration": {
+                    "Rules": [{"ApplyServerSideEncryptionByDefault": {"SSEAlgorithm": "AES256"}}]
+                }
+            }
+
+        s3_client.list_buckets.return_value = {"Buckets": [{"Name": "test-bucket"}]}
+        s3_client.get_bucket_location.return_value = {"LocationConstraint": None}
+        s3_client.get_bucket_encryption.side_effect = slow_encryption
+        s3_client.get_public_access_block.return_value = {
+            "PublicAccessBlockConfiguration": {
+                "BlockPublicAcls": True,
+                "IgnorePublicAcls": True,
+                "BlockPublicPolicy": True,
+                "RestrictPublicBuckets": True,
+            }
+        }
+        return s3_client
+
+    storage_resources = {"error": "Resource Explorer not configured"}
+
+    # Measure the longest gap between heartbeats while the tools run
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal max_lag
+        loop = asyncio.get_running_loop()
+        while not done.is_set():
+            start = loop.time()
+            await asyncio.sleep(0.01)
+            max_lag = max(max_lag, loop.time() - start - 0.01)
+
+    monitor = asyncio.create_task(heartbeat())
+    started = time.monotonic()
+    results = await asyncio.gather(
+        *[
+            check_s3_buckets("us-east-1", make_s3_client(), mock_ctx, storage_resources)
+            for _ in range(invocations)
+        ]
+    )
+    elapsed = time.monotonic() - started
+    done.set()
+    await monitor
+
+    assert all(result["resources_checked"] == 1 for result in results)
+    # Sequential blocking calls would take invocations * call_latency
+    assert elapsed < invocations * call_latency / 2
+    assert max_lag < call_latency / 2
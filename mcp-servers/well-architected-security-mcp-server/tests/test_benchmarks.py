@@ -0,0 +1,102 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the offline tool benchmark harness."""
+
+import pytest
+
+from benchmarks.bench_tools import benchmark_size, find_regressions
+
+
+@pytest.fixture
+def offline_credentials(monkeypatch):
+    """Provide dummy credentials so clients are built without looking for real ones."""
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+    monkeypatch.delenv("AWS_ASSUME_ROLE_ARN", raising=False)
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "benchmark")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "benchmark")
+
+
+@pytest.mark.asyncio
+async def test_benchmark_size_runs_every_tool_offline(offline_credentials):
+    """Test that every tool runs against a small synthetic account with simulated calls only."""
+    entries = await benchmark_size(size=6, repeat=1, seed=1)
+
+    by_tool = {entry["tool"]: entry for entry in entries}
+    assert set(by_tool) == {
+        "CheckStorageEncryption",
+        "CheckNetworkSecurity",
+        "GetSecurityFindings[guardduty]",
+        "GetSecurityFindings[securityhub]",
+        "GetSecurityFindings[securityhub-counts]",
+    }
+    for entry in entries:
+        assert "error" not in entry
+        assert "unsimulated_operations" not in entry
+
+    # 6 buckets and 6 volumes; 6 security groups and 6 load balancers
+    assert by_tool["CheckStorageEncryption"]["resources_checked"] == 12
+    assert (
+        by_tool["CheckStorageEncryption"]["api_calls_by_operation"]["s3.GetBucketEncryption"] == 6
+    )
+    assert by_tool["CheckNetworkSecurity"]["resources_checked"] == 12
+    assert (
+        by_tool["CheckNetworkSecurity"]["api_calls_by_operation"]["elbv2.DescribeListeners"] == 3
+    )
+
+    # Counts come from one insight result per attribute, without retrieving any finding
+    counts = by_tool["GetSecurityFindings[securityhub-counts]"]
+    assert counts["resources_checked"] == 6
+    assert counts["api_calls_by_operation"]["securityhub.GetInsightResults"] == 2
+    assert counts["api_calls_by_operation"]["securityhub.DeleteInsight"] == 2
+    assert "securityhub.GetFindings" not in counts["api_calls_by_operation"]
+
+
+def test_find_regressions():
+    """Test that only tools slower than the baseline by more than the tolerance are reported."""
+    baseline = {
+        "results": [
+            {"tool": "A", "size": 100, "seconds": {"median": 1.0}},
+            {"tool": "B", "size": 100, "seconds": {"median": 1.0}},
+        ]
+    }
+    report = {
+        "results": [
+            {"tool": "A", "size": 100, "seconds": {"median": 1.1}},
+            {"tool": "B", "size": 100, "seconds": {"median": 1.5}},
+            {"tool": "C", "size": 100, "seconds": {"median": 9.0}},
+        ]
+    }
+
+    assert find_regressions(report, baseline, tolerance=0.2) == [
+        "B size=100: 1000.0 ms -> 1500.0 ms"
+    ]
@@ -0,0 +1,125 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the compact output encoding."""
+
+import json
+
+import pytest
+
+from src.util.compact_output import compact_results, validate_output_format
+
+
+def make_results():
+    """Build storage check results with repeated types, issues and remediation steps."""
+    resource_details = []
+    for index in range(20):
+        compliant = index % 2 == 0
+        resource_details.append(
+            {
+                "name": f"bucket-{index}",
+                "arn": f"arn:aws:s3:::bucket-{index}",
+                "type": "s3",
+                "compliant": compliant,
+                "issues": [] if compliant else ["Default encryption not enabled"],
+                "checks": {"default_encryption": {"enabled": compliant}, "using_cmk": False},
+                "remediation": []
+                if compliant
+                else ["Enable default encryption using SSE-KMS or SSE-S3"],
+            }
+        )
+    resource_details.append(
+        {
+            "id": "vol-1",
+            "type": "ebs",
+            "compliant": False,
+            "issues": ["Volume is not encrypted"],
+            "remediation": [
+                "Enable default EBS encryption for the region",
+                "Enable default encryption using SSE-KMS or SSE-S3",
+            ],
+        }
+    )
+    return {
+        "region": "us-east-1",
+        "resources_checked": 21,
+        "compliant_resources": 10,
+        "non_compliant_resources": 11,
+        "recommendations": ["Enable encryption"],
+        "resource_details": resource_details,
+    }
+
+
+def test_compact_results_builds_table_and_lookups():
+    """Test that resources become rows that reference deduplicated lookup tables."""
+    compact = compact_results(make_results())
+
+    assert "resource_details" not in compact
+    assert compact["output_format"] == "compact"
+    assert compact["resources"]["columns"] == ["id", "type", "compliant", "issues", "remediation"]
+    assert compact["types"] == ["s3", "ebs"]
+    assert compact["issue_codes"] == ["Default encryption not enabled", "Volume is not encrypted"]
+    assert compact["remediations"] == [
+        "Enable default encryption using SSE-KMS or SSE-S3",
+        "Enable default EBS encryption for the region",
+    ]
+
+    rows = compact["resources"]["rows"]
+    assert len(rows) == 21
+    assert rows[0] == ["bucket-0", 0, 1, [], []]
+    assert rows[1] == ["bucket-1", 0, 0, [0], [0]]
+    assert rows[-1] == ["vol-1", 1, 0, [1], [1, 0]]
+
+    # Summary fields are kept unchanged
+    assert compact["region"] == "us-east-1"
+    assert compact["non_compliant_resources"] == 11
+    assert compact["recommendations"] == ["Enable encryption"]
+
+
+def test_compact_results_is_smaller_and_reports_size():
+    """Test that the size report matches the serialized sizes of both encodings."""
+    results = make_results()
+    compact = compact_results(results)
+    report = compact["size_report"]
+
+    assert report["full_bytes"] == len(json.dumps(results, separators=(",", ":")))
+    assert report["compact_bytes"] < report["full_bytes"]
+    assert report["estimated_compact_tokens"] < report["estimated_full_tokens"]
+    assert report["reduction_percent"] > 50
+
+
+def test_validate_output_format():
+    """Test that formats are case-insensitive and unknown formats are rejected."""
+    assert validate_output_format("Compact") == "compact"
+    assert validate_output_format("full") == "full"
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        validate_output_format("yaml")
@@ -0,0 +1,187 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the context store backends."""
+
+import datetime
+import itertools
+import threading
+from unittest import mock
+
+import pytest
+
+from src.server import context_storage, get_stored_security_context
+from src.util.context_store import MemoryContextStore, SQLiteContextStore
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    """Create a store of each backend with a small capacity."""
+    if request.param == "sqlite":
+        return SQLiteContextStore(str(tmp_path / "context.db"), ttl=60, max_entries=2)
+    return MemoryContextStore(ttl=60, max_entries=2)
+
+
+def test_store_behaves_like_dict(store):
+    """Test item access, membership, deletion and clearing."""
+    store["a"] = {"summary": "ok", "when": datetime.datetime(2024, 1, 1)}
+
+    assert "a" in store
+    assert store["a"]["summary"] == "ok"
+    assert list(store) == ["a"]
+
+    del store["a"]
+    assert "a" not in store
+    with pytest.raises(KeyError):
+        store["a"]
+
+    store["b"] = 1
+    store.clear()
+    assert len(store) == 0
+
+
+def test_store_expires_entries(store):
+    """Test that entries disappear once their TTL has elapsed."""
+    with mock.patch("src.util.context_store.time.time", return_value=1000.0):
+        store["a"] = {"x": 1}
+        assert store.metadata("a")["expires_at"] == 1060.0
+
+    with mock.patch("src.util.context_store.time.time", return_value=1061.0):
+        assert "a" not in store
+        assert store.metadata("a") is None
+        assert len(store) == 0
+
+
+def test_store_evicts_least_recently_used(store):
+    """Test that exceeding max_entries evicts the least recently read entry."""
+    clock = itertools.count(1000)
+    with mock.patch("src.util.context_store.time.time", side_effect=lambda: next(clock)):
+        store["a"] = 1
+        store["b"] = 2
+        store["a"]
+        store["c"] = 3
+
+        assert set(store) == {"a", "c"}
+
+
+def test_store_invalidate_and_stats(store):
+    """Test prefix invalidation and per-key size accounting."""
+    store.max_entries = 10
+    store["security_services_us-east-1"] = {"summary": "x"}
+    store["security_services_us-west-2"] = {"summary": "y"}
+    store["network_security_us-east-1"] = {"summary": "z"}
+
+    stats = store.stats()
+    assert stats["entries"] == 3
+    assert stats["size_by_key"]["network_security_us-east-1"] == len('{"summary": "z"}')
+    assert stats["total_bytes"] == sum(stats["size_by_key"].values())
+
+    assert store.invalidate(prefix="security_services_") == 2
+    assert list(store) == ["network_security_us-east-1"]
+    assert store.invalidate(key="network_security_us-east-1") == 1
+    assert store.invalidate(key="missing") == 0
+
+
+def test_sqlite_store_is_shared_between_connections(tmp_path):
+    """Test that two stores opened on the same file see each other's writes."""
+    path = str(tmp_path / "context.db")
+    writer = SQLiteContextStore(path)
+    reader = SQLiteContextStore(path)
+
+    writer["security_services_us-east-1"] = {"all_enabled": True}
+
+    assert reader["security_services_us-east-1"] == {"all_enabled": True}
+
+
+def test_sqlite_stores_in_separate_tables(tmp_path):
+    """Test that stores sharing a file in different tables do not see or evict each other."""
+    path = str(tmp_path / "context.db")
+    context = SQLiteContextStore(path, max_entries=1)
+    snapshots = SQLiteContextStore(path, max_entries=1, table="snapshots")
+
+    context["key"] = "context"
+    snapshots["key"] = "snapshot"
+    snapshots["other"] = "snapshot"
+
+    assert context["key"] == "context"
+    assert list(snapshots) == ["other"]
+
+
+@pytest.mark.asyncio
+async def test_get_stored_security_context_reports_timestamps(mock_ctx):
+    """Test that GetStoredSecurityContext returns when the data was stored and expires."""
+    context_storage["security_services_eu-west-1"] = {"summary": "stored"}
+    try:
+        result = await get_stored_security_context(mock_ctx, region="eu-west-1", detailed=False)
+    finally:
+        del context_storage["security_services_eu-west-1"]
+
+    stored_at = datetime.datetime.fromisoformat(result["timestamp"])
+    expires_at = datetime.datetime.fromisoformat(result["expires_at"])
+    assert result["available"] is True
+    assert expires_at - stored_at == datetime.timedelta(seconds=context_storage.ttl)
+
+
+def test_memory_store_iterates_while_entries_expire():
+    """Test that iterating and writing from several threads does not corrupt the store."""
+    store = MemoryContextStore(ttl=0.001, max_entries=1000)
+    errors = []
+
+    def churn(worker):
+        try:
+            for i in range(2000):
+                store[f"{worker}-{i}"] = i
+                list(store)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=churn, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+@pytest.mark.asyncio
+async def test_get_stored_security_context_entry_expires_during_lookup(mock_ctx):
+    """Test that an entry expiring right after it is found is still returned, not a KeyError."""
+    stored_at = 1000.0
+    expires_at = stored_at + context_storage.ttl
+    clock = iter([stored_at, expires_at - 1, expires_at + 1, expires_at + 1])
+    with mock.patch("src.util.context_store.time.time", side_effect=lambda: next(clock)):
+        context_storage["security_services_eu-west-1"] = {"summary": "stored"}
+        result = await get_stored_security_context(mock_ctx, region="eu-west-1", detailed=False)
+
+    assert result["available"] is True
+    assert result["summary"] == "stored"
+    assert "security_services_eu-west-1" not in context_storage
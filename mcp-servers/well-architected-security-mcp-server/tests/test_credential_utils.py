@@ -0,0 +1,223 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the credential_utils module."""
+
+import datetime
+import threading
+from unittest import mock
+
+import boto3
+import pytest
+from botocore.config import Config
+
+from src.util.credential_utils import (
+    USER_AGENT_CONFIG,
+    create_aws_session,
+    get_credential_identity,
+    get_session_cache_stats,
+)
+
+
+def _sts_credentials(expires_in: datetime.timedelta) -> dict:
+    """Build an AssumeRole response whose credentials expire after the given delay."""
+    return {
+        "Credentials": {
+            "AccessKeyId": "AKIAEXAMPLE",
+            "SecretAccessKey": "secret",
+            "SessionToken": "token",
+            "Expiration": datetime.datetime.now(datetime.timezone.utc) + expires_in,
+        },
+        "AssumedRoleUser": {"Arn": "arn:aws:sts::123456789012:assumed-role/Audit/mcp"},
+    }
+
+
+@pytest.fixture
+def assume_role_env(monkeypatch):
+    """Configure AssumeRole through environment variables."""
+    monkeypatch.setenv("AWS_ASSUME_ROLE_ARN", "arn:aws:iam::123456789012:role/Audit")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+
+
+@pytest.fixture
+def mock_sts_client():
+    """Mock the STS client used for AssumeRole, keeping real sessions for assumed roles."""
+    sts_client = mock.MagicMock()
+    real_session = boto3.Session
+
+    def make_session(*args, **kwargs):
+        if "botocore_session" in kwargs:
+            return real_session(*args, **kwargs)
+        initial_session = mock.MagicMock()
+        initial_session.client.return_value = sts_client
+        return initial_session
+
+    with mock.patch("boto3.Session", side_effect=make_session):
+        yield sts_client
+
+
+def test_default_session_is_cached():
+    """Test that the default credential chain session is created once and reused."""
+    first = create_aws_session()
+    second = create_aws_session()
+
+    assert first is second
+    stats = get_session_cache_stats()
+    assert stats["session_misses"] == 1
+    assert stats["session_hits"] == 1
+    assert stats["sts_assume_role_calls"] == 0
+
+
+def test_clients_are_cached_per_service_and_region():
+    """Test that clients are reused per service and region and share a sized pool."""
+    session = create_aws_session()
+
+    first = session.client("ec2", region_name="us-east-1", config=USER_AGENT_CONFIG)
+    second = session.client("ec2", region_name="us-east-1", config=USER_AGENT_CONFIG)
+    other_region = session.client("ec2", region_name="us-west-2", config=USER_AGENT_CONFIG)
+
+    assert first is second
+    assert other_region is not first
+    assert first.meta.config.max_pool_connections > 10
+    assert first.meta.config.retries["total_max_attempts"] == 1
+    stats = get_session_cache_stats()
+    assert stats["client_misses"] == 2
+    assert stats["client_hits"] == 1
+
+
+def test_clients_are_cached_per_config_contents():
+    """Test that equal configs share a client and different configs do not."""
+    session = create_aws_session()
+
+    first = session.client("ec2", region_name="us-east-1", config=Config(read_timeout=5))
+    second = session.client("ec2", region_name="us-east-1", config=Config(read_timeout=5))
+    other = session.client("ec2", region_name="us-east-1", config=Config(read_timeout=30))
+
+    assert first is second
+    assert other is not first
+    assert other.meta.config.read_timeout == 30
+    stats = get_session_cache_stats()
+    assert stats["client_misses"] == 2
+    assert stats["client_hits"] == 1
+
+
+def test_slow_assume_role_does_not_block_other_sessions(assume_role_env, mock_sts_client):
+    """Test that AssumeRole for one role runs without holding up other cache keys."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_assume_role(**kwargs):
+        if kwargs["RoleArn"] == "arn:aws:iam::123456789012:role/Audit":
+            started.set()
+            assert release.wait(5)
+        return _sts_credentials(datetime.timedelta(hours=1))
+
+    mock_sts_client.assume_role.side_effect = slow_assume_role
+    worker = threading.Thread(target=create_aws_session)
+    worker.start()
+    try:
+        assert started.wait(5)
+        other = create_aws_session("arn:aws:iam::210987654321:role/Audit")
+        assert other is not None
+        assert mock_sts_client.assume_role.call_count == 2
+    finally:
+        release.set()
+        worker.join(5)
+
+    assert get_session_cache_stats()["cached_sessions"] == 2
+
+
+def test_assume_role_is_called_once(assume_role_env, mock_sts_client):
+    """Test that repeated tool calls reuse the assumed role session."""
+    mock_sts_client.assume_role.return_value = _sts_credentials(datetime.timedelta(hours=1))
+
+    sessions = [create_aws_session() for _ in range(5)]
+    credentials = sessions[0].get_credentials().get_frozen_credentials()
+
+    assert all(session is sessions[0] for session in sessions)
+    assert credentials.access_key == "AKIAEXAMPLE"
+    mock_sts_client.assume_role.assert_called_once()
+    assert get_session_cache_stats()["sts_assume_role_calls"] == 1
+
+
+def test_assume_role_credentials_refresh_before_expiry(assume_role_env, mock_sts_client):
+    """Test that credentials close to expiry are refreshed through AssumeRole."""
+    mock_sts_client.assume_role.side_effect = [
+        _sts_credentials(datetime.timedelta(minutes=5)),
+        _sts_credentials(datetime.timedelta(hours=1)),
+    ]
+
+    session = create_aws_session()
+    session.get_credentials().get_frozen_credentials()
+
+    assert mock_sts_client.assume_role.call_count == 2
+    assert get_session_cache_stats()["sts_assume_role_calls"] == 2
+
+
+def test_changed_role_creates_new_session(assume_role_env, mock_sts_client, monkeypatch):
+    """Test that changing the role configuration bypasses the cached session."""
+    mock_sts_client.assume_role.return_value = _sts_credentials(datetime.timedelta(hours=1))
+
+    first = create_aws_session()
+    monkeypatch.setenv("AWS_ASSUME_ROLE_EXTERNAL_ID", "external-id")
+    second = create_aws_session()
+
+    assert first is not second
+    assert mock_sts_client.assume_role.call_count == 2
+
+
+def test_explicit_role_arn_overrides_environment(assume_role_env, mock_sts_client):
+    """Test that a role ARN passed in is assumed instead of AWS_ASSUME_ROLE_ARN."""
+    mock_sts_client.assume_role.return_value = _sts_credentials(datetime.timedelta(hours=1))
+    other_role = "arn:aws:iam::210987654321:role/Audit"
+
+    first = create_aws_session(other_role)
+    second = create_aws_session(other_role)
+
+    assert first is second
+    mock_sts_client.assume_role.assert_called_once()
+    assert mock_sts_client.assume_role.call_args.kwargs["RoleArn"] == other_role
+
+
+@pytest.mark.asyncio
+async def test_credential_identity_is_looked_up_once_per_session():
+    """Test that the identity ARN is cached per session but failed lookups are retried."""
+    session = mock.MagicMock()
+    sts_client = session.client.return_value
+    sts_client.get_caller_identity.side_effect = [
+        Exception("Unable to locate credentials"),
+        {"Arn": "arn:aws:iam::123456789012:user/auditor"},
+    ]
+
+    assert await get_credential_identity(session) is None
+    assert await get_credential_identity(session) == "arn:aws:iam::123456789012:user/auditor"
+    assert await get_credential_identity(session) == "arn:aws:iam::123456789012:user/auditor"
+    assert sts_client.get_caller_identity.call_count == 2
@@ -212,14 +212,10 @@ async def test_find_network_resources_success(
         "resource-explorer-2", region_name="us-east-1", config=mock.ANY
     )
     resource_explorer.list_views.assert_called_once()
-    paginator.paginate.assert_called_once()
-    assert (
-        "service:elasticloadbalancing"
-        in paginator.paginate.call_args[1]["Filters"]["FilterString"]
-    )
-    assert (
-        "service:ec2 resourcetype:ec2:vpc"
-        in paginator.paginate.call_args[1]["Filters"]["FilterString"]
+    # The whole default view is swept once and shared with the other checks
+    paginator.paginate.assert_called_once_with(
+        MaxResults=1000,
+        ViewArn="arn:aws:resource-explorer-2:us-east-1:123456789012:view/default-view",
     )
 
 
@@ -607,8 +603,8 @@ async def test_check_security_groups_success(mock_ctx, mock_ec2_client):
     assert result["non_compliant_resources"] == 0
     assert len(result["resource_details"]) == 1
 
-    # Verify EC2 client was called correctly
-    mock_ec2_client.describe_security_groups.assert_called()
+    # Verify security groups were paged through
+    mock_ec2_client.get_paginator.assert_called_with("describe_security_groups")
 
 
 @pytest.mark.asyncio
@@ -624,26 +620,28 @@ async def test_check_security_groups_open_sensitive_ports(mock_ctx, mock_ec2_cli
     }
 
     # Mock describe_security_groups to return a group with open sensitive ports
-    mock_ec2_client.describe_security_groups.return_value = {
-        "SecurityGroups": [
-            {
-                "GroupId": "sg-1234567890abcdef0",
-                "GroupName": "test-sg",
-                "VpcId": "vpc-1234567890abcdef0",
-                "OwnerId": "123456789012",
-                "IpPermissions": [
-                    {
-                        "FromPort": 80,  # HTTP - sensitive port
-                        "ToPort": 80,
-                        "IpProtocol": "tcp",
-                        "IpRanges": [
-                            {"CidrIp": "0.0.0.0/0"}  # Open to the world
-                        ],
-                    }
-                ],
-            }
-        ]
-    }
+    mock_ec2_client.get_paginator.return_value.paginate.return_value = [
+        {
+            "SecurityGroups": [
+                {
+                    "GroupId": "sg-1234567890abcdef0",
+                    "GroupName": "test-sg",
+                    "VpcId": "vpc-1234567890abcdef0",
+                    "OwnerId": "123456789012",
+                    "IpPermissions": [
+                        {
+                            "FromPort": 80,  # HTTP - sensitive port
+                            "ToPort": 80,
+                            "IpProtocol": "tcp",
+                            "IpRanges": [
+                                {"CidrIp": "0.0.0.0/0"}  # Open to the world
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+    ]
 
     # Call the function
     result = await check_security_groups("us-east-1", mock_ec2_client, mock_ctx, network_resources)
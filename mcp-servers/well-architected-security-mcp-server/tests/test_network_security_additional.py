@@ -31,6 +31,7 @@
 
 """Additional tests for the network_security module to improve coverage."""
 
+import time
 from unittest import mock
 
 import botocore.exceptions
@@ -45,8 +46,11 @@ from src.util.network_security import (
     check_security_groups,
     check_vpc_endpoints,
     find_network_resources,
+    find_open_sensitive_ports,
 )
 
+ALB_ARN = "arn:aws:elasticloadbalancing:us-east-1:123456789012:loadbalancer/app/alb-{}/1234567890"
+
 
 @pytest.mark.asyncio
 async def test_find_network_resources_api_error(mock_ctx, mock_boto3_session):
@@ -137,14 +141,8 @@ async def test_find_network_resources_with_all_services(
     assert "apigateway" in result["resources_by_service"]
     assert "cloudfront" in result["resources_by_service"]
 
-    # Verify filter string includes all services
-    filter_string = paginator.paginate.call_args[1]["Filters"]["FilterString"]
-    assert "service:elasticloadbalancing" in filter_string
-    assert "service:ec2 resourcetype:ec2:vpc" in filter_string
-    assert "service:ec2 resourcetype:ec2:vpc-endpoint" in filter_string
-    assert "service:ec2 resourcetype:ec2:security-group" in filter_string
-    assert "service:apigateway" in filter_string
-    assert "service:cloudfront" in filter_string
+    # Verify the view was swept without a filter
+    assert "Filters" not in paginator.paginate.call_args[1]
 
 
 @pytest.mark.asyncio
@@ -559,7 +557,9 @@ async def test_check_security_groups_api_error(mock_ctx, mock_boto3_session):
     """Test handling of API errors in check_security_groups."""
     # Create a mock EC2 client that raises an exception
     ec2_client = mock.MagicMock()
-    ec2_client.describe_security_groups.side_effect = botocore.exceptions.BotoCoreError()
+    ec2_client.get_paginator.return_value.paginate.side_effect = (
+        botocore.exceptions.BotoCoreError()
+    )
 
     # Set up mock network resources
     network_resources = {
@@ -604,9 +604,8 @@ async def test_check_security_groups_fallback_to_direct_api(mock_ctx, mock_ec2_c
     assert result["non_compliant_resources"] == 0
     assert len(result["resource_details"]) == 1
 
-    # Verify EC2 client was called - we don't assert the exact call count
-    # as the implementation might make multiple calls
-    assert mock_ec2_client.describe_security_groups.called
+    # Verify security groups were paged through
+    mock_ec2_client.get_paginator.assert_called_with("describe_security_groups")
 
 
 @pytest.mark.asyncio
@@ -622,23 +621,25 @@ async def test_check_security_groups_no_ports_defined(mock_ctx, mock_ec2_client)
     }
 
     # Mock describe_security_groups to return a group with no ports defined
-    mock_ec2_client.describe_security_groups.return_value = {
-        "SecurityGroups": [
-            {
-                "GroupId": "sg-1234567890abcdef0",
-                "GroupName": "test-sg",
-                "VpcId": "vpc-1234567890abcdef0",
-                "OwnerId": "123456789012",
-                "IpPermissions": [
-                    {
-                        # No FromPort or ToPort defined
-                        "IpProtocol": "-1",
-                        "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
-                    }
-                ],
-            }
-        ]
-    }
+    mock_ec2_client.get_paginator.return_value.paginate.return_value = [
+        {
+            "SecurityGroups": [
+                {
+                    "GroupId": "sg-1234567890abcdef0",
+                    "GroupName": "test-sg",
+                    "VpcId": "vpc-1234567890abcdef0",
+                    "OwnerId": "123456789012",
+                    "IpPermissions": [
+                        {
+                            # No FromPort or ToPort defined
+                            "IpProtocol": "-1",
+                            "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
+                        }
+                    ],
+                }
+            ]
+        }
+    ]
 
     # Call the function
     result = await check_security_groups("us-east-1", mock_ec2_client, mock_ctx, network_resources)
@@ -1134,3 +1135,258 @@ async def test_check_network_security_cloudfront_not_in_us_east_1(mock_ctx, mock
                 "us-west-2", mock_boto3_session, ["cloudfront"], mock_ctx
             )
             mock_check_cf.assert_not_called()  # Should not be called for non-us-east-1 regions
+
+
+def test_find_open_sensitive_ports_wide_range():
+    """Test that a full port range reports every sensitive port once."""
+    open_ports = find_open_sensitive_ports(
+        [
+            {
+                "IpProtocol": "tcp",
+                "FromPort": 0,
+                "ToPort": 65535,
+                "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
+            }
+        ]
+    )
+
+    assert [port_info["port"] for port_info in open_ports] == [20, 21, 23, 25, 69, 80, 110, 143]
+    assert all(port_info["cidr"] == "0.0.0.0/0" for port_info in open_ports)
+
+
+def test_find_open_sensitive_ports_ipv6_and_restricted_ranges():
+    """Test that ::/0 sources are reported and restricted sources are ignored."""
+    open_ports = find_open_sensitive_ports(
+        [
+            {
+                "IpProtocol": "tcp",
+                "FromPort": 80,
+                "ToPort": 80,
+                "IpRanges": [{"CidrIp": "10.0.0.0/8"}],
+                "Ipv6Ranges": [{"CidrIpv6": "::/0"}],
+            },
+            {
+                "IpProtocol": "tcp",
+                "FromPort": 100,
+                "ToPort": 200,
+                "IpRanges": [{"CidrIp": "192.168.0.0/16"}],
+            },
+        ]
+    )
+
+    assert open_ports == [{"port": 80, "service": "HTTP", "cidr": "::/0"}]
+
+
+@pytest.mark.asyncio
+async def test_check_security_groups_single_sweep(mock_ctx, mock_ec2_client):
+    """Test that groups are evaluated from a paginated sweep without per-group calls."""
+    paginator = mock_ec2_client.get_paginator.return_value
+    paginator.paginate.return_value = [
+        {
+            "SecurityGroups": [
+                {
+                    "GroupId": "sg-1",
+                    "IpPermissions": [
+                        {
+                            "IpProtocol": "tcp",
+                            "FromPort": 23,
+                            "ToPort": 23,
+                            "Ipv6Ranges": [{"CidrIpv6": "::/0"}],
+                        }
+                    ],
+                }
+            ],
+            "NextToken": "page-2",
+        },
+        {"SecurityGroups": [{"GroupId": "sg-2", "IpPermissions": []}]},
+    ]
+    network_resources = {"error": "No default Resource Explorer view found"}
+
+    result = await check_security_groups("us-east-1", mock_ec2_client, mock_ctx, network_resources)
+
+    assert result["resources_checked"] == 2
+    assert result["non_compliant_resources"] == 1
+    assert result["resource_details"][0]["issues"] == [
+        "Port 23 (Telnet) open to the world over IPv6"
+    ]
+    mock_ec2_client.get_paginator.assert_called_once_with("describe_security_groups")
+    paginator.paginate.assert_called_once_with(MaxResults=1000)
+    mock_ec2_client.describe_security_groups.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_elbv2_ssl_policy_catalog_is_memoized(mock_ctx, mock_elbv2_client):
+    """Test that SSL policies are fetched once and evaluated by their protocols."""
+    mock_elbv2_client.describe_ssl_policies.return_value = {
+        "SslPolicies": [
+            {"Name": "ELBSecurityPolicy-TLS13-1-2-2021-06", "SslProtocols": ["TLSv1.2"]},
+            {"Name": "ELBSecurityPolicy-2016-08", "SslProtocols": ["TLSv1", "TLSv1.2"]},
+        ]
+    }
+    mock_elbv2_client.describe_listeners.return_value = {
+        "Listeners": [
+            {"Protocol": "HTTPS", "SslPolicy": "ELBSecurityPolicy-TLS13-1-2-2021-06"},
+        ]
+    }
+    network_resources = {"error": "No default Resource Explorer view found"}
+
+    first = await check_elbv2_load_balancers(
+        "us-east-1", mock_elbv2_client, mock_ctx, network_resources
+    )
+    second = await check_elbv2_load_balancers(
+        "us-east-1", mock_elbv2_client, mock_ctx, network_resources
+    )
+
+    assert first["compliant_resources"] == 1
+    assert second["compliant_resources"] == 1
+    mock_elbv2_client.describe_ssl_policies.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_elbv2_listeners_fetched_concurrently(mock_ctx, mock_elbv2_client):
+    """Test that listeners for many load balancers are fetched concurrently."""
+    lb_count = 10
+    mock_elbv2_client.describe_load_balancers.return_value = {
+        "LoadBalancers": [{"LoadBalancerArn": ALB_ARN.format(i)} for i in range(lb_count)]
+    }
+
+    def slow_describe_listeners(LoadBalancerArn):
+        time.sleep(0.1)
+        return {"Listeners": [{"Protocol": "HTTPS", "SslPolicy": "ELBSecurityPolicy-TLS-1-2"}]}
+
+    mock_elbv2_client.describe_listeners.side_effect = slow_describe_listeners
+    network_resources = {"error": "No default Resource Explorer view found"}
+
+    started = time.monotonic()
+    result = await check_elbv2_load_balancers(
+        "us-east-1", mock_elbv2_client, mock_ctx, network_resources
+    )
+
+    assert result["compliant_resources"] == lb_count
+    assert [lb["arn"] for lb in result["resource_details"]] == [
+        ALB_ARN.format(i) for i in range(lb_count)
+    ]
+    assert time.monotonic() - started < lb_count * 0.1 / 2
+
+
+@pytest.mark.asyncio
+async def test_classic_load_balancers_described_in_batches(mock_ctx, mock_elb_client):
+    """Test that Resource Explorer load balancers are described in one batch call."""
+    mock_elb_client.describe_load_balancers.return_value = {
+        "LoadBalancerDescriptions": [
+            {
+                "LoadBalancerName": f"lb-{i}",
+                "ListenerDescriptions": [
+                    {
+                        "Listener": {"Protocol": "HTTPS"},
+                        "PolicyNames": ["ELBSecurityPolicy-2016-08"],
+                    }
+                ],
+            }
+            for i in range(3)
+        ]
+    }
+    network_resources = {
+        "resources_by_service": {
+            "elb": [
+                {"Arn": f"arn:aws:elasticloadbalancing:us-east-1:123456789012:loadbalancer/lb-{i}"}
+                for i in range(3)
+            ]
+        }
+    }
+
+    result = await check_classic_load_balancers(
+        "us-east-1", mock_elb_client, mock_ctx, network_resources
+    )
+
+    assert result["compliant_resources"] == 3
+    mock_elb_client.describe_load_balancers.assert_called_once_with(
+        LoadBalancerNames=["lb-0", "lb-1", "lb-2"]
+    )
+    # Each load balancer's own policies are described once
+    assert mock_elb_client.describe_load_balancer_policies.call_count == 3
+    mock_elb_client.describe_load_balancer_policies.assert_called_with(
+        LoadBalancerName="lb-2", PolicyNames=["ELBSecurityPolicy-2016-08"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_classic_policy_named_like_predefined_policy_is_described(mock_ctx, mock_elb_client):
+    """Test that a custom policy with a predefined policy's name is judged by its own protocols."""
+    mock_elb_client.describe_load_balancers.return_value = {
+        "LoadBalancerDescriptions": [
+            {
+                "LoadBalancerName": "lb-custom",
+                "ListenerDescriptions": [
+                    {
+                        "Listener": {"Protocol": "HTTPS"},
+                        "PolicyNames": ["AWSConsole-LBCookieStickinessPolicy", "TLS-1-2-Policy"],
+                    },
+                    {"Listener": {"Protocol": "SSL"}, "PolicyNames": ["TLS-1-2-Policy"]},
+                ],
+            }
+        ]
+    }
+    mock_elb_client.describe_load_balancer_policies.return_value = {
+        "PolicyDescriptions": [
+            {
+                "PolicyName": "AWSConsole-LBCookieStickinessPolicy",
+                "PolicyTypeName": "LBCookieStickinessPolicyType",
+                "PolicyAttributeDescriptions": [
+                    {"AttributeName": "CookieExpirationPeriod", "AttributeValue": "0"}
+                ],
+            },
+            {
+                "PolicyName": "TLS-1-2-Policy",
+                "PolicyTypeName": "SSLNegotiationPolicyType",
+                "PolicyAttributeDescriptions": [
+                    {"AttributeName": "Protocol-TLSv1.2", "AttributeValue": "true"},
+                    {"AttributeName": "Protocol-TLSv1.0", "AttributeValue": "true"},
+                ],
+            },
+        ]
+    }
+    network_resources = {"error": "No default Resource Explorer view found"}
+
+    result = await check_classic_load_balancers(
+        "us-east-1", mock_elb_client, mock_ctx, network_resources
+    )
+
+    assert result["non_compliant_resources"] == 1
+    assert result["resource_details"][0]["issues"] == [
+        "Using insecure protocols: TLSv1.0",
+        "Using insecure protocols: TLSv1.0",
+    ]
+    # Both listeners' policies come from a single call for the load balancer
+    mock_elb_client.describe_load_balancer_policies.assert_called_once_with(
+        LoadBalancerName="lb-custom",
+        PolicyNames=["AWSConsole-LBCookieStickinessPolicy", "TLS-1-2-Policy"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_elbv2_ssl_policy_catalog_follows_pages(mock_ctx, mock_elbv2_client):
+    """Test that the SSL policy catalog includes policies from every page."""
+    mock_elbv2_client.describe_ssl_policies.side_effect = [
+        {
+            "SslPolicies": [{"Name": "ELBSecurityPolicy-2016-08", "SslProtocols": ["TLSv1"]}],
+            "NextMarker": "page-2",
+        },
+        {
+            "SslPolicies": [
+                {"Name": "ELBSecurityPolicy-TLS13-1-3-2021-06", "SslProtocols": ["TLSv1.3"]}
+            ]
+        },
+    ]
+    mock_elbv2_client.describe_listeners.return_value = {
+        "Listeners": [{"Protocol": "HTTPS", "SslPolicy": "ELBSecurityPolicy-TLS13-1-3-2021-06"}]
+    }
+    network_resources = {"error": "No default Resource Explorer view found"}
+
+    result = await check_elbv2_load_balancers(
+        "us-east-1", mock_elbv2_client, mock_ctx, network_resources
+    )
+
+    assert result["compliant_resources"] == 1
+    assert mock_elbv2_client.describe_ssl_policies.call_count == 2
+    mock_elbv2_client.describe_ssl_policies.assert_called_with(PageSize=400, Marker="page-2")
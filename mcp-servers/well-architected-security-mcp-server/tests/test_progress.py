@@ -0,0 +1,70 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the progress module."""
+
+from unittest import mock
+
+import pytest
+
+from src.util.progress import ProgressReporter
+
+
+@pytest.mark.asyncio
+async def test_batch_done_reports_every_batch(mock_ctx):
+    """Test that batches report fractional progress and leave the last batch to service_done."""
+    progress = ProgressReporter(mock_ctx, 2, "Storage check")
+
+    with mock.patch("src.util.progress.PROGRESS_BATCH_SIZE", 2):
+        for done in range(1, 5):
+            await progress.batch_done("s3", done, 4)
+    await progress.service_done("s3", 4)
+
+    calls = mock_ctx.report_progress.await_args_list
+    assert [call.args[:2] for call in calls] == [(0.5, 2), (1, 2)]
+    assert "s3 2/4 resources checked" in calls[0].args[2]
+    assert "1/2 services, 4 resources checked, about" in calls[1].args[2]
+
+
+@pytest.mark.asyncio
+async def test_report_without_message_support():
+    """Test that progress falls back to no message and never fails the check."""
+    ctx = mock.AsyncMock()
+    ctx.report_progress.side_effect = [TypeError("unexpected argument"), None]
+    progress = ProgressReporter(ctx, 1, "Network check")
+
+    await progress.service_done("vpc", 1)
+
+    assert ctx.report_progress.await_args_list[-1].args == (1, 1)
+
+    ctx.report_progress.side_effect = Exception("connection closed")
+    await progress.service_done("apigateway", 0)
@@ -0,0 +1,190 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the shared Resource Explorer inventory."""
+
+import datetime
+from unittest import mock
+
+import pytest
+
+from src.server import refresh_resource_inventory
+from src.util.network_security import find_network_resources
+from src.util.resource_inventory import get_resource_inventory
+from src.util.resource_utils import list_services_in_region
+from src.util.storage_security import find_storage_resources
+
+DEFAULT_VIEW = "arn:aws:resource-explorer-2:us-east-1:123456789012:view/default-view"
+REPORTED = datetime.datetime(2024, 1, 1)
+
+
+def _set_resources(resource_explorer, resources):
+    paginator = mock.MagicMock()
+    paginator.paginate.return_value = [{"Resources": resources}]
+    resource_explorer.get_paginator.return_value = paginator
+    return paginator
+
+
+@pytest.mark.asyncio
+async def test_checks_share_one_sweep(mock_ctx, mock_boto3_session, mock_resource_explorer_client):
+    """Test that storage, network and service listing in one region cost a single sweep."""
+    paginator = _set_resources(
+        mock_resource_explorer_client,
+        [
+            {"Arn": "arn:aws:s3:::bucket", "ResourceType": "s3:bucket"},
+            {"Arn": "arn:aws:ec2:us-east-1:123456789012:volume/vol-1"},
+            {"Arn": "arn:aws:ec2:us-east-1:123456789012:instance/i-1"},
+            {"Arn": "arn:aws:ec2:us-east-1:123456789012:security-group/sg-1"},
+            {"Arn": "arn:aws:elasticloadbalancing:us-east-1:123456789012:loadbalancer/lb"},
+        ],
+    )
+
+    storage = await find_storage_resources(
+        "us-east-1", mock_boto3_session, ["s3", "ebs"], mock_ctx
+    )
+    network = await find_network_resources(
+        "us-east-1", mock_boto3_session, ["elb", "vpc"], mock_ctx
+    )
+    services = await list_services_in_region("us-east-1", mock_boto3_session, mock_ctx)
+
+    assert sorted(storage["resources_by_service"]) == ["ebs", "s3"]
+    assert sorted(network["resources_by_service"]) == ["elb", "security_groups"]
+    assert services["service_counts"] == {"s3": 1, "ec2": 3, "elasticloadbalancing": 1}
+    mock_resource_explorer_client.list_views.assert_called_once()
+    paginator.paginate.assert_called_once_with(MaxResults=1000, ViewArn=DEFAULT_VIEW)
+
+
+@pytest.mark.asyncio
+async def test_expired_inventory_refreshes_incrementally(
+    mock_ctx, mock_boto3_session, mock_resource_explorer_client
+):
+    """Test that a sweep after the TTL reports what changed based on LastReportedAt."""
+    _set_resources(
+        mock_resource_explorer_client,
+        [
+            {"Arn": "arn:aws:s3:::kept", "LastReportedAt": REPORTED},
+            {"Arn": "arn:aws:s3:::changed", "LastReportedAt": REPORTED},
+            {"Arn": "arn:aws:s3:::deleted", "LastReportedAt": REPORTED},
+        ],
+    )
+    inventory = await get_resource_inventory("us-east-1", mock_boto3_session, mock_ctx)
+    kept = inventory.resources["arn:aws:s3:::kept"]
+
+    _set_resources(
+        mock_resource_explorer_client,
+        [
+            {"Arn": "arn:aws:s3:::kept", "LastReportedAt": REPORTED},
+            {"Arn": "arn:aws:s3:::changed", "LastReportedAt": datetime.datetime(2024, 2, 1)},
+            {"Arn": "arn:aws:s3:::new", "LastReportedAt": REPORTED},
+        ],
+    )
+    with mock.patch("src.util.resource_inventory.RESOURCE_INVENTORY_TTL", 0):
+        refreshed = await get_resource_inventory("us-east-1", mock_boto3_session, mock_ctx)
+
+    assert refreshed is inventory
+    assert refreshed.last_refresh["mode"] == "incremental"
+    assert {
+        k: refreshed.last_refresh[k] for k in ("added", "updated", "removed", "unchanged")
+    } == {
+        "added": 1,
+        "updated": 1,
+        "removed": 1,
+        "unchanged": 1,
+    }
+    assert refreshed.resources["arn:aws:s3:::kept"] is kept
+    assert refreshed.by_service["s3"] == [
+        "arn:aws:s3:::kept",
+        "arn:aws:s3:::changed",
+        "arn:aws:s3:::new",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_refresh_resource_inventory_forces_sweep(
+    mock_ctx, mock_boto3_session, mock_resource_explorer_client
+):
+    """Test that RefreshResourceInventory sweeps again even while the inventory is fresh."""
+    paginator = _set_resources(mock_resource_explorer_client, [{"Arn": "arn:aws:s3:::bucket"}])
+    await get_resource_inventory("us-east-1", mock_boto3_session, mock_ctx)
+
+    result = await refresh_resource_inventory(mock_ctx, region="us-east-1")
+
+    assert result["available"] is True
+    assert result["service_counts"] == {"s3": 1}
+    assert result["last_refresh"]["unchanged"] == 1
+    assert paginator.paginate.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_default_view_is_not_cached(
+    mock_ctx, mock_boto3_session, mock_resource_explorer_client
+):
+    """Test that a region without a default view is checked again on the next lookup."""
+    mock_resource_explorer_client.list_views.return_value = {"Views": []}
+
+    assert await get_resource_inventory("us-east-1", mock_boto3_session, mock_ctx) is None
+    assert await get_resource_inventory("us-east-1", mock_boto3_session, mock_ctx) is None
+    assert mock_resource_explorer_client.list_views.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_rotated_credentials_reuse_inventory(
+    mock_ctx, mock_boto3_session, mock_resource_explorer_client
+):
+    """Test that a new session for the same identity reuses the cached inventory."""
+    paginator = _set_resources(mock_resource_explorer_client, [{"Arn": "arn:aws:s3:::bucket"}])
+    mock_resource_explorer_client.get_caller_identity.return_value = {
+        "Arn": "arn:aws:sts::123456789012:assumed-role/Audit/mcp-server-session"
+    }
+    rotated_session = mock.MagicMock()
+    rotated_session.client.return_value = mock_resource_explorer_client
+
+    first = await get_resource_inventory("us-east-1", mock_boto3_session, mock_ctx)
+    second = await get_resource_inventory("us-east-1", rotated_session, mock_ctx)
+
+    assert second is first
+    paginator.paginate.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_least_recently_swept_inventories_are_evicted(
+    mock_ctx, mock_boto3_session, mock_resource_explorer_client
+):
+    """Test that only the most recently swept inventories are kept beyond the limit."""
+    paginator = _set_resources(mock_resource_explorer_client, [{"Arn": "arn:aws:s3:::bucket"}])
+
+    with mock.patch("src.util.resource_inventory.RESOURCE_INVENTORY_MAX_ENTRIES", 2):
+        for region in ["us-east-1", "us-west-2", "eu-west-1", "us-west-2", "us-east-1"]:
+            await get_resource_inventory(region, mock_boto3_session, mock_ctx)
+
+    assert [call.kwargs["ViewArn"] for call in paginator.paginate.call_args_list] == [
+        DEFAULT_VIEW
+    ] * 4
@@ -83,8 +83,10 @@ async def test_list_services_in_region_success(
     mock_boto3_session.client.assert_called_with(
         "resource-explorer-2", region_name="us-east-1", config=mock.ANY
     )
-    resource_explorer.search.assert_called_once()
-    paginator.paginate.assert_called_once_with(QueryString="*", MaxResults=1000)
+    paginator.paginate.assert_called_once_with(
+        MaxResults=1000,
+        ViewArn="arn:aws:resource-explorer-2:us-east-1:123456789012:view/default-view",
+    )
 
 
 @pytest.mark.asyncio
@@ -41,14 +41,14 @@ from src.util.resource_utils import (
 
 
 @pytest.mark.asyncio
-async def test_list_services_in_region_search_exception(mock_ctx, mock_boto3_session):
-    """Test handling when the search API raises an exception."""
+async def test_list_services_in_region_list_views_exception(mock_ctx, mock_boto3_session):
+    """Test handling when the list_views API raises an exception."""
     # Create a mock resource explorer client
     resource_explorer = mock.MagicMock()
     mock_boto3_session.client.return_value = resource_explorer
 
-    # Mock search to raise an exception that is not about Resource Explorer not being set up
-    resource_explorer.search = mock.MagicMock(side_effect=Exception("Some other API error"))
+    # Mock list_views to raise an exception that is not about Resource Explorer not being set up
+    resource_explorer.list_views = mock.MagicMock(side_effect=Exception("Some other API error"))
 
     # Call the function
     result = await list_services_in_region("us-east-1", mock_boto3_session, mock_ctx)
@@ -70,8 +70,8 @@ async def test_list_services_in_region_resource_explorer_not_setup_specific(
     resource_explorer = mock.MagicMock()
     mock_boto3_session.client.return_value = resource_explorer
 
-    # Mock search to raise an exception indicating Resource Explorer is not set up
-    resource_explorer.search = mock.MagicMock(
+    # Mock list_views to raise an exception indicating Resource Explorer is not set up
+    resource_explorer.list_views = mock.MagicMock(
         side_effect=Exception("Resource Explorer has not been set up")
     )
 
@@ -93,8 +93,8 @@ async def test_list_services_in_region_paginator_exception(mock_ctx, mock_boto3_
     resource_explorer = mock.MagicMock()
     mock_boto3_session.client.return_value = resource_explorer
 
-    # Mock search to succeed but paginator to raise an exception
-    resource_explorer.search = mock.MagicMock()
+    # Mock list_views to succeed but paginator to raise an exception
+    resource_explorer.list_views.return_value = {"Views": [{"ViewArn": "default-view"}]}
 
     # Mock get_paginator to return a paginator that raises an exception
     paginator = mock.MagicMock()
@@ -119,8 +119,8 @@ async def test_list_services_in_region_page_iterator_exception(mock_ctx, mock_bo
     resource_explorer = mock.MagicMock()
     mock_boto3_session.client.return_value = resource_explorer
 
-    # Mock search to succeed
-    resource_explorer.search = mock.MagicMock()
+    # Mock list_views to return the default view
+    resource_explorer.list_views.return_value = {"Views": [{"ViewArn": "default-view"}]}
 
     # Mock get_paginator to return a paginator
     paginator = mock.MagicMock()
@@ -153,8 +153,8 @@ async def test_list_services_in_region_datetime_serialization(mock_ctx, mock_bot
     resource_explorer = mock.MagicMock()
     mock_boto3_session.client.return_value = resource_explorer
 
-    # Mock search to succeed
-    resource_explorer.search = mock.MagicMock()
+    # Mock list_views to return the default view
+    resource_explorer.list_views.return_value = {"Views": [{"ViewArn": "default-view"}]}
 
     # Mock get_paginator to return a paginator
     paginator = mock.MagicMock()
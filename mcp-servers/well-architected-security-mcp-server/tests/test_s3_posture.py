@@ -0,0 +1,183 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the s3_posture module."""
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from src.util.s3_posture import iter_bucket_posture, resolve_bucket_regions
+from src.util.storage_security import check_s3_buckets
+
+ENCRYPTED = {
+    "ServerSideEncryptionConfiguration": {
+        "Rules": [{"ApplyServerSideEncryptionByDefault": {"SSEAlgorithm": "AES256"}}]
+    }
+}
+BLOCKED = {
+    "PublicAccessBlockConfiguration": {
+        "BlockPublicAcls": True,
+        "IgnorePublicAcls": True,
+        "BlockPublicPolicy": True,
+        "RestrictPublicBuckets": True,
+    }
+}
+
+
+@pytest.fixture
+def mock_s3_client():
+    """Mock S3 client with compliant buckets in two regions."""
+    s3_client = mock.MagicMock()
+    s3_client.list_buckets.return_value = {
+        "Buckets": [{"Name": "east-bucket"}, {"Name": "west-bucket"}]
+    }
+    s3_client.get_bucket_location.side_effect = lambda Bucket: {
+        "LocationConstraint": None if Bucket == "east-bucket" else "us-west-2"
+    }
+    s3_client.get_bucket_encryption.return_value = ENCRYPTED
+    s3_client.get_public_access_block.return_value = BLOCKED
+    return s3_client
+
+
+@pytest.mark.asyncio
+async def test_bucket_regions_are_cached_across_regions(mock_ctx, mock_s3_client):
+    """Test that bucket locations are looked up once and reused for other regions."""
+    storage_resources = {"error": "Resource Explorer not configured"}
+
+    east = await check_s3_buckets("us-east-1", mock_s3_client, mock_ctx, storage_resources)
+    west = await check_s3_buckets("us-west-2", mock_s3_client, mock_ctx, storage_resources)
+
+    assert [bucket["name"] for bucket in east["resource_details"]] == ["east-bucket"]
+    assert [bucket["name"] for bucket in west["resource_details"]] == ["west-bucket"]
+    assert mock_s3_client.get_bucket_location.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_bucket_region_from_list_buckets(mock_ctx, mock_s3_client):
+    """Test that BucketRegion from list_buckets avoids get_bucket_location calls."""
+    buckets = [
+        {"Name": "east-bucket", "BucketRegion": "us-east-1"},
+        {"Name": "west-bucket", "BucketRegion": "us-west-2"},
+    ]
+
+    regions = await resolve_bucket_regions(mock_s3_client, buckets, mock_ctx)
+
+    assert regions == {"east-bucket": "us-east-1", "west-bucket": "us-west-2"}
+    mock_s3_client.get_bucket_location.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bucket_location_error_skips_bucket(mock_ctx, mock_s3_client):
+    """Test that a bucket whose location cannot be read is reported and skipped."""
+    mock_s3_client.get_bucket_location.side_effect = Exception("Access Denied")
+
+    regions = await resolve_bucket_regions(mock_s3_client, [{"Name": "east-bucket"}], mock_ctx)
+
+    assert regions == {}
+    mock_ctx.warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_iter_bucket_posture_respects_concurrency(mock_s3_client):
+    """Test that no more than the configured number of buckets are probed at once."""
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_encryption(Bucket):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return ENCRYPTED
+
+    mock_s3_client.get_bucket_encryption.side_effect = slow_encryption
+    bucket_names = [f"bucket-{i}" for i in range(8)]
+
+    results = [
+        result async for result in iter_bucket_posture(mock_s3_client, bucket_names, concurrency=2)
+    ]
+
+    assert sorted(result["name"] for result in results) == bucket_names
+    assert all(result["compliant"] for result in results)
+    assert peak <= 2
+
+
+@pytest.mark.asyncio
+async def test_iter_bucket_posture_yields_fastest_first(mock_s3_client):
+    """Test that results are yielded as soon as each bucket is done."""
+
+    def get_bucket_encryption(Bucket):
+        if Bucket == "slow-bucket":
+            time.sleep(0.2)
+        return ENCRYPTED
+
+    mock_s3_client.get_bucket_encryption.side_effect = get_bucket_encryption
+
+    results = [
+        result["name"]
+        async for result in iter_bucket_posture(mock_s3_client, ["slow-bucket", "fast-bucket"])
+    ]
+
+    assert results == ["fast-bucket", "slow-bucket"]
+
+
+@pytest.mark.asyncio
+async def test_check_s3_buckets_time_budget(mock_ctx, mock_s3_client):
+    """Test that buckets not probed within the time budget are reported as not checked."""
+
+    def get_bucket_encryption(Bucket):
+        if Bucket == "slow-bucket":
+            time.sleep(0.5)
+        return ENCRYPTED
+
+    mock_s3_client.get_bucket_encryption.side_effect = get_bucket_encryption
+    mock_s3_client.list_buckets.return_value = {
+        "Buckets": [
+            {"Name": "slow-bucket", "BucketRegion": "us-east-1"},
+            {"Name": "fast-bucket", "BucketRegion": "us-east-1"},
+        ]
+    }
+    storage_resources = {"error": "Resource Explorer not configured"}
+
+    result = await check_s3_buckets(
+        "us-east-1", mock_s3_client, mock_ctx, storage_resources, time_budget=0.1
+    )
+
+    assert result["resources_checked"] == 1
+    assert result["resource_details"][0]["name"] == "fast-bucket"
+    assert result["buckets_not_checked"] == ["slow-bucket"]
@@ -34,10 +34,10 @@
 import datetime
 from unittest import mock
 
+import botocore.exceptions
 import pytest
 
 from src.util.security_services import (
-    _clean_datetime_objects,
     _summarize_access_analyzer_findings,
     _summarize_guardduty_findings,
     _summarize_inspector_findings,
@@ -55,55 +55,12 @@ from src.util.security_services import (
     get_guardduty_findings,
     get_inspector_findings,
     get_macie_findings,
+    get_securityhub_finding_counts,
     get_securityhub_findings,
     get_trusted_advisor_findings,
 )
 
 
-@pytest.mark.asyncio
-async def test_clean_datetime_objects():
-    """Test the _clean_datetime_objects function."""
-    # Test with a datetime object
-    dt = datetime.datetime(2023, 1, 1, 12, 0, 0)
-    result = _clean_datetime_objects(dt)
-    assert isinstance(result, str)
-    assert result == dt.isoformat()
-
-    # Test with a list containing a datetime object
-    dt_list = [datetime.datetime(2023, 1, 1, 12, 0, 0)]
-    result = _clean_datetime_objects(dt_list)
-    assert isinstance(result, list)
-    assert isinstance(result[0], str)
-    assert result[0] == dt_list[0].isoformat()
-
-    # Test with a dictionary containing a datetime object
-    dt_dict = {"timestamp": datetime.datetime(2023, 1, 1, 12, 0, 0)}
-    result = _clean_datetime_objects(dt_dict)
-    assert isinstance(result, dict)
-    assert isinstance(result["timestamp"], str)
-    assert result["timestamp"] == dt_dict["timestamp"].isoformat()
-
-    # Test with a nested structure
-    nested = {
-        "timestamps": [
-            {"created": datetime.datetime(2023, 1, 1, 12, 0, 0)},
-            {"updated": datetime.datetime(2023, 1, 2, 12, 0, 0)},
-        ],
-        "metadata": {"last_check": datetime.datetime(2023, 1, 3, 12, 0, 0)},
-    }
-    result = _clean_datetime_objects(nested)
-    assert isinstance(result["timestamps"][0]["created"], str)
-    assert isinstance(result["timestamps"][1]["updated"], str)
-    assert isinstance(result["metadata"]["last_check"], str)
-
-    # Test with non-datetime objects
-    assert _clean_datetime_objects(123) == 123
-    assert _clean_datetime_objects("string") == "string"
-    assert _clean_datetime_objects(None) is None
-    assert _clean_datetime_objects([1, 2, 3]) == [1, 2, 3]
-    assert _clean_datetime_objects({"a": 1, "b": 2}) == {"a": 1, "b": 2}
-
-
 @pytest.mark.asyncio
 async def test_summarize_guardduty_findings():
     """Test the _summarize_guardduty_findings function."""
@@ -806,6 +763,160 @@ async def test_get_securityhub_findings_not_enabled(mock_ctx, mock_boto3_session
         assert "AWS Security Hub is not enabled" in result["message"]
 
 
+def _fake_securityhub_insights(mock_securityhub_client, results):
+    """Make the Security Hub client keep custom insights and count with the given results."""
+    insights = {}
+    created = iter(range(1000))
+
+    def create_insight(**params):
+        arn = f"arn:insight/{next(created)}"
+        insights[arn] = {"InsightArn": arn, **params}
+        return {"InsightArn": arn}
+
+    def delete_insight(InsightArn):
+        del insights[InsightArn]
+        return {"InsightArn": InsightArn}
+
+    def get_insight_results(InsightArn):
+        attribute = insights[InsightArn]["GroupByAttribute"]
+        return {"InsightResults": {"ResultValues": results[attribute]}}
+
+    mock_securityhub_client.create_insight.side_effect = create_insight
+    mock_securityhub_client.delete_insight.side_effect = delete_insight
+    mock_securityhub_client.get_insight_results.side_effect = get_insight_results
+    return insights
+
+
+@pytest.mark.asyncio
+async def test_get_securityhub_finding_counts(
+    mock_ctx, mock_boto3_session, mock_securityhub_client
+):
+    """Test that findings are counted with insights that are deleted once read."""
+    insights = _fake_securityhub_insights(
+        mock_securityhub_client,
+        {
+            "SeverityLabel": [
+                {"GroupByAttributeValue": "HIGH", "Count": 40},
+                {"GroupByAttributeValue": "CRITICAL", "Count": 2},
+            ],
+            "ResourceType": [{"GroupByAttributeValue": "AwsS3Bucket", "Count": 42}],
+        },
+    )
+    severity_filter = {"SeverityLabel": [{"Comparison": "EQUALS", "Value": "HIGH"}]}
+
+    result = await get_securityhub_finding_counts(
+        "us-east-1", mock_boto3_session, mock_ctx, ["severity", "resource_type"], severity_filter
+    )
+
+    assert result["enabled"] is True
+    assert result["counts"] == {
+        "severity": {"HIGH": 40, "CRITICAL": 2},
+        "resource_type": {"AwsS3Bucket": 42},
+    }
+    assert result["total_count"] == 42
+    assert "counted_from_findings" not in result
+    assert result["filters"]["SeverityLabel"] == severity_filter["SeverityLabel"]
+    assert result["filters"]["RecordState"] == [{"Comparison": "EQUALS", "Value": "ACTIVE"}]
+    assert [
+        (c.kwargs["GroupByAttribute"], c.kwargs["Filters"])
+        for c in mock_securityhub_client.create_insight.call_args_list
+    ] == [("SeverityLabel", result["filters"]), ("ResourceType", result["filters"])]
+    # No insight is left behind in the account
+    assert insights == {}
+    assert mock_securityhub_client.delete_insight.call_count == 2
+    mock_securityhub_client.update_insight.assert_not_called()
+    mock_securityhub_client.get_findings.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_securityhub_finding_counts_deletes_insight_on_error(
+    mock_ctx, mock_boto3_session, mock_securityhub_client
+):
+    """Test that the insight is deleted even when reading its results fails."""
+    insights = _fake_securityhub_insights(mock_securityhub_client, {})
+    mock_securityhub_client.get_insight_results.side_effect = botocore.exceptions.ClientError(
+        {"Error": {"Code": "InternalException", "Message": "boom"}}, "GetInsightResults"
+    )
+
+    result = await get_securityhub_finding_counts(
+        "us-east-1", mock_boto3_session, mock_ctx, ["severity"]
+    )
+
+    assert "boom" in result["error"]
+    assert insights == {}
+
+
+@pytest.mark.parametrize("code", ["LimitExceededException", "AccessDeniedException"])
+@pytest.mark.asyncio
+async def test_get_securityhub_finding_counts_falls_back_to_findings(
+    mock_ctx, mock_boto3_session, mock_securityhub_client, code
+):
+    """Test that findings are counted from one get_findings sweep when insights cannot be created."""
+    mock_securityhub_client.create_insight.side_effect = botocore.exceptions.ClientError(
+        {"Error": {"Code": code, "Message": "no more insights"}}, "CreateInsight"
+    )
+    paginator = mock_securityhub_client.get_paginator.return_value
+    paginator.paginate.return_value = iter(
+        [
+            {
+                "Findings": [
+                    {
+                        "Severity": {"Label": "HIGH"},
+                        "Resources": [{"Type": "AwsS3Bucket", "Id": "b1"}],
+                    },
+                    {
+                        "Severity": {"Label": "HIGH"},
+                        "Resources": [{"Type": "AwsEc2Instance", "Id": "i1"}],
+                    },
+                ]
+            },
+            {
+                "Findings": [
+                    {
+                        "Severity": {"Label": "LOW"},
+                        "Resources": [{"Type": "AwsS3Bucket", "Id": "b2"}],
+                    }
+                ]
+            },
+        ]
+    )
+
+    result = await get_securityhub_finding_counts(
+        "us-east-1", mock_boto3_session, mock_ctx, ["severity", "resource_type"]
+    )
+
+    assert result["counts"] == {
+        "severity": {"HIGH": 2, "LOW": 1},
+        "resource_type": {"AwsS3Bucket": 2, "AwsEc2Instance": 1},
+    }
+    assert result["total_count"] == 3
+    assert result["counted_from_findings"] == ["severity", "resource_type"]
+    # The second attribute does not try to create an insight again
+    mock_securityhub_client.create_insight.assert_called_once()
+    mock_securityhub_client.get_paginator.assert_called_once_with("get_findings")
+    paginator.paginate.assert_called_once_with(
+        Filters=result["filters"], PaginationConfig={"PageSize": 100}
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_securityhub_finding_counts_not_enabled(
+    mock_ctx, mock_boto3_session, mock_securityhub_client
+):
+    """Test that InvalidAccessException is reported as Security Hub not being enabled."""
+    mock_securityhub_client.create_insight.side_effect = botocore.exceptions.ClientError(
+        {"Error": {"Code": "InvalidAccessException", "Message": "not subscribed"}}, "CreateInsight"
+    )
+
+    result = await get_securityhub_finding_counts(
+        "us-east-1", mock_boto3_session, mock_ctx, ["severity"]
+    )
+
+    assert result["enabled"] is False
+    assert result["counts"] == {}
+    mock_ctx.error.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_inspector_findings_success(mock_ctx, mock_boto3_session, mock_inspector_client):
     """Test the get_inspector_findings function when Inspector is enabled."""
@@ -41,6 +41,7 @@ from src.util.security_services import (
     get_macie_findings,
     get_securityhub_findings,
     get_trusted_advisor_findings,
+    normalize_finding_severity,
 )
 
 
@@ -507,3 +508,160 @@ async def test_get_macie_findings_with_custom_filter_criteria(
 
         # Check that maxResults was set correctly
         assert call_args["maxResults"] == 50
+
+
+@pytest.mark.asyncio
+async def test_get_access_analyzer_findings_pages_list_results(
+    mock_ctx, mock_boto3_session, mock_accessanalyzer_client
+):
+    """Test that findings are paged from list_findings with filters and a budget."""
+    analyzer_arn = "arn:aws:access-analyzer:us-east-1:123456789012:analyzer/account-analyzer"
+
+    def list_findings(analyzerArn, maxResults, filter, nextToken=None):
+        page = int(nextToken or 0)
+        return {
+            "findings": [
+                {"id": f"f-{page}-{i}", "resourceType": "AWS::S3::Bucket", "isPublic": True}
+                for i in range(maxResults)
+            ],
+            "nextToken": str(page + 1),
+        }
+
+    mock_accessanalyzer_client.list_findings = mock.MagicMock(side_effect=list_findings)
+
+    with mock.patch("src.util.security_services.check_access_analyzer") as mock_check:
+        mock_check.return_value = {"enabled": True, "analyzers": [{"arn": analyzer_arn}]}
+
+        result = await get_access_analyzer_findings(
+            "us-east-1",
+            mock_boto3_session,
+            mock_ctx,
+            max_findings=250,
+            severity_filter="high",
+            resource_types=["AWS::S3::Bucket"],
+        )
+
+    assert len(result["findings"]) == 250
+    assert result["debug_info"]["list_findings_calls"] == 3
+    assert [
+        c.kwargs["maxResults"] for c in mock_accessanalyzer_client.list_findings.call_args_list
+    ] == [
+        100,
+        100,
+        50,
+    ]
+    assert mock_accessanalyzer_client.list_findings.call_args.kwargs["filter"] == {
+        "isPublic": {"eq": ["true"]},
+        "resourceType": {"eq": ["AWS::S3::Bucket"]},
+    }
+    mock_accessanalyzer_client.get_finding.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_access_analyzer_findings_unmatched_severity(
+    mock_ctx, mock_boto3_session, mock_accessanalyzer_client
+):
+    """Test that severities Access Analyzer cannot express are ignored instead of matching nothing."""
+    mock_accessanalyzer_client.list_findings = mock.MagicMock(
+        return_value={"findings": [{"id": "f-1", "isPublic": False}]}
+    )
+
+    with mock.patch("src.util.security_services.check_access_analyzer") as mock_check:
+        mock_check.return_value = {"enabled": True, "analyzers": [{"arn": "arn"}]}
+
+        result = await get_access_analyzer_findings(
+            "us-east-1", mock_boto3_session, mock_ctx, severity_filter="CRITICAL"
+        )
+
+    assert [f["id"] for f in result["findings"]] == ["f-1"]
+    assert "CRITICAL is not supported and was ignored" in result["message"]
+    assert "filter" not in mock_accessanalyzer_client.list_findings.call_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_get_trusted_advisor_findings_prefilters_by_summary(
+    mock_ctx, mock_boto3_session, mock_support_client
+):
+    """Test that only checks whose summary matches the status filter get full results."""
+    with mock.patch("src.util.security_services.check_trusted_advisor") as mock_check:
+        mock_check.return_value = {"enabled": True, "support_tier": "Business/Enterprise"}
+
+        result = await get_trusted_advisor_findings(
+            "us-east-1", mock_boto3_session, mock_ctx, status_filter=["error", "warning"]
+        )
+
+    assert [f["check_id"] for f in result["findings"]] == ["Pfx0RwqBli"]
+    mock_support_client.describe_trusted_advisor_check_summaries.assert_called_once_with(
+        checkIds=["Pfx0RwqBli", "7DAFEmoDos"]
+    )
+    mock_support_client.describe_trusted_advisor_check_result.assert_called_once_with(
+        checkId="Pfx0RwqBli", language="en"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_trusted_advisor_findings_caches_until_refresh(
+    mock_ctx, mock_boto3_session, mock_support_client
+):
+    """Test that check results are reused until the check summary reports a refresh."""
+    check_result = mock_support_client.describe_trusted_advisor_check_result
+
+    with mock.patch("src.util.security_services.check_trusted_advisor") as mock_check:
+        mock_check.return_value = {"enabled": True, "support_tier": "Business/Enterprise"}
+
+        await get_trusted_advisor_findings("us-east-1", mock_boto3_session, mock_ctx)
+        await get_trusted_advisor_findings("us-east-1", mock_boto3_session, mock_ctx)
+        assert check_result.call_count == 1
+
+        summaries = mock_support_client.describe_trusted_advisor_check_summaries
+        summaries.return_value["summaries"][0]["timestamp"] = "2023-01-02T00:00:00Z"
+        await get_trusted_advisor_findings("us-east-1", mock_boto3_session, mock_ctx)
+        assert check_result.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_trusted_advisor_findings_cache_is_bounded(
+    mock_ctx, mock_boto3_session, mock_support_client
+):
+    """Test that results are shared across credential rotations but the oldest are dropped."""
+    check_result = mock_support_client.describe_trusted_advisor_check_result
+    rotated_session = mock.MagicMock()
+    rotated_session.client.return_value = mock_support_client
+    other_session = mock.MagicMock()
+    other_session.client.return_value = mock_support_client
+
+    with (
+        mock.patch("src.util.security_services.check_trusted_advisor") as mock_check,
+        mock.patch("src.util.security_services.TRUSTED_ADVISOR_CACHE_MAX_ENTRIES", 1),
+    ):
+        mock_check.return_value = {"enabled": True, "support_tier": "Business/Enterprise"}
+
+        mock_support_client.get_caller_identity.return_value = {"Arn": "arn:aws:iam::1:role/A"}
+        await get_trusted_advisor_findings("us-east-1", mock_boto3_session, mock_ctx)
+        await get_trusted_advisor_findings("us-east-1", rotated_session, mock_ctx)
+        assert check_result.call_count == 1
+
+        mock_support_client.get_caller_identity.return_value = {"Arn": "arn:aws:iam::2:role/B"}
+        await get_trusted_advisor_findings("us-east-1", other_session, mock_ctx)
+        await get_trusted_advisor_findings("us-east-1", mock_boto3_session, mock_ctx)
+        assert check_result.call_count == 3
+
+
+@pytest.mark.parametrize(
+    "service, finding, expected",
+    [
+        ("guardduty", {"Severity": 9.0}, "CRITICAL"),
+        ("guardduty", {"Severity": 7.5}, "HIGH"),
+        ("guardduty", {"Severity": 2.0}, "LOW"),
+        ("securityhub", {"Severity": {"Label": "INFORMATIONAL"}}, "INFORMATIONAL"),
+        ("securityhub", {}, "MEDIUM"),
+        ("inspector", {"severity": "UNTRIAGED"}, "INFORMATIONAL"),
+        ("macie", {"severity": {"description": "High", "score": 3}}, "HIGH"),
+        ("macie", {"severity": {"score": 2}}, "MEDIUM"),
+        ("trustedadvisor", {"status": "warning"}, "MEDIUM"),
+        ("accessanalyzer", {"isPublic": True}, "HIGH"),
+    ],
+)
+def test_normalize_finding_severity(service, finding, expected):
+    """Test that each service's severity representation maps onto the shared labels."""
+    assert normalize_finding_severity(service, finding) == expected
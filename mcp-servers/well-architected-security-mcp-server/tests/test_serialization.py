@@ -0,0 +1,75 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the serialization utilities."""
+
+import datetime
+import json
+
+from src.util.serialization import json_default, normalize_datetimes
+
+
+def test_normalize_datetimes_in_place():
+    """Test that nested dates and datetimes are converted without copying the containers."""
+    created = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+    finding = {
+        "Id": "finding-1",
+        "CreatedAt": created,
+        "Resources": [{"Details": {"LastSeen": datetime.date(2023, 1, 2)}}],
+        "Tags": ["a", 1, None],
+    }
+    resources = finding["Resources"]
+
+    result = normalize_datetimes(finding)
+
+    assert result is finding
+    assert finding["Resources"] is resources
+    assert finding["CreatedAt"] == created.isoformat()
+    assert resources[0]["Details"]["LastSeen"] == "2023-01-02"
+    assert finding["Tags"] == ["a", 1, None]
+
+
+def test_normalize_datetimes_scalars():
+    """Test that a bare datetime becomes its ISO string and other values are unchanged."""
+    assert normalize_datetimes(datetime.datetime(2023, 1, 1)) == "2023-01-01T00:00:00"
+    assert normalize_datetimes(123) == 123
+    assert normalize_datetimes("string") == "string"
+    assert normalize_datetimes(None) is None
+
+
+def test_json_default():
+    """Test the JSON default hook for datetimes and other unsupported values."""
+    value = {"at": datetime.datetime(2023, 1, 1, 12, 0, 0), "tags": {"x"}}
+    assert json.loads(json.dumps(value, default=json_default)) == {
+        "at": "2023-01-01T12:00:00",
+        "tags": "{'x'}",
+    }
@@ -31,6 +31,7 @@
 
 """Tests for the server.py module."""
 
+import asyncio
 from unittest import mock
 
 import pytest
@@ -40,9 +41,12 @@ from src.server import (
     check_security_services,
     check_storage_encryption_tool,
     context_storage,
+    get_result_page,
     get_stored_security_context,
     list_services_in_region_tool,
+    snapshot_storage,
 )
+from src.util.aws_calls import get_throttle_stats
 
 
 @pytest.mark.asyncio
@@ -136,6 +140,74 @@ async def test_check_security_services_error(mock_ctx):
         assert "message" in result
 
 
+@pytest.mark.asyncio
+async def test_check_security_services_concurrent(mock_ctx, mock_boto3_session):
+    """Test that service checks overlap when running in concurrent mode."""
+    running = 0
+    max_running = 0
+
+    async def slow_check(region, session, ctx):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return {"enabled": True, "message": "enabled"}
+
+    with (
+        mock.patch("src.server.check_guard_duty", side_effect=slow_check),
+        mock.patch("src.server.check_security_hub", side_effect=slow_check),
+        mock.patch("src.server.check_macie", side_effect=slow_check),
+    ):
+        result = await check_security_services(
+            mock_ctx,
+            region="us-east-1",
+            services=["guardduty", "securityhub", "macie"],
+            store_in_context=False,
+            debug=True,
+            concurrent=True,
+        )
+
+    assert max_running == 3
+    assert result["all_enabled"] is True
+    assert list(result["service_statuses"]) == ["guardduty", "securityhub", "macie"]
+    assert set(result["debug_info"]["service_details"]) == {"guardduty", "securityhub", "macie"}
+    for details in result["debug_info"]["service_details"].values():
+        assert details["duration_seconds"] >= 0.05
+        assert details["status"] == "success"
+
+
+@pytest.mark.asyncio
+async def test_check_security_services_service_timeout(mock_ctx, mock_boto3_session):
+    """Test that a slow service yields a partial result instead of failing the call."""
+
+    async def hanging_check(region, session, ctx):
+        await asyncio.sleep(5)
+        return {"enabled": True}
+
+    with (
+        mock.patch("src.server.check_guard_duty", side_effect=hanging_check),
+        mock.patch("src.server.check_macie") as mock_macie,
+        mock.patch.dict("src.server.SERVICE_CHECK_TIMEOUTS", {"guardduty": 0.05}),
+    ):
+        mock_macie.return_value = {"enabled": True, "message": "Macie is enabled"}
+
+        result = await check_security_services(
+            mock_ctx,
+            region="us-east-1",
+            services=["guardduty", "macie"],
+            store_in_context=False,
+            debug=True,
+            concurrent=True,
+        )
+
+    assert result["all_enabled"] is False
+    assert result["service_statuses"]["macie"]["enabled"] is True
+    assert result["service_statuses"]["guardduty"]["status"] == "timeout"
+    assert result["debug_info"]["service_details"]["guardduty"]["status"] == "timeout"
+    assert result["debug_info"]["service_details"]["macie"]["status"] == "success"
+
+
 @pytest.mark.asyncio
 async def test_get_security_findings_guardduty(mock_ctx):
     """Test the get_security_findings function for GuardDuty."""
@@ -336,6 +408,9 @@ async def test_check_storage_encryption_tool(mock_ctx, mock_boto3_session):
             services=["s3", "ebs"],
             include_unencrypted_only=False,
             store_in_context=True,
+            page_size=0,
+            since_snapshot=None,
+            output_format="full",
         )
 
         # Verify the result
@@ -347,11 +422,206 @@ async def test_check_storage_encryption_tool(mock_ctx, mock_boto3_session):
         assert "resource_details" in result
         assert "recommendations" in result
 
+        assert result["debug_info"]["throttling"] == get_throttle_stats()
+
         # Verify that the result was stored in context
         assert "storage_encryption_us-east-1" in context_storage
         assert context_storage["storage_encryption_us-east-1"] == result
 
 
+@pytest.mark.asyncio
+async def test_check_storage_encryption_tool_paginated(mock_ctx, mock_boto3_session):
+    """Test that page_size returns the first page and GetResultPage returns the rest."""
+    resource_details = [{"type": "s3", "name": f"bucket{i}", "compliant": True} for i in range(5)]
+    with mock.patch("src.server.check_storage_encryption") as mock_check:
+        mock_check.return_value = {"region": "us-east-1", "resource_details": resource_details}
+
+        result = await check_storage_encryption_tool(
+            mock_ctx,
+            region="us-east-1",
+            services=["s3"],
+            include_unencrypted_only=False,
+            store_in_context=True,
+            page_size=2,
+            since_snapshot=None,
+            output_format="full",
+        )
+
+    assert result["resource_details"] == resource_details[:2]
+    assert result["pagination"]["total_resource_details"] == 5
+    # The stored context keeps every resource
+    assert context_storage["storage_encryption_us-east-1"]["resource_details"] == resource_details
+
+    second = await get_result_page(
+        mock_ctx, cursor=result["pagination"]["next_cursor"], page_size=2, output_format="full"
+    )
+    assert second["available"] is True
+    assert second["resource_details"] == resource_details[2:4]
+
+    last = await get_result_page(
+        mock_ctx, cursor=second["pagination"]["next_cursor"], page_size=0, output_format="full"
+    )
+    assert last["resource_details"] == resource_details[4:]
+    assert last["pagination"]["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_check_storage_encryption_tool_returns_first_page_while_running(
+    mock_ctx, mock_boto3_session
+):
+    """Test that the first page is returned before the remaining services are checked."""
+    s3_details = [{"type": "s3", "name": f"bucket{i}", "compliant": True} for i in range(3)]
+    rds_details = [{"type": "rds", "name": f"db{i}", "compliant": False} for i in range(2)]
+    rds_started = asyncio.Event()
+    release_rds = asyncio.Event()
+
+    async def check(region, services, session, ctx, include_unencrypted_only, snapshot, on_update):
+        results = {"region": region, "resources_checked": 3, "resource_details": list(s3_details)}
+        on_update(results)
+        rds_started.set()
+        await release_rds.wait()
+        await ctx.warning("rds checked after the first page")
+        results["resources_checked"] = 5
+        results["resource_details"].extend(rds_details)
+        return results
+
+    with mock.patch("src.server.check_storage_encryption", side_effect=check):
+        first = await check_storage_encryption_tool(
+            mock_ctx,
+            region="us-east-1",
+            services=["s3", "rds"],
+            include_unencrypted_only=False,
+            store_in_context=True,
+            page_size=2,
+            since_snapshot=None,
+            output_format="full",
+        )
+        assert rds_started.is_set()
+        assert first["resource_details"] == s3_details[:2]
+        assert first["resources_checked"] == 3
+        assert first["pagination"]["complete"] is False
+
+        second_page = asyncio.ensure_future(
+            get_result_page(
+                mock_ctx,
+                cursor=first["pagination"]["next_cursor"],
+                page_size=2,
+                output_format="full",
+            )
+        )
+        await asyncio.sleep(0)
+        release_rds.set()
+        second = await second_page
+
+    assert second["resource_details"] == [s3_details[2], rds_details[0]]
+    assert second["pagination"]["complete"] is True
+    last = await get_result_page(
+        mock_ctx, cursor=second["pagination"]["next_cursor"], page_size=0, output_format="full"
+    )
+    assert last["resource_details"] == rds_details[1:]
+    assert last["pagination"]["next_cursor"] is None
+    assert context_storage["storage_encryption_us-east-1"]["resources_checked"] == 5
+    # The client no longer listens once the first page is returned
+    mock_ctx.warning.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_check_storage_encryption_tool_compact(mock_ctx, mock_boto3_session):
+    """Test that output_format='compact' returns a resources table and keeps context full."""
+    resource_details = [
+        {"type": "s3", "name": "bucket1", "compliant": False, "issues": ["Not encrypted"]},
+        {"type": "s3", "name": "bucket2", "compliant": True, "issues": []},
+    ]
+    with mock.patch("src.server.check_storage_encryption") as mock_check:
+        mock_check.return_value = {"region": "us-east-1", "resource_details": resource_details}
+
+        result = await check_storage_encryption_tool(
+            mock_ctx,
+            region="us-east-1",
+            services=["s3"],
+            include_unencrypted_only=False,
+            store_in_context=True,
+            page_size=0,
+            since_snapshot=None,
+            output_format="COMPACT",
+        )
+        invalid = await check_storage_encryption_tool(
+            mock_ctx,
+            region="us-east-1",
+            services=["s3"],
+            include_unencrypted_only=False,
+            store_in_context=True,
+            page_size=0,
+            since_snapshot=None,
+            output_format="yaml",
+        )
+
+    assert "resource_details" not in result
+    assert result["resources"]["rows"] == [["bucket1", 0, 0, [0], []], ["bucket2", 0, 1, [], []]]
+    assert result["issue_codes"] == ["Not encrypted"]
+    assert "size_report" in result
+    assert context_storage["storage_encryption_us-east-1"]["resource_details"] == resource_details
+    assert "Unsupported output format" in invalid["error"]
+
+
+@pytest.mark.asyncio
+async def test_check_storage_encryption_tool_since_latest_snapshot(mock_ctx, mock_boto3_session):
+    """Test that since_snapshot='latest' compares a run with the previous run in the region."""
+    snapshot_storage.clear()
+
+    async def check(region, services, session, ctx, include_unencrypted_only, snapshot, on_update):
+        snapshot.record("s3", {"resource_details": [{"arn": "arn:aws:s3:::b", "compliant": True}]})
+        return {"region": region, "resource_details": []}
+
+    with mock.patch("src.server.check_storage_encryption", side_effect=check):
+        first = await check_storage_encryption_tool(
+            mock_ctx,
+            region="eu-west-1",
+            services=["s3"],
+            include_unencrypted_only=False,
+            store_in_context=False,
+            page_size=0,
+            since_snapshot=None,
+            output_format="full",
+        )
+        second = await check_storage_encryption_tool(
+            mock_ctx,
+            region="eu-west-1",
+            services=["s3"],
+            include_unencrypted_only=False,
+            store_in_context=False,
+            page_size=0,
+            since_snapshot="latest",
+            output_format="full",
+        )
+        missing = await check_storage_encryption_tool(
+            mock_ctx,
+            region="eu-west-1",
+            services=["s3"],
+            include_unencrypted_only=False,
+            store_in_context=False,
+            page_size=0,
+            since_snapshot="unknown",
+            output_format="full",
+        )
+
+    assert "delta" not in first
+    assert second["delta"]["previous_snapshot_found"] is True
+    assert second["delta"]["since_snapshot"] == first["snapshot_id"]
+    assert second["delta"]["diff"]["unchanged"] == 1
+    assert missing["delta"]["previous_snapshot_found"] is False
+    assert missing["delta"]["diff"]["added"] == ["arn:aws:s3:::b"]
+
+
+@pytest.mark.asyncio
+async def test_get_result_page_unknown_cursor(mock_ctx):
+    """Test that an unknown or expired cursor reports that no results are available."""
+    result = await get_result_page(mock_ctx, cursor="missing:2", page_size=0, output_format="full")
+
+    assert result["available"] is False
+    assert "missing:2" in result["message"]
+
+
 @pytest.mark.asyncio
 async def test_check_storage_encryption_tool_error(mock_ctx, mock_boto3_session):
     """Test the check_storage_encryption_tool function when an error occurs."""
@@ -366,6 +636,9 @@ async def test_check_storage_encryption_tool_error(mock_ctx, mock_boto3_session)
             services=["s3", "ebs"],
             include_unencrypted_only=False,
             store_in_context=True,
+            page_size=0,
+            since_snapshot=None,
+            output_format="full",
         )
 
         # Verify the result
@@ -470,6 +743,9 @@ async def test_check_network_security_tool(mock_ctx, mock_boto3_session):
             services=["elb", "vpc"],
             include_non_compliant_only=False,
             store_in_context=True,
+            page_size=0,
+            since_snapshot=None,
+            output_format="full",
         )
 
         # Verify the result
@@ -481,6 +757,8 @@ async def test_check_network_security_tool(mock_ctx, mock_boto3_session):
         assert "resource_details" in result
         assert "recommendations" in result
 
+        assert result["debug_info"]["throttling"] == get_throttle_stats()
+
         # Verify that the result was stored in context
         assert "network_security_us-east-1" in context_storage
         assert context_storage["network_security_us-east-1"] == result
@@ -500,6 +778,9 @@ async def test_check_network_security_tool_error(mock_ctx, mock_boto3_session):
             services=["elb", "vpc"],
             include_non_compliant_only=False,
             store_in_context=True,
+            page_size=0,
+            since_snapshot=None,
+            output_format="full",
         )
 
         # Verify the result
@@ -37,6 +37,7 @@ import pytest
 
 from src.server import (
     context_storage,
+    get_aggregated_security_findings,
     get_security_findings,
 )
 
@@ -74,6 +75,8 @@ async def test_get_security_findings_with_service_enabled_in_context(mock_ctx, m
                 service="guardduty",
                 max_findings=100,
                 check_enabled=True,
+                aggregate_by=None,
+                resource_type=None,
                 severity_filter=None,
             )
 
@@ -118,6 +121,8 @@ async def test_get_security_findings_with_service_disabled_in_context(
                 service="guardduty",
                 max_findings=100,
                 check_enabled=True,
+                aggregate_by=None,
+                resource_type=None,
                 severity_filter=None,
             )
 
@@ -165,6 +170,8 @@ async def test_get_security_findings_with_service_not_in_context(mock_ctx, mock_
                 service="guardduty",
                 max_findings=100,
                 check_enabled=True,
+                aggregate_by=None,
+                resource_type=None,
                 severity_filter=None,
             )
 
@@ -206,6 +213,8 @@ async def test_get_security_findings_with_no_context_storage(mock_ctx, mock_boto
                 service="guardduty",
                 max_findings=100,
                 check_enabled=True,
+                aggregate_by=None,
+                resource_type=None,
                 severity_filter=None,
             )
 
@@ -251,6 +260,8 @@ async def test_get_security_findings_with_check_enabled_false(mock_ctx, mock_bot
                 service="guardduty",
                 max_findings=100,
                 check_enabled=False,
+                aggregate_by=None,
+                resource_type=None,
                 severity_filter=None,
             )
 
@@ -289,6 +300,8 @@ async def test_get_security_findings_with_securityhub(mock_ctx, mock_boto3_sessi
                 service="securityhub",
                 max_findings=100,
                 check_enabled=False,
+                aggregate_by=None,
+                resource_type=None,
                 severity_filter=None,
             )
 
@@ -327,6 +340,8 @@ async def test_get_security_findings_with_inspector(mock_ctx, mock_boto3_session
                 service="inspector",
                 max_findings=100,
                 check_enabled=False,
+                aggregate_by=None,
+                resource_type=None,
                 severity_filter=None,
             )
 
@@ -365,6 +380,8 @@ async def test_get_security_findings_with_accessanalyzer(mock_ctx, mock_boto3_se
                 service="accessanalyzer",
                 max_findings=100,
                 check_enabled=False,
+                aggregate_by=None,
+                resource_type="AWS::S3::Bucket",
                 severity_filter=None,
             )
 
@@ -373,8 +390,25 @@ async def test_get_security_findings_with_accessanalyzer(mock_ctx, mock_boto3_se
             assert result["enabled"] is True
             assert len(result["findings"]) == 1
 
-            # Verify get_access_analyzer_findings was called
+            # Verify get_access_analyzer_findings was called with the resource type
             mock_get_findings.assert_called_once()
+            assert mock_get_findings.call_args.kwargs["resource_types"] == ["AWS::S3::Bucket"]
+
+
+@pytest.mark.asyncio
+async def test_get_security_findings_resource_type_requires_accessanalyzer(mock_ctx):
+    """Test that resource_type is rejected for services other than IAM Access Analyzer."""
+    with pytest.raises(ValueError, match="resource_type is only supported"):
+        await get_security_findings(
+            mock_ctx,
+            region="us-east-1",
+            service="guardduty",
+            max_findings=100,
+            check_enabled=False,
+            aggregate_by=None,
+            resource_type="AWS::S3::Bucket",
+            severity_filter=None,
+        )
 
 
 @pytest.mark.asyncio
@@ -403,6 +437,8 @@ async def test_get_security_findings_with_trustedadvisor(mock_ctx, mock_boto3_se
                 service="trustedadvisor",
                 max_findings=100,
                 check_enabled=False,
+                aggregate_by=None,
+                resource_type=None,
                 severity_filter=None,
             )
 
@@ -446,6 +482,8 @@ async def test_get_security_findings_with_trustedadvisor_and_severity_filter(
             max_findings=100,
             severity_filter="ERROR",
             check_enabled=False,
+            aggregate_by=None,
+            resource_type=None,
         )
 
         # Verify the result
@@ -490,6 +528,8 @@ async def test_get_security_findings_with_macie(mock_ctx, mock_boto3_session):
                 service="macie",
                 max_findings=100,
                 check_enabled=False,
+                aggregate_by=None,
+                resource_type=None,
                 severity_filter=None,
             )
 
@@ -524,6 +564,8 @@ async def test_get_security_findings_with_severity_filter_guardduty(mock_ctx, mo
             max_findings=100,
             severity_filter="HIGH",
             check_enabled=False,
+            aggregate_by=None,
+            resource_type=None,
         )
 
         # Verify the result
@@ -554,6 +596,8 @@ async def test_get_security_findings_with_unsupported_service(mock_ctx, mock_bot
                 service="unsupported",
                 max_findings=100,
                 check_enabled=False,
+                aggregate_by=None,
+                resource_type=None,
                 severity_filter=None,
             )
 
@@ -561,6 +605,53 @@ async def test_get_security_findings_with_unsupported_service(mock_ctx, mock_bot
         assert "Unsupported security service" in str(excinfo.value)
 
 
+@pytest.mark.asyncio
+async def test_get_security_findings_with_aggregate_by(mock_ctx, mock_boto3_session):
+    """Test that aggregate_by counts Security Hub findings instead of retrieving them."""
+    with (
+        mock.patch("src.server.get_securityhub_finding_counts") as mock_get_counts,
+        mock.patch("src.server.get_securityhub_findings") as mock_get_findings,
+    ):
+        mock_get_counts.return_value = {
+            "enabled": True,
+            "counts": {"severity": {"HIGH": 5}},
+            "total_count": 5,
+        }
+
+        result = await get_security_findings(
+            mock_ctx,
+            region="us-east-1",
+            service="securityhub",
+            max_findings=100,
+            severity_filter="high",
+            check_enabled=False,
+            aggregate_by=["severity"],
+            resource_type=None,
+        )
+
+        assert result["service"] == "securityhub"
+        assert result["counts"] == {"severity": {"HIGH": 5}}
+        mock_get_findings.assert_not_called()
+        args = mock_get_counts.call_args.args
+        assert args[3] == ["severity"]
+        assert args[4] == {"SeverityLabel": [{"Comparison": "EQUALS", "Value": "HIGH"}]}
+
+    # Only Security Hub findings can be aggregated, by the supported attributes
+    for service, aggregate_by in (("guardduty", ["severity"]), ("securityhub", ["region"])):
+        with pytest.raises(ValueError) as excinfo:
+            await get_security_findings(
+                mock_ctx,
+                region="us-east-1",
+                service=service,
+                max_findings=100,
+                severity_filter=None,
+                check_enabled=False,
+                aggregate_by=aggregate_by,
+                resource_type=None,
+            )
+        assert "aggregate_by" in str(excinfo.value)
+
+
 @pytest.mark.asyncio
 async def test_get_security_findings_with_exception(mock_ctx, mock_boto3_session):
     """Test get_security_findings with exception."""
@@ -582,6 +673,8 @@ async def test_get_security_findings_with_exception(mock_ctx, mock_boto3_session
                     service="guardduty",
                     max_findings=100,
                     check_enabled=False,
+                    aggregate_by=None,
+                    resource_type=None,
                     severity_filter=None,
                 )
 
@@ -618,6 +711,8 @@ async def test_get_security_findings_updates_context_when_service_disabled(
                 service="guardduty",
                 max_findings=100,
                 check_enabled=False,
+                aggregate_by=None,
+                resource_type=None,
                 severity_filter=None,
             )
 
@@ -635,3 +730,100 @@ async def test_get_security_findings_updates_context_when_service_disabled(
                 ]
                 is False
             )
+
+
+@pytest.mark.asyncio
+async def test_get_aggregated_security_findings_merges_services_and_regions(
+    mock_ctx, mock_boto3_session
+):
+    """Test that findings from every service/region pair are merged by normalized severity."""
+    context_storage.clear()
+
+    async def guardduty_findings(region, session, ctx, max_findings, filter_criteria):
+        return {
+            "enabled": True,
+            "findings": [
+                {"Id": f"gd-{region}", "Severity": 5.0 if region == "us-east-1" else 9.5}
+            ],
+        }
+
+    async def securityhub_findings(region, session, ctx, max_findings, filter_criteria):
+        if region == "us-west-2":
+            raise Exception("Throttled")
+        return {
+            "enabled": True,
+            "findings": [
+                {"Id": "sh-high", "Severity": {"Label": "HIGH"}},
+                {"Id": "sh-low", "Severity": {"Label": "LOW"}},
+            ],
+        }
+
+    with (
+        mock.patch("src.server.get_guardduty_findings", side_effect=guardduty_findings),
+        mock.patch("src.server.get_securityhub_findings", side_effect=securityhub_findings),
+    ):
+        result = await get_aggregated_security_findings(
+            mock_ctx,
+            regions=["us-east-1", "us-west-2"],
+            services=["guardduty", "securityhub", "unknown"],
+            max_findings=3,
+            severity_filter=None,
+            check_enabled=True,
+        )
+
+    assert [(f["finding"]["Id"], f["severity"]) for f in result["findings"]] == [
+        ("gd-us-west-2", "CRITICAL"),
+        ("sh-high", "HIGH"),
+        ("gd-us-east-1", "MEDIUM"),
+    ]
+    assert result["truncated"] is True
+    assert result["summary"]["total_count"] == 4
+    assert result["summary"]["region_counts"] == {"us-east-1": 3, "us-west-2": 1}
+    assert result["unsupported_services"] == ["unknown"]
+
+    failed = [s for s in result["sources"] if s.get("error")]
+    assert failed == [
+        {
+            "service": "securityhub",
+            "region": "us-west-2",
+            "enabled": False,
+            "findings_retrieved": 0,
+            "message": "Error retrieving securityhub findings",
+            "error": "Throttled",
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_aggregated_security_findings_severity_filter(mock_ctx, mock_boto3_session):
+    """Test that the severity filter applies to normalized severities of every service."""
+    context_storage.clear()
+
+    with (
+        mock.patch("src.server.get_trusted_advisor_findings") as mock_ta,
+        mock.patch("src.server.get_inspector_findings") as mock_inspector,
+    ):
+        mock_ta.return_value = {
+            "enabled": True,
+            "findings": [
+                {"check_id": "a", "status": "error"},
+                {"check_id": "b", "status": "warning"},
+            ],
+        }
+        mock_inspector.return_value = {"enabled": True, "findings": [{"severity": "HIGH"}]}
+
+        result = await get_aggregated_security_findings(
+            mock_ctx,
+            regions=["us-east-1"],
+            services=["trustedadvisor", "inspector"],
+            max_findings=10,
+            severity_filter="high",
+            check_enabled=True,
+        )
+
+    assert [f["service"] for f in result["findings"]] == ["trustedadvisor", "inspector"]
+    # Trusted Advisor treats severity_filter as a status, so it falls back to error/warning
+    assert mock_ta.call_args.kwargs["status_filter"] == ["error", "warning"]
+    assert mock_inspector.call_args.args[4] == {
+        "severities": [{"comparison": "EQUALS", "value": "HIGH"}]
+    }
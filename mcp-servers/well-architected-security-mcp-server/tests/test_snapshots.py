@@ -0,0 +1,194 @@
+# MIT No Attribution
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the snapshots module and delta storage checks."""
+
+import datetime
+from unittest import mock
+
+import pytest
+
+from src.util.snapshots import AssessmentSnapshot
+from src.util.storage_security import check_storage_encryption
+
+REPORTED = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+CHANGED = datetime.datetime(2024, 2, 1, tzinfo=datetime.timezone.utc)
+
+
+def _inventory(bucket_timestamps, volume_timestamp=REPORTED):
+    """Build find_storage_resources results for buckets and one EBS volume."""
+    return {
+        "resources_by_service": {
+            "s3": [
+                {"Arn": f"arn:aws:s3:::{name}", "LastReportedAt": reported}
+                for name, reported in bucket_timestamps.items()
+            ],
+            "ebs": [
+                {
+                    "Arn": "arn:aws:ec2:us-east-1:123456789012:volume/vol-1",
+                    "LastReportedAt": volume_timestamp,
+                }
+            ],
+        }
+    }
+
+
+def _s3_client(unencrypted=()):
+    """Create an S3 client mock where the given buckets have no default encryption."""
+    s3_client = mock.MagicMock()
+
+    def get_bucket_encryption(Bucket):
+        if Bucket in unencrypted:
+            return {"ServerSideEncryptionConfiguration": {"Rules": []}}
+        return {
+            "ServerSideEncryptionConfiguration": {
+                "Rules": [{"ApplyServerSideEncryptionByDefault": {"SSEAlgorithm": "AES256"}}]
+            }
+        }
+
+    s3_client.get_bucket_encryption.side_effect = get_bucket_encryption
+    s3_client.get_public_access_block.return_value = {
+        "PublicAccessBlockConfiguration": {
+            "BlockPublicAcls": True,
+            "IgnorePublicAcls": True,
+            "BlockPublicPolicy": True,
+            "RestrictPublicBuckets": True,
+        }
+    }
+    return s3_client
+
+
+def _service_results(*resources):
+    """Build the results of one service check from resource details."""
+    return {
+        "resources_checked": len(resources),
+        "compliant_resources": sum(1 for resource in resources if resource["compliant"]),
+        "non_compliant_resources": sum(1 for resource in resources if not resource["compliant"]),
+        "resource_details": list(resources),
+    }
+
+
+async def _run(session, ctx, inventory, ebs_check, previous=None):
+    """Run a storage check of s3 and ebs, recording a snapshot."""
+    snapshot = AssessmentSnapshot("storage", "us-east-1", previous)
+    with (
+        mock.patch("src.util.storage_security.find_storage_resources", return_value=inventory),
+        mock.patch("src.util.storage_security.check_ebs_volumes", ebs_check),
+    ):
+        results = await check_storage_encryption(
+            "us-east-1", ["s3", "ebs"], session, ctx, snapshot=snapshot
+        )
+    return results, snapshot
+
+
+@pytest.mark.asyncio
+async def test_delta_check_rechecks_only_changed_and_non_compliant(mock_ctx):
+    """Test that a delta run probes only new, changed and previously non-compliant resources."""
+    volume = {"arn": "arn:aws:ec2:us-east-1:123456789012:volume/vol-1", "compliant": True}
+    ebs_check = mock.AsyncMock(return_value=_service_results(volume))
+    session = mock.MagicMock()
+    session.client.return_value = _s3_client(unencrypted={"open"})
+
+    first_results, first = await _run(
+        session,
+        mock_ctx,
+        _inventory({"same": REPORTED, "edited": REPORTED, "open": REPORTED}),
+        ebs_check,
+    )
+    assert first_results["non_compliant_resources"] == 1
+
+    # "edited" changed, "open" was non-compliant and is now fixed, "new" appeared
+    s3_client = _s3_client()
+    session.client.return_value = s3_client
+    results, second = await _run(
+        session,
+        mock_ctx,
+        _inventory({"same": REPORTED, "edited": CHANGED, "open": REPORTED, "new": REPORTED}),
+        ebs_check,
+        previous=first.to_dict(),
+    )
+
+    probed = sorted(
+        call.kwargs["Bucket"] for call in s3_client.get_bucket_encryption.call_args_list
+    )
+    assert probed == ["edited", "new", "open"]
+    # The unchanged, compliant EBS service is reused without being checked again
+    ebs_check.assert_awaited_once()
+    assert results["resources_checked"] == 5
+    assert results["non_compliant_resources"] == 0
+
+    delta = second.delta()
+    assert delta["since_snapshot"] == first.snapshot_id
+    assert delta["services_reused"] == ["ebs"]
+    assert delta["resources_reused"] == 2
+    assert delta["resources_rechecked"] == 3
+    assert delta["diff"]["added"] == ["arn:aws:s3:::new"]
+    assert delta["diff"]["resolved"] == ["arn:aws:s3:::open"]
+    assert delta["diff"]["newly_non_compliant"] == []
+    assert delta["diff"]["removed"] == []
+
+
+@pytest.mark.asyncio
+async def test_changed_inventory_rechecks_service(mock_ctx):
+    """Test that a service is checked again once one of its resources is reported changed."""
+    volume = {"arn": "arn:aws:ec2:us-east-1:123456789012:volume/vol-1", "compliant": True}
+    ebs_check = mock.AsyncMock(return_value=_service_results(volume))
+    session = mock.MagicMock()
+    session.client.return_value = _s3_client()
+
+    _, first = await _run(session, mock_ctx, _inventory({}), ebs_check)
+    _, second = await _run(
+        session, mock_ctx, _inventory({}, volume_timestamp=CHANGED), ebs_check, first.to_dict()
+    )
+
+    assert ebs_check.await_count == 2
+    assert second.delta()["services_reused"] == ["s3"]
+
+
+@pytest.mark.asyncio
+async def test_no_inventory_checks_everything(mock_ctx):
+    """Test that without Resource Explorer every service is checked and still diffed."""
+    volume = {"arn": "arn:aws:ec2:us-east-1:123456789012:volume/vol-1", "compliant": True}
+    ebs_check = mock.AsyncMock(return_value=_service_results(volume))
+    session = mock.MagicMock()
+    s3_client = _s3_client()
+    s3_client.list_buckets.return_value = {"Buckets": []}
+    session.client.return_value = s3_client
+
+    _, first = await _run(session, mock_ctx, {"error": "no view"}, ebs_check)
+    ebs_check.return_value = _service_results({**volume, "compliant": False})
+    _, second = await _run(session, mock_ctx, {"error": "no view"}, ebs_check, first.to_dict())
+
+    assert ebs_check.await_count == 2
+    diff = second.delta()["diff"]
+    assert diff["changed"] == [volume["arn"]]
+    assert diff["newly_non_compliant"] == [volume["arn"]]
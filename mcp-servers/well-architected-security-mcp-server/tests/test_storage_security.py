@@ -175,11 +175,10 @@ async def test_find_storage_resources_success(
         "resource-explorer-2", region_name="us-east-1", config=mock.ANY
     )
     resource_explorer.list_views.assert_called_once()
-    paginator.paginate.assert_called_once()
-    assert "service:s3" in paginator.paginate.call_args[1]["Filters"]["FilterString"]
-    assert (
-        "service:ec2 resourcetype:ec2:volume"
-        in paginator.paginate.call_args[1]["Filters"]["FilterString"]
+    # The whole default view is swept once and shared with the other checks
+    paginator.paginate.assert_called_once_with(
+        MaxResults=1000,
+        ViewArn="arn:aws:resource-explorer-2:us-east-1:123456789012:view/default-view",
     )
 
 
@@ -505,6 +504,30 @@ async def test_check_storage_encryption_success(mock_ctx, mock_boto3_session):
             mock_check_s3.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_check_storage_encryption_reports_progress(mock_ctx, mock_boto3_session):
+    """Test that a progress notification is sent as each storage service completes."""
+    service_result = {
+        "resources_checked": 3,
+        "compliant_resources": 3,
+        "non_compliant_resources": 0,
+        "resource_details": [],
+    }
+    with (
+        mock.patch(
+            "src.util.storage_security.find_storage_resources", return_value={"error": "none"}
+        ),
+        mock.patch("src.util.storage_security.check_s3_buckets", return_value=service_result),
+        mock.patch("src.util.storage_security.check_ebs_volumes", return_value=service_result),
+    ):
+        await check_storage_encryption("us-east-1", ["s3", "ebs"], mock_boto3_session, mock_ctx)
+
+    calls = mock_ctx.report_progress.await_args_list
+    assert [call.args[:2] for call in calls] == [(1, 2), (2, 2)]
+    assert "s3 done, 3 resources checked" in calls[0].args[2]
+    assert "6 resources checked" in calls[1].args[2]
+
+
 @pytest.mark.asyncio
 async def test_check_storage_encryption_include_unencrypted_only(mock_ctx, mock_boto3_session):
     """Test checking storage encryption with include_unencrypted_only=True."""
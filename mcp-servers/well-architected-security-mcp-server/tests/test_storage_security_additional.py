@@ -243,9 +243,8 @@ async def test_check_dynamodb_tables_success(mock_ctx, mock_boto3_session):
     mock_boto3_session.client.return_value = mock_dynamodb_client
 
     # Mock describe_table to return encrypted tables
-    # The function calls describe_table twice for each table (once for table info, once for SSE)
     mock_dynamodb_client.describe_table.side_effect = [
-        # First table - first call
+        # First table
         {
             "Table": {
                 "TableName": "test-table-1",
@@ -257,27 +256,7 @@ async def test_check_dynamodb_tables_success(mock_ctx, mock_boto3_session):
                 "TableStatus": "ACTIVE",
             }
         },
-        # First table - second call (SSE check)
-        {
-            "Table": {
-                "TableName": "test-table-1",
-                "SSEDescription": {
-                    "Status": "ENABLED",
-                    "SSEType": "KMS",
-                    "KMSMasterKeyArn": "arn:aws:kms:us-east-1:123456789012:key/12345678-1234-1234-1234-123456789012",
-                },
-                "TableStatus": "ACTIVE",
-            }
-        },
-        # Second table - first call
-        {
-            "Table": {
-                "TableName": "test-table-2",
-                "TableStatus": "ACTIVE",
-                # No SSEDescription means not encrypted
-            }
-        },
-        # Second table - second call (SSE check)
+        # Second table
         {
             "Table": {
                 "TableName": "test-table-2",
@@ -300,7 +279,7 @@ async def test_check_dynamodb_tables_success(mock_ctx, mock_boto3_session):
     assert len(result["resource_details"]) == 2
 
     # Verify DynamoDB client was called correctly
-    assert mock_dynamodb_client.describe_table.call_count == 4  # Called twice for each table
+    assert mock_dynamodb_client.describe_table.call_count == 2  # Called once for each table
 
 
 @pytest.mark.asyncio
@@ -612,3 +591,89 @@ async def test_check_efs_filesystems_api_error(mock_ctx, mock_boto3_session):
     assert result["compliant_resources"] == 0
     assert result["non_compliant_resources"] == 0
     assert len(result["resource_details"]) == 0  # No details due to error
+
+
+@pytest.mark.asyncio
+async def test_check_rds_instances_uses_list_results(mock_ctx, mock_boto3_session):
+    """Test that RDS instances are evaluated from the paginated list without describe calls."""
+    storage_resources = {"error": "Resource Explorer not configured"}
+
+    mock_rds_client = mock.MagicMock()
+    mock_paginator = mock.MagicMock()
+    mock_rds_client.get_paginator.return_value = mock_paginator
+    mock_paginator.paginate.return_value = [
+        {
+            "DBInstances": [
+                {"DBInstanceIdentifier": "db-1", "StorageEncrypted": True},
+                {"DBInstanceIdentifier": "db-2", "StorageEncrypted": False},
+            ]
+        }
+    ]
+
+    result = await check_rds_instances("us-east-1", mock_rds_client, mock_ctx, storage_resources)
+
+    assert result["resources_checked"] == 2
+    assert result["compliant_resources"] == 1
+    assert result["non_compliant_resources"] == 1
+    mock_rds_client.describe_db_instances.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_check_efs_filesystems_describes_only_unlisted(mock_ctx, mock_boto3_session):
+    """Test that only filesystems missing from the list sweep are described individually."""
+    storage_resources = {
+        "resources_by_service": {
+            "elasticfilesystem": [
+                {"Arn": "arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-1"},
+                {"Arn": "arn:aws:elasticfilesystem:us-east-1:123456789012:file-system/fs-2"},
+            ]
+        }
+    }
+
+    mock_efs_client = mock.MagicMock()
+    mock_paginator = mock.MagicMock()
+    mock_efs_client.get_paginator.return_value = mock_paginator
+    mock_paginator.paginate.return_value = [
+        {"FileSystems": [{"FileSystemId": "fs-1", "Encrypted": True}]}
+    ]
+    mock_efs_client.describe_file_systems.return_value = {
+        "FileSystems": [{"FileSystemId": "fs-2", "Encrypted": False}]
+    }
+
+    result = await check_efs_filesystems("us-east-1", mock_efs_client, mock_ctx, storage_resources)
+
+    assert result["resources_checked"] == 2
+    assert result["compliant_resources"] == 1
+    assert result["non_compliant_resources"] == 1
+    mock_efs_client.describe_file_systems.assert_called_once_with(FileSystemId="fs-2")
+
+
+@pytest.mark.asyncio
+async def test_check_elasticache_clusters_uses_list_results(mock_ctx, mock_boto3_session):
+    """Test that ElastiCache clusters are evaluated from the paginated list."""
+    storage_resources = {"error": "Resource Explorer not configured"}
+
+    mock_elasticache_client = mock.MagicMock()
+    mock_paginator = mock.MagicMock()
+    mock_elasticache_client.get_paginator.return_value = mock_paginator
+    mock_paginator.paginate.return_value = [
+        {
+            "CacheClusters": [
+                {
+                    "CacheClusterId": "redis-1",
+                    "Engine": "redis",
+                    "AtRestEncryptionEnabled": True,
+                    "TransitEncryptionEnabled": True,
+                    "AuthTokenEnabled": True,
+                }
+            ]
+        }
+    ]
+
+    result = await check_elasticache_clusters(
+        "us-east-1", mock_elasticache_client, mock_ctx, storage_resources
+    )
+
+    assert result["resources_checked"] == 1
+    assert result["compliant_resources"] == 1
+    mock_elasticache_client.describe_cache_clusters.assert_not_called()
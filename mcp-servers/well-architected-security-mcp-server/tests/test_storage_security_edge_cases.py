@@ -132,22 +132,30 @@ async def test_check_s3_buckets_fallback_to_list_buckets(mock_ctx, mock_boto3_se
         {"LocationConstraint": None},  # us-east-1
     ]
 
-    # Mock get_bucket_encryption for both buckets
-    mock_s3_client.get_bucket_encryption.side_effect = [
-        {
+    # Mock get_bucket_encryption for both buckets (buckets are probed concurrently)
+    encryption_responses = {
+        "test-bucket-1": {
             "ServerSideEncryptionConfiguration": {
                 "Rules": [{"ApplyServerSideEncryptionByDefault": {"SSEAlgorithm": "AES256"}}]
             }
         },
-        ClientError(
+        "test-bucket-2": ClientError(
             {"Error": {"Code": "ServerSideEncryptionConfigurationNotFoundError"}},
             "GetBucketEncryption",
         ),
-    ]
+    }
+
+    def get_bucket_encryption(Bucket):
+        response = encryption_responses[Bucket]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    mock_s3_client.get_bucket_encryption.side_effect = get_bucket_encryption
 
     # Mock get_public_access_block for both buckets
-    mock_s3_client.get_public_access_block.side_effect = [
-        {
+    public_access_responses = {
+        "test-bucket-1": {
             "PublicAccessBlockConfiguration": {
                 "BlockPublicAcls": True,
                 "IgnorePublicAcls": True,
@@ -155,7 +163,7 @@ async def test_check_s3_buckets_fallback_to_list_buckets(mock_ctx, mock_boto3_se
                 "RestrictPublicBuckets": True,
             }
         },
-        {
+        "test-bucket-2": {
             "PublicAccessBlockConfiguration": {
                 "BlockPublicAcls": False,
                 "IgnorePublicAcls": False,
@@ -163,6 +171,9 @@ async def test_check_s3_buckets_fallback_to_list_buckets(mock_ctx, mock_boto3_se
                 "RestrictPublicBuckets": False,
             }
         },
+    }
+    mock_s3_client.get_public_access_block.side_effect = lambda Bucket: public_access_responses[
+        Bucket
     ]
 
     # Call the function
@@ -312,9 +323,9 @@ async def test_check_dynamodb_tables_fallback_to_list_tables(mock_ctx, mock_boto
         {"TableNames": ["test-table-3"]},
     ]
 
-    # Mock describe_table for each table (called twice per table)
+    # Mock describe_table for each table
     mock_dynamodb_client.describe_table.side_effect = [
-        # First table - first call
+        # First table
         {
             "Table": {
                 "TableName": "test-table-1",
@@ -323,15 +334,7 @@ async def test_check_dynamodb_tables_fallback_to_list_tables(mock_ctx, mock_boto
                 "TableArn": "arn:aws:dynamodb:us-east-1:123456789012:table/test-table-1",
             }
         },
-        # First table - second call (SSE check)
-        {
-            "Table": {
-                "TableName": "test-table-1",
-                "SSEDescription": {"Status": "ENABLED", "SSEType": "KMS"},
-                "TableStatus": "ACTIVE",
-            }
-        },
-        # Second table - first call
+        # Second table
         {
             "Table": {
                 "TableName": "test-table-2",
@@ -339,14 +342,7 @@ async def test_check_dynamodb_tables_fallback_to_list_tables(mock_ctx, mock_boto
                 "TableArn": "arn:aws:dynamodb:us-east-1:123456789012:table/test-table-2",
             }
         },
-        # Second table - second call (SSE check)
-        {
-            "Table": {
-                "TableName": "test-table-2",
-                "TableStatus": "ACTIVE",
-            }
-        },
-        # Third table - first call
+        # Third table
         {
             "Table": {
                 "TableName": "test-table-3",
@@ -354,13 +350,6 @@ async def test_check_dynamodb_tables_fallback_to_list_tables(mock_ctx, mock_boto
                 "TableArn": "arn:aws:dynamodb:us-east-1:123456789012:table/test-table-3",
             }
         },
-        # Third table - second call (SSE check)
-        {
-            "Table": {
-                "TableName": "test-table-3",
-                "TableStatus": "ACTIVE",
-            }
-        },
     ]
 
     # Call the function
@@ -581,17 +570,15 @@ async def test_check_dynamodb_tables_with_sse_error(mock_ctx, mock_boto3_session
     mock_dynamodb_client = mock.MagicMock()
     mock_boto3_session.client.return_value = mock_dynamodb_client
 
-    # Mock describe_table - first call succeeds, second call (SSE check) fails
-    mock_dynamodb_client.describe_table.side_effect = [
-        {
-            "Table": {
-                "TableName": "test-table-1",
-                "TableStatus": "ACTIVE",
-                "TableArn": "arn:aws:dynamodb:us-east-1:123456789012:table/test-table-1",
-            }
-        },
-        Exception("SSE check failed"),
-    ]
+    # Mock describe_table - the table is described but its SSE settings cannot be read
+    mock_dynamodb_client.describe_table.return_value = {
+        "Table": {
+            "TableName": "test-table-1",
+            "TableStatus": "ACTIVE",
+            "TableArn": "arn:aws:dynamodb:us-east-1:123456789012:table/test-table-1",
+            "SSEDescription": None,
+        }
+    }
 
     # Call the function
     result = await check_dynamodb_tables(
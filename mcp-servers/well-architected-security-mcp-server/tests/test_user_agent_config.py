@@ -26,6 +26,9 @@ from src import __version__
 from src.util.network_security import (
     USER_AGENT_CONFIG as NETWORK_USER_AGENT_CONFIG,
 )
+from src.util.resource_inventory import (
+    USER_AGENT_CONFIG as INVENTORY_USER_AGENT_CONFIG,
+)
 from src.util.resource_utils import (
     USER_AGENT_CONFIG as RESOURCE_USER_AGENT_CONFIG,
 )
@@ -55,6 +58,10 @@ def test_user_agent_config_is_properly_configured():
     assert isinstance(RESOURCE_USER_AGENT_CONFIG, Config)
     assert RESOURCE_USER_AGENT_CONFIG.user_agent_extra == expected_user_agent  # type: ignore[attr-defined]
 
+    # Test resource_inventory config
+    assert isinstance(INVENTORY_USER_AGENT_CONFIG, Config)
+    assert INVENTORY_USER_AGENT_CONFIG.user_agent_extra == expected_user_agent  # type: ignore[attr-defined]
+
 
 @pytest.mark.asyncio
 async def test_security_services_uses_user_agent_config():
@@ -99,9 +106,9 @@ async def test_storage_security_uses_user_agent_config():
     services = ["s3"]
     await find_storage_resources("us-east-1", mock_session, services, mock_ctx)
 
-    # Verify that the client was created with the config parameter
+    # Verify that the shared inventory created the client with the config parameter
     mock_session.client.assert_called_with(
-        "resource-explorer-2", region_name="us-east-1", config=STORAGE_USER_AGENT_CONFIG
+        "resource-explorer-2", region_name="us-east-1", config=INVENTORY_USER_AGENT_CONFIG
     )
 
 
@@ -124,9 +131,9 @@ async def test_network_security_uses_user_agent_config():
     services = ["elb"]
     await find_network_resources("us-east-1", mock_session, services, mock_ctx)
 
-    # Verify that the client was created with the config parameter
+    # Verify that the shared inventory created the client with the config parameter
     mock_session.client.assert_called_with(
-        "resource-explorer-2", region_name="us-east-1", config=NETWORK_USER_AGENT_CONFIG
+        "resource-explorer-2", region_name="us-east-1", config=INVENTORY_USER_AGENT_CONFIG
     )
 
 
@@ -148,7 +155,7 @@ async def test_resource_utils_uses_user_agent_config():
     # Call the function
     await list_services_in_region("us-east-1", mock_session, mock_ctx)
 
-    # Verify that the client was created with the config parameter
+    # Verify that the shared inventory created the client with the config parameter
     mock_session.client.assert_called_with(
-        "resource-explorer-2", region_name="us-east-1", config=RESOURCE_USER_AGENT_CONFIG
+        "resource-explorer-2", region_name="us-east-1", config=INVENTORY_USER_AGENT_CONFIG
     )